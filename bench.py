@@ -0,0 +1,532 @@
+"""
+Rough timing harness for Nutshell's hot paths. Run as
+  python bench.py [NAME ...]
+to run only the named benchmarks (default: all of them).
+"""
+import subprocess
+import sys
+from timeit import repeat
+
+from nutshell.common.utils import RAND_SEED, random as nutshell_rand
+
+BENCHES = {}
+
+
+def bench(func):
+    BENCHES[func.__name__.replace('bench_', '', 1)] = func
+    return func
+
+
+def report(label, times, number):
+    print(f'  {label:<48} {1000 * min(times) / number:9.3f} ms')
+
+
+@bench
+def bench_parser_setup():
+    """Per-@TABLE setup cost: a freshly built parser vs. the shared one"""
+    from nutshell.segment_types.table import table
+    src = ['states: 2', '0, 1, 1, 1, 0, 0, 0, 0, 0; 1']
+
+    def fresh():
+        table.get_parser.cache_clear()
+        table.TableSegment(src)
+
+    report('building the parser', repeat(table.lark_standalone.Lark_StandAlone, number=20, repeat=5), 20)
+    report('tiny table, parser rebuilt per table (before)', repeat(fresh, number=20, repeat=5), 20)
+    table.get_parser()
+    report('tiny table, shared parser (after)', repeat(lambda: table.TableSegment(src), number=20, repeat=5), 20)
+
+
+@bench
+def bench_line_cache():
+    """Retranspiling roed.ruel after a one-line edit: from scratch vs. reusing unchanged lines"""
+    from nutshell.main import transpile
+    from nutshell.segment_types.table.table import TableSegment
+    with open('examples/nutshells/roed.ruel') as f:
+        src = f.read().splitlines(True)
+    idx = src.index('0; N south, NE..SE any, S north, SW..NW any; 0\n')
+    edited = [*src[:idx], '0; N north, NE..SE any, S south, SW..NW any; 0\n', *src[idx+1:]]
+    
+    def prime():
+        TableSegment.expanded_lines.clear()
+        transpile(src)
+    
+    report('edited file, nothing cached (before)', repeat(lambda: transpile(edited), TableSegment.expanded_lines.clear, number=1, repeat=5), 1)
+    report('edited file, rest of the table cached (after)', repeat(lambda: transpile(edited), prime, number=1, repeat=5), 1)
+
+
+@bench
+def bench_segment_pruning():
+    """Parsing a 254-icon rule for -f: every segment vs. only @TABLE and what it depends on"""
+    from nutshell import segmentor
+    icon = ['x = 31, y = 31, rule = Big', '$'.join(['3A2.5B4.9D2C6.'] * 31) + '!']
+    src = [
+      '@RULE Big', '@TABLE', 'states: 255', 'symmetries: permute', '0, 1, 0, 0, 0, 0, 0, 0, 0; 1',
+      '@ICONS', *(line for state in range(1, 255) for line in [f'#C {state}', *icon])
+      ]
+    report('all segments (before)', repeat(lambda: segmentor.parse(src), number=5, repeat=5), 5)
+    report("only @TABLE's (after)", repeat(lambda: segmentor.parse(src, only=['@TABLE']), number=5, repeat=5), 5)
+
+
+@bench
+def bench_streaming_output():
+    """Peak memory compiling two permute lines that expand to ~80,000 under symmetries: none"""
+    import tempfile
+    import tracemalloc
+    from nutshell import compiler, segmentor
+    from nutshell.segment_types.table._napkins import Permute
+    src = [
+      '@RULE Big', '@TABLE', 'states: 8', 'symmetries: permute',
+      '0, 0, 1, 2, 3, 4, 5, 6, 7; 1', '1, 1, 2, 3, 4, 5, 6, 7, 0; 0',
+      'symmetries: none', '0, 1, 0, 0, 0, 0, 0, 0, 0; 1'
+      ]
+
+    def peak(func):
+        Permute.clear()
+        tracemalloc.start()
+        with tempfile.TemporaryFile('w') as f:
+            func(f)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    before = peak(lambda f: f.write(compiler.compile(segmentor.parse(src))))
+    after = peak(lambda f: compiler.write(segmentor.parse(src), f))
+    print(f"  {'joined into one string (before)':<48} {before / 2**20:9.3f} MiB")
+    print(f"  {'streamed to the file (after)':<48} {after / 2**20:9.3f} MiB")
+
+
+@bench
+def bench_final_transitions():
+    """Peak memory building the ~80,000 output transitions of two permute lines that a macro needs all at once"""
+    import tracemalloc
+    from nutshell.segment_types.table.table import TableSegment
+    from nutshell.segment_types.table._napkins import Permute
+    src = [
+      'states: 8', 'symmetries: permute', 'weave: 1',
+      '0, 0, 1, 2, 3, 4, 5, 6, 7; 1', '1, 1, 2, 3, 4, 5, 6, 7, 0; 0', 'weave: \\',
+      'symmetries: none', '0, 1, 0, 0, 0, 0, 0, 0, 0; 1'
+      ]
+    Permute.clear()
+    TableSegment.expanded_lines.clear()
+    tracemalloc.start()
+    TableSegment(src)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {'peak memory':<48} {peak / 2**20:9.3f} MiB")
+
+
+@bench
+def bench_permute_expansion():
+    """Nine Moore permute lines with repeated states converted to symmetries: none"""
+    import tracemalloc
+    from itertools import permutations
+    from nutshell.segment_types.table import _napkins
+    from nutshell.segment_types.table.table import TableSegment
+    src = [
+      'states: 6', 'symmetries: permute',
+      *(f'{i}, {i}, 1, 1, 2, 2, 0, 0, 0; {(i+1) % 6}' for i in range(6)),
+      *(f'{i}, 1, 2, 3, 4, 0, 0, 0, 0; 0' for i in range(1, 4)),
+      'symmetries: none', '0, 1, 0, 0, 0, 0, 0, 0, 0; 1'
+      ]
+    multiset_permutations = _napkins.multiset_permutations
+
+    def fresh():
+        _napkins.Permute.clear()
+        TableSegment.expanded_lines.clear()
+        TableSegment(src)
+
+    def measure(label):
+        tracemalloc.start()
+        fresh()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {label + ', peak memory':<48} {peak / 2**20:9.3f} MiB")
+        report(label, repeat(fresh, number=1, repeat=3), 1)
+
+    _napkins.multiset_permutations = lambda seq: permutations(sorted(seq))
+    measure('every permutation (before)')
+    _napkins.multiset_permutations = multiset_permutations
+    measure('distinct permutations only (after)')
+
+
+@bench
+def bench_napkin_equality():
+    """Deduplicating 300 Moore napkins under rotate8reflect and comparing 60 of them pairwise"""
+    from nutshell.common.utils import distinct
+    from nutshell.segment_types.table import _napkins
+    values = [tuple(str((i*7 + j*3 + i*j) % 5) for j in range(8)) for i in range(300)]
+    napkin = _napkins.Napkin
+    canonical = napkin.__hash__, napkin.__eq__
+
+    def run():
+        napkins = [_napkins.Rotate8Reflect(v) for v in values]
+        list(distinct(napkins))
+        [a == b for a in napkins[:60] for b in napkins[:60]]
+
+    napkin.__hash__ = lambda self: hash(tuple(sorted(self.expanded_unique)))
+    napkin.__eq__ = lambda self, other: isinstance(other, tuple) and any(map(other.__eq__, self.expanded))
+    report('expanded again per hash or comparison (before)', repeat(run, number=5, repeat=3), 5)
+    napkin.__hash__, napkin.__eq__ = canonical
+    report('canonical forms (after)', repeat(run, number=5, repeat=3), 5)
+
+
+@bench
+def bench_group_memo():
+    """A 100-state table of ten differently-spaced copies of one mapping transition"""
+    from nutshell.segment_types.table import _classes, table
+    line = '(1..99), N..NW any, [0: (2..100)]'
+    src = ['states: 101', 'symmetries: rotate4reflect', *(line.replace(', ', ',' + ' ' * i) for i in range(10))]
+    structure = _classes.TransitionGroup.structure
+
+    def fresh():
+        table.TableSegment.expanded_lines.clear()
+        table.TableSegment(src)
+
+    _classes.TransitionGroup.structure = lambda self: None
+    report('each group expanded on its own (before)', repeat(fresh, number=1, repeat=5), 1)
+    _classes.TransitionGroup.structure = structure
+    report('identical groups expanded once (after)', repeat(fresh, number=1, repeat=5), 1)
+
+
+@bench
+def bench_expansion():
+    """Building the @TABLE of mapping-heavy example rules, with no expansion cached between runs"""
+    from nutshell import segmentor
+    from nutshell.segment_types.table.table import TableSegment
+    for name in ('XHistory', 'roed', 'bf'):
+        with open(f'examples/nutshells/{name}.ruel') as f:
+            segments = segmentor.parse(f, only=['@NUTSHELL'])
+
+        def build():
+            TableSegment.expanded_lines.clear()
+            TableSegment(segments['@TABLE'], dep=[segments.get('@NUTSHELL')])
+
+        report(f'{name}.ruel', repeat(build, number=1, repeat=10), 1)
+
+
+@bench
+def bench_statelist_subtraction():
+    """A 250-state table with `any - (...)` and `live - (...)` in every line"""
+    from nutshell.segment_types.table.table import TableSegment
+    src = [
+      'states: 250', 'symmetries: rotate4reflect',
+      *(f'{i}, any - ({i}, {i+1}, {i+2}), live - ({i+3}, {i+4}), any, 0, 0, 0, 0, 0; {i+1}' for i in range(1, 200)),
+      *(f'({i}, {i+1}, {i+2}), any - [0] - 3, 0, 0, 0, 0, 0, 0, 0; 0' for i in range(1, 60))
+      ]
+
+    def build():
+        TableSegment.expanded_lines.clear()
+        TableSegment(src)
+
+    report('building the table', repeat(build, number=1, repeat=5), 1)
+
+
+@bench
+def bench_symmetry_conversion():
+    """Two permute lines converted to rotate4reflect: napkins deduplicated by hashing vs. by index permutations"""
+    from nutshell.common.utils import distinct
+    from nutshell.segment_types.table import _napkins
+    from nutshell.segment_types.table.table import TableSegment
+    src = [
+      'states: 8', 'symmetries: permute', '0, 0, 1, 2, 3, 4, 5, 6, 7; 1', '1, 1, 1, 2, 2, 3, 4, 5, 6; 0',
+      'symmetries: rotate4reflect', '0, 1, 0, 0, 0, 0, 0, 0, 0; 1'
+      ]
+    unique, quotient = _napkins._NapkinMeta.unique, _napkins._NapkinMeta.quotient
+
+    def fresh():
+        _napkins.Permute.clear()
+        TableSegment.expanded_lines.clear()
+        TableSegment(src)
+
+    # (going through unique() for every napkin, as it did before quotient() came along)
+    _napkins._NapkinMeta.quotient = lambda cls, source, napkin: list(cls.unique(source(napkin).expand()))
+    _napkins._NapkinMeta.unique = lambda cls, napkins: distinct(map(cls, napkins))
+    report('hashing every napkin (before)', repeat(fresh, number=1, repeat=3), 1)
+    _napkins._NapkinMeta.unique = unique
+    report('index permutations (after)', repeat(fresh, number=1, repeat=3), 1)
+    _napkins._NapkinMeta.quotient = quotient
+
+
+@bench
+def bench_symmetry_setup():
+    """Importing the symmetry types, then working out permute's Moore-neighborhood symmetries"""
+    from nutshell.segment_types.table import _napkins, _symcache
+
+    def fresh():
+        _napkins.Permute.clear()
+        _napkins.Permute.symmetries._computed.clear()
+        _napkins.Permute.sym_lens._computed.clear()
+        _napkins.Permute.sym_lens[8]
+
+    proc = subprocess.run(
+      [sys.executable, '-X', 'importtime', '-c', 'import nutshell.common.symmetries'],
+      capture_output=True, text=True, check=True
+      )
+    cumulative = next(int(line.split('|')[1]) for line in proc.stderr.splitlines() if line.endswith(' nutshell.segment_types.table._napkins'))
+    report('importing _napkins', [cumulative / 1_000_000], 1)
+    load, store = _symcache.load, _symcache.store
+    _symcache.load, _symcache.store = lambda cls, length: None, lambda cls, length, perms: None
+    report('permute, Moore: computed', repeat(fresh, number=1, repeat=5), 1)
+    _symcache.load, _symcache.store = load, store
+    fresh()
+    report('permute, Moore: from the disk cache', repeat(fresh, number=1, repeat=5), 1)
+
+
+@bench
+def bench_min_sym_type():
+    """Finding the symmetry type a Moore table mixing permute with up to nine other types converts to, from scratch"""
+    from nutshell.common import symmetries as ext
+    from nutshell.segment_types.table import _napkins, _symutils
+    types = [
+      _napkins.Permute, _napkins.Rotate8Reflect, _napkins.Rotate8, _napkins.Rotate4Reflect, _napkins.Rotate4,
+      _napkins.ReflectHorizontal, ext.ReflectVertical, ext.XReflectDiagonal, ext.Rotate2, ext.AlternatingPermute
+      ]
+    mixes = [types[:i] for i in range(2, len(types) + 1)]
+    
+    def by_napkins(symmetries, tr_len):
+        min_cls = min(symmetries, key=lambda cls: len(cls.symmetries[tr_len]))
+        golly_cls = min_cls.fallback.get(tr_len, min_cls.fallback[None]) if hasattr(min_cls, 'fallback') else min_cls
+        min_syms = golly_cls.symmetries[tr_len]
+        failures = [c.symmetries[tr_len] for c in symmetries if min_cls is not c is not golly_cls]
+        failures = [napkin_set for napkin_set in failures if not all(map(napkin_set.__contains__, min_syms))]
+        if not failures:
+            return golly_cls
+        return next(
+          cls for cls, v in _napkins.GOLLY_SYMS[tr_len]
+          if v < len(min_syms) and all(n in s for n in cls.symmetries[tr_len] for s in [min_syms, *failures])
+          )
+    
+    def fresh(find):
+        _napkins.Permute.clear()
+        for cls in types:
+            for per_length in (cls.symmetries, cls.groups, cls.sym_lens):
+                if isinstance(per_length, _napkins._PerLength):
+                    per_length._computed.clear()
+        for mix in mixes:
+            find(mix, 8)
+    
+    report('comparing expansions napkin by napkin (before)', repeat(lambda: fresh(by_napkins), number=1, repeat=5), 1)
+    report('comparing permutation groups (after)', repeat(lambda: fresh(_symutils.find_min_sym_type), number=1, repeat=5), 1)
+
+
+@bench
+def bench_symmetry_quotient():
+    """Converting transitions to a common symmetry type: every example rule's @TABLE, and rotate4reflect lines with permute auxiliaries"""
+    import glob
+    from nutshell import segmentor
+    from nutshell.segment_types.table import _napkins
+    from nutshell.segment_types.table.table import TableSegment
+    examples = []
+    for path in sorted(glob.glob('examples/nutshells/*.ruel')):
+        with open(path) as f:
+            segments = segmentor.parse(f, only=['@NUTSHELL'])
+        if '@TABLE' in segments:
+            examples.append((segments['@TABLE'], [segments.get('@NUTSHELL')]))
+    synthetic = [
+      'states: 12', 'symmetries: rotate4reflect',
+      *(f'{i}, {i+1}, {i+2}, 3, 4, 5, 6, 7, 8; {i} -> permute(N:0  S:{i})' for i in range(1, 4)),
+      *(f'{i}, 1, 2, 3, 4, 5, 6, 7, 8; 0 -> permute(E:{i})' for i in range(9, 12))
+      ]
+    quotient = _napkins._NapkinMeta.quotient
+    
+    def build(src, dep=(None,)):
+        _napkins.Permute.clear()
+        TableSegment.expanded_lines.clear()
+        TableSegment(src, dep=dep)
+    
+    def run(label):
+        report(f'examples/nutshells, {label}', repeat(lambda: [build(*example) for example in examples], number=1, repeat=3), 1)
+        report(f'permute auxiliaries, {label}', repeat(lambda: build(synthetic), number=1, repeat=3), 1)
+    
+    _napkins._NapkinMeta.quotient = lambda cls, source, napkin: list(cls.unique(source(napkin).expand()))
+    run('whole orbits (before)')
+    _napkins._NapkinMeta.quotient = quotient
+    run('cosets (after)')
+
+
+@bench
+def bench_shadowed_pruning():
+    """Building every example rule's @TABLE without and with -p: time taken, and transitions written"""
+    import glob
+    from nutshell import segmentor
+    from nutshell.cli import cli
+    from nutshell.segment_types.table.table import TableSegment
+    examples = []
+    for path in sorted(glob.glob('examples/nutshells/*.ruel')):
+        with open(path) as f:
+            segments = segmentor.parse(f, only=['@NUTSHELL'])
+        if '@TABLE' in segments:
+            examples.append((segments['@TABLE'], [segments.get('@NUTSHELL')]))
+    
+    def build():
+        TableSegment.expanded_lines.clear()
+        return sum(TableSegment(src, dep=dep)._n_final for src, dep in examples)
+    
+    for prune, label in ((False, 'everything (before)'), (True, 'shadowed transitions pruned (after)')):
+        cli.commands['transpile'].set_defaults(prune_shadowed=prune)
+        print(f'  {label + ", transitions":<48} {build():9}')
+        report(label, repeat(build, number=1, repeat=3), 1)
+    cli.commands['transpile'].set_defaults(prune_shadowed=False)
+
+
+@bench
+def bench_transition_merging():
+    """Building every example rule's @TABLE without and with -o: time taken, and transitions written"""
+    import glob
+    from nutshell import segmentor
+    from nutshell.cli import cli
+    from nutshell.segment_types.table.table import TableSegment
+    examples = []
+    for path in sorted(glob.glob('examples/nutshells/*.ruel')):
+        with open(path) as f:
+            segments = segmentor.parse(f, only=['@NUTSHELL'])
+        if '@TABLE' in segments:
+            examples.append((segments['@TABLE'], [segments.get('@NUTSHELL')]))
+    
+    def build():
+        TableSegment.expanded_lines.clear()
+        return sum(TableSegment(src, dep=dep)._n_final for src, dep in examples)
+    
+    for optimize, label in ((False, 'everything (before)'), (True, 'transitions merged (after)')):
+        cli.commands['transpile'].set_defaults(optimize=optimize)
+        print(f'  {label + ", transitions":<48} {build():9}')
+        report(label, repeat(build, number=1, repeat=3), 1)
+    cli.commands['transpile'].set_defaults(optimize=False)
+
+
+@bench
+def bench_rule_tree():
+    """Building a @TREE from every example rule's compiled @TABLE, and giving up on bf.ruel's, which is too big"""
+    import glob
+    from nutshell import segmentor
+    from nutshell.common.errors import Error
+    from nutshell.segment_types.table.table import TableSegment
+    tables = []
+    for path in sorted(glob.glob('examples/nutshells/*.ruel')):
+        with open(path) as f:
+            segments = segmentor.parse(f, only=['@NUTSHELL'])
+        if '@TABLE' in segments:
+            tables.append(TableSegment(segments['@TABLE'], dep=[segments.get('@NUTSHELL')]))
+    bf = tables.pop(next(i for i, t in enumerate(tables) if t.n_states == 96))
+    print(f'  {"transitions":<48} {sum(t._n_final for t in tables):9}')
+    print(f'  {"tree nodes":<48} {sum(len(t.tree().nodes) for t in tables):9}')
+    report('@TREE from @TABLE', repeat(lambda: [t.tree() for t in tables], number=1, repeat=3), 1)
+
+    def give_up():
+        try:
+            bf.tree()
+        except Error:
+            pass
+    report('bf.ruel, until it hits RuleTree.MAX_CHILDREN', repeat(give_up, number=1, repeat=1), 1)
+
+
+@bench
+def bench_transition_search():
+    """-f on a 20000-line rotate4reflect table: building its index, then each search"""
+    import random
+    from nutshell.cli import cli
+    from nutshell.segment_types.table.table import TableSegment
+    rng = random.Random(0)
+    src = [
+      'states: 8', 'symmetries: rotate4reflect',
+      *(', '.join(str(rng.randrange(8)) for _ in range(10)) for _ in range(20000))
+      ]
+    cli.set_defaults(quiet=True)
+    tbl = TableSegment(src)
+    queries = [tuple(rng.choice([rng.randrange(8), '*']) for _ in range(10)) for _ in range(20)]
+    report('index, built on first search', repeat(lambda: (setattr(tbl, '_search_index', None), tbl.match(queries[0])), number=1, repeat=3), 1)
+    report('search', repeat(lambda: [tbl.match(q) for q in queries], number=1, repeat=3), len(queries))
+    cli.set_defaults(quiet=False)
+
+
+@bench
+def bench_find_file():
+    """200 searches in Simpl.ruel: a process per -f vs. one --find-file"""
+    import random
+    rng = random.Random(0)
+    queries = [','.join(str(rng.choice([0, 0, 1, 2, '*'])) for _ in range(10)) for _ in range(200)]
+    cmd = [sys.executable, '-m', 'nutshell', 't', 'examples/nutshells/Simpl.ruel', '-q']
+    report(
+      '-f, one process per search (before)',
+      repeat(lambda: [subprocess.run([*cmd, '-f', q], capture_output=True, check=True) for q in queries[:20]], number=1, repeat=3),
+      20
+      )
+    report(
+      '--find-file, all in one process (after)',
+      repeat(lambda: subprocess.run([*cmd, '--find-file=-'], input='\n'.join(queries), capture_output=True, text=True, check=True), number=1, repeat=3),
+      len(queries)
+      )
+
+
+@bench
+def bench_simulation():
+    """A generation of a 128x128 DeficientLife soup on a torus: cell by cell down the rule tree vs. vectorized"""
+    import random
+    from nutshell import segmentor
+    from nutshell.cli import cli
+    from nutshell.simulate import OFFSETS, Simulation, TreeRule
+    from nutshell.segment_types.table._tree import TREE_ORDER
+    rng = random.Random(0)
+    cli.set_defaults(quiet=True)
+    with open('examples/nutshells/DeficientLife.ruel') as f:
+        tree = segmentor.parse(f, only=['@TABLE'])['@TABLE'].tree()
+    cli.set_defaults(quiet=False)
+    soup = [[rng.random() < .3 for _ in range(128)] for _ in range(128)]
+    nodes = [list(map(int, line.split()[1:])) for line in tree.nodes]
+    offsets = [OFFSETS[cdir] for cdir in TREE_ORDER[tree.n_neighbors]] + [(0, 0)]
+
+    def walk():
+        new = []
+        for y in range(128):
+            row = []
+            for x in range(128):
+                node = len(nodes) - 1
+                for dy, dx in offsets:
+                    node = nodes[node][soup[(y + dy) % 128][(x + dx) % 128]]
+                row.append(node)
+            new.append(row)
+        return new
+
+    sim = Simulation(TreeRule(tree), soup, torus=True)
+    report('cell by cell (before)', repeat(walk, number=1, repeat=3), 1)
+    report('vectorized (after)', repeat(sim.step, number=20, repeat=3), 20)
+
+
+@bench
+def bench_table_diff():
+    """nutshell-ca diff of Brew.ruel's output with and without -p -o (every neighborhood, up to rotate4reflect)"""
+    import os
+    import tempfile
+    from ergo.misc import ErgoNamespace
+    from nutshell import diff
+    with tempfile.TemporaryDirectory() as tmp:
+        for sub, flags in (('plain', []), ('optimized', ['-p', '-o'])):
+            os.mkdir(os.path.join(tmp, sub))
+            subprocess.run(
+              [sys.executable, '-m', 'nutshell', 't', 'examples/nutshells/Brew.ruel', os.path.join(tmp, sub), '-q', *flags],
+              check=True
+              )
+        args = ErgoNamespace(before=os.path.join(tmp, 'plain', 'Brew.rule'), after=os.path.join(tmp, 'optimized', 'Brew.rule'), samples=0, seed=0, show=0)
+        print(f'  {"neighborhoods checked":<48} {list(diff.run(args))[-1].split()[3]:>9}')
+        report('diff', repeat(lambda: list(diff.run(args)), number=1, repeat=3), 1)
+
+
+@bench
+def bench_import_time():
+    """CLI startup: cumulative -X importtime of nutshell.main and of the heaviest modules it loads"""
+    proc = subprocess.run(
+      [sys.executable, '-X', 'importtime', '-c', 'import nutshell.main'],
+      capture_output=True, text=True, check=True
+      )
+    rows = [line.split('|') for line in proc.stderr.splitlines()[1:]]
+    by_time = sorted(((int(cumulative), name.strip()) for _, cumulative, name in rows), reverse=True)
+    for cumulative, name in by_time[:8]:
+        report(name, [cumulative / 1_000_000], 1)
+
+
+if __name__ == '__main__':
+    for name in sys.argv[1:] or BENCHES:
+        print(f'{name}: {BENCHES[name].__doc__}')
+        BENCHES[name]()
+        nutshell_rand.seed(RAND_SEED)
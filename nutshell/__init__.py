@@ -1,4 +1,13 @@
 __version__ = '0.6.3'
 from .common import *
-from .segment_types.table import _napkins as napkin
-from .segment_types.table._napkins import Napkin, OrthNapkin, HexNapkin
+
+_NAPKIN_EXPORTS = {'Napkin', 'OrthNapkin', 'HexNapkin'}
+
+
+def __getattr__(name):
+    # (Imported lazily so that `import nutshell` stays cheap)
+    if name == 'napkin' or name in _NAPKIN_EXPORTS:
+        from .segment_types.table import _napkins
+        globals().update(napkin=_napkins, **{i: getattr(_napkins, i) for i in _NAPKIN_EXPORTS})
+        return globals()[name]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
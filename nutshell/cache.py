@@ -0,0 +1,73 @@
+"""
+On-disk cache of transpiled rules, so that unchanged files needn't be reparsed.
+
+An entry is keyed by the hash of a rule's source text, the Nutshell version,
+and every CLI option that affects output; it also records the hashes of the
+external files (macro files, symmetry & modifier modules) the rule pulled in,
+which are rechecked whenever it's looked up.
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+from nutshell import __version__
+from nutshell.cli import cli
+
+# transpile options that change what gets written to the output file
+OUTPUT_OPTIONS = ('header', 'comment_src', 'preserve_comments', 'prune_shadowed', 'optimize', 'format')
+
+
+def file_hash(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def make_key(src):
+    options = {name: getattr(cli.result.transpile, name, None) for name in OUTPUT_OPTIONS}
+    blob = json.dumps([__version__, options, src], sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def _entry_path(directory, key):
+    return os.path.join(directory, f'{key}.json')
+
+
+def lookup(directory, key):
+    """
+    Returns the cached output for `key` along with the paths of the files
+    it depended on, or None if there isn't any or if one of those files
+    has since changed.
+    """
+    try:
+        with open(_entry_path(directory, key)) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if any(file_hash(path) != digest for path, digest in entry['dependencies'].items()):
+        return None
+    return entry['output'], list(entry['dependencies'])
+
+
+def store(directory, key, output, dependencies=()):
+    """
+    Writes an entry atomically (to a temp file first), so that a
+    concurrent or interrupted run never sees a half-written one.
+    """
+    os.makedirs(directory, exist_ok=True)
+    entry = {
+      'version': __version__,
+      'dependencies': {path: file_hash(path) for path in dependencies},
+      'output': output
+      }
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, _entry_path(directory, key))
+    except BaseException:
+        os.remove(tmp_path)
+        raise
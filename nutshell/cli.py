@@ -1,3 +1,6 @@
+import os
+import sys
+
 from joffrey import CLI, Group
 
 from nutshell import __version__
@@ -17,6 +20,21 @@ transpile = cli.command(
   )
 transpile.main_grp = Group(XOR='find|normal')
 
+watch = cli.command(
+  'watch', 'Transpile files, then transpile them again whenever they (or files they import) change',
+  aliases=['w'], OR='not nothing'
+  )
+
+simulate = cli.command(
+  'simulate', "Run a pattern under a rule's @TABLE, printing each generation's population and hash",
+  aliases=['s'], OR='not nothing'
+  )
+
+diff = cli.command(
+  'diff', 'Check whether two compiled rules\' @TABLEs take any neighborhood to different states',
+  aliases=['d'], OR='not nothing'
+  )
+
 icon = cli.command(
   'icon',
   'Tools related to the @ICONS section',
@@ -99,8 +117,165 @@ def preserve_comments():
     return True
 
 
+def cache_directory(*parts):
+    """Nutshell's directory under $XDG_CACHE_HOME (or ~/.cache), joined with `parts`"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'nutshell', *parts)
+
+
+@transpile.main_grp.flag(short=None, default=None)
+def cache(directory=''):
+    """
+    Reuse output from an on-disk cache when neither a file nor anything it depends on has changed
+    
+    Argument is the directory to keep the cache in. Default is ~/.cache/nutshell
+    (or $XDG_CACHE_HOME/nutshell if that's set).
+    """
+    return directory or cache_directory()
+
+
+@transpile.main_grp.flag(short='p', default=False)
+def prune_shadowed():
+    """Leave out @TABLE transitions that an earlier transition in the output already covers entirely"""
+    return True
+
+
+@transpile.main_grp.flag(short='o', default=False)
+def optimize():
+    """Merge @TABLE transitions that differ in a single cell into one, where that doesn't change which transition a cell goes by"""
+    return True
+
+
+@transpile.main_grp.flag('format', short=None, default='table')
+def output_format(kind):
+    """
+    Format to write @TABLE's transitions in: 'table' (default) for a Golly @TABLE,
+    or 'tree' for a @TREE that Golly can load without converting it first
+    """
+    if kind not in ('table', 'tree'):
+        raise ValueError(f"Unknown format {kind!r} (expected 'table' or 'tree')")
+    return kind
+
+
+@transpile.main_grp.flag(short='j', default=1)
+def jobs(n: int = 0):
+    """
+    Transpile up to N files at once, each in its own process
+    Default (if given no N) is the number of CPUs available. Output is the same as without -j.
+    """
+    return n if n > 0 else os.cpu_count() or 1
+
+
+def parse_transition(transition):
+    """States of a comma-separated transition to search for, with '*' and '?' left as is"""
+    return tuple(s if s in '*?' else int(s) for s in map(str.strip, transition.split(',')))
+
+
 @transpile.clump(OR='find|outdirs', XOR='find|outdirs')
 @transpile.flag(short='f', default=None)
 def find(transition):
     """Locate first transition in `infile` that matches"""
-    return tuple(s if s in '*?' else int(s) for s in map(str.strip, transition.split(',')))
+    return parse_transition(transition)
+
+
+# (dest spelt with a hyphen because joffrey checks clumps by the
+# flag's hyphenated name but records it under its dest)
+@transpile.clump(OR='find|outdirs', XOR='find|outdirs')
+@transpile.flag('find-file', short=None, default=None)
+def find_file(path):
+    """Like -f for each transition in file `path` (one per line; --find-file=- for stdin), writing results as JSON lines"""
+    return path
+
+
+# `watch` takes the same arguments as `transpile`, sans -f
+watch.arg(required=True)(infiles.func)
+watch.arg(required=True)(outdirs.func)
+watch.flag(short='t', default=DEFAULT_HEADER)(header.func)
+watch.flag(short='s', aliases=['source'], default=None)(comment_src.func)
+watch.flag(short='c', aliases=['comments'], default=False)(preserve_comments.func)
+watch.flag(short=None, default=None)(cache.func)
+watch.flag(short='p', default=False)(prune_shadowed.func)
+watch.flag(short='o', default=False)(optimize.func)
+watch.flag('format', short=None, default='table')(output_format.func)
+
+
+@watch.flag(short='n', default=1.0)
+def interval(seconds: float):
+    """Seconds to wait between checks for changes; default 1"""
+    return seconds
+
+
+@simulate.arg(required=True)
+def rulefile(path):
+    """Nutshell-formatted file whose @TABLE to run the pattern under"""
+    return path
+
+
+@simulate.arg(required=True)
+def pattern(path):
+    """RLE file of the pattern to run (- for stdin)"""
+    from nutshell.simulate import read_rle
+    if path == '-':
+        return read_rle(sys.stdin)
+    with open(path) as f:
+        return read_rle(f)
+
+
+@simulate.flag(short='g', default=100)
+def generations(n: int):
+    """Number of generations to run the pattern for; default 100"""
+    if n < 0:
+        raise ValueError('Number of generations cannot be negative')
+    return n
+
+
+@simulate.flag(short=None, default=None)
+def size(dimensions):
+    """
+    Run on a bounded WIDTHxHEIGHT grid, off whose edges every cell is 0
+    (default: unbounded, or with --torus, the size of the pattern)
+    """
+    width, _, height = dimensions.lower().partition('x')
+    return int(width), int(height)
+
+
+@simulate.flag(short=None, default=False)
+def torus():
+    """Wrap the grid's edges around to meet each other"""
+    return True
+
+
+simulate.flag(short='p', default=False)(prune_shadowed.func)
+simulate.flag(short='o', default=False)(optimize.func)
+
+
+@diff.arg(required=True)
+def before(path):
+    """Golly .rule file whose @TABLE to compare"""
+    return path
+
+
+@diff.arg(required=True)
+def after(path):
+    """Golly .rule file whose @TABLE to compare it to"""
+    return path
+
+
+@diff.flag(short='n', default=1_000_000)
+def samples(n: int):
+    """Number of neighborhoods to check, if there are too many to check them all; default 1000000"""
+    if n < 1:
+        raise ValueError('Number of samples must be positive')
+    return n
+
+
+@diff.flag(short=None, default=0)
+def seed(n: int):
+    """Seed for picking those neighborhoods; default 0"""
+    return n
+
+
+@diff.flag(short=None, default=10)
+def show(n: int):
+    """Number of differing neighborhoods to show; default 10"""
+    return n
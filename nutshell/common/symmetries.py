@@ -1,4 +1,5 @@
-from itertools import permutations, chain, repeat
+from collections import OrderedDict
+from itertools import chain, repeat
 
 from nutshell.segment_types.table._napkins import *
 from .utils import LazyProperty
@@ -7,6 +8,7 @@ from .utils import LazyProperty
 class ReflectVertical(Napkin):
     neighborhoods = vonNeumann, hexagonal, Moore
     fallback = NoSymmetry
+    by_index = True
     
     _rotation_amounts = {vonNeumann: 1, hexagonal: 4, Moore: 3}  # these values seem to be arbitrary, dunno
     
@@ -18,31 +20,31 @@ class ReflectVertical(Napkin):
 class XReflectDiagonal(OrthNapkin):
     neighborhoods = vonNeumann, Moore
     fallback = NoSymmetry
+    by_index = True
 
     @property
     def expanded(self):
-        rots = list(self.rotate(4))[1::2]
-        return sorted([tuple(self), *((i[0], *i[:0:-1]) for i in rots)])
+        return sorted([tuple(self), *map(self.reflected, self.rotate(4)[1::2])])
 
 
 class _NWSWReflectDiagonal(OrthNapkin):
     neighborhoods = vonNeumann, Moore
     fallback = NoSymmetry
+    by_index = True
 
     @property
     def expanded(self):
-        rot = self.rotate_by(len(self) // 4)
-        return sorted([tuple(self), (rot[0], *rot[:0:-1])])
+        return sorted([tuple(self), self.reflected(self.rotate_by(len(self) // 4))])
 
 
 class _SENEReflectDiagonal(OrthNapkin):
     neighborhoods = vonNeumann, Moore
     fallback = NoSymmetry
+    by_index = True
 
     @property
     def expanded(self):
-        rot = self.rotate_by(-len(self) // 4)
-        return sorted([tuple(self), (rot[0], *rot[:0:-1])])
+        return sorted([tuple(self), self.reflected(self.rotate_by(-len(self) // 4))])
 
 
 globals()['\\ReflectDiagonal'] = _NWSWReflectDiagonal
@@ -55,6 +57,7 @@ class Rotate2(OrthNapkin):
     """
     neighborhoods = range(2, 9)  # neighborhood of size 1 can't be rotated by 2
     fallback = {Any: NoSymmetry, hexagonal: Rotate2}  # the Rotate2 is Golly's, not this one
+    by_index = True
     
     @property
     def expanded(self):
@@ -88,20 +91,22 @@ class AlternatingPermute(ExplicitPermute):
     
     In vonNeumann neighborhood, permutes between opposing cells.
     """
-    RECENTS = {}
-    HASHES = {}
+    RECENTS = OrderedDict()
     neighborhoods = Any
     fallback = {Any: Rotate4Reflect, hexagonal: NoSymmetry}
     
+    @staticmethod
+    def canonical_form(napkin):
+        return tuple(sorted(napkin[::2])), tuple(sorted(napkin[1::2]))
+    
     @LazyProperty
     def expanded(self):
-        t = orth, diag = map(tuple, map(sorted, (self[::2], self[1::2])))
-        if t in self.RECENTS:
-            self._hash = self.HASHES[t]
-            return self.RECENTS[t]
-        self.RECENTS[t] = ret = [tuple(chain.from_iterable(zip(i, j))) for i in permutations(orth) for j in permutations(diag)]
-        self.HASHES[t] = self._hash = hash(tuple(sorted(ret)))
-        return ret
+        orth, diag = self.canonical
+        return self.recent(self.canonical, lambda: [
+          tuple(chain.from_iterable(zip(i, j)))
+          for i in multiset_permutations(orth)
+          for j in list(multiset_permutations(diag))
+          ])
     
     @staticmethod
     def special(values, length):
@@ -3,21 +3,48 @@ from contextlib import suppress
 from nutshell.cli import cli
 
 
-def _handle_rule(rulefile, include_header, seg):
+def _handle_rule(include_header, seg):
     """
-    rulefile: stream to write to
     include_header: whether to include the compiled-by header or not
     seg: @RULE-segment data as a list of lines
 
-    Writes @RULE segment to output stream
+    Yields @RULE segment's lines
     """
     if seg is None:
         return
-    name = seg.pop(0)
-    rulefile.append(f'@RULE {name}')
+    name, *lines = seg
+    yield f'@RULE {name}'
     if include_header:
-        rulefile.append(cli.result.transpile.header)
-    rulefile.extend(seg)
+        yield cli.result.transpile.header
+    yield from lines
+
+
+def _iter_lines(parsed):
+    parsed = dict(parsed)
+    if '@TABLE' in parsed and cli.result.transpile.format == 'tree':
+        # (built before the first line's yielded, since it can turn out too big
+        # to -- though by then a caller may have opened the file it's writing to)
+        parsed['@TABLE'] = parsed['@TABLE'].tree()
+    with suppress(KeyError):
+        yield from _handle_rule('@NUTSHELL' in parsed, parsed.pop('@NUTSHELL', parsed.pop('@RULE', None)))
+    for label, segment in parsed.items():
+        if label == '@TABLE' and cli.result.transpile.format == 'tree':
+            yield from ('', '@TREE')
+            yield from segment
+            continue
+        yield from ('', label)
+        yield from segment
+
+
+def close(parsed):
+    """
+    parsed: dict of operated-upon segments from Nutshell file
+    Frees anything they hold on to for compiling (i.e. @TABLE's spooled
+    transitions), once that's been done for the last time
+    """
+    for segment in parsed.values():
+        if hasattr(segment, 'close'):
+            segment.close()
 
 
 def compile(parsed):
@@ -25,9 +52,13 @@ def compile(parsed):
     parsed: dict of operated-upon segments from Nutshell file
     return: text of Golly table compiled from the above
     """
-    rulefile = []
-    with suppress(KeyError):
-        _handle_rule(rulefile, '@NUTSHELL' in parsed, parsed.pop('@NUTSHELL', parsed.pop('@RULE', None)))
-    for label, segment in parsed.items():
-        rulefile.extend(('', label, *segment))
-    return '\n'.join(rulefile) + '\n'
+    return '\n'.join(_iter_lines(parsed)) + '\n'
+
+
+def write(parsed, fp):
+    """
+    parsed: dict of operated-upon segments from Nutshell file
+    fp: text stream to write the Golly table compiled from the above to,
+        line by line (so that the whole thing never has to be in memory)
+    """
+    fp.writelines(f'{line}\n' for line in _iter_lines(parsed))
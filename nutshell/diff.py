@@ -0,0 +1,308 @@
+"""
+Checks whether two compiled rule tables behave the same -- that is, whether
+they take every neighborhood to the same state, whatever their text.
+
+Each table is read back from its .rule file, and each of its lines expanded
+into its symmetric variants, which are then matched against a whole batch of
+neighborhoods (as a NumPy array with a row per neighborhood) at once. Where
+there are few enough neighborhoods, every one is checked -- or rather one
+from each class of ones that both tables' symmetries treat the same, unless
+either table has a line whose resultant is bound to a cell (since then which
+state a neighborhood goes to depends on which variant of that line matches
+it first, which its symmetries don't keep the same); where there are too
+many, a seeded random sample is. Needs NumPy, which Nutshell otherwise
+doesn't.
+"""
+from contextlib import nullcontext
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from nutshell.segment_types.table import _symutils as symutils
+from nutshell.segment_types.table._napkins import multiset_permutations, permuter
+from nutshell.segment_types.table.table import TableSegment
+
+# Tables with at most this many neighborhoods (before going by symmetry) are checked exhaustively
+EXHAUSTIVE_MAX = 1 << 24
+# How many neighborhoods to check at a time
+BATCH_SIZE = 1 << 16
+
+
+class _Variant:
+    """
+    One symmetric variant of a table line: the states allowed in each cell
+    (where that's not every state), the cells a repeated variable binds to
+    each other, and either the state it goes to or the cell whose state it
+    goes to.
+    """
+    __slots__ = 'checks', 'equal', 'resultant', 'to_cell'
+
+    def __init__(self, table, cells, resultant, bound):
+        self.checks, self.equal = [], []
+        first = {}  # {bound variable :: cell it first appears in}
+        for pos, token in enumerate(cells):
+            if token in first:
+                self.equal.append((first[token], pos))
+                continue
+            if token in bound:
+                first[token] = pos
+            if not table.takes_all(token):
+                self.checks.append((pos, table.allowed(token)))
+        self.to_cell = resultant in bound
+        self.resultant = first[resultant] if self.to_cell else int(resultant)
+
+    def matches(self, configs):
+        hit = np.ones(len(configs), dtype=bool)
+        for pos, allowed in self.checks:
+            hit &= allowed[configs[:, pos]]
+        for i, j in self.equal:
+            hit &= configs[:, i] == configs[:, j]
+        return hit
+
+
+class GollyTable:
+    """
+    The @TABLE of a .rule file (or of `lines` of one, if given, in which
+    case `path` only names it), with its lines (line number in the file and
+    text) in order, which can say what state each of a batch of
+    neighborhoods goes to and which line decided it.
+    """
+    def __init__(self, path, lines=None):
+        self.path = path
+        directives, variables, self.lines, transitions = {}, {}, [], []
+        with open(path) if lines is None else nullcontext(lines) as f:
+            lines = enumerate(f, 1)
+            if next((True for _, line in lines if line.strip() == '@TABLE'), None) is None:
+                raise ValueError(f'No @TABLE in {path}')
+            for lno, line in lines:
+                text = line.split('#', 1)[0].strip()
+                if text.startswith('@'):
+                    break
+                if not text:
+                    continue
+                if text.startswith('var '):
+                    name, _, value = text[4:].partition('=')
+                    states = set()
+                    for item in value.strip().strip('{}').split(','):
+                        item = item.strip()
+                        states.update(variables[item] if item in variables else [int(item)])
+                    variables[name.strip()] = frozenset(states)
+                elif ':' in text:
+                    key, _, value = text.partition(':')
+                    directives[key.strip()] = value.strip()
+                else:
+                    self.lines.append((lno, text))
+                    transitions.append(list(map(str.strip, text.split(','))) if ',' in text else list(text))
+        self.n_states = int(directives.get('n_states', directives.get('num_states', 2)))
+        self.neighborhood = directives.get('neighborhood', 'Moore')
+        self.symmetries = directives.get('symmetries', 'none')
+        if self.neighborhood not in TableSegment.TRLENS:
+            raise ValueError(f'Unknown neighborhood {self.neighborhood!r} in {path}')
+        self.trlen = TableSegment.TRLENS[self.neighborhood]
+        try:
+            self.sym_type = symutils.get_sym_type(self.symmetries)
+        except ImportError:
+            raise ValueError(f'Unknown symmetries {self.symmetries!r} in {path}')
+        self._allowed, self._masks = {}, {}
+        for (lno, text), tokens in zip(self.lines, transitions):
+            if len(tokens) != self.trlen + 2:
+                raise ValueError(f'{path}, line {lno}: expected {self.trlen + 2} states, got {len(tokens)}')
+            for token in tokens:
+                if token not in self._allowed:
+                    if token not in variables and not token.isdigit():
+                        raise ValueError(f'{path}, line {lno}: unknown variable {token!r}')
+                    self._allowed[token] = variables[token] if token in variables else frozenset([int(token)])
+            if not tokens[-1].isdigit() and tokens[-1] not in tokens[:-1]:
+                raise ValueError(f'{path}, line {lno}: resultant {tokens[-1]!r} is not bound to any cell')
+        self._transitions = transitions
+        self.binds_resultant = any(not tokens[-1].isdigit() for tokens in transitions)
+        self._variants = [None] * len(transitions)
+
+    def allowed(self, token):
+        """Array of whether each state is allowed by `token`, indexed by state"""
+        if token not in self._masks:
+            allowed = np.zeros(self.n_states, dtype=bool)
+            allowed[[state for state in self._allowed[token] if 0 <= state < self.n_states]] = True
+            self._masks[token] = allowed
+        return self._masks[token]
+
+    def takes_all(self, token):
+        return self._allowed[token].issuperset(range(self.n_states))
+
+    def variants(self, idx):
+        """The distinct symmetric variants of the line at `idx`, each as a _Variant"""
+        if self._variants[idx] is None:
+            tokens = self._transitions[idx]
+            bound = {token for token in tokens if not token.isdigit() and tokens.count(token) > 1}
+            # (variables that aren't bound are only told apart by their states, so
+            # that lines like `0, a.0, a.1, ...` don't give every arrangement of them)
+            center, *napkin, resultant = [token if token in bound else self._by_states(token) for token in tokens]
+            perms = symutils.variant_permutations(self.sym_type, self.trlen)
+            if perms is None:
+                arrangements = multiset_permutations(napkin)
+            else:
+                arrangements = dict.fromkeys(tuple(permuter(perm)(napkin)) for perm in perms)
+            self._variants[idx] = [_Variant(self, (center, *arrangement), resultant, bound) for arrangement in arrangements]
+        return self._variants[idx]
+
+    def _by_states(self, token):
+        """A name for the states `token` allows, which can't be mistaken for a variable"""
+        if token.isdigit():
+            return token
+        name = ' ' + ','.join(map(str, sorted(self._allowed[token])))
+        self._allowed[name] = self._allowed[token]
+        return name
+
+    def evaluate(self, configs):
+        """
+        (the state each of `configs` -- an array with a row of states per
+        neighborhood, center first -- goes to, and the index in self.lines
+        of the line that decided it, or -1 if none did and it stays as is)
+        """
+        results, decided_by = configs[:, 0].copy(), np.full(len(configs), -1)
+        # {center state :: (the neighborhoods with it that no line has matched yet, their rows in configs)}
+        # so that each line only has to look at the ones whose center it could match
+        pending = {}
+        for center in np.unique(configs[:, 0]).tolist():
+            rows = np.nonzero(configs[:, 0] == center)[0]
+            pending[center] = rows, configs[rows]
+        for idx, (center_token, *_) in enumerate(self._transitions):
+            if not pending:
+                break
+            centers = self.allowed(center_token)
+            for center, (rows, rest) in list(pending.items()):
+                if center >= len(centers) or not centers[center]:
+                    continue
+                unmatched = np.ones(len(rows), dtype=bool)
+                for variant in self.variants(idx):
+                    hit = variant.matches(rest) & unmatched
+                    if hit.any():
+                        results[rows[hit]] = rest[hit, variant.resultant] if variant.to_cell else variant.resultant
+                        unmatched &= ~hit
+                if unmatched.all():
+                    continue
+                decided_by[rows[~unmatched]] = idx
+                if unmatched.any():
+                    pending[center] = rows[unmatched], rest[unmatched]
+                else:
+                    del pending[center]
+        return results, decided_by
+
+    def sample(self, n, rng):
+        """
+        `n` neighborhoods that some line or other matches, each fit to a
+        random line and arranged by a random one of the table's symmetries
+        """
+        configs = np.empty((n, self.trlen + 1), dtype=np.int64)
+        picks = rng.integers(len(self._transitions), size=n)
+        for idx in np.unique(picks):
+            rows = np.nonzero(picks == idx)[0]
+            tokens = self._transitions[idx][:-1]
+            for pos, token in enumerate(tokens):
+                if token in tokens[:pos]:
+                    configs[rows, pos] = configs[rows, tokens.index(token)]
+                else:
+                    states = np.nonzero(self.allowed(token))[0]
+                    configs[rows, pos] = rng.choice(states, size=len(rows)) if len(states) else self.n_states
+        perms = symutils.variant_permutations(self.sym_type, self.trlen)
+        if perms is None:
+            configs[:, 1:] = rng.permuted(configs[:, 1:], axis=1)
+        else:
+            perms = np.array(perms)[rng.integers(len(perms), size=n)]
+            configs[:, 1:] = np.take_along_axis(configs[:, 1:], perms, axis=1)
+        return configs
+
+
+def every_neighborhood(n_states, trlen, perms):
+    """
+    Yields batches of every neighborhood, but only the first (by its states)
+    in each class of ones that the napkin permutations `perms` (or every
+    permutation, if None) rearrange into each other
+    """
+    place_values = n_states ** np.arange(trlen, -1, -1, dtype=np.int64)
+    total = n_states ** (trlen + 1)
+    for start in range(0, total, BATCH_SIZE):
+        configs = np.arange(start, min(total, start + BATCH_SIZE))[:, None] // place_values % n_states
+        napkins = configs[:, 1:]
+        if perms is None:
+            first = (napkins[:, :-1] <= napkins[:, 1:]).all(axis=1)
+        elif len(perms) > 1:
+            codes = napkins[:, np.array(perms)] @ place_values[1:]
+            first = codes.min(axis=1) == napkins @ place_values[1:]
+        else:
+            first = slice(None)
+        yield configs[first]
+
+
+def random_neighborhoods(tables, n_states, trlen, n, rng):
+    """
+    Yields batches of `n` random neighborhoods in all: half of them entirely
+    random, and half fit to lines of one table or the other (since the
+    neighborhoods a given line matches may be very few of the whole lot)
+    """
+    for start in range(0, n, BATCH_SIZE):
+        size = min(BATCH_SIZE, n - start)
+        configs = [rng.integers(n_states, size=(size - size // 2, trlen + 1))]
+        for i, table in enumerate(tables):
+            share = size // 2 // len(tables) + (i < size // 2 % len(tables))
+            if share and table.lines:
+                configs.append(table.sample(share, rng))
+        configs = np.concatenate(configs)
+        # (leaving out any with states the other table doesn't have)
+        yield configs[(configs < n_states).all(axis=1)]
+
+
+def _describe(table, result, decided_by):
+    if decided_by < 0:
+        return f'  {table.path}: {result} (no line matches)'
+    lno, text = table.lines[decided_by]
+    return f'  {table.path}: {result} (line {lno}: {text})'
+
+
+def run(args):
+    """
+    Yields lines describing the neighborhoods that args.before and
+    args.after's @TABLEs take to different states (up to args.show of
+    them) and how many were checked, then exits with status 1 if there
+    were any
+    """
+    if np is None:
+        raise SystemExit('nutshell-ca diff needs NumPy (e.g. `pip install numpy`)')
+    try:
+        tables = GollyTable(args.before), GollyTable(args.after)
+    except (OSError, ValueError) as e:
+        raise SystemExit(str(e))
+    a, b = tables
+    if a.neighborhood != b.neighborhood:
+        raise SystemExit(f'Different neighborhoods: {a.neighborhood} in {a.path}, {b.neighborhood} in {b.path}')
+    n_states, trlen = min(a.n_states, b.n_states), a.trlen
+    if a.n_states != b.n_states:
+        yield f'Different numbers of states ({a.n_states} in {a.path}, {b.n_states} in {b.path}); only checking the first {n_states}'
+    if n_states ** (trlen + 1) <= EXHAUSTIVE_MAX:
+        if a.binds_resultant or b.binds_resultant:
+            batches = every_neighborhood(n_states, trlen, [tuple(range(trlen))])
+            checked_what = 'every neighborhood, as some resultant is bound to a cell'
+        else:
+            common = symutils.find_min_sym_type([a.sym_type, b.sym_type], trlen)
+            name = next(name for name, cls in symutils.NAMES.items() if cls is common)
+            batches = every_neighborhood(n_states, trlen, symutils.variant_permutations(common, trlen))
+            checked_what = 'every neighborhood' if name == 'none' else f'every neighborhood, up to {name} symmetry'
+    else:
+        batches = random_neighborhoods(tables, n_states, trlen, args.samples, np.random.default_rng(args.seed))
+        checked_what = f'random sample, seed {args.seed}'
+    checked = differing = 0
+    for configs in batches:
+        (result_a, by_a), (result_b, by_b) = a.evaluate(configs), b.evaluate(configs)
+        different = np.nonzero(result_a != result_b)[0]
+        for i in different[:max(0, args.show - differing)]:
+            yield f"{', '.join(map(str, configs[i]))}:"
+            yield _describe(a, result_a[i], by_a[i])
+            yield _describe(b, result_b[i], by_b[i])
+        checked += len(configs)
+        differing += len(different)
+    if differing:
+        yield f'{differing} of {checked} neighborhoods checked ({checked_what}) differ'
+        raise SystemExit(1)
+    yield f'No differences in {checked} neighborhoods checked ({checked_what})'
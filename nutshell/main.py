@@ -1,44 +1,261 @@
 """Facilitates conversion of a nutshell file into a Golly-compatible .rule file."""
+import json
 import os
 import sys
+import time
+from contextlib import contextmanager, redirect_stdout, suppress
 from inspect import cleandoc
+from io import StringIO
+from itertools import chain
 
 from ergo.misc import ErgoNamespace
 
-from nutshell import segmentor, compiler, tools
-from nutshell.common.utils import printq
+from nutshell import segmentor, compiler
+from nutshell.common.utils import RAND_SEED, printq, random
 from nutshell.common.errors import NutshellException
-from nutshell.cli import cli
+from nutshell.cli import cli, parse_transition
 
 
-def transpile(fp, *, find=None):
+def _parse(fp, *, find=None, dependencies=None):
+    printq('\nParsing...')
+    # (all a search needs is the @TABLE segment)
+    parsed = segmentor.parse(fp, only=['@TABLE'] if find else None)
+    if find:
+        try:
+            print(parsed['@TABLE'].match(find) + '\n')
+        finally:
+            compiler.close(parsed)
+        return None
+    if dependencies is not None:
+        dependencies.update(getattr(parsed.get('@TABLE'), 'dependencies', ()))
+    printq('Complete!', 'Compiling...', sep='\n\n')
+    return parsed
+
+
+def _find_all(fp, queries, fname):
+    """
+    Searches the table in `fp` for each transition in `queries` (one per
+    line; blank lines and #comments are skipped), printing each one's
+    result as a line of JSON. The table is parsed and indexed only once,
+    and only the results go to stdout, so they can be piped elsewhere.
+    """
+    with redirect_stdout(sys.stderr):
+        printq('\nParsing...')
+        table = segmentor.parse(fp, only=['@TABLE'])['@TABLE']
+        printq('Complete!\n\nSearching for matches...')
+    try:
+        for lno, line in enumerate(queries, 1):
+            query = line.split('#', 1)[0].strip()
+            if not query:
+                continue
+            result = {'file': fname, 'query_line': lno, 'query': query}
+            try:
+                result.update(table.search(parse_transition(query)))
+            except ValueError as e:
+                result['error'] = str(e)
+            except NutshellException as e:
+                result['error'] = e.msg
+            print(json.dumps(result), flush=True)
+    finally:
+        table.close()
+
+
+def transpile(fp, *, find=None, dependencies=None):
     """
     Performs the parsing process from start to finish
+    (If given a set as `dependencies`, adds to it the paths of any
+    external files -- macros, symmetry types, &c -- the rule pulled in)
     """
-    printq('\nParsing...')
-    parsed = segmentor.parse(fp)
+    parsed = _parse(fp, find=find, dependencies=dependencies)
+    if parsed is None:
+        return None
+    try:
+        return compiler.compile(parsed)
+    finally:
+        compiler.close(parsed)
+
+
+def _transpile_cached(src, cache_dir, dependencies):
+    from nutshell import cache
+    key = cache.make_key(src)
+    cached = cache.lookup(cache_dir, key)
+    if cached is not None:
+        printq('\nUnchanged since last compiled; using cached output')
+        finished, paths = cached
+        dependencies.update(paths)
+        return finished
+    finished = transpile(StringIO(src), dependencies=dependencies)
+    cache.store(cache_dir, key, finished, dependencies)
+    return finished
+
+
+@contextmanager
+def _replacing(path):
+    """
+    Opens a file to write `path`'s new contents to, which only takes its
+    place once they've been written in full (so that an error partway
+    through leaves whatever was there before alone)
+    """
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'x') as fp:
+            yield fp
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _transpile_file(infile, args, dependencies=None, src=None):
+    find, find_file, cache_dir = args._.get('find'), args._.get('find-file'), args._.get('cache')
+    if src is None and infile == '-':
+        src = sys.stdin.read()
+    elif src is None:
+        with open(infile) as infp:
+            src = infp.read()
+    # Every file starts from the same RNG state, so its output doesn't
+    # depend on what else was transpiled before it (or in what process)
+    random.seed(RAND_SEED)
+    fname = os.path.split(infile)[-1].split('.')[0]
+    outdirs = args._.get('outdirs', ())
     if find:
-        print(parsed['@TABLE'].match(find) + '\n')
+        _parse(StringIO(src), find=find)
         return
-    printq('Complete!', 'Compiling...', sep='\n\n')
-    return compiler.compile(parsed)
+    if find_file is not None:
+        if find_file == '-':
+            if infile == '-':
+                raise SystemExit('Cannot read both the rule and the transitions to find from stdin')
+            _find_all(StringIO(src), sys.stdin, infile)
+            return
+        with open(find_file) as queries:
+            _find_all(StringIO(src), queries, infile)
+        return
+    if cache_dir is None and '-' not in outdirs:
+        # Written straight from the parsed segments, so that a huge table
+        # never has to exist as a single string
+        parsed = _parse(StringIO(src), dependencies=dependencies)
+        try:
+            for directory in outdirs:
+                path = f'{os.path.join(directory, fname)}.rule'
+                with _replacing(path) as outfp:
+                    compiler.write(parsed, outfp)
+                yield ('Complete!', '', f'Created {os.path.realpath(path)}')
+        finally:
+            compiler.close(parsed)
+        return
+    if cache_dir is None:
+        finished = transpile(StringIO(src), dependencies=dependencies)
+    else:
+        finished = _transpile_cached(src, cache_dir, set() if dependencies is None else dependencies)
+    for directory in outdirs:
+        if directory == '-':
+            yield finished.splitlines()
+            continue
+        path = f'{os.path.join(directory, fname)}.rule'
+        with _replacing(path) as outfp:
+            outfp.write(finished)
+        yield ('Complete!', '', f'Created {os.path.realpath(path)}')
+
+
+def _init_worker(options):
+    # A spawned worker starts out with an unprepared CLI (so cli.result is just
+    # the defaults), while a forked one inherits the parent's parsed result;
+    # either way, it needs the parent's options and shouldn't print progress
+    cli.set_defaults(quiet=True)
+    cli.commands['transpile'].set_defaults(**options)
+    cli.result.quiet = True
+
+
+def _transpile_job(infile, args, src):
+    try:
+        return list(_transpile_file(infile, args, src=src)), None
+    except NutshellException as e:
+        # (the exception itself doesn't survive pickling intact)
+        return [], e.code
+
+
+def _transpile_parallel(args, jobs):
+    """
+    Fans args.infiles out to a pool of `jobs` processes, yielding each
+    file's messages as soon as that file is done.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from nutshell.cache import OUTPUT_OPTIONS
+    # (the same options that go into a cached rule's key, since they're what changes the output)
+    options = {name: getattr(cli.result.transpile, name) for name in OUTPUT_OPTIONS}
+    job_args = ErgoNamespace(outdirs=args._.get('outdirs', ()), cache=args._.get('cache'))
+    stdin = sys.stdin.read() if '-' in args.infiles else None
+    with ProcessPoolExecutor(min(jobs, len(args.infiles)), initializer=_init_worker, initargs=(options,)) as pool:
+        futures = [
+          pool.submit(_transpile_job, infile, job_args, stdin if infile == '-' else None)
+          for infile in args.infiles
+          ]
+        for future in as_completed(futures):
+            messages, error = future.result()
+            if error is not None:
+                for i in futures:
+                    i.cancel()
+                raise SystemExit(error)
+            yield from messages
 
 
 def _transpile(args):
+    jobs = args._.get('jobs') or 1
+    if jobs > 1 and len(args.infiles) > 1 and not args._.get('find') and not args._.get('find-file'):
+        yield from _transpile_parallel(args, jobs)
+        return
     for infile in args.infiles:
-        if infile == '-':
-            finished = transpile(sys.stdin.read().splitlines(True), find=args.find)
-        else:
-            with open(infile) as infp:
-                finished = transpile(infp, find=args.find)
-        fname = os.path.split(infile)[-1].split('.')[0]
-        for directory in args._.get('outdirs', ()):
-            if directory == '-':
-                yield finished.splitlines()
-                continue
-            with open(f'{os.path.join(directory, fname)}.rule', 'w') as outfp:
-                outfp.write(finished)
-                yield ('Complete!', '', f'Created {os.path.realpath(outfp.name)}')
+        yield from _transpile_file(infile, args)
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _watch(args):
+    """
+    Transpiles args.infiles, then keeps polling them (and the files
+    they import) for changes and transpiling them again as needed.
+    Everything happens in this one process so that the parser, imported
+    modules, and per-line expansion cache stay warm between edits.
+    """
+    from nutshell.segment_types.table.table import TableSegment
+    infiles = [i for i in args.infiles if i != '-']
+    dependencies = {infile: set() for infile in infiles}
+    last_seen = {}
+    try:
+        while True:
+            mtimes = {path: _mtime(path) for path in chain(infiles, *dependencies.values())}
+            changed = {path for path, mtime in mtimes.items() if mtime != last_seen.get(path)}
+            for path in changed.difference(infiles):
+                try:
+                    TableSegment.reload_dependency(path)
+                except Exception as e:
+                    print(f'\nCould not reload {path}: {type(e).__name__}: {e}', file=sys.stderr)
+            for infile in infiles:
+                if mtimes[infile] is None or changed.isdisjoint([infile, *dependencies[infile]]):
+                    continue
+                new_dependencies = set()
+                try:
+                    yield from _transpile_file(infile, args, new_dependencies)
+                except NutshellException as e:
+                    print(e.code, file=sys.stderr)
+                    continue
+                except Exception as e:
+                    # (e.g. an unknown symmetry type, or the file deleted just after it was polled)
+                    print(f'\n{infile}: {type(e).__name__}: {e}', file=sys.stderr)
+                    continue
+                dependencies[infile] = new_dependencies
+                for path in new_dependencies:
+                    mtimes.setdefault(path, _mtime(path))
+            last_seen = mtimes
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        return
 
 
 def write_rule(**kwargs):
@@ -47,6 +264,10 @@ def write_rule(**kwargs):
 
 
 def _main():
+    # nutshell.tools registers the `icon` subcommands when imported, so it
+    # only needs to be loaded if one of those is what's being run
+    if next((i for i in sys.argv[1:] if not i.startswith('-')), None) in ('icon', 'i'):
+        from nutshell import tools
     inp = cli \
       .prepare(strict=True, propagate_unknowns=True) \
       .set_defaults(quiet=False) \
@@ -55,6 +276,23 @@ def _main():
         return
     if 'transpile' in inp:
         res = _transpile(inp.transpile)
+    elif 'watch' in inp:
+        # (everything downstream reads its formatting options from here)
+        inp.transpile = inp.watch
+        res = _watch(inp.watch)
+    elif 'simulate' in inp:
+        from nutshell import simulate
+        # (the table's compiled with transpile's defaults, bar -p and -o)
+        inp.transpile = cli.commands['transpile'].defaults
+        inp.transpile.prune_shadowed, inp.transpile.optimize = inp.simulate.prune_shadowed, inp.simulate.optimize
+        for line in simulate.run(inp.simulate):
+            print(line, flush=True)
+        return
+    elif 'diff' in inp:
+        from nutshell import diff
+        for line in diff.run(inp.diff):
+            print(line, flush=True)
+        return
     elif 'icon' in inp:
         res = tools.dispatch(inp.icon)
     for val in res:
@@ -1,4 +1,23 @@
-from .colors import ColorSegment
-from .icons import IconSegment
-from .table import TableSegment
-from .nutshell import NutshellSegment
+"""
+Segment converters. Each is only imported once something asks for it,
+so that e.g. a rule with no @TABLE never loads the table parser.
+"""
+from importlib import import_module
+
+_SUBMODULES = {
+  'ColorSegment': 'colors',
+  'IconSegment': 'icons',
+  'TableSegment': 'table',
+  'NutshellSegment': 'nutshell',
+  }
+
+
+def __getattr__(name):
+    if name not in _SUBMODULES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = globals()[name] = getattr(import_module(f'.{_SUBMODULES[name]}', __name__), name)
+    return value
+
+
+def __dir__():
+    return [*globals(), *_SUBMODULES]
@@ -21,20 +21,31 @@ class IShouldntHaveToDoThisBidict(bidict.bidict):
 class Icon:
     _rRUNS = re.compile(r'(\d*)([$.A-Z]|[p-y][A-O])')
     
-    def __init__(self, rle, height, x, y):
+    def __init__(self, rows, height):
+        """
+        rows: the icon's pixels, as decoded by Icon.decode()
+        """
         if height not in (7, 15, 31):
             raise ValueError(f"Need to declare valid height (not '{height!r}')")
         self.height = height
         self._fill = ['..' * height]
-        self._rle = rle
-        _split = ''.join(
+        self._split = rows
+        self.ascii = self._pad()
+    
+    @classmethod
+    def decode(cls, rle, x, y):
+        """
+        Expands an RLE pattern x cells wide and y tall into rows
+        of two-character pixels, each padded out to the full width
+        """
+        split = ''.join(
           maybe_double(val) * int(run_length or 1)
           for run_length, val in
-            self._rRUNS.findall(self._rle)
+            cls._rRUNS.findall(rle)
           ).split('$$')
-        self._split = [i + '..' * (x - len(i) // 2) for i in _split]
-        self._split += repeat('..'*x, y-len(_split))
-        self.ascii = self._pad()
+        split = [i + '..' * (x - len(i) // 2) for i in split]
+        split += repeat('..'*x, y-len(split))
+        return split
     
     def __iter__(self):
         yield from self.ascii
@@ -62,7 +73,7 @@ class IconSegment:
     _rDIMS = re.compile(r'\s*x\s*=\s*(\d+),\s*y\s*=\s*(\d+)')
     _rCOLOR = re.compile(r'(\d+:\s*|[.A-Z]\s+|[p-y][A-O]\s+)(\d{0,3}\s+\d{0,3}\s+\d{0,3}|[0-9A-Fa-f]{6}|[0-9A-Fa-f]{3}).*')
     
-    def __init__(self, segment, start=0, *, dep: ['@COLORS', '@TABLE', '@NUTSHELL'] = (None, None, None)):
+    def __init__(self, segment, start=0, *, dep: ['@COLORS', '@TABLE', '@NUTSHELL'] = (None, None, None), prepared=None):
         self._src = segment
         self._set_states = None
         self._fill_gradient = None
@@ -74,16 +85,38 @@ class IconSegment:
         self._color_segment = None if isinstance(_colors, list) else _colors
         self._nutshell = _nutshell
         
-        self.colormap, _start_state_def = self._parse_colors()
-        self._states, self._comments, dims = self._sep_states(_start_state_def)
+        # (the segmentor normally does this part in the background while
+        # @TABLE is still being parsed)
+        if prepared is None:
+            prepared = self.prepare(segment, start)
+        self.colormap, gradient, blocks = prepared
+        if gradient is not None:
+            # Can put n_states in brackets if no TABLE section to grab it from
+            set_states, start_color, end_color = gradient
+            self._set_states = self._n_states if set_states is None else set_states
+            # Construct ColorRange from states and start/end values
+            self._fill_gradient = ColorRange(int(self._set_states), start_color, end_color)
+        self._states, self._comments, dims, rows = self._sep_states(blocks)
         
         self.set_height(dims.values())
         self.icons = {
-          state: list(Icon(''.join(rle), self._height, *dims[state]))
+          state: list(Icon(rows[state] or Icon.decode(''.join(rle), *dims[state]), self._height))
           for state, rle in self._states.items()
           }
         self._fill_missing_states()
     
+    @classmethod
+    def prepare(cls, segment, start=0):
+        """
+        The part of parsing @ICONS that doesn't need any other segment:
+        reading its colors, and splitting out & decoding each icon
+        before it's known which states (or vars) it's for
+        
+        return: (colormap, gradient, icon blocks) to pass to the constructor
+        """
+        colormap, gradient, start_state_def = cls._parse_colors(segment)
+        return colormap, gradient, cls._split_icons(segment, start_state_def)
+    
     def __iter__(self):
         preserve_comments = cli.result.transpile.preserve_comments
         yield 'XPM'
@@ -110,22 +143,21 @@ class IconSegment:
             name = ''.join(random.sample(SAFE_CHARS, 2))
         return name
     
-    def _parse_colors(self, start=1):
+    @classmethod
+    def _parse_colors(cls, src, start=1):
         colormap = IShouldntHaveToDoThisBidict()
+        gradient = None
         lno = start
         last_valid_lno = start
-        for lno, line in enumerate((i.split('#')[0].strip() for i in self._src), 1):
+        for lno, line in enumerate((i.split('#')[0].strip() for i in src), 1):
             if line.startswith('?'):
-                # Can put n_states in brackets if no TABLE section to grab it from
                 pre, *post = map(str.strip, line.split('[', 1))
                 # Below *_ allows for an arbitrary separator like `000 ... FFF` between the two colors
                 _, start, *_, end = pre.split()
                 # If available, get n_states from said n_states-containing [comment]
-                self._set_states = int(post[0].strip(']').strip()) if post else self._n_states
-                # Construct ColorRange from states and start/end values
-                self._fill_gradient = ColorRange(int(self._set_states), start.upper(), end.upper())
+                gradient = int(post[0].strip(']').strip()) if post else None, start.upper(), end.upper()
                 continue
-            match = self._rCOLOR.match(line)
+            match = cls._rCOLOR.match(line)
             if match is None:
                 if line:
                     break
@@ -133,14 +165,18 @@ class IconSegment:
             last_valid_lno = lno
             state, color = match[1].strip().strip(':'), match[2].upper()
             colormap[SYMBOL_MAP[int(state)] if state.isdigit() else maybe_double(state)] = ColorMixin.pack(color).upper()
-        return colormap, last_valid_lno
+        return colormap, gradient, last_valid_lno
     
-    def _sep_states(self, start) -> dict:
-        states, comments, dims = {}, {}, {}
-        cur_states, cur_comments = set(), []
-        last_comment, last_comment_lno = None, 0
-        replace_constants = (lambda x: x) if self._nutshell is None else self._nutshell.replace_line
-        for lno, line in enumerate(map(str.strip, self._src[start-1:]), start):
+    @classmethod
+    def _split_icons(cls, src, start):
+        """
+        return: list of each icon's (header lno, header comment, comments
+        above header, RLE lines, dimensions, decoded pixels or None)
+        """
+        blocks = []
+        cur_comments, cur_lines = [], None
+        last_comment_lno = 0
+        for lno, line in enumerate(map(str.strip, src[start-1:]), start):
             if not line:
                 continue
             if line.startswith('#'):
@@ -148,31 +184,56 @@ class IconSegment:
                 last_comment_lno = lno
                 continue
             if last_comment_lno:
-                *cur_comments, last_comment = cur_comments
-                cur_states = set()
-                for word in multisplit(replace_constants(last_comment), (None, ',')):
-                    if word.isdigit():
-                        state = int(word)
-                        if not 0 < state < 256:
-                            raise Error(last_comment_lno, f'Icon declared for invalid state {state}')
-                        if state in states:
-                            raise Error(last_comment_lno, f'State {state} has already been assigned an icon')
-                        cur_states.add(state)
-                    elif word in self._vars:
-                        cur_states.update(self._vars[word])
-                    elif TableRange.check(word):
-                        cur_states.update(TableRange(word))
-                last_comment_lno = 0
-            if cur_states:
-                line = line.translate(TWO_STATE)
-                for state in cur_states:
-                    states.setdefault(state, []).append(line)
-                    comments.setdefault(state, []).extend(cur_comments)
+                *comments, header = cur_comments
+                cur_lines = []
+                blocks.append((last_comment_lno, header, comments, cur_lines))
                 cur_comments = []
+                last_comment_lno = 0
+            if cur_lines is not None:
+                cur_lines.append(line.translate(TWO_STATE))
+        decoded = []
+        for header_lno, header, comments, (dims_line, *rle) in blocks:
+            dims = list(map(int, chain.from_iterable(cls._rDIMS.findall(dims_line))))
+            rows = Icon.decode(''.join(rle), *dims) if len(dims) == 2 else None
+            decoded.append((header_lno, header, comments, [dims_line, *rle], dims, rows))
+        return decoded
+    
+    def _sep_states(self, blocks) -> dict:
+        states, comments, dims, rows = {}, {}, {}, {}
+        cur_comments = []
+        replace_constants = (lambda x: x) if self._nutshell is None else self._nutshell.replace_line
+        for header_lno, header, block_comments, block_lines, block_dims, block_rows in blocks:
+            cur_comments.extend(block_comments)
+            cur_states = set()
+            for word in multisplit(replace_constants(header), (None, ',')):
+                if word.isdigit():
+                    state = int(word)
+                    if not 0 < state < 256:
+                        raise Error(header_lno, f'Icon declared for invalid state {state}')
+                    if state in states:
+                        raise Error(header_lno, f'State {state} has already been assigned an icon')
+                    cur_states.add(state)
+                elif word in self._vars:
+                    cur_states.update(self._vars[word])
+                elif TableRange.check(word):
+                    cur_states.update(TableRange(word))
+            if not cur_states:
+                # (its comments then carry over to the next icon)
+                continue
+            for state in cur_states:
+                if state in states:
+                    # A var or range overlapped an earlier icon's states, so
+                    # this state's lines run on from that one's and have to
+                    # be decoded together
+                    rows[state] = None
+                else:
+                    dims[state], rows[state] = block_dims, block_rows
+                states.setdefault(state, []).extend(block_lines)
+                comments.setdefault(state, []).extend(cur_comments)
+            cur_comments = []
         for state, rle in states.items():
             states[state] = rle[1:]
-            dims[state] = list(map(int, chain.from_iterable(self._rDIMS.findall(rle[0]))))
-        return states, comments, dims
+        return states, comments, dims, rows
     
     def _fill_missing_states(self):
         # Account for that some/all cellstates may be expressed as non-numeric symbols rather than their state's number
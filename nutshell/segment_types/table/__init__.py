@@ -1 +1,7 @@
-from .table import *
\ No newline at end of file
+def __getattr__(name):
+    # Importing .table pulls in the (large) parser, so don't do it just
+    # because something wanted one of this package's other submodules
+    if name != 'TableSegment':
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    from .table import TableSegment
+    return TableSegment
@@ -1,11 +1,13 @@
-from collections.abc import Iterable
+import threading
+from array import array
+from collections.abc import Iterable, MutableSequence
 from collections import defaultdict
 from contextlib import suppress
 from functools import partial
 from itertools import count, cycle
 
 from . import _neighborhoods as nbhds
-from nutshell.common.utils import random, distinct
+from nutshell.common.utils import random
 from nutshell.common.errors import *
 from .lark_assets.exceptions import *
 
@@ -86,6 +88,31 @@ class TransitionCRange(TRStateLocation):
               *range(1, 1+tbl.neighborhood[b])
               )
 
+def structure(term):
+    """
+    A hashable stand-in for an unexpanded transition term, equal between any
+    two terms that expand identically regardless of where each came from.
+    Raises TypeError if given something that can't be compared that way.
+    """
+    if term is None or term is Ellipsis or isinstance(term, (int, str)):
+        return term
+    if isinstance(term, StateList):
+        # (statelists never change once made, so this only has to be worked out once)
+        with suppress(AttributeError):
+            return term._structure
+        term._structure = (type(term), term.start, getattr(term, 'cdir', None), *map(structure, term._tuple))
+        return term._structure
+    if isinstance(term, VarValue):
+        return VarValue, structure(term.value), term.index
+    if isinstance(term, Mapping):
+        return Mapping, term.cdir, structure(term.map_to)
+    if isinstance(term, Binding):
+        return Binding, term.cdir
+    if isinstance(term, Operation):
+        return type(term), structure(term.a), structure(term.b)
+    raise TypeError(f'No structural equivalent for {term!r}')
+
+
 class TransitionGroup:
     def __init__(self, tbl, initial, napkin, resultant, *, context, extra=None, symmetries=None):
         if tbl.n_states < 2:
@@ -116,53 +143,114 @@ class TransitionGroup:
     def from_seq(cls, tr, tbl, **kwargs):
         return cls(tbl, tr[0], dict(enumerate(tr[1:-1], 1)), tr[-1], **kwargs)
     
+    def structure(self):
+        """
+        Everything this group's expansion depends on (when not expanded within
+        another transition), or None if some term can't be compared structurally
+        """
+        try:
+            return self.symmetries, tuple(map(structure, self._tr))
+        except TypeError:
+            return None
+    
     def expand(self, reference=None):
         if reference is None:
             reference = self
         if reference in self._expandeds:
             return self._expandeds[reference]
+        key = self.structure() if reference is self else None
+        if key in self.tbl.expanded_groups:
+            # Another group (from another line, another rulestring letter, or
+            # another branch of this same expansion) already resolved all of
+            # this one's bindings & mappings; only the context is different
+            return [
+              Transition(tr.tr, self.tbl, context=self.ctx, extra=self.extra, symmetries=self.symmetries)
+              for tr in self.tbl.expanded_groups[key]
+              ]
+        trs = self._expand(reference)
+        if key is not None:
+            self.tbl.expanded_groups[key] = trs
+        return trs
+    
+    def _branch(self, group, idx, value):
+        return TransitionGroup.from_seq(
+          [*group[:idx], value, *group[1+idx:]], self.tbl, context=self.ctx, extra=self.extra, symmetries=self.symmetries
+          )
+    
+    def _plan(self, reference):
+        """
+        Works out up front which terms this group has to be split up by,
+        and in what order those splits nest, before all of its terms can be
+        resolved. Each split is given as (cdir of the term to split, index
+        of the term that needs it split, whether that term is an ellipsis
+        mapping). All branches of a split are shaped alike, so the first
+        one stands in for the rest while working out the splits below it.
+        """
+        plan = []
+        group = self
+        while True:
+            try:
+                for orig_idx, val in enumerate(group):
+                    if isinstance(val, Expandable):
+                        val.within(reference)
+            except Ellipse as e:
+                cdir, is_ellipsis = e.cdir, True
+                branches = group[cdir].within(reference)[:e.split]
+            except Reshape as e:
+                cdir, is_ellipsis = e.cdir, False
+                branches = group[cdir].within(reference)
+            else:
+                return plan
+            plan.append((cdir, orig_idx, is_ellipsis))
+            if not branches:
+                return plan
+            group = reference = self._branch(group, cdir != '0' and self.tbl.neighborhood[cdir], branches[0])
+    
+    def _expand(self, reference):
         trs = []
-        current = []
-        for orig_idx, val in enumerate(self._tr):
-            if isinstance(val, Expandable):
+        plan = self._plan(reference)
+        # Groups still to expand, last first, each as (group, reference to resolve
+        # its terms within, its plan, how many of that plan's splits it's been through)
+        pending = [(self, reference, plan, 0)]
+        while pending:
+            group, ref, group_plan, depth = pending.pop()
+            if depth == len(group_plan):
                 try:
-                    current.append(val.within(reference))
-                except Ellipse as e:
-                    idx = e.cdir != '0' and self.tbl.neighborhood[e.cdir]
-                    tethered_var = self[e.cdir].within(reference)
-                    individuals, combine = tethered_var[:e.split], tethered_var[e.split:]
-                    trs.extend(
-                      new_tr for tr in
-                      ([*self[:idx], value, *self[1+idx:]] for value in individuals)
-                      for new_tr in
-                      TransitionGroup.from_seq(
-                        tr, self.tbl, context=self.ctx, extra=self.extra, symmetries=self.symmetries
-                      ).expand()
-                      )
-                    if combine:
-                        tr = self[:]
-                        tr[idx], tr[orig_idx] = StateList(combine, e.split, context=tethered_var.ctx), e.val
-                        trs.extend(TransitionGroup.from_seq(
-                          tr, self.tbl, context=self.ctx, extra=self.extra, symmetries=self.symmetries
-                        ).expand())
-                    break
-                except Reshape as e:
-                    var = self[e.cdir].within(reference)
-                    idx = e.cdir != '0' and self.tbl.neighborhood[e.cdir]
-                    trs.extend(
-                      new_tr for tr in
-                      ([*self[:idx], individual, *self[1+idx:]] for individual in var)
-                      for new_tr in
-                      TransitionGroup.from_seq(
-                        tr, self.tbl, context=self.ctx, extra=self.extra, symmetries=self.symmetries
-                      ).expand()
-                      )
-                    break
+                    current = [val.within(ref) if isinstance(val, Expandable) else val for val in group]
+                except (Ellipse, Reshape):
+                    # Not shaped like the branch its plan was worked out from, so it
+                    # gets its own (which, being worked out from it, then can't fail)
+                    pending.append((group, ref, group._plan(ref), 0))
+                    continue
+                trs.append(Transition(current, self.tbl, context=self.ctx, extra=self.extra, symmetries=self.symmetries))
+                continue
+            cdir, orig_idx, is_ellipsis = group_plan[depth]
+            idx = cdir != '0' and self.tbl.neighborhood[cdir]
+            if not is_ellipsis:
+                pending.extend((branch, branch, group_plan, 1 + depth) for branch in (
+                  self._branch(group, idx, value) for value in reversed(group[cdir].within(ref))
+                  ))
+                continue
+            # (where the ellipsis splits the var can depend on the group, so ask again)
+            try:
+                group[orig_idx].within(ref)
+            except Ellipse as e:
+                tethered_var = group[cdir].within(ref)
+                individuals, combine = tethered_var[:e.split], tethered_var[e.split:]
+                if combine:
+                    tr = group[:]
+                    tr[idx], tr[orig_idx] = StateList(combine, e.split, context=tethered_var.ctx), e.val
+                    combined = TransitionGroup.from_seq(tr, self.tbl, context=self.ctx, extra=self.extra, symmetries=self.symmetries)
+                    pending.append((combined, combined, combined._plan(combined), 0))
+                pending.extend((branch, branch, group_plan, 1 + depth) for branch in (
+                  self._branch(group, idx, value) for value in reversed(individuals)
+                  ))
+            except Reshape:
+                pending.append((group, ref, group._plan(ref), 0))
             else:
-                current.append(val)
-        else:
-            return [Transition(current, self.tbl, context=self.ctx, extra=self.extra, symmetries=self.symmetries)]
-        self._expandeds[reference] = trs
+                pending.append((group, ref, group._plan(ref), 0))
+        if plan:
+            self._expandeds[reference] = trs
         return trs
     
     def apply_aux(self, auxiliaries, top=True):
@@ -283,19 +371,19 @@ class Transition:
             while isinstance(i, VarValue):
                 i = i.value
             if not isinstance(i, StateList):
-                ret.append(str(i))
+                ret.append(CELLS.parse(str(i)))
             elif isinstance(i, ResolvedBinding):
                 ret.append(i)  # Handled below because of forward references
             elif i.untether() in variables:
                 varname = variables[i.untether()]
                 seen[varname] += 1
                 varname.update_rep(seen[varname])
-                ret.append(f'{varname}.{seen[varname]}')
+                ret.append(CELLS.code(varname.name, seen[varname]))
             else:
                 varname = self.tbl.new_varname()
                 seen[varname] = 0
                 variables.inv[varname] = i.untether()
-                ret.append(f'{varname}.0')
+                ret.append(CELLS.code(varname.name, 0))
         for i, v in enumerate(ret):
             if isinstance(v, ResolvedBinding):
                 cdir = v.cdir != '0' and self.tbl.neighborhood[v.cdir]
@@ -304,11 +392,12 @@ class Transition:
                 ret[i] = ret[cdir]
         
         if self.tbl.gollyize_nbhd is not None:
+            ret = list(map(CELLS.string, ret))
             return FinalTransition(
               [ret[0], *self.tbl.gollyize_nbhd(self.tbl, ret[1:-1], 1 + seen.get('any', 0)), ret[-1]],
               context=self.ctx, extra=self.extra
               )
-        return FinalTransition(ret, context=self.ctx, extra=self.extra)
+        return FinalTransition(codes=ret, context=self.ctx, extra=self.extra)
     
     def fix_partial(self):
         ret = []
@@ -345,44 +434,134 @@ class Transition:
         ret = []
         seen = {}
         variables = self.tbl.vars.inv
-        for i in tr:
-            if isinstance(i, str):
-                if '.' in i:
-                    varname, tag = i.split('.')
-                    seen.setdefault(varname, set()).add(int(tag))
-                    # (ew, but converting string to varname)
-                    variables[variables.inv[varname]].update_rep(int(tag))
-                else:
-                    seen[i] = set()
-        for i in tr:
+        codes = list(map(CELLS.parse, tr))
+        for code in codes:
+            name, tag = CELLS.names[code], CELLS.tags[code]
+            if tag is not None:
+                seen.setdefault(name, set()).add(tag)
+                # (ew, but converting string to varname)
+                variables[variables.inv[name]].update_rep(tag)
+            else:
+                seen[name] = set()
+        for code in codes:
             tag_counter = count()
-            if isinstance(i, str) and i.isidentifier():
-                tag = next(j for j in tag_counter if j not in seen[i])
-                seen[i].add(tag)
-                ret.append(f'{i}.{tag}')
+            if CELLS.untagged_var[code]:
+                name = CELLS.names[code]
+                tag = next(j for j in tag_counter if j not in seen[name])
+                seen[name].add(tag)
+                ret.append(CELLS.code(name, tag))
                 # (ew, but converting string to varname)
-                variables[variables.inv[i]].update_rep(int(tag))
+                variables[variables.inv[name]].update_rep(tag)
             else:
-                ret.append(i)
+                ret.append(code)
         if self.tbl.gollyize_nbhd is not None:
+            ret = list(map(CELLS.string, ret))
             return FinalTransition(
               [ret[0], *self.tbl.gollyize_nbhd(self.tbl, ret[1:-1], seen.get('any', {})), ret[-1]],
               context=self.ctx, extra=self.extra
               )
-        return FinalTransition(ret, context=self.ctx, extra=self.extra)
+        return FinalTransition(codes=ret, context=self.ctx, extra=self.extra)
     
     def in_symmetry(self, NewSymmetry):
         initial, *napkin, resultant = self.fix_partial()
-        return [self.fix_final([initial, *i, resultant]) for i in distinct(NewSymmetry(j) for j in self.symmetries(napkin).expand())]
+        return [self.fix_final([initial, *i, resultant]) for i in NewSymmetry.quotient(self.symmetries, napkin)]
+
+
+class CellTable:
+    """
+    Interns the cells that make up final transitions. Each distinct
+    cell -- a cellstate, or a variable's name along with its tag -- is
+    given a small int code, so that a FinalTransition needn't be more
+    than an array of those; the cell's string is only put together
+    when something asks for it.
+    """
+    def __init__(self):
+        self.names = []  # code -> name, e.g. 'any' or '5'
+        self.tags = []  # code -> tag, e.g. 3 for 'any.3', or None
+        self.untagged_var = []  # code -> whether it's a variable still in need of a tag
+        self.strings = []  # code -> the cell as it's written out
+        self._codes = {}  # (name, tag) -> code
+        self._parsed = {}  # string -> code
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def code(self, name, tag=None):
+        key = name, tag
+        if key not in self._codes:
+            with self._lock:
+                if key not in self._codes:
+                    self.names.append(name)
+                    self.tags.append(tag)
+                    self.untagged_var.append(tag is None and name.isidentifier())
+                    self.strings.append(name if tag is None else f'{name}.{tag}')
+                    self._codes[key] = len(self.names) - 1
+        return self._codes[key]
+    
+    def parse(self, cell):
+        """
+        Code for a cell given as a string, e.g. 'any.3', 'any', or '5'
+        (or anything else that stringifies to one).
+        """
+        if cell not in self._parsed:
+            name, dot, tag = str(cell).partition('.')
+            self._parsed[cell] = self.code(name, int(tag) if dot else None)
+        return self._parsed[cell]
+    
+    def string(self, code):
+        return self.strings[code]
+
 
+CELLS = CellTable()
 
-class FinalTransition(list):
-    def __init__(self, it, *, context=None, extra=None, lno=None):
-        super().__init__(it)
+
+class FinalTransition(MutableSequence):
+    """
+    A transition as it'll be written to the compiled table. Behaves like
+    a list of its cells' strings, but only stores their codes in CELLS.
+    """
+    __slots__ = 'codes', 'ctx', 'extra'
+    
+    def __init__(self, it=(), *, context=None, extra=None, lno=None, codes=None):
+        self.codes = array('I', map(CELLS.parse, it) if codes is None else codes)
         # at least one of (context, lno) should not be None
         self.ctx = (lno, None, None) if context is None else context
         self.extra = extra
     
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [CELLS.strings[i] for i in self.codes[item]]
+        return CELLS.strings[self.codes[item]]
+    
+    def __setitem__(self, item, value):
+        if isinstance(item, slice):
+            self.codes[item] = array('I', map(CELLS.parse, value))
+        else:
+            self.codes[item] = CELLS.parse(value)
+    
+    def __delitem__(self, item):
+        del self.codes[item]
+    
+    def __len__(self):
+        return len(self.codes)
+    
+    def __iter__(self):
+        return map(CELLS.strings.__getitem__, self.codes)
+    
+    def __eq__(self, other):
+        if isinstance(other, FinalTransition):
+            return self.codes == other.codes
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    def __repr__(self):
+        return repr(list(self))
+    
+    def insert(self, idx, value):
+        self.codes.insert(idx, CELLS.parse(value))
+    
     @property
     def lno(self):
         return self.ctx[0]
@@ -571,14 +750,32 @@ class StateList(Expandable):
     def __init__(self, t, start=0, **kw):
         Expandable.__init__(self, **kw)
         self._tuple = self.unpack_vars_only(t) if isinstance(t, Iterable) else (t,)
-        self._set = set(self._tuple)
+        self._bits = None
         self.start = start
         self._d = {}
+        # whether any of its states depend on the transition it's in
+        self._contextual = any(isinstance(i, Expandable) for i in self._tuple)
+    
+    @property
+    def bits(self):
+        """
+        (mask, rest): a bitmask of the cellstates in this statelist,
+        and a frozenset of anything in it that isn't a cellstate.
+        """
+        if self._bits is None:
+            self._bits = bitmask(self.values())
+        return self._bits
+    
+    def values(self):
+        return self._tuple
     
     def __contains__(self, item):
         if isinstance(item, VarValue):
-            return self._set.__contains__(item.value)    
-        return self._set.__contains__(item)
+            item = item.value
+        mask, rest = self.bits
+        if isinstance(item, int) and item >= 0:
+            return mask >> item & 1 == 1
+        return item in rest
     
     def __eq__(self, other):
         return self._tuple.__eq__(other)
@@ -631,9 +828,12 @@ class StateList(Expandable):
         return r
     
     def within(self, tr):
-        if tr not in self._d:
-            self._d[tr] = TetheredVar(self.iwithin(tr), self.start, context=self.ctx)
-        return self._d[tr]
+        # (if nothing in it refers to another term, it comes out the
+        # same in every transition, so it only needs tethering once)
+        key = tr if self._contextual else None
+        if key not in self._d:
+            self._d[key] = TetheredVar(self.iwithin(tr), self.start, context=self.ctx)
+        return self._d[key]
     
     def iwithin(self, tr, counter=None):
         if counter is None:
@@ -666,23 +866,41 @@ class TetheredVar(StateList):  # Tethered == bound to a transition
     def __init__(self, t, start=0, **kw):
         Expandable.__init__(self, **kw)
         self._tuple = self.unpack_vars_only(t) if isinstance(t, Iterable) else (t,)
-        # isinstance check is because StateList.__rmul__ returns self.__class__([other]*len(blah)) and that
-        # results in ints rather than varvalues
-        # should probably fix to a more-robust solution
-        self._set = {i.value for i in self._tuple} if isinstance(self._tuple[0] if self._tuple else None, VarValue) else set(self._tuple)
+        self._bits = None
+        self._values = None
+        self._differences = {}
         self.start = start
         self._d = {}
+        self._contextual = any(isinstance(i, Expandable) for i in self._tuple)
     
     def __sub__(self, other):
-        c = count()
+        # (the same tethered var gets reused across transitions, so
+        # differences are remembered by what was taken out of it)
         if type(other) is type(self):
-            return TetheredVar([i.reindex(next(c)) for i in self if i.value not in other])
-        if isinstance(other, int):
-            return TetheredVar([i.reindex(next(c)) for i in self if i.value != other])
-        return NotImplemented
+            key = other.bits
+        elif isinstance(other, int):
+            key = bitmask((other,))
+        else:
+            return NotImplemented
+        if key not in self._differences:
+            mask, rest = key
+            c = count()
+            self._differences[key] = TetheredVar([
+              i.reindex(next(c)) for i in self
+              if not (mask >> i.value & 1 if isinstance(i.value, int) and i.value >= 0 else i.value in rest)
+              ])
+        return self._differences[key]
+    
+    def values(self):
+        # isinstance check is because StateList.__rmul__ returns self.__class__([other]*len(blah)) and that
+        # results in ints rather than varvalues
+        # should probably fix to a more-robust solution
+        if self._values is None:
+            self._values = tuple(i.value if isinstance(i, VarValue) else i for i in self._tuple)
+        return self._values
     
     def untether(self):
-        return tuple(i.value for i in self)
+        return self.values()
 
 
 class ResolvedBinding(StateList):
@@ -702,6 +920,21 @@ class ResolvedBinding(StateList):
         return tuple(getattr(i, 'value', i) for i in self)
 
 
+def bitmask(values):
+    """
+    Splits `values` into a bitmask of the cellstates among them (bit n
+    set if state n is) and a frozenset of everything else.
+    """
+    mask = 0
+    rest = set()
+    for value in values:
+        if isinstance(value, int) and value >= 0:
+            mask |= 1 << value
+        else:
+            rest.add(value)
+    return mask, frozenset(rest)
+
+
 class VarValue:
     __slots__ = 'parent', 'index', 'value'
     SPECIALS = {'_': None, '...': ...}
@@ -1,19 +1,297 @@
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
 from itertools import permutations
-from math import ceil
+from math import ceil, factorial
+from operator import itemgetter
 
 from nutshell.common.utils import LazyProperty, distinct
 from ._classes import InlineBinding
+from . import _symcache
 
 oneDimensional, vonNeumann, hexagonal, Moore = 2, 4, 6, 8
 Any = None
 
+# below this many napkins, _NapkinMeta.unique() isn't worth importing numpy for
+NUMPY_BATCH_SIZE = 1024
+
+
+@lru_cache(maxsize=None)
+def permuter(perm):
+    """
+    Returns a function rearranging a sequence into a tuple according to
+    the index permutation `perm`, so (2, 0, 1) gives seq -> (seq[2], seq[0], seq[1])
+    """
+    if len(perm) == 1:
+        idx, = perm
+        return lambda seq: (seq[idx],)
+    return itemgetter(*perm)
+
+
+@lru_cache(maxsize=None)
+def rotation(length, offset):
+    """Index permutation rotating a napkin of `length` cells by `offset` cells"""
+    return permuter(tuple((i + offset) % length for i in range(length)))
+
+
+@lru_cache(maxsize=None)
+def rotations(length, n):
+    """Index permutations rotating a napkin of `length` cells through `n` evenly-spaced steps"""
+    return tuple(rotation(length, offset) for offset in range(0, length, length // n))
+
+
+def multiset_permutations(seq):
+    """
+    Yields the distinct permutations of `seq` in lexicographic order --
+    the same ones, in the same order, as distinct(permutations(sorted(seq))),
+    but without generating the duplicates.
+    """
+    a = sorted(seq)
+    if len(set(a)) == len(a):
+        # (nothing to skip, so itertools is quicker)
+        yield from permutations(a)
+        return
+    last = len(a) - 1
+    while True:
+        yield tuple(a)
+        # find the rightmost ascent, then swap it with the smallest larger
+        # value to its right and put everything to its right back in order
+        i = last - 1
+        while i >= 0 and not a[i] < a[i + 1]:
+            i -= 1
+        if i < 0:
+            return
+        j = last
+        while not a[i] < a[j]:
+            j -= 1
+        a[i], a[j] = a[j], a[i]
+        a[i + 1:] = reversed(a[i + 1:])
+
+
+def _closure(generators, length):
+    """Every index permutation that composing `generators` can make"""
+    rearrangers = [permuter(tuple(g)) for g in generators]
+    elements = {tuple(range(length))}
+    frontier = list(elements)
+    while frontier:
+        new = {rearrange(p) for p in frontier for rearrange in rearrangers} - elements
+        elements |= new
+        frontier = new
+    return elements
+
+
+class PermGroup:
+    """
+    A group of index permutations (as taken by permuter()) of napkins of
+    one length, given by a few generators. Its elements, and so its order,
+    are only enumerated once something needs them; checking whether it's
+    a subgroup of another group only needs its generators.
+    """
+    def __init__(self, generators, length, elements=None):
+        self.generators = tuple(map(tuple, generators))
+        self.length = length
+        if elements is not None:
+            self.elements = frozenset(elements)
+        self._subgroup_of, self._cosets = {}, {}
+    
+    @classmethod
+    def from_elements(cls, elements, length):
+        """
+        The group made up of the index permutations `elements`, with as
+        generators however many of them it takes to get the rest -- or
+        None if `elements` isn't a group in the first place
+        """
+        elements = set(elements)
+        if tuple(range(length)) not in elements:
+            return None
+        generators, closure = [], {tuple(range(length))}
+        for perm in sorted(elements):
+            if perm not in closure:
+                generators.append(perm)
+                closure = _closure(generators, length)
+                if not closure <= elements:
+                    return None
+        return cls(generators, length, elements)
+    
+    @LazyProperty
+    def elements(self):
+        return frozenset(_closure(self.generators, self.length))
+    
+    @property
+    def order(self):
+        return len(self.elements)
+    
+    def __contains__(self, perm):
+        return perm in self.elements
+    
+    def __le__(self, other):
+        try:
+            return self._subgroup_of[other]
+        except KeyError:
+            ret = self._subgroup_of[other] = all(g in other for g in self.generators)
+            return ret
+    
+    def coset_representatives(self, subgroup):
+        """
+        One element g from each coset {g then h | h in subgroup} of `subgroup`
+        (i.e. rearranging by g and then by h); rearranging a napkin by each of
+        these gives a napkin from every one of the subgroup's classes in the
+        napkin's orbit under this group
+        """
+        try:
+            return self._cosets[subgroup]
+        except KeyError:
+            pass
+        then = [permuter(h) for h in subgroup.elements]
+        seen, reps = set(), []
+        for g in sorted(self.elements):
+            if g not in seen:
+                reps.append(g)
+                seen.update(rearrange(g) for rearrange in then)
+        self._cosets[subgroup] = reps
+        return reps
+    
+    def orbit_size(self, napkin):
+        """How many distinct napkins rearranging `napkin` by this group's elements gives"""
+        return len({permuter(perm)(napkin) for perm in self.elements})
+    
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self.generators)!r}, {self.length})'
+
+
+class SymmetricGroup(PermGroup):
+    """Every permutation of `length` cells, which it takes no enumerating to tell apart"""
+    def __init__(self, length):
+        # a rotation by one cell and a swap of the first two generate the rest
+        super().__init__([(*range(1, length), 0), (1, 0, *range(2, length))] if length > 1 else [(0,)], length)
+    
+    @LazyProperty
+    def elements(self):
+        return frozenset(permutations(range(self.length)))
+    
+    @property
+    def order(self):
+        return factorial(self.length)
+    
+    def __contains__(self, perm):
+        return len(perm) == self.length and sorted(perm) == list(range(self.length))
+    
+    def orbit_size(self, napkin):
+        # (the multinomial coefficient of the napkin's states' counts)
+        size = factorial(self.length)
+        for count in Counter(napkin).values():
+            size //= factorial(count)
+        return size
+    
+    def __repr__(self):
+        return f'{type(self).__name__}({self.length})'
+
+
+def _numpy_encode(napkins):
+    """
+    The napkins as an array of ints that keep the states' ordering, and
+    what each int stands for -- or None if numpy isn't available (or the
+    napkins have too many distinct states to encode)
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    # codes have to preserve the states' ordering for min() to agree with
+    # the pure-Python version, since napkins are compared as tuples
+    try:
+        states = sorted(set().union(*napkins))
+    except TypeError:
+        return None
+    if len(states) ** len(napkins[0]) >= 2 ** 63:
+        return None
+    code = {state: n for n, state in enumerate(states)}
+    return numpy.array([[code[state] for state in napkin] for napkin in napkins], dtype=numpy.int64), states
+
+
+def _numpy_keys(arr, perms, base):
+    """Each napkin in `arr` rearranged by each of `perms` and read as one number in base `base`"""
+    import numpy
+    place_values = base ** numpy.arange(arr.shape[-1] - 1, -1, -1, dtype=numpy.int64)
+    return arr[..., numpy.array(perms)] @ place_values
+
+
+def _numpy_canonical_forms(reps, perms, napkin):
+    """
+    _NapkinMeta.quotient() for a big batch of coset representatives:
+    the distinct smallest rearrangements by `perms` of `napkin` rearranged
+    by each of `reps`, sorted -- or None if numpy isn't available
+    """
+    encoded = _numpy_encode([napkin])
+    if encoded is None:
+        return None
+    import numpy
+    (codes,), states = encoded
+    keys = numpy.unique(_numpy_keys(codes[numpy.array(reps)], perms, len(states)).min(axis=1))
+    digits = keys[:, None] // len(states) ** numpy.arange(len(napkin) - 1, -1, -1, dtype=numpy.int64) % len(states)
+    return [tuple(states[i] for i in row) for row in digits.tolist()]
+
+
+def _numpy_firsts(perms, napkins):
+    """
+    _NapkinMeta.unique() for a big batch: encodes the napkins as an array
+    of ints, takes every rearrangement of every one at once, and reduces
+    each to the smallest of its rearrangements. Returns the indices of the
+    first napkin to have each, or None if numpy isn't available (or the
+    napkins have too many distinct states to encode).
+    """
+    encoded = _numpy_encode(napkins)
+    if encoded is None:
+        return None
+    import numpy
+    arr, states = encoded
+    # each rearrangement as a single number, in base len(states)
+    keys = _numpy_keys(arr, perms, len(states)).min(axis=1)
+    _, firsts = numpy.unique(keys, return_index=True)
+    return sorted(firsts.tolist())
+
+
+class _PerLength(Mapping):
+    """
+    {napkin length :: whatever} for the lengths a symmetry type supports,
+    with each value only computed (by `compute`) once it's first needed
+    """
+    def __init__(self, compute, lengths):
+        self.compute, self.lengths, self._computed = compute, lengths, {}
+    
+    def __getitem__(self, length):
+        try:
+            return self._computed[length]
+        except KeyError:
+            if length not in self.lengths:
+                raise
+        value = self._computed[length] = self.compute(length)
+        return value
+    
+    def __contains__(self, length):
+        return length in self.lengths
+    
+    def __iter__(self):
+        return iter(self.lengths)
+    
+    def __len__(self):
+        return len(self.lengths)
+
 
 class _NapkinMeta(type):
     def __init__(cls, name, bases, attrs):
-        if 'expanded' not in attrs or 'symmetries' in attrs:
+        if not ('expanded' in attrs or 'generators' in attrs) or 'symmetries' in attrs:
             # if it's some sort of base class like Napkin or OrthNapkin
             # or has symmetries preimplemented itself
             return
+        if 'generators' in attrs:
+            # a symmetry type can be given as {length :: generators of a PermGroup}
+            # instead of by how it expands a napkin, in which case it expands
+            # a napkin into its rearrangements by each element of that group
+            attrs = {'neighborhoods': tuple(cls.generators), 'by_index': True, **attrs}
+            cls.neighborhoods = attrs['neighborhoods']
+            if 'expanded' not in attrs:
+                cls.expanded = property(cls.rearranged)
         if isinstance(attrs.get('fallback'), (str, _NapkinMeta)):
             cls.fallback = {Any: NAMES[cls.fallback] if isinstance(cls.fallback, str) else cls.fallback}
         if isinstance(attrs.get('fallback'), dict):
@@ -25,40 +303,149 @@ class _NapkinMeta(type):
                   # cls.fallback[Any]s where possible, so this goes 2nd
                   **{k: v for k, v in cls.fallback.items() if k is not Any}
                   }
-        cls.symmetries = {
-          n: set(cls(range(n)).expanded)
-          for n in
-          (range(1, 9) if cls.neighborhoods is Any else cls.neighborhoods)
-          }
-        cls.sym_lens = {n: len(v) for n, v in cls.symmetries.items()}
+        # these are only worked out for a given length once something asks,
+        # so that importing a symmetry type costs nothing up front
+        lengths = range(1, 9) if cls.neighborhoods is Any else cls.neighborhoods
+        cls.symmetries = _PerLength(cls._symmetries, lengths)
+        # cls.symmetries as a PermGroup, or None where they aren't one
+        # (e.g. rotate2 on an odd-length napkin)
+        if 'groups' not in attrs:
+            cls.groups = _PerLength(cls._group, lengths)
+        cls.sym_lens = _PerLength(
+          lambda n: len(cls.symmetries[n]) if cls.groups[n] is None else cls.groups[n].order,
+          lengths
+          )
+        # a napkin of a by_index class (one that has to say so itself, as this
+        # isn't inherited) expands to exactly its rearrangements by each of the
+        # index permutations in cls.symmetries, so those can be used directly
+        # wherever they form a group (and elsewhere, the permutations are None)
+        cls.by_index = attrs.get('by_index', False)
+        # likewise, a lexicographic class (e.g. permute) expands a napkin into every rearrangement
+        # of it by its group, in sorted order and without duplicates
+        cls.lexicographic = attrs.get('lexicographic', False)
+        if cls.by_index:
+            cls.permutations = _PerLength(lambda n: None if cls.groups[n] is None else sorted(cls.groups[n].elements), lengths)
+            cls.permuters = _PerLength(
+              lambda n: None if cls.permutations[n] is None else [permuter(perm) for perm in cls.permutations[n]],
+              lengths
+              )
         if 'clear' in attrs:
             cls.clear()
+    
+    def _symmetries(cls, length):
+        if 'generators' in vars(cls):
+            return set(cls.groups[length].elements)
+        symmetries = _symcache.load(cls, length)
+        if symmetries is None:
+            symmetries = set(cls(range(length)).expanded)
+            _symcache.store(cls, length, symmetries)
+        return symmetries
+    
+    def _group(cls, length):
+        if 'generators' in vars(cls):
+            return PermGroup(cls.generators[length], length)
+        return PermGroup.from_elements(cls.symmetries[length], length)
+    
+    def quotient(cls, source, napkin):
+        """
+        The same as list(cls.unique(source(napkin).expand())): cls(napkin) for the
+        first napkin in each class of cls-equivalent ones in the orbit of `napkin`
+        under `source`, in order.
+        
+        If `source` is lexicographic and cls is a subgroup of it, the first
+        napkin in each of those classes is its smallest, i.e. its canonical
+        form, and the classes are the orbits of `napkin` rearranged by one
+        element from each of cls's cosets in `source` -- so where there are
+        fewer cosets than napkins in the orbit, those can be used instead.
+        """
+        n = len(napkin)
+        group, subgroup = source.groups.get(n), cls.groups.get(n)
+        if (
+          source.lexicographic and cls.by_index
+          and group is not None and subgroup is not None and subgroup <= group
+          and group.order // subgroup.order < group.orbit_size(napkin)
+          ):
+            reps = group.coset_representatives(subgroup)
+            forms = None
+            if len(reps) >= NUMPY_BATCH_SIZE:
+                forms = _numpy_canonical_forms(reps, cls.permutations[n], napkin)
+            if forms is None:
+                canonical_form = cls.canonical_form
+                forms = sorted({canonical_form(permuter(rep)(napkin)) for rep in reps})
+            return list(map(cls, forms))
+        return list(cls.unique(source(napkin).expand()))
+    
+    def unique(cls, napkins):
+        """
+        Yields cls(napkin) for the first of `napkins` (all the same length)
+        in each class of ones equivalent under cls's symmetries -- the same
+        as distinct(map(cls, napkins)), but without hashing every one.
+        """
+        napkins = list(napkins)
+        if not napkins:
+            return
+        if cls.by_index and len(napkins) >= NUMPY_BATCH_SIZE and cls.permutations.get(len(napkins[0])) is not None:
+            firsts = _numpy_firsts(cls.permutations[len(napkins[0])], napkins)
+            if firsts is not None:
+                yield from (cls(napkins[i]) for i in firsts)
+                return
+        seen = set()
+        for napkin in napkins:
+            k = cls.canonical_form(napkin)
+            if k not in seen:
+                seen.add(k)
+                yield cls(napkin)
 
 
 class Napkin(tuple, metaclass=_NapkinMeta):
     """
     Term "napkin" by 83bismuth38.
     Represents the 'neighborhood' segment of a transition.
+    
+    Napkins are hashed and compared by their canonical form, which is the
+    same for every napkin equivalent to them under their symmetries.
     """
-    def __init__(self, iterable=None):
-        self._hash = None
+    by_index = False
     
     def __eq__(self, other):
-        return isinstance(other, tuple) and any(map(other.__eq__, self.expanded))
+        if not isinstance(other, tuple) or len(other) != len(self):
+            return False
+        if type(other) is type(self):
+            return other.canonical == self.canonical
+        return type(self).canonical_form(other) == self.canonical
     
     def __hash__(self):
-        if self._hash is None:
-            self._hash = hash(tuple(sorted(self.expanded_unique)))
-        return self._hash
+        return hash(self.canonical)
+    
+    @classmethod
+    def canonical_form(cls, napkin):
+        """
+        The smallest of `napkin`'s rearrangements if the class is by_index
+        (and they form a group), else its whole expansion, sorted
+        """
+        if cls.by_index and cls.permuters.get(len(napkin)) is not None:
+            return min(rearrange(napkin) for rearrange in cls.permuters[len(napkin)])
+        return tuple(sorted((napkin if type(napkin) is cls else cls(napkin)).expanded_unique))
+    
+    @LazyProperty
+    def canonical(self):
+        return type(self).canonical_form(self)
     
     def __repr__(self):
         return f'{type(self).__name__}({super().__repr__()})'
     
+    def rearranged(self):
+        """The napkin's distinct rearrangements by its class's index permutations, sorted"""
+        return sorted({rearrange(self) for rearrange in type(self).permuters[len(self)]})
+    
     def rotate_by(self, offset):
-        return self[offset:] + self[:offset]
+        if not -len(self) < offset < len(self):
+            # (same as what slicing & concatenating would have given)
+            offset = 0
+        return rotation(len(self), offset % len(self))(self)
     
     def rotate(self, n):
-        return map(self.rotate_by, range(0, len(self), len(self) // n))
+        return [rearrange(self) for rearrange in rotations(len(self), n)]
     
     @LazyProperty
     def expanded_unique(self):
@@ -71,8 +458,12 @@ class Napkin(tuple, metaclass=_NapkinMeta):
 class OrthNapkin(Napkin):
     """Moore & vonNeumann"""
     @staticmethod
-    def reflection_of(seq):
-        return sorted((seq, (seq[0], *seq[:0:-1])))
+    def reflected(seq):
+        return _orth_reflection(len(seq))(seq)
+    
+    @classmethod
+    def reflection_of(cls, seq):
+        return sorted((seq, cls.reflected(seq)))
     
     def rotated4(self):
         return sorted(self.rotate(4))
@@ -81,10 +472,18 @@ class OrthNapkin(Napkin):
         return sorted(self.rotate(8))
 
 
+@lru_cache(maxsize=None)
+def _orth_reflection(length):
+    return permuter((0, *range(length - 1, 0, -1)))
+
+
+_HEX_REFLECTION = permuter((4, 2, 3, 1, 0, 5))
+
+
 class HexNapkin(Napkin):
     @staticmethod
     def reflection_of(seq):
-        return sorted((seq, tuple(seq[i] for i in (4, 2, 3, 1, 0, 5))))
+        return sorted((seq, _HEX_REFLECTION(seq)))
     
     def rotated2(self):
         return sorted(self.rotate(2))
@@ -99,6 +498,7 @@ class HexNapkin(Napkin):
 class NoSymmetry(tuple, metaclass=_NapkinMeta):
     neighborhoods = Any
     name = ['none']
+    canonical_form = tuple
     
     def expand(self):
         return self,
@@ -109,6 +509,7 @@ class NoSymmetry(tuple, metaclass=_NapkinMeta):
 # Hexagonal napkins
 class Rotate2(HexNapkin):
     neighborhoods = hexagonal,
+    by_index = True
     @property
     def expanded(self):
         return self.rotated2()
@@ -116,6 +517,7 @@ class Rotate2(HexNapkin):
 
 class Rotate3(HexNapkin):
     neighborhoods = hexagonal,
+    by_index = True
     @property
     def expanded(self):
         return self.rotated3()
@@ -123,6 +525,7 @@ class Rotate3(HexNapkin):
 
 class Rotate6(HexNapkin):
     neighborhoods = hexagonal,
+    by_index = True
     @property
     def expanded(self):
         return self.rotated6()
@@ -130,6 +533,7 @@ class Rotate6(HexNapkin):
 
 class Rotate6Reflect(HexNapkin):
     neighborhoods = hexagonal,
+    by_index = True
     @property
     def expanded(self):
         return (tup for i in self.rotated6() for tup in self.reflection_of(i))
@@ -139,6 +543,7 @@ class Rotate6Reflect(HexNapkin):
 class ReflectHorizontal(OrthNapkin):
     neighborhoods = vonNeumann, Moore
     name = ['reflect', 'reflect_horizontal']
+    by_index = True
     @LazyProperty
     def expanded(self):
         return self.reflection_of(tuple(self))
@@ -146,6 +551,7 @@ class ReflectHorizontal(OrthNapkin):
 
 class Rotate4(OrthNapkin):
     neighborhoods = vonNeumann, Moore
+    by_index = True
     @LazyProperty
     def expanded(self):
         return self.rotated4()
@@ -153,6 +559,7 @@ class Rotate4(OrthNapkin):
 
 class Rotate4Reflect(OrthNapkin):
     neighborhoods = vonNeumann, Moore
+    by_index = True
     @property
     def expanded(self):
         return (tup for i in self.rotated4() for tup in self.reflection_of(i))
@@ -160,6 +567,7 @@ class Rotate4Reflect(OrthNapkin):
 
 class Rotate8(OrthNapkin):
     neighborhoods = Moore,
+    by_index = True
     @LazyProperty
     def expanded(self):
         return self.rotated8()
@@ -167,6 +575,7 @@ class Rotate8(OrthNapkin):
 
 class Rotate8Reflect(OrthNapkin):
     neighborhoods = Moore,
+    by_index = True
     @property
     def expanded(self):
         return (tup for i in self.rotated8() for tup in self.reflection_of(i))
@@ -175,28 +584,37 @@ class Rotate8Reflect(OrthNapkin):
 # General
 class Permute(Napkin):
     neighborhoods = Any
-    RECENTS = {}
-    HASHES = {}
+    # {canonical form :: expansion} of the napkins expanded most recently
+    RECENTS = OrderedDict()
+    MAX_RECENTS = 64
+    groups = {n: SymmetricGroup(n) for n in range(1, 9)}
+    lexicographic = True
     
-    def __hash__(self):
-        if self._hash is None:
-            self._hash = self.HASHES[tuple(sorted(self))]
-        return self._hash
+    @staticmethod
+    def canonical_form(napkin):
+        return tuple(sorted(napkin))
     
     @LazyProperty
     def expanded(self):
-        t = tuple(sorted(self))
-        if t in self.RECENTS:
-            self._hash = self.HASHES[t]
-            return self.RECENTS[t]
-        self.RECENTS[t] = ret = list(permutations(t))
-        self.HASHES[t] = self._hash = hash(tuple(ret))
-        return ret
+        return self.recent(self.canonical, lambda: list(multiset_permutations(self.canonical)))
+    
+    @classmethod
+    def recent(cls, key, expand):
+        """
+        Looks up `key` in RECENTS, or else stores expand() there under
+        it and evicts whatever was used longest ago if there's too much
+        """
+        try:
+            cls.RECENTS.move_to_end(key)
+        except KeyError:
+            cls.RECENTS[key] = expand()
+            if len(cls.RECENTS) > cls.MAX_RECENTS:
+                cls.RECENTS.popitem(last=False)
+        return cls.RECENTS[key]
     
     @classmethod
     def clear(cls):
         cls.RECENTS.clear()
-        cls.HASHES.clear()
     
     @staticmethod
     def special(values, length):
@@ -0,0 +1,290 @@
+"""
+Passes over a table's compiled transitions that make it smaller without
+changing what it does. Golly goes by the first line (or symmetric variant
+of a line) to match a cell, so a line that an earlier one matches every
+variant of is dead weight, and lines can only be combined or moved past
+one another where that doesn't change which one matches first.
+"""
+from collections import deque
+
+from ._classes import CELLS, FinalTransition, StateList, bitmask
+from ._napkins import permuter
+from . import _symutils as symutils
+
+
+class _CellMasks(dict):
+    """
+    {cell code :: bitmask of the states that cell matches, or None if
+    that can't be told or doesn't fit in `width` bits}
+    """
+    def __init__(self, tbl, width):
+        super().__init__()
+        self.tbl, self.width = tbl, width
+
+    def __missing__(self, code):
+        name = CELLS.names[code]
+        mask = None
+        if name.isdigit():
+            mask = 1 << int(name)
+        elif name in self.tbl.vars:
+            mask, rest = bitmask(self.tbl.vars[name])
+            mask = None if rest else mask
+        if mask is not None and mask >> self.width:
+            mask = None
+        self[code] = mask
+        return mask
+
+
+class _Pass:
+    def __init__(self, tbl):
+        self._width = max(tbl.n_states, 1)
+        self._masks = _CellMasks(tbl, self._width)
+        self._sym_type = symutils.get_sym_type(tbl.directives['symmetries'])
+        self._perms = {}
+
+    def _permutations(self, length):
+        """The index permutations to go through, or None if any will do"""
+        if length not in self._perms:
+            self._perms[length] = symutils.variant_permutations(self._sym_type, length)
+        return self._perms[length]
+
+
+class ShadowedTransitions(_Pass):
+    """
+    Filters out each transition that some single earlier one shadows
+    entirely, i.e. where some symmetric variant of the earlier one
+    matches every state that every cell of this one does (and where
+    it has a bound variable, this one has the same thing in each of
+    the cells that variable is in).
+
+    Transitions are compared as ints made of their cells' bitmasks laid
+    end to end, so that checking whether a variant covers a transition
+    is a single `&`. Under permute, whose 8! variants are too many to go
+    through, the neighbors are matched up with each other directly.
+    """
+    def __init__(self, tbl):
+        super().__init__(tbl)
+        self.removed = 0
+        # {center cell's mask :: [(~union of a transition's variants, how to check it), ...]}
+        self._kept = {}
+
+    def filter(self, final):
+        for tr in final:
+            if self._shadowed(tr):
+                self.removed += 1
+                continue
+            yield tr
+
+    def _pack(self, center, napkin):
+        packed = center
+        for n, mask in enumerate(napkin, 1):
+            packed |= mask << (n * self._width)
+        return packed
+
+    def _shadowed(self, tr):
+        codes = tr.codes[:-1]
+        masks = [self._masks[code] for code in codes]
+        if None in masks:
+            return False
+        center, *napkin = masks
+        packed = self._pack(center, napkin)
+        for key, kept in self._kept.items():
+            if center & ~key:
+                continue
+            for not_union, covers in kept:
+                if not packed & not_union and covers(packed, codes, napkin):
+                    return True
+        # a variable that occurs more than once is bound, so the cells it's in
+        # also have to be one and the same state (or variable) in what it shadows
+        occurrences = {}
+        for i, code in enumerate(codes):
+            if not CELLS.names[code].isdigit():
+                occurrences.setdefault(code, []).append(i)
+        bound = [cells for cells in occurrences.values() if len(cells) > 1]
+        perms = self._permutations(len(napkin))
+        if perms is None:
+            if bound:
+                return False
+            union = 0
+            for mask in napkin:
+                union |= mask
+            self._kept.setdefault(center, []).append((~self._pack(center, [union] * len(napkin)), _matcher(napkin)))
+            return False
+        not_variants = []
+        union = 0
+        for perm in perms:
+            variant = self._pack(center, permuter(perm)(napkin))
+            union |= variant
+            # (where each of those cells ends up in this variant)
+            moved = {0: 0, **{1 + j: 1 + i for i, j in enumerate(perm)}}
+            not_variants.append((~variant, [[moved[i] for i in cells] for cells in bound]))
+        self._kept.setdefault(center, []).append((~union, _variant_checker(not_variants)))
+        return False
+
+
+class _Run:
+    """One or more transitions merged into a single line"""
+    __slots__ = 'tr', 'masks', 'spread', 'at', 'keys'
+
+    def __init__(self, tr, masks):
+        self.tr, self.masks = tr, masks
+        self.spread = None  # per cell, the union of what any variant has there
+        self.at = None  # (cell merged at, whether the resultant is that cell's state)
+        self.keys = []
+
+
+class MergedTransitions(_Pass):
+    """
+    Merges each transition into an earlier one that's the same but for a
+    single cell, by making that cell a variable of the states either has
+    there. The two have to agree on the resultant, or else each has to
+    have that cell's state as its resultant (in which case the merged
+    line does too -- so that's only done under symmetries with no other
+    variants than the line itself).
+
+    Merging moves the later transition up to the earlier one, so it's only
+    done if nothing in between can match any neighborhood that it does.
+    Merges are found greedily, and only among the last WINDOW lines.
+    """
+    WINDOW = 64
+
+    def __init__(self, tbl, *, by_context=False):
+        super().__init__(tbl)
+        self.merged = 0
+        self._tbl = tbl
+        self._by_context = by_context  # (only merge lines from the same source line)
+        self._buffer = deque()
+        self._index = {}  # {((cell, *the others), resultant[, context]) :: _Run}
+        self._names = {}  # {states' mask :: (varname, code of it untagged)}
+
+    def filter(self, final):
+        for tr in final:
+            masks = [self._masks[code] for code in tr.codes[:-1]]
+            if None in masks or not self._merge(tr, masks):
+                run = _Run(tr, None if None in masks else masks)
+                self._buffer.append(run)
+                self._add_keys(run)
+            if len(self._buffer) > self.WINDOW:
+                yield self._emit(self._buffer.popleft())
+        while self._buffer:
+            yield self._emit(self._buffer.popleft())
+
+    def _keys(self, tr):
+        *codes, resultant = tr.codes
+        # (a resultant bound to a cell is that cell's state in whichever variant
+        # matches first, and merging two lines can change which variant that is)
+        unvaried = self._permutations(len(codes) - 1) == [tuple(range(len(codes) - 1))]
+        if not unvaried and not CELLS.names[resultant].isdigit():
+            return
+        for i, code in enumerate(codes):
+            if not CELLS.names[code].isdigit() and codes.count(code) > 1:
+                # (bound to another cell, which it'd have to stay the same as)
+                continue
+            others = (i, *codes[:i], *codes[i+1:])
+            ctx = (tr.ctx,) if self._by_context else ()
+            if resultant == code and unvaried:
+                # (None standing for "this cell's state")
+                yield (others, None, *ctx)
+            if resultant != code or CELLS.names[code].isdigit():
+                yield (others, resultant, *ctx)
+
+    def _add_keys(self, run):
+        if run.masks is None:
+            return
+        run.keys = list(self._keys(run.tr))
+        for key in run.keys:
+            self._index[key] = run
+
+    def _merge(self, tr, masks):
+        for key in self._keys(tr):
+            run = self._index.get(key)
+            if run is None:
+                continue
+            buffer = list(self._buffer)
+            following = buffer[buffer.index(run) + 1:]
+            if any(self._overlap(masks, other) for other in following):
+                continue
+            i = key[0][0]
+            run.masks[i] |= masks[i]
+            run.spread = None
+            if run.at is None:
+                run.at = i, key[1] is None
+                for other_key in run.keys:
+                    if other_key != key and self._index.get(other_key) is run:
+                        del self._index[other_key]
+                run.keys = [key]
+            self.merged += 1
+            return True
+        return False
+
+    def _overlap(self, masks, run):
+        """Whether some neighborhood could match both `masks` and `run`"""
+        if run.masks is None:
+            return True
+        center, *napkin = masks
+        other_center, *other = run.masks
+        if not center & other_center:
+            return False
+        perms = self._permutations(len(napkin))
+        if run.spread is None:
+            if perms is None:
+                union = 0
+                for mask in other:
+                    union |= mask
+                run.spread = [union] * len(other)
+            else:
+                run.spread = [0] * len(other)
+                for perm in perms:
+                    run.spread = [a | b for a, b in zip(run.spread, permuter(perm)(other))]
+        if any(not a & b for a, b in zip(napkin, run.spread)):
+            return False
+        if perms is None:
+            return symutils.pairs_off(napkin, other, lambda a, b: a & b)
+        return any(all(a & b for a, b in zip(napkin, permuter(perm)(other))) for perm in perms)
+
+    def _emit(self, run):
+        for key in run.keys:
+            if self._index.get(key) is run:
+                del self._index[key]
+        if run.at is None:
+            return run.tr
+        i, bound = run.at
+        name, untagged = self._varname(run.masks[i])
+        codes = list(run.tr.codes)
+        used = {CELLS.tags[code] for code in codes if CELLS.names[code] == name}
+        tag = next(j for j in range(len(codes) + 1) if j not in used)
+        name.update_rep(tag)
+        codes[i] = CELLS.code(CELLS.names[untagged], tag)
+        if bound:
+            codes[-1] = codes[i]
+        return FinalTransition(codes=codes, context=run.tr.ctx, extra=run.tr.extra)
+
+    def _varname(self, mask):
+        if mask not in self._names:
+            states = tuple(n for n in range(mask.bit_length()) if mask >> n & 1)
+            name = self._tbl.vars.inv.get(states)
+            if name is None:
+                name = self._tbl.new_varname()
+                self._tbl.vars[name] = StateList(states, context=None)
+            self._names[mask] = name, CELLS.code(str(name))
+        return self._names[mask]
+
+
+def _variant_checker(not_variants):
+    def covers(packed, codes, napkin):
+        return any(
+          not packed & not_variant and all(len({codes[i] for i in cells}) == 1 for cells in bound)
+          for not_variant, bound in not_variants
+          )
+    return covers
+
+
+def _matcher(cover):
+    """
+    Checks whether the cells of a napkin can each be paired off with a
+    different one of `cover`'s that matches all its states, i.e. whether
+    some rearrangement of `cover` covers the napkin
+    """
+    def covers(packed, codes, napkin):
+        return symutils.pairs_off(napkin, cover, lambda a, b: not a & ~b)
+    return covers
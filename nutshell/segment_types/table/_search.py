@@ -0,0 +1,130 @@
+"""
+An index over a table's transitions for `-f`, so that a search needn't go
+through the whole table one transition and one query variant at a time.
+"""
+from collections.abc import Iterable
+
+from ._classes import StateList
+from ._napkins import permuter
+from . import _symutils as symutils
+
+WILDCARDS = frozenset({'*', '?'})
+
+
+def _bitset(indices, length):
+    """An int with the bits at `indices` set (without building it up one | at a time)"""
+    bits = bytearray(length // 8 + 1)
+    for i in indices:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def _accepted(cell):
+    """Bitmask of the states that a search term can match a transition's `cell` with"""
+    if isinstance(cell, StateList):
+        return cell.bits[0]
+    if isinstance(cell, Iterable):
+        mask = 0
+        for state in cell:
+            if isinstance(state, int) and state >= 0:
+                mask |= 1 << state
+        return mask
+    value = getattr(cell, 'value', cell)
+    return 1 << value if isinstance(value, int) and value >= 0 else 0
+
+
+class TransitionIndex:
+    """
+    For each cell of a transition and each state, the transitions whose
+    cell there takes that state, as an int with a bit set for each one
+    (bit n for transitions[n]); the transitions a query can match are then
+    just the `&` of those for each of its states.
+
+    A cell that takes every state is kept apart rather than added to every
+    state's bitset, so big tables full of `any` don't cost n_states times over.
+    Under permute, where a query has too many variants to go through, the
+    transitions that could match are narrowed down by which states they
+    take anywhere in the neighborhood, and then checked one by one.
+    """
+    def __init__(self, transitions, sym_type, trlen, n_states):
+        self._sym_type, self._trlen = sym_type, trlen
+        transitions = list(transitions)
+        self._all = (1 << len(transitions)) - 1
+        full = (1 << n_states) - 1
+        wild = [[] for _ in range(2 + trlen)]
+        specific = [{} for _ in range(2 + trlen)]
+        self._cells = []  # {transition :: what each of its cells takes}
+        for i, tr in enumerate(transitions):
+            self._cells.append([_accepted(cell) for cell in tr])
+            for position, mask in enumerate(self._cells[-1]):
+                if mask & full == full:
+                    wild[position].append(i)
+                    mask &= ~full
+                while mask:
+                    low = mask & -mask
+                    specific[position].setdefault(low.bit_length() - 1, []).append(i)
+                    mask ^= low
+        self._n_states = n_states
+        self._wild = [_bitset(indices, len(transitions)) for indices in wild]
+        self._specific = [
+          {state: _bitset(indices, len(transitions)) for state, indices in by_state.items()}
+          for by_state in specific
+          ]
+
+    def _posting(self, position, state):
+        """The transitions whose cell at `position` takes `state`"""
+        wild = self._wild[position] if 0 <= state < self._n_states else 0
+        return wild | self._specific[position].get(state, 0)
+
+    def _anywhere(self, state):
+        """The transitions with a neighbor (not the center) that takes `state`"""
+        anywhere = 0
+        for position in range(1, 1 + self._trlen):
+            anywhere |= self._posting(position, state)
+        return anywhere
+
+    def _first_in_any_order(self, center, napkin, candidates):
+        if center not in WILDCARDS:
+            candidates &= self._posting(0, center)
+        for state in set(napkin) - WILDCARDS:
+            candidates &= self._anywhere(state)
+        while candidates:
+            low = candidates & -candidates
+            candidates ^= low
+            i = low.bit_length() - 1
+            if symutils.pairs_off(napkin, self._cells[i][1:-1], lambda state, mask: state in WILDCARDS or mask >> state & 1):
+                return i
+        return None
+
+    def first(self, query):
+        """
+        (index, whether its resultant is the query's too) of the first
+        transition that any symmetric variant of `query` matches, or None
+        if there's no such transition.
+
+        If the query has wildcards among its input cells, a transition
+        whose resultant is different doesn't count, because one with the
+        wildcards filled in differently might still be found further on.
+        """
+        center, *napkin, resultant = query
+        same_resultant = self._all if resultant in WILDCARDS else self._posting(1 + self._trlen, resultant)
+        wildcard_inputs = bool(WILDCARDS.intersection(query[:-1]))
+        perms = symutils.variant_permutations(self._sym_type, self._trlen)
+        if perms is None:
+            first = self._first_in_any_order(center, napkin, same_resultant if wildcard_inputs else self._all)
+            return None if first is None else (first, bool(same_resultant >> first & 1))
+        matched = 0
+        for variant in dict.fromkeys(tuple(permuter(perm)(napkin)) for perm in perms):
+            candidates = self._all
+            for position, state in enumerate((center, *variant)):
+                if state not in WILDCARDS:
+                    candidates &= self._posting(position, state)
+                    if not candidates:
+                        break
+            matched |= candidates
+        if wildcard_inputs:
+            matched &= same_resultant
+        if not matched:
+            return None
+        first = (matched & -matched).bit_length() - 1
+        return first, bool(same_resultant >> first & 1)
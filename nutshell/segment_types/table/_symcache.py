@@ -0,0 +1,81 @@
+"""
+On-disk cache of symmetry types' index permutations (the `none`-symmetry
+expansion of cls(range(n)) for each neighborhood length n), so that big ones
+like permute's 8! needn't be worked out again in every run.
+
+An entry is keyed by the class's qualified name, the Nutshell version, and the
+source of every module the class and its bases were defined in; it holds the
+permutations as n bytes apiece. Failing to read or write the cache is never an
+error, only a reason to compute them afresh.
+"""
+import hashlib
+import os
+import sys
+from functools import lru_cache
+
+from nutshell import __version__
+from nutshell.cli import cache_directory
+
+
+def directory():
+    return cache_directory('symmetries')
+
+
+@lru_cache(maxsize=None)
+def _module_hash(module_name):
+    path = getattr(sys.modules.get(module_name), '__file__', None)
+    if path is None:
+        return None
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def forget(module_name):
+    """Rehash `module_name` next time round, e.g. once it's been reloaded"""
+    # (lru_cache can't drop a single key, but the rest are cheap to rehash)
+    _module_hash.cache_clear()
+
+
+def _entry_path(cls, length):
+    modules = sorted({base.__module__ for base in cls.__mro__} - {'builtins'})
+    blob = repr([__version__, cls.__module__, cls.__qualname__, [(m, _module_hash(m)) for m in modules]])
+    return os.path.join(directory(), f'{hashlib.sha256(blob.encode()).hexdigest()}-{length}.bin')
+
+
+def load(cls, length):
+    """Returns the cached set of cls's index permutations of `length`, or None"""
+    try:
+        with open(_entry_path(cls, length), 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    if not data or len(data) % length:
+        return None
+    return set(zip(*[iter(data)] * length))
+
+
+def store(cls, length, perms):
+    cells = set(range(min(length, 256)))
+    if any(len(perm) != length or not cells.issuperset(perm) for perm in perms):
+        # (not something that fits in n bytes -- a custom expansion
+        # that adds or drops cells instead of rearranging them)
+        return
+    import tempfile
+    path = _entry_path(cls, length)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(bytes(i for perm in sorted(perms) for i in perm))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
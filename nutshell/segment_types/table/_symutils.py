@@ -1,11 +1,54 @@
 from importlib import import_module
 
 from nutshell.common import symmetries as ext_symmetries
-from . import _napkins as napkins
+from . import _napkins as napkins, _symcache
 
 NAMES = napkins.NAMES.copy()
 
 
+def comprises(cls, other, tr_len):
+    """
+    Whether every napkin `other` expands a napkin of length tr_len to is
+    also in cls's expansion of it -- which, if both are permutation groups,
+    only needs other's generators checked
+    """
+    group, subgroup = cls.groups[tr_len], other.groups[tr_len]
+    if group is not None and subgroup is not None:
+        return subgroup <= group
+    return other.symmetries[tr_len] <= cls.symmetries[tr_len]
+
+
+def variant_permutations(cls, tr_len):
+    """
+    The index permutations that give cls's variants of a napkin of length
+    tr_len (sorted), or None if they're every permutation there is
+    """
+    if isinstance(cls.groups.get(tr_len), napkins.SymmetricGroup):
+        return None
+    if tr_len in cls.symmetries:
+        return sorted(cls.symmetries[tr_len])
+    return [tuple(range(tr_len))]
+
+
+def pairs_off(napkin, other, fits):
+    """
+    Whether each of napkin's cells can be paired with a different one of
+    `other`'s that it fits
+    """
+    paired = {}  # {index in other :: index in napkin}
+    
+    def pair(i, tried):
+        # (finding an augmenting path, as in bipartite matching)
+        for j, mask in enumerate(other):
+            if j not in tried and fits(napkin[i], mask):
+                tried.add(j)
+                if j not in paired or pair(paired[j], tried):
+                    paired[j] = i
+                    return True
+        return False
+    return all(pair(i, set()) for i in range(len(napkin)))
+
+
 def find_min_sym_type(symmetries, tr_len):
     """
     Find the "minimum" common symmetry type between all given symmetries.
@@ -25,28 +68,30 @@ def find_min_sym_type(symmetries, tr_len):
     (3) if (2), returning that minimum symmetry type, but otherwise:
     (4) finding the first Golly symmetry type that is comprised entirely
         by both the minimum symmetry type and all the rest
+    Symmetry types are compared as permutation groups where they are
+    ones, so none of this has to enumerate e.g. permute's 8! napkins.
     """
     # Find smallest symmetries:none-expanded sym type
-    # (sym_lens holds precalculated lengths of these 'none expansions')
+    # (sym_lens holds the lengths of these 'none expansions', i.e. group orders)
     min_cls = min(symmetries, key=lambda cls: cls.sym_lens[tr_len])
     # If it's a custom symmetry type, use its Golly fallback
     golly_cls = min_cls if not hasattr(min_cls, 'fallback') else min_cls.fallback.get(tr_len, min_cls.fallback[None])
-    min_syms, min_sym_len = golly_cls.symmetries[tr_len], golly_cls.sym_lens[tr_len]
-    # All symmetry types used which do not comprise min_syms
+    min_sym_len = golly_cls.sym_lens[tr_len]
+    # All symmetry types used which do not comprise golly_cls
     failures = [
-      napkin_set for napkin_set in
-        [c.symmetries[tr_len] for c in symmetries if min_cls is not c is not golly_cls]
-      if not all(map(napkin_set.__contains__, min_syms))
+      c for c in symmetries
+      if min_cls is not c is not golly_cls
+      and not comprises(c, golly_cls, tr_len)
       ]
     if not failures:
         return golly_cls
-    to_test = [min_syms, *failures]
-    # Largest Golly symmetry type that comprises both min_syms and everything else used
+    to_test = [golly_cls, *failures]
+    # Largest Golly symmetry type that is comprised by both golly_cls and everything else used
     return next(
       cls
       for cls, v in napkins.GOLLY_SYMS[tr_len]
       if v < min_sym_len
-      and all(napkin in napkin_set for napkin in cls.symmetries[tr_len] for napkin_set in to_test)
+      and all(comprises(c, cls, tr_len) for c in to_test)
       )
 
 
@@ -58,3 +103,11 @@ def get_sym_type(sym):
         module = ext_symmetries if name == 'nutshell' else import_module(name.lstrip('_'))
         NAMES[sym] = getattr(module, clsname)
     return NAMES[sym]
+
+
+def forget_module(module_name):
+    """Drop symmetry types imported from `module_name` so they're looked up afresh"""
+    for sym, cls in list(NAMES.items()):
+        if cls.__module__ == module_name:
+            del NAMES[sym]
+    _symcache.forget(module_name)
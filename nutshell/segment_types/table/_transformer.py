@@ -1,3 +1,4 @@
+import re
 from collections import namedtuple
 from functools import wraps
 from inspect import signature
@@ -15,6 +16,7 @@ from . import _symutils as symutils, _neighborhoods as nbhoods, inline_rulestrin
 
 SPECIALS = {'...', '_', 'N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW'}
 Meta = namedtuple('Meta', ['lno', 'start', 'end'])
+NAME = re.compile(r'[A-Za-z_]\w*')
 
 
 def fix(meta):
@@ -31,6 +33,12 @@ def inline(func):
     return wrapper
 
 
+def shift_lno(ctx, by):
+    if isinstance(ctx, Meta):
+        return ctx._replace(lno=ctx.lno + by)
+    return (ctx[0] + by, *ctx[1:])
+
+
 def _add_mod(modulus, index, add, start=1):
     index += add - start
     return index % modulus + start
@@ -55,6 +63,10 @@ class Preprocess(Transformer):
         self.vars = tbl.vars
         self.consts = {}
         self._nbhd_assigned = False
+        # What a line's expansion can depend on, for TableSegment.expanded_lines:
+        # every directive so far, plus the declarations of the names it mentions
+        self._directives_key = None
+        self._decl_keys = {}
     
     def kill_string(self, val, meta, li=False, var_and_special=True):
         if isinstance(val, str):
@@ -106,6 +118,52 @@ class Preprocess(Transformer):
         # will already have been transformed (by self.permute_shorthand) and
         # returned by the first conditional in this method
     
+    def transform(self, tree):
+        # (n_states isn't known until the whole table has been lexed)
+        self._directives_key = hash((tuple(self.directives.items()), self._tbl.n_states))
+        return super().transform(tree)
+    
+    def line_key(self, lno):
+        text = self._tbl[lno-1].split('#', 1)[0].rstrip()
+        names = {i for i in NAME.findall(text) if i in self._decl_keys or f'+{i}' in self._decl_keys}
+        return text, self._directives_key, tuple((i, self._decl_keys.get(i), self._decl_keys.get(f'+{i}')) for i in sorted(names))
+    
+    def _transform_tree(self, tree):
+        # (rulestring transitions aren't worth it: they name new variables as they go,
+        # which couldn't be replayed without desyncing the table's varname generator)
+        if tree.data != 'transition':
+            return super()._transform_tree(tree)
+        tbl, lno = self._tbl, tree.meta.line
+        key = self.line_key(lno)
+        if key in tbl.expanded_lines:
+            tbl.expanded_lines.move_to_end(key)
+            return self._replay_line(lno, *tbl.expanded_lines[key])
+        n_vars, sym_types, dependencies, default_sym_used = len(tbl.vars), set(tbl.sym_types), set(tbl.dependencies), tbl.default_sym_used
+        ret = super()._transform_tree(tree)
+        if len(tbl.vars) != n_vars:
+            # same thing (stationary auxiliaries can name new variables too)
+            return ret
+        tbl.expanded_lines[key] = (
+          lno,
+          tbl.sym_types - sym_types,
+          tbl.dependencies - dependencies,
+          tbl.default_sym_used and not default_sym_used,
+          [(tr.tr, tr.ctx, tr.extra, tr.symmetries) for tr in ret]
+          )
+        if len(tbl.expanded_lines) > tbl.EXPANDED_LINES_MAXSIZE:
+            tbl.expanded_lines.popitem(last=False)
+        return ret
+    
+    def _replay_line(self, lno, cached_lno, sym_types, dependencies, default_sym_used, transitions):
+        self._tbl.sym_types.update(sym_types)
+        self._tbl.dependencies.update(dependencies)
+        if default_sym_used:
+            self._tbl.default_sym_used = True
+        return [
+          Transition(tr, self._tbl, context=shift_lno(ctx, lno - cached_lno), extra=extra, symmetries=symmetries)
+          for tr, ctx, extra, symmetries in transitions
+          ]
+    
     #-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#
     
     def table(self, transitions, meta):
@@ -136,6 +194,7 @@ class Preprocess(Transformer):
     
     @inline
     def directive(self, meta, name, val):
+        self._directives_key = hash((self._directives_key, self.line_key(meta.lno)))
         if not isinstance(val, str):
             val = str(val)
         cmt_val = val
@@ -176,11 +235,13 @@ class Preprocess(Transformer):
     
     @inline
     def var_decl(self, meta, name, var):
+        self._decl_keys[str(name)] = hash(self.line_key(meta.lno))
         self.vars[VarName(name)] = self.noref_var(var, meta)
         raise Discard
     
     @inline
     def const_decl(self, meta, name, val):
+        self._decl_keys[f'+{name}'] = hash(self.line_key(meta.lno))
         self.consts[name] = self.kill_string(val, meta)
         raise Discard
     
@@ -444,7 +505,10 @@ class Preprocess(Transformer):
     
     @inline
     def noref_subt(self, meta, minuend, subtrhnd):
-        return StateList(i for i in self.kill_string(minuend, meta) if i not in self.kill_string(subtrhnd, meta, li=True))
+        subtrhnd = self.kill_string(subtrhnd, meta, li=True)
+        if not isinstance(subtrhnd, StateList):
+            subtrhnd = StateList(subtrhnd)
+        return StateList(i for i in self.kill_string(minuend, meta) if i not in subtrhnd)
     
     @inline
     def noref_live_except(self, meta, subtrhnd):
@@ -587,7 +651,11 @@ class Preprocess(Transformer):
     def modified_rulestring_napkin(self, meta, rulestring, modifier, foreground, background):
         imp = modifier.split('.', 1)
         try:
-            func = inline_rulestring.funcs.get(modifier, None) or getattr(import_module(imp[0]), imp[1])
+            func = inline_rulestring.funcs.get(modifier, None)
+            if func is None:
+                module = import_module(imp[0])
+                func = getattr(module, imp[1])
+                self._tbl.add_dependency(module)
         except (ImportError, ModuleNotFoundError):
             raise UndefinedErr(meta, f"Unknown modifier '{modifier}'")
         return func, {
@@ -0,0 +1,204 @@
+"""
+Compiles a table's transitions straight to Golly's @TREE format.
+
+A rule tree is a DAG that decides a cell's next state by looking at one
+cell per level, in the order Golly's ruletree algorithm reads them (nw, ne,
+sw, se, n, w, e, s, and then the cell itself; or just n, w, e, s, and the
+cell), and whose bottom-level nodes map the cell's state to its next one.
+It's built top-down by narrowing the table's transitions to the ones still
+able to match at each node, the first of which decides the result, and
+nodes that come out the same are only stored once.
+"""
+from itertools import product
+
+from nutshell.common.errors import Error
+from ._classes import CELLS, bitmask
+from ._napkins import multiset_permutations, permuter
+from . import _symutils as symutils
+
+# {number of neighbors :: the compass directions a @TREE goes through, in order}
+TREE_ORDER = {
+  4: ('N', 'W', 'E', 'S'),
+  8: ('NW', 'NE', 'SW', 'SE', 'N', 'W', 'E', 'S'),
+}
+
+
+class RuleTree:
+    """
+    Iterates over the lines of the @TREE segment equivalent to `transitions`
+    (a table's compiled FinalTransitions, in order).
+
+    Every symmetric variant of every transition is numbered, with bound
+    variables spelt out state by state, so that the variants that can still
+    match at a node are a single int with a bit set for each; going down a
+    level then only takes an `&` with the variants that accept each state
+    there. (States that the same variants accept are gone through as one.)
+
+    Working out a node takes a child per state, and many nodes only turn
+    out to be duplicates once they're worked out, so a table with lots of
+    states can take far too long to become a tree and far too much memory
+    to hold as one; building stops with an error once MAX_CHILDREN
+    children have been worked out.
+    """
+    MAX_CHILDREN = 1 << 22
+
+    def __init__(self, tbl, transitions):
+        self.n_states = tbl.n_states
+        cardinals = tbl.CARDINALS[tbl.directives['neighborhood']]
+        self.n_neighbors = 4 if set(cardinals) <= set(TREE_ORDER[4]) else 8
+        # index in a transition of the cell each level looks at (or None if it's not in the table's neighborhood)
+        self._order = [cardinals.get(cdir) for cdir in TREE_ORDER[self.n_neighbors]] + [0]
+        self._full = (1 << self.n_states) - 1
+        self._sym_type = symutils.get_sym_type(tbl.directives['symmetries'])
+        self._tbl = tbl
+        self._masks = {}
+        self._outputs = []  # {variant :: its resultant}
+        self._cells = []  # {variant :: its cells' masks}
+        self._total_from = []  # {variant :: the first level from which it matches anything}
+        # per level: (the variants that accept any state there, [the others that accept each state])
+        self._accepts = [(0, [0] * self.n_states) for _ in self._order]
+        for tr in transitions:
+            for cells, output in self._expand(tr):
+                self._add_variant(cells, output)
+        # per level: [(the variants that accept some states, those states), ...]
+        self._classes = []
+        for wild, specific in self._accepts:
+            classes = {}
+            for state, variants in enumerate(specific):
+                classes.setdefault(wild | variants, []).append(state)
+            self._classes.append(list(classes.items()))
+        # per level: {variant :: the earlier variants that match everything it does from there on down}
+        self._shadowers = [[0] * len(self._outputs) for _ in range(len(self._order) + 1)]
+        self._shadowers[-1] = [(1 << i) - 1 for i in range(len(self._outputs))]
+        covering = {}  # {(level, mask) :: the variants that accept every state in it there}
+        for depth in reversed(range(len(self._order))):
+            wild, specific = self._accepts[depth]
+            for i, cells in enumerate(self._cells):
+                mask = cells[depth]
+                if (depth, mask) not in covering:
+                    variants = -1
+                    for state in range(self.n_states):
+                        if mask >> state & 1:
+                            variants &= wild | specific[state]
+                    covering[depth, mask] = variants
+                self._shadowers[depth][i] = self._shadowers[depth + 1][i] & covering[depth, mask]
+        self.nodes = []  # lines of the nodes, each after the ones it points to
+        self._ids = {}  # {(level, children) :: node's index}
+        self._built = {}  # {(depth, candidates) :: node's index}
+        self._budget = self.MAX_CHILDREN
+        self._build(0, (1 << len(self._outputs)) - 1)
+
+    def __iter__(self):
+        yield f'num_states={self.n_states}'
+        yield f'num_neighbors={self.n_neighbors}'
+        yield f'num_nodes={len(self.nodes)}'
+        yield from self.nodes
+
+    def _mask(self, code):
+        if code not in self._masks:
+            name = CELLS.names[code]
+            if name.isdigit():
+                mask = 1 << int(name)
+            else:
+                mask, _ = bitmask(self._tbl.vars[name])
+            self._masks[code] = mask & self._full
+        return self._masks[code]
+
+    def _expand(self, tr):
+        """
+        Yields (the mask of each cell in the tree's order, resultant state)
+        for each variant of tr
+        """
+        *codes, resultant = tr.codes
+        occurrences = {}
+        for code in codes:
+            if not CELLS.names[code].isdigit():
+                occurrences[code] = occurrences.get(code, 0) + 1
+        bound = [code for code, n in occurrences.items() if n > 1 or code == resultant]
+        if not CELLS.names[resultant].isdigit() and resultant not in bound:
+            raise ValueError(f'Resultant {CELLS.strings[resultant]} of transition {", ".join(tr)} is not bound to any cell')
+        bound_states = [[state for state in range(self.n_states) if self._mask(code) >> state & 1] for code in bound]
+        for states in product(*bound_states):
+            # (with its bound variables' states filled in, so that every cell is just a mask)
+            masks = [1 << states[bound.index(code)] if code in bound else self._mask(code) for code in codes]
+            output = states[bound.index(resultant)] if resultant in bound else int(CELLS.names[resultant])
+            center, *napkin = masks
+            perms = symutils.variant_permutations(self._sym_type, len(napkin))
+            if perms is None:
+                arrangements = multiset_permutations(napkin)
+            else:
+                arrangements = dict.fromkeys(tuple(permuter(perm)(napkin)) for perm in perms)
+            for arrangement in arrangements:
+                cells = (center, *arrangement)
+                yield [self._full if i is None else cells[i] for i in self._order], output
+
+    def _add_variant(self, cells, output):
+        bit = 1 << len(self._outputs)
+        self._outputs.append(output)
+        self._cells.append(cells)
+        total_from = len(cells)
+        for depth, mask in enumerate(cells):
+            wild, specific = self._accepts[depth]
+            if mask == self._full:
+                self._accepts[depth] = wild | bit, specific
+                continue
+            total_from = depth + 1
+            while mask:
+                low = mask & -mask
+                specific[low.bit_length() - 1] |= bit
+                mask ^= low
+        self._total_from.append(total_from)
+
+    def _node(self, level, children):
+        key = level, tuple(children)
+        if key not in self._ids:
+            self._ids[key] = len(self.nodes)
+            self.nodes.append(f'{level} {" ".join(map(str, children))}')
+        return self._ids[key]
+
+    def _unshadowed(self, depth, candidates):
+        """
+        Drops the candidates that can't be reached from `depth` on, because an
+        earlier one matches everything they do, so that nodes that'll come
+        out the same are only built once
+        """
+        shadowers = self._shadowers[depth]
+        rest = candidates
+        while rest:
+            low = rest & -rest
+            rest ^= low
+            if candidates & shadowers[low.bit_length() - 1]:
+                candidates ^= low
+        return candidates
+
+    def _build(self, depth, candidates):
+        key = depth, candidates
+        if key in self._built:
+            return self._built[key]
+        self._budget -= self.n_states
+        if self._budget < 0:
+            raise Error(
+              None,
+              f'Rule tree too big to build (over {self.MAX_CHILDREN} node children worked out, {self.n_states} per node)'
+              )
+        last = depth == len(self._order) - 1
+        children = [None] * self.n_states
+        for accepting, states in self._classes[depth]:
+            matching = candidates & accepting
+            first = (matching & -matching).bit_length() - 1
+            if last:
+                for state in states:
+                    # (a cell no transition matches stays as it is)
+                    children[state] = state if first < 0 else self._outputs[first]
+                continue
+            if first >= 0 and self._total_from[first] <= depth + 1:
+                # (nothing after it could ever be reached)
+                matching &= -matching
+            else:
+                matching = self._unshadowed(depth + 1, matching)
+            child = self._build(depth + 1, matching)
+            for state in states:
+                children[state] = child
+        node = self._node(len(self._order) - depth, children)
+        self._built[key] = node
+        return node
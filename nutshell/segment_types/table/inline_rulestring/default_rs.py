@@ -70,7 +70,8 @@ def standard(meta, initial, fg, bg, resultant, rulestring, variables, table):
           symmetries=ROTATE_4_REFLECT
         )
         for nb_count, letters in r4r_nbhds.items()
-        for letter in letters
+        # (sets of letters iterate in an order that varies with PYTHONHASHSEED)
+        for letter in sorted(letters, key=hensel.R4R_LETTERS.index)
     ]
     if '8' in r4r_nbhds:
         ret.append(TransitionGroup(
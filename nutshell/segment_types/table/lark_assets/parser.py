@@ -1556,29 +1556,28 @@ class LALR_Parser(object):
         self.parser = _Parser(analysis.parse_table, callbacks, debug)
 
     @classmethod
-    def deserialize(cls, data, memo, callbacks, *, tbl):
+    def deserialize(cls, data, memo, callbacks):
         inst = cls.__new__(cls)
         inst._parse_table = IntParseTable.deserialize(data, memo)
-        inst.parser = _Parser(inst._parse_table, callbacks, tbl=tbl)
+        inst.parser = _Parser(inst._parse_table, callbacks)
         return inst
 
     def serialize(self, memo):
         return self._parse_table.serialize(memo)
 
-    def parse(self, *args):
-        return self.parser.parse(*args)
+    def parse(self, *args, **kwargs):
+        return self.parser.parse(*args, **kwargs)
 
 
 class _Parser:
-    def __init__(self, parse_table, callbacks, debug=False, *, tbl):
+    def __init__(self, parse_table, callbacks, debug=False):
         self.states = parse_table.states
         self.start_states = parse_table.start_states
         self.end_states = parse_table.end_states
         self.callbacks = callbacks
         self.debug = debug
-        self._tbl = tbl
 
-    def parse(self, seq, start, set_state=None):
+    def parse(self, seq, start, set_state=None, *, tbl):
         token = None
         stream = iter(seq)
         states = self.states
@@ -1640,7 +1639,7 @@ class _Parser:
 
             raise
 
-        token = Token.new_borrow_pos('$END', '', token, tbl=self._tbl) if token else Token('$END', '', 0, 1, 1, tbl=self._tbl)
+        token = Token.new_borrow_pos('$END', '', token, tbl=tbl) if token else Token('$END', '', 0, 1, 1, tbl=tbl)
         while True:
             _action, arg = get_action(token)
             assert(_action is Reduce)
@@ -1749,13 +1748,13 @@ def get_frontend(parser, lexer):
 
 
 class _ParserFrontend(Serialize):
-    def _parse(self, input, start, *args):
+    def _parse(self, input, start, *args, **kwargs):
         if start is None:
             start = self.start
             if len(start) > 1:
                 raise ValueError("Lark initialized with more than 1 possible start rule. Must specify which start rule to parse", start)
             start ,= start
-        return self.parser.parse(input, start, *args)
+        return self.parser.parse(input, start, *args, **kwargs)
 
 
 class WithLexer(_ParserFrontend):
@@ -1773,10 +1772,10 @@ class WithLexer(_ParserFrontend):
         self.postlex = lexer_conf.postlex
 
     @classmethod
-    def deserialize(cls, data, memo, callbacks, postlex, *, tbl):
+    def deserialize(cls, data, memo, callbacks, postlex):
         inst = super(WithLexer, cls).deserialize(data, memo)
         inst.postlex = postlex
-        inst.parser = LALR_Parser.deserialize(inst.parser, memo, callbacks, tbl=tbl)
+        inst.parser = LALR_Parser.deserialize(inst.parser, memo, callbacks)
         inst.init_lexer()
         return inst
 
@@ -1826,7 +1825,7 @@ class LALR_ContextualLexer(LALR_WithLexer):
             parser_state[0] = s
 
         token_stream = self.lex(text, lambda: parser_state[0], tbl=tbl)
-        return self._parse(token_stream, start, set_parser_state)
+        return self._parse(token_stream, start, set_parser_state, tbl=tbl)
 
 
 class LarkOptions(Serialize):
@@ -2109,7 +2108,7 @@ class Lark(Serialize):
         inst = cls.__new__(cls)
         return inst._load(f)
 
-    def _load(self, f, transformer=None, postlex=None, *, tbl):
+    def _load(self, f, transformer=None, postlex=None):
         if isinstance(f, dict):
             d = f
         else:
@@ -2128,14 +2127,13 @@ class Lark(Serialize):
         self.rules = [Rule.deserialize(r, memo) for r in data['rules']]
         self.source = '<deserialized>'
         self._prepare_callbacks()
-        self.parser = self.parser_class.deserialize(data['parser'], memo, self._callbacks, self.options.postlex, tbl=tbl)
-        self._tbl = tbl
+        self.parser = self.parser_class.deserialize(data['parser'], memo, self._callbacks, self.options.postlex)
         return self
 
     @classmethod
-    def _load_from_dict(cls, data, memo, transformer=None, postlex=None, *, tbl):
+    def _load_from_dict(cls, data, memo, transformer=None, postlex=None):
         inst = cls.__new__(cls)
-        return inst._load({'data': data, 'memo': memo}, transformer, postlex, tbl=tbl)
+        return inst._load({'data': data, 'memo': memo}, transformer, postlex)
 
     @classmethod
     def open(cls, grammar_filename, rel_to=None, **options):
@@ -2172,14 +2170,16 @@ class Lark(Serialize):
         "Get information about a terminal"
         return self._terminals_dict[name]
 
-    def parse(self, text, start=None):
+    def parse(self, text, start=None, *, tbl):
         """Parse the given text, according to the options provided.
 
         The 'start' parameter is required if Lark was given multiple possible start symbols (using the start option).
+        (Modified) `tbl` is the TableSegment whose state-count the lexer should update; it's
+        bound per call so that one Lark instance can be shared between tables.
 
         Returns a tree, unless specified otherwise.
         """
-        return self.parser.parse(text, start=start, tbl=self._tbl)
+        return self.parser.parse(text, start=start, tbl=tbl)
 
 DATA = (
 {'parser': {'parser': {'tokens': {0: '$END', 1: 'STATE', 2: '__ANON_5', 3: 'COMMA', 4: 'LSQB', 5: '_NL', 6: '_NEGATE_LIVE', 7: '_LROT', 8: '_SUBT', 9: '_MULT', 10: '_VAR_CLOSE', 11: 'NAME', 12: 'LBRACE', 13: '_VAR_OPEN', 14: '_RROT', 15: '_WS', 16: '__ANON_6', 17: 'BANG', 18: 'PLUS', 19: '_NEGATE_ALL', 20: 'math', 21: '_expr_no_int', 22: 'range', 23: 'operation', 24: 'var', 25: '_expr', 26: '__ANON_4', 27: '_PERMUTE', 28: '_NORMAL_ARROW', 29: '_HOIST_ARROW', 30: '_HENSEL_SEP', 31: 'RSQB', 32: 'SEMICOLON', 33: '_HENSEL_CLOSE', 34: '_ref_expr_no_int', 35: 'ref_var', 36: 'reference', 37: 'ref_operation', 38: 'INT', 39: 'RBRACE', 40: 'STAR', 41: 'SLASH', 42: '_math_expr', 43: '__ANON_1', 44: 'COMPASS_DIR', 45: '_HENSEL_OPEN', 46: '_aux_expr_no_int', 47: 'aux_operation', 48: 'LEAVE_ALONE', 49: 'aux_reference', 50: 'aux_var', 51: 'leave_alone_mult', 52: '_expr_no_rec', 53: '_expr_norec_int', 54: '__var_star_4', 55: '_subt', 56: 'COLON', 57: 'tr_operation', 58: '_tr_expr_no_int', 59: '_tr_expr', 60: 'tr_var', 61: '_aux_expr', 62: '___aux_group_star_3', 63: 'RPAR', 64: 'cdir_delay', 65: 'SYMMETRY_NAME', 66: 'symmetried_aux', 67: 'auxiliary', 68: '_rs_expr', 69: 'inline_binding', 70: '__ANON_2', 71: '_crange', 72: 'location', 73: 'tr_state', 74: 'math_operation', 75: '_sep', 76: 'end_bs', 77: 'comment', 78: 'line', 79: 'transition', 80: 'rulestring_tr', 81: '_ref_expr', 82: 'EQUAL', 83: '__ANON_0', 84: 'normal_aux', 85: '_ref_expr_no_rec', 86: '__ref_var_star_6', 87: 'hoist_aux', 88: '_auxlist', 89: '__tr_var_star_5', 90: 'LPAR', 91: '_aux_group', 92: '___auxlist_star_2', 93: '_ref_expr_norec_int', 94: '_tr_expr_no_rec', 95: '_tr_expr_norec_int', 96: 'rulestring_napkin', 97: 'EXTEND_LAST', 98: '__table_plus_0', 99: 'table', 100: '__transition_plus_1', 101: '_aux', 102: '_aux_expr_no_rec', 103: '__ANON_3', 104: '__aux_var_star_7', 105: '_aux_expr_norec_int'}, 'states': {0: {0: (1, {'@': 44}), 1: (1, {'@': 44}), 2: (1, {'@': 44}), 3: (1, {'@': 44}), 4: (1, {'@': 44}), 5: (1, {'@': 44}), 6: (1, {'@': 44}), 7: (1, {'@': 44}), 8: (1, {'@': 44}), 9: (1, {'@': 44}), 10: (1, {'@': 44}), 11: (1, {'@': 44}), 12: (1, {'@': 44}), 13: (1, {'@': 44}), 14: (1, {'@': 44}), 15: (1, {'@': 44}), 16: (1, {'@': 44}), 17: (1, {'@': 44}), 18: (1, {'@': 44}), 19: (1, {'@': 44})}, 1: {1: (0, 168), 20: (0, 174), 12: (0, 381), 21: (0, 180), 22: (0, 311), 23: (0, 318), 13: (0, 325), 24: (0, 0), 6: (0, 1), 11: (0, 2), 19: (0, 3), 25: (0, 329)}, 2: {0: (1, {'@': 45}), 1: (1, {'@': 45}), 2: (1, {'@': 45}), 3: (1, {'@': 45}), 4: (1, {'@': 45}), 5: (1, {'@': 45}), 6: (1, {'@': 45}), 7: (1, {'@': 45}), 8: (1, {'@': 45}), 9: (1, {'@': 45}), 10: (1, {'@': 45}), 11: (1, {'@': 45}), 12: (1, {'@': 45}), 13: (1, {'@': 45}), 14: (1, {'@': 45}), 15: (1, {'@': 45}), 16: (1, {'@': 45}), 17: (1, {'@': 45}), 18: (1, {'@': 45}), 19: (1, {'@': 45})}, 3: {1: (0, 168), 20: (0, 174), 25: (0, 48), 12: (0, 381), 21: (0, 180), 22: (0, 311), 23: (0, 318), 13: (0, 325), 24: (0, 0), 6: (0, 1), 11: (0, 2), 19: (0, 3)}, 4: {11: (1, {'@': 46}), 0: (1, {'@': 46}), 1: (1, {'@': 46}), 12: (1, {'@': 46}), 15: (1, {'@': 46}), 18: (1, {'@': 46}), 4: (1, {'@': 46}), 16: (1, {'@': 46}), 17: (1, {'@': 46}), 13: (1, {'@': 46}), 6: (1, {'@': 46}), 19: (1, {'@': 46})}, 5: {26: (0, 59), 15: (0, 77)}, 6: {15: (0, 394), 18: (0, 396), 26: (0, 403)}, 7: {18: (0, 406), 15: (0, 408), 26: (0, 128)}, 8: {9: (1, {'@': 47}), 27: (1, {'@': 47}), 0: (1, {'@': 47}), 1: (1, {'@': 47}), 7: (1, {'@': 47}), 10: (1, {'@': 47}), 11: (1, {'@': 47}), 2: (1, {'@': 47}), 12: (1, {'@': 47}), 19: (1, {'@': 47}), 3: (1, {'@': 47}), 28: (1, {'@': 47}), 29: (1, {'@': 47}), 18: (1, {'@': 47}), 4: (1, {'@': 47}), 13: (1, {'@': 47}), 14: (1, {'@': 47}), 30: (1, {'@': 47}), 15: (1, {'@': 47}), 31: (1, {'@': 47}), 6: (1, {'@': 47}), 16: (1, {'@': 47}), 17: (1, {'@': 47}), 5: (1, {'@': 47}), 32: (1, {'@': 47}), 8: (1, {'@': 47}), 33: (1, {'@': 47})}, 9: {9: (1, {'@': 48}), 27: (1, {'@': 48}), 0: (1, {'@': 48}), 1: (1, {'@': 48}), 7: (1, {'@': 48}), 10: (1, {'@': 48}), 11: (1, {'@': 48}), 2: (1, {'@': 48}), 12: (1, {'@': 48}), 19: (1, {'@': 48}), 3: (1, {'@': 48}), 28: (1, {'@': 48}), 29: (1, {'@': 48}), 18: (1, {'@': 48}), 4: (1, {'@': 48}), 13: (1, {'@': 48}), 14: (1, {'@': 48}), 30: (1, {'@': 48}), 15: (1, {'@': 48}), 31: (1, {'@': 48}), 6: (1, {'@': 48}), 16: (1, {'@': 48}), 17: (1, {'@': 48}), 5: (1, {'@': 48}), 32: (1, {'@': 48}), 8: (1, {'@': 48}), 33: (1, {'@': 48})}, 10: {9: (1, {'@': 49}), 6: (1, {'@': 49}), 10: (1, {'@': 49}), 14: (1, {'@': 49}), 7: (1, {'@': 49}), 8: (1, {'@': 49}), 3: (1, {'@': 49}), 33: (1, {'@': 49}), 30: (1, {'@': 49}), 27: (1, {'@': 49}), 11: (1, {'@': 49}), 0: (1, {'@': 49}), 1: (1, {'@': 49}), 12: (1, {'@': 49}), 2: (1, {'@': 49}), 29: (1, {'@': 49}), 28: (1, {'@': 49}), 4: (1, {'@': 49}), 13: (1, {'@': 49}), 5: (1, {'@': 49}), 32: (1, {'@': 49}), 15: (1, {'@': 49}), 16: (1, {'@': 49}), 17: (1, {'@': 49}), 18: (1, {'@': 49}), 19: (1, {'@': 49}), 31: (1, {'@': 49})}, 11: {9: (1, {'@': 50}), 6: (1, {'@': 50}), 10: (1, {'@': 50}), 14: (1, {'@': 50}), 7: (1, {'@': 50}), 8: (1, {'@': 50}), 3: (1, {'@': 50}), 33: (1, {'@': 50}), 30: (1, {'@': 50}), 27: (1, {'@': 50}), 11: (1, {'@': 50}), 0: (1, {'@': 50}), 1: (1, {'@': 50}), 12: (1, {'@': 50}), 2: (1, {'@': 50}), 29: (1, {'@': 50}), 28: (1, {'@': 50}), 4: (1, {'@': 50}), 13: (1, {'@': 50}), 5: (1, {'@': 50}), 32: (1, {'@': 50}), 15: (1, {'@': 50}), 16: (1, {'@': 50}), 17: (1, {'@': 50}), 18: (1, {'@': 50}), 19: (1, {'@': 50}), 31: (1, {'@': 50})}, 12: {9: (1, {'@': 51}), 27: (1, {'@': 51}), 0: (1, {'@': 51}), 1: (1, {'@': 51}), 7: (1, {'@': 51}), 10: (1, {'@': 51}), 11: (1, {'@': 51}), 2: (1, {'@': 51}), 12: (1, {'@': 51}), 19: (1, {'@': 51}), 3: (1, {'@': 51}), 28: (1, {'@': 51}), 29: (1, {'@': 51}), 18: (1, {'@': 51}), 4: (1, {'@': 51}), 13: (1, {'@': 51}), 14: (1, {'@': 51}), 30: (1, {'@': 51}), 15: (1, {'@': 51}), 31: (1, {'@': 51}), 6: (1, {'@': 51}), 16: (1, {'@': 51}), 17: (1, {'@': 51}), 5: (1, {'@': 51}), 32: (1, {'@': 51}), 8: (1, {'@': 51}), 33: (1, {'@': 51})}, 13: {12: (0, 381), 20: (0, 300), 1: (0, 81)}, 14: {1: (0, 186), 20: (0, 7), 4: (0, 389), 12: (0, 381), 19: (0, 194), 34: (0, 205), 13: (0, 213), 35: (0, 243), 6: (0, 250), 36: (0, 261), 15: (0, 268), 11: (0, 280), 37: (0, 287), 22: (0, 293)}, 15: {9: (1, {'@': 52}), 10: (1, {'@': 52}), 0: (1, {'@': 52}), 1: (1, {'@': 52}), 7: (1, {'@': 52}), 11: (1, {'@': 52}), 12: (1, {'@': 52}), 2: (1, {'@': 52}), 3: (1, {'@': 52}), 18: (1, {'@': 52}), 4: (1, {'@': 52}), 13: (1, {'@': 52}), 14: (1, {'@': 52}), 15: (1, {'@': 52}), 16: (1, {'@': 52}), 17: (1, {'@': 52}), 5: (1, {'@': 52}), 6: (1, {'@': 52}), 8: (1, {'@': 52}), 19: (1, {'@': 52}), 31: (1, {'@': 52}), 33: (1, {'@': 52}), 30: (1, {'@': 52}), 27: (1, {'@': 52}), 29: (1, {'@': 52}), 28: (1, {'@': 52}), 32: (1, {'@': 52})}, 16: {9: (1, {'@': 53}), 10: (1, {'@': 53}), 0: (1, {'@': 53}), 1: (1, {'@': 53}), 7: (1, {'@': 53}), 11: (1, {'@': 53}), 12: (1, {'@': 53}), 2: (1, {'@': 53}), 3: (1, {'@': 53}), 18: (1, {'@': 53}), 4: (1, {'@': 53}), 13: (1, {'@': 53}), 14: (1, {'@': 53}), 15: (1, {'@': 53}), 16: (1, {'@': 53}), 17: (1, {'@': 53}), 5: (1, {'@': 53}), 6: (1, {'@': 53}), 8: (1, {'@': 53}), 19: (1, {'@': 53}), 31: (1, {'@': 53}), 33: (1, {'@': 53}), 30: (1, {'@': 53}), 27: (1, {'@': 53}), 29: (1, {'@': 53}), 28: (1, {'@': 53}), 32: (1, {'@': 53})}, 17: {15: (0, 85), 26: (0, 91)}, 18: {1: (0, 39), 20: (0, 94), 12: (0, 381), 15: (0, 96)}, 19: {15: (0, 600), 26: (0, 611)}, 20: {38: (0, 480), 15: (0, 101)}, 21: {9: (1, {'@': 54}), 10: (1, {'@': 54}), 0: (1, {'@': 54}), 1: (1, {'@': 54}), 7: (1, {'@': 54}), 11: (1, {'@': 54}), 12: (1, {'@': 54}), 2: (1, {'@': 54}), 3: (1, {'@': 54}), 18: (1, {'@': 54}), 4: (1, {'@': 54}), 13: (1, {'@': 54}), 14: (1, {'@': 54}), 15: (1, {'@': 54}), 16: (1, {'@': 54}), 17: (1, {'@': 54}), 5: (1, {'@': 54}), 6: (1, {'@': 54}), 8: (1, {'@': 54}), 19: (1, {'@': 54}), 31: (1, {'@': 54}), 33: (1, {'@': 54}), 30: (1, {'@': 54}), 27: (1, {'@': 54}), 29: (1, {'@': 54}), 28: (1, {'@': 54}), 32: (1, {'@': 54})}, 22: {12: (0, 381), 1: (0, 103), 20: (0, 108)}, 23: {9: (1, {'@': 55}), 10: (1, {'@': 55}), 0: (1, {'@': 55}), 1: (1, {'@': 55}), 7: (1, {'@': 55}), 11: (1, {'@': 55}), 12: (1, {'@': 55}), 2: (1, {'@': 55}), 3: (1, {'@': 55}), 4: (1, {'@': 55}), 26: (1, {'@': 55}), 13: (1, {'@': 55}), 5: (1, {'@': 55}), 14: (1, {'@': 55}), 15: (1, {'@': 55}), 16: (1, {'@': 55}), 17: (1, {'@': 55}), 18: (1, {'@': 55}), 6: (1, {'@': 55}), 8: (1, {'@': 55}), 19: (1, {'@': 55}), 27: (1, {'@': 55}), 28: (1, {'@': 55}), 32: (1, {'@': 55}), 33: (1, {'@': 55}), 29: (1, {'@': 55}), 30: (1, {'@': 55}), 31: (1, {'@': 55}), 39: (1, {'@': 55}), 40: (1, {'@': 55}), 41: (1, {'@': 55})}, 24: {42: (0, 113), 43: (0, 150), 38: (0, 155), 12: (0, 381), 15: (0, 115), 20: (0, 173)}, 25: {15: (1, {'@': 56}), 39: (1, {'@': 56})}, 26: {6: (0, 230), 18: (0, 125), 40: (0, 134), 41: (0, 145)}, 27: {43: (0, 150), 42: (0, 25), 12: (0, 381), 38: (0, 155), 20: (0, 173), 15: (0, 283)}, 28: {11: (1, {'@': 57}), 1: (1, {'@': 57}), 12: (1, {'@': 57}), 44: (1, {'@': 57}), 4: (1, {'@': 57}), 13: (1, {'@': 57}), 6: (1, {'@': 57}), 19: (1, {'@': 57}), 45: (1, {'@': 57})}, 29: {43: (0, 150), 38: (0, 155), 12: (0, 381), 42: (0, 322), 15: (0, 157), 20: (0, 173)}, 30: {1: (0, 208), 13: (0, 109), 20: (0, 7), 12: (0, 381), 4: (0, 123), 46: (0, 126), 22: (0, 36), 47: (0, 40), 38: (0, 44), 44: (0, 47), 48: (0, 49), 49: (0, 52), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 31: {43: (0, 150), 42: (0, 117), 15: (0, 170), 38: (0, 155), 12: (0, 381), 20: (0, 173)}, 32: {9: (1, {'@': 58}), 6: (1, {'@': 58}), 14: (1, {'@': 58}), 7: (1, {'@': 58}), 8: (1, {'@': 58}), 31: (1, {'@': 58}), 10: (1, {'@': 58}), 3: (1, {'@': 58})}, 33: {10: (0, 342), 9: (1, {'@': 59}), 7: (1, {'@': 59}), 14: (1, {'@': 59}), 3: (1, {'@': 59}), 6: (1, {'@': 59}), 8: (1, {'@': 59})}, 34: {9: (1, {'@': 60}), 10: (1, {'@': 60}), 0: (1, {'@': 60}), 1: (1, {'@': 60}), 7: (1, {'@': 60}), 11: (1, {'@': 60}), 12: (1, {'@': 60}), 2: (1, {'@': 60}), 3: (1, {'@': 60}), 18: (1, {'@': 60}), 4: (1, {'@': 60}), 13: (1, {'@': 60}), 14: (1, {'@': 60}), 15: (1, {'@': 60}), 16: (1, {'@': 60}), 17: (1, {'@': 60}), 5: (1, {'@': 60}), 6: (1, {'@': 60}), 8: (1, {'@': 60}), 19: (1, {'@': 60}), 31: (1, {'@': 60}), 33: (1, {'@': 60}), 30: (1, {'@': 60}), 27: (1, {'@': 60}), 29: (1, {'@': 60}), 28: (1, {'@': 60}), 32: (1, {'@': 60})}, 35: {38: (0, 552)}, 36: {9: (1, {'@': 61}), 7: (1, {'@': 61}), 14: (1, {'@': 61}), 31: (1, {'@': 61}), 6: (1, {'@': 61}), 8: (1, {'@': 61}), 10: (1, {'@': 61}), 3: (1, {'@': 61})}, 37: {11: (1, {'@': 62}), 0: (1, {'@': 62}), 1: (1, {'@': 62}), 12: (1, {'@': 62}), 2: (1, {'@': 62}), 29: (1, {'@': 62}), 28: (1, {'@': 62}), 4: (1, {'@': 62}), 13: (1, {'@': 62}), 5: (1, {'@': 62}), 15: (1, {'@': 62}), 16: (1, {'@': 62}), 17: (1, {'@': 62}), 18: (1, {'@': 62}), 6: (1, {'@': 62}), 19: (1, {'@': 62})}, 38: {1: (0, 556), 20: (0, 560), 12: (0, 381), 52: (0, 564), 24: (0, 530), 22: (0, 533), 13: (0, 325), 53: (0, 568), 11: (0, 542)}, 39: {9: (1, {'@': 63}), 10: (1, {'@': 63}), 0: (1, {'@': 63}), 1: (1, {'@': 63}), 7: (1, {'@': 63}), 11: (1, {'@': 63}), 12: (1, {'@': 63}), 2: (1, {'@': 63}), 3: (1, {'@': 63}), 18: (1, {'@': 63}), 4: (1, {'@': 63}), 13: (1, {'@': 63}), 14: (1, {'@': 63}), 15: (1, {'@': 63}), 16: (1, {'@': 63}), 17: (1, {'@': 63}), 5: (1, {'@': 63}), 6: (1, {'@': 63}), 8: (1, {'@': 63}), 19: (1, {'@': 63}), 31: (1, {'@': 63}), 33: (1, {'@': 63}), 30: (1, {'@': 63}), 27: (1, {'@': 63}), 29: (1, {'@': 63}), 28: (1, {'@': 63}), 32: (1, {'@': 63})}, 40: {9: (1, {'@': 64}), 7: (1, {'@': 64}), 14: (1, {'@': 64}), 31: (1, {'@': 64}), 6: (1, {'@': 64}), 8: (1, {'@': 64}), 10: (1, {'@': 64}), 3: (1, {'@': 64})}, 41: {1: (0, 208), 13: (0, 109), 20: (0, 7), 12: (0, 381), 4: (0, 123), 46: (0, 501), 22: (0, 36), 47: (0, 40), 15: (0, 505), 48: (0, 49), 49: (0, 52), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 42: {54: (0, 577), 10: (0, 584), 3: (0, 586)}, 43: {55: (0, 297), 6: (0, 314), 9: (0, 309), 7: (0, 316), 31: (0, 578), 14: (0, 323), 8: (0, 131)}, 44: {56: (0, 41), 31: (0, 412)}, 45: {11: (1, {'@': 65}), 0: (1, {'@': 65}), 1: (1, {'@': 65}), 12: (1, {'@': 65}), 15: (1, {'@': 65}), 18: (1, {'@': 65}), 4: (1, {'@': 65}), 16: (1, {'@': 65}), 17: (1, {'@': 65}), 13: (1, {'@': 65}), 6: (1, {'@': 65}), 19: (1, {'@': 65})}, 46: {11: (1, {'@': 66}), 0: (1, {'@': 66}), 1: (1, {'@': 66}), 12: (1, {'@': 66}), 2: (1, {'@': 66}), 15: (1, {'@': 66}), 13: (1, {'@': 66}), 18: (1, {'@': 66}), 4: (1, {'@': 66}), 16: (1, {'@': 66}), 17: (1, {'@': 66}), 5: (1, {'@': 66}), 6: (1, {'@': 66}), 19: (1, {'@': 66})}, 47: {56: (0, 114), 31: (0, 414)}, 48: {0: (1, {'@': 67}), 1: (1, {'@': 67}), 2: (1, {'@': 67}), 3: (1, {'@': 67}), 4: (1, {'@': 67}), 5: (1, {'@': 67}), 6: (1, {'@': 67}), 7: (1, {'@': 67}), 8: (1, {'@': 67}), 9: (1, {'@': 67}), 10: (1, {'@': 67}), 11: (1, {'@': 67}), 12: (1, {'@': 67}), 13: (1, {'@': 67}), 14: (1, {'@': 67}), 15: (1, {'@': 67}), 16: (1, {'@': 67}), 17: (1, {'@': 67}), 18: (1, {'@': 67}), 19: (1, {'@': 67})}, 49: {9: (0, 78), 7: (1, {'@': 68}), 14: (1, {'@': 68}), 31: (1, {'@': 68}), 6: (1, {'@': 68}), 8: (1, {'@': 68}), 10: (1, {'@': 68}), 3: (1, {'@': 68})}, 50: {1: (0, 376), 20: (0, 378), 4: (0, 389), 12: (0, 381), 13: (0, 404), 6: (0, 339), 22: (0, 382), 57: (0, 385), 36: (0, 377), 58: (0, 343), 59: (0, 581), 60: (0, 350), 19: (0, 363), 11: (0, 278)}, 51: {15: (0, 198), 26: (0, 593)}, 52: {9: (0, 415)}, 53: {4: (1, {'@': 69}), 56: (1, {'@': 69})}, 54: {38: (0, 500)}, 55: {10: (1, {'@': 70}), 3: (1, {'@': 70})}, 56: {9: (1, {'@': 71}), 7: (1, {'@': 71}), 14: (1, {'@': 71}), 31: (1, {'@': 71}), 6: (1, {'@': 71}), 8: (1, {'@': 71}), 10: (1, {'@': 71}), 3: (1, {'@': 71})}, 57: {12: (0, 381), 1: (0, 579), 20: (0, 605)}, 58: {1: (0, 76), 13: (0, 109), 20: (0, 612), 12: (0, 381), 4: (0, 123), 46: (0, 616), 22: (0, 36), 47: (0, 40), 49: (0, 636), 61: (0, 606), 48: (0, 49), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 59: {20: (0, 518), 1: (0, 618), 12: (0, 381), 15: (0, 623)}, 60: {33: (1, {'@': 72}), 30: (1, {'@': 72}), 32: (1, {'@': 72}), 15: (1, {'@': 72}), 27: (1, {'@': 72}), 3: (1, {'@': 72})}, 61: {20: (0, 369), 12: (0, 381), 1: (0, 434)}, 62: {32: (1, {'@': 73}), 3: (1, {'@': 73})}, 63: {9: (1, {'@': 74}), 7: (1, {'@': 74}), 14: (1, {'@': 74}), 31: (1, {'@': 74}), 6: (1, {'@': 74}), 8: (1, {'@': 74}), 10: (1, {'@': 74}), 3: (1, {'@': 74})}, 64: {9: (1, {'@': 75}), 10: (1, {'@': 75}), 0: (1, {'@': 75}), 1: (1, {'@': 75}), 7: (1, {'@': 75}), 11: (1, {'@': 75}), 12: (1, {'@': 75}), 2: (1, {'@': 75}), 3: (1, {'@': 75}), 18: (1, {'@': 75}), 4: (1, {'@': 75}), 13: (1, {'@': 75}), 14: (1, {'@': 75}), 15: (1, {'@': 75}), 16: (1, {'@': 75}), 17: (1, {'@': 75}), 5: (1, {'@': 75}), 6: (1, {'@': 75}), 8: (1, {'@': 75}), 19: (1, {'@': 75}), 31: (1, {'@': 75}), 33: (1, {'@': 75}), 30: (1, {'@': 75}), 27: (1, {'@': 75}), 29: (1, {'@': 75}), 28: (1, {'@': 75}), 32: (1, {'@': 75})}, 65: {32: (1, {'@': 76}), 3: (1, {'@': 76})}, 66: {1: (0, 76), 13: (0, 109), 20: (0, 612), 12: (0, 381), 4: (0, 123), 46: (0, 616), 22: (0, 36), 47: (0, 40), 49: (0, 636), 48: (0, 49), 50: (0, 56), 19: (0, 58), 61: (0, 417), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 67: {9: (1, {'@': 77}), 10: (1, {'@': 77}), 0: (1, {'@': 77}), 1: (1, {'@': 77}), 7: (1, {'@': 77}), 11: (1, {'@': 77}), 12: (1, {'@': 77}), 2: (1, {'@': 77}), 3: (1, {'@': 77}), 18: (1, {'@': 77}), 4: (1, {'@': 77}), 13: (1, {'@': 77}), 14: (1, {'@': 77}), 15: (1, {'@': 77}), 16: (1, {'@': 77}), 17: (1, {'@': 77}), 5: (1, {'@': 77}), 6: (1, {'@': 77}), 8: (1, {'@': 77}), 19: (1, {'@': 77}), 31: (1, {'@': 77}), 33: (1, {'@': 77}), 30: (1, {'@': 77}), 27: (1, {'@': 77}), 29: (1, {'@': 77}), 28: (1, {'@': 77}), 32: (1, {'@': 77})}, 68: {56: (0, 435), 31: (0, 475)}, 69: {32: (1, {'@': 78}), 3: (1, {'@': 78})}, 70: {9: (1, {'@': 79}), 7: (1, {'@': 79}), 14: (1, {'@': 79}), 31: (1, {'@': 79}), 6: (1, {'@': 79}), 8: (1, {'@': 79}), 10: (1, {'@': 79}), 3: (1, {'@': 79})}, 71: {26: (0, 597), 15: (0, 639)}, 72: {32: (1, {'@': 80}), 3: (1, {'@': 80})}, 73: {9: (1, {'@': 81}), 10: (1, {'@': 81}), 0: (1, {'@': 81}), 1: (1, {'@': 81}), 7: (1, {'@': 81}), 11: (1, {'@': 81}), 12: (1, {'@': 81}), 2: (1, {'@': 81}), 3: (1, {'@': 81}), 4: (1, {'@': 81}), 26: (1, {'@': 81}), 13: (1, {'@': 81}), 5: (1, {'@': 81}), 14: (1, {'@': 81}), 15: (1, {'@': 81}), 16: (1, {'@': 81}), 17: (1, {'@': 81}), 18: (1, {'@': 81}), 6: (1, {'@': 81}), 8: (1, {'@': 81}), 19: (1, {'@': 81}), 27: (1, {'@': 81}), 28: (1, {'@': 81}), 32: (1, {'@': 81}), 33: (1, {'@': 81}), 29: (1, {'@': 81}), 30: (1, {'@': 81}), 31: (1, {'@': 81}), 39: (1, {'@': 81}), 40: (1, {'@': 81}), 41: (1, {'@': 81})}, 74: {15: (0, 362), 62: (0, 423), 63: (0, 424)}, 75: {15: (1, {'@': 82}), 32: (1, {'@': 82}), 3: (1, {'@': 82})}, 76: {15: (0, 394), 18: (0, 396), 9: (0, 604), 26: (0, 403), 10: (1, {'@': 83}), 7: (1, {'@': 83}), 14: (1, {'@': 83}), 31: (1, {'@': 83}), 3: (1, {'@': 83}), 6: (1, {'@': 83}), 8: (1, {'@': 83})}, 77: {26: (0, 589)}, 78: {38: (0, 621)}, 79: {32: (1, {'@': 84}), 3: (1, {'@': 84})}, 80: {64: (0, 253), 65: (0, 267), 44: (0, 289), 66: (0, 112), 67: (0, 425)}, 81: {9: (1, {'@': 85}), 10: (1, {'@': 85}), 0: (1, {'@': 85}), 1: (1, {'@': 85}), 7: (1, {'@': 85}), 11: (1, {'@': 85}), 12: (1, {'@': 85}), 2: (1, {'@': 85}), 3: (1, {'@': 85}), 18: (1, {'@': 85}), 4: (1, {'@': 85}), 13: (1, {'@': 85}), 14: (1, {'@': 85}), 15: (1, {'@': 85}), 16: (1, {'@': 85}), 17: (1, {'@': 85}), 5: (1, {'@': 85}), 6: (1, {'@': 85}), 8: (1, {'@': 85}), 19: (1, {'@': 85}), 31: (1, {'@': 85}), 33: (1, {'@': 85}), 30: (1, {'@': 85}), 27: (1, {'@': 85}), 29: (1, {'@': 85}), 28: (1, {'@': 85}), 32: (1, {'@': 85})}, 82: {32: (1, {'@': 86}), 3: (1, {'@': 86})}, 83: {1: (0, 168), 20: (0, 174), 12: (0, 381), 21: (0, 180), 22: (0, 311), 23: (0, 318), 13: (0, 325), 24: (0, 0), 6: (0, 1), 25: (0, 416), 11: (0, 2), 19: (0, 3)}, 84: {1: (0, 376), 20: (0, 378), 4: (0, 507), 12: (0, 381), 13: (0, 404), 6: (0, 339), 22: (0, 382), 57: (0, 385), 68: (0, 512), 36: (0, 377), 58: (0, 343), 69: (0, 591), 60: (0, 350), 59: (0, 594), 19: (0, 363), 11: (0, 278)}, 85: {26: (0, 607)}, 86: {11: (1, {'@': 87}), 0: (1, {'@': 87}), 1: (1, {'@': 87}), 12: (1, {'@': 87}), 2: (1, {'@': 87}), 29: (1, {'@': 87}), 28: (1, {'@': 87}), 4: (1, {'@': 87}), 13: (1, {'@': 87}), 5: (1, {'@': 87}), 15: (1, {'@': 87}), 16: (1, {'@': 87}), 17: (1, {'@': 87}), 18: (1, {'@': 87}), 6: (1, {'@': 87}), 19: (1, {'@': 87})}, 87: {1: (0, 376), 20: (0, 378), 4: (0, 507), 12: (0, 381), 68: (0, 587), 13: (0, 404), 6: (0, 339), 22: (0, 382), 57: (0, 385), 36: (0, 377), 58: (0, 343), 69: (0, 591), 60: (0, 350), 59: (0, 594), 19: (0, 363), 11: (0, 278)}, 88: {1: (0, 168), 20: (0, 174), 12: (0, 381), 21: (0, 180), 22: (0, 311), 23: (0, 318), 13: (0, 325), 24: (0, 0), 6: (0, 1), 25: (0, 426), 11: (0, 2), 19: (0, 3), 15: (0, 427)}, 89: {1: (0, 376), 20: (0, 378), 4: (0, 507), 12: (0, 381), 13: (0, 404), 6: (0, 339), 22: (0, 382), 57: (0, 385), 36: (0, 377), 58: (0, 343), 69: (0, 591), 60: (0, 350), 68: (0, 543), 59: (0, 594), 19: (0, 363), 11: (0, 278)}, 90: {11: (1, {'@': 88}), 0: (1, {'@': 88}), 1: (1, {'@': 88}), 12: (1, {'@': 88}), 2: (1, {'@': 88}), 29: (1, {'@': 88}), 28: (1, {'@': 88}), 4: (1, {'@': 88}), 13: (1, {'@': 88}), 5: (1, {'@': 88}), 15: (1, {'@': 88}), 16: (1, {'@': 88}), 17: (1, {'@': 88}), 18: (1, {'@': 88}), 6: (1, {'@': 88}), 19: (1, {'@': 88})}, 91: {1: (0, 509), 20: (0, 646), 12: (0, 381), 15: (0, 650)}, 92: {9: (1, {'@': 89}), 10: (1, {'@': 89}), 0: (1, {'@': 89}), 1: (1, {'@': 89}), 7: (1, {'@': 89}), 11: (1, {'@': 89}), 12: (1, {'@': 89}), 2: (1, {'@': 89}), 3: (1, {'@': 89}), 18: (1, {'@': 89}), 4: (1, {'@': 89}), 13: (1, {'@': 89}), 14: (1, {'@': 89}), 15: (1, {'@': 89}), 16: (1, {'@': 89}), 17: (1, {'@': 89}), 5: (1, {'@': 89}), 6: (1, {'@': 89}), 8: (1, {'@': 89}), 19: (1, {'@': 89})}, 93: {70: (0, 598)}, 94: {9: (1, {'@': 90}), 10: (1, {'@': 90}), 0: (1, {'@': 90}), 1: (1, {'@': 90}), 7: (1, {'@': 90}), 11: (1, {'@': 90}), 12: (1, {'@': 90}), 2: (1, {'@': 90}), 3: (1, {'@': 90}), 18: (1, {'@': 90}), 4: (1, {'@': 90}), 13: (1, {'@': 90}), 14: (1, {'@': 90}), 15: (1, {'@': 90}), 16: (1, {'@': 90}), 17: (1, {'@': 90}), 5: (1, {'@': 90}), 6: (1, {'@': 90}), 8: (1, {'@': 90}), 19: (1, {'@': 90}), 31: (1, {'@': 90}), 33: (1, {'@': 90}), 30: (1, {'@': 90}), 27: (1, {'@': 90}), 29: (1, {'@': 90}), 28: (1, {'@': 90}), 32: (1, {'@': 90})}, 95: {10: (1, {'@': 91}), 3: (1, {'@': 91})}, 96: {1: (0, 137), 12: (0, 381), 20: (0, 138)}, 97: {11: (1, {'@': 92}), 0: (1, {'@': 92}), 1: (1, {'@': 92}), 12: (1, {'@': 92}), 2: (1, {'@': 92}), 15: (1, {'@': 92}), 13: (1, {'@': 92}), 18: (1, {'@': 92}), 4: (1, {'@': 92}), 16: (1, {'@': 92}), 17: (1, {'@': 92}), 5: (1, {'@': 92}), 6: (1, {'@': 92}), 19: (1, {'@': 92})}, 98: {5: (0, 508), 11: (1, {'@': 93}), 0: (1, {'@': 93}), 1: (1, {'@': 93}), 12: (1, {'@': 93}), 15: (1, {'@': 93}), 18: (1, {'@': 93}), 4: (1, {'@': 93}), 16: (1, {'@': 93}), 17: (1, {'@': 93}), 13: (1, {'@': 93}), 6: (1, {'@': 93}), 19: (1, {'@': 93})}, 99: {12: (0, 381), 20: (0, 601)}, 100: {26: (0, 541)}, 101: {38: (0, 631)}, 102: {9: (1, {'@': 94}), 10: (1, {'@': 94}), 0: (1, {'@': 94}), 1: (1, {'@': 94}), 7: (1, {'@': 94}), 11: (1, {'@': 94}), 12: (1, {'@': 94}), 2: (1, {'@': 94}), 3: (1, {'@': 94}), 18: (1, {'@': 94}), 4: (1, {'@': 94}), 13: (1, {'@': 94}), 14: (1, {'@': 94}), 15: (1, {'@': 94}), 16: (1, {'@': 94}), 17: (1, {'@': 94}), 5: (1, {'@': 94}), 6: (1, {'@': 94}), 8: (1, {'@': 94}), 19: (1, {'@': 94}), 31: (1, {'@': 94}), 33: (1, {'@': 94}), 30: (1, {'@': 94}), 27: (1, {'@': 94}), 29: (1, {'@': 94}), 28: (1, {'@': 94}), 32: (1, {'@': 94})}, 103: {9: (1, {'@': 95}), 10: (1, {'@': 95}), 0: (1, {'@': 95}), 1: (1, {'@': 95}), 7: (1, {'@': 95}), 11: (1, {'@': 95}), 12: (1, {'@': 95}), 2: (1, {'@': 95}), 3: (1, {'@': 95}), 18: (1, {'@': 95}), 4: (1, {'@': 95}), 13: (1, {'@': 95}), 14: (1, {'@': 95}), 15: (1, {'@': 95}), 16: (1, {'@': 95}), 17: (1, {'@': 95}), 5: (1, {'@': 95}), 6: (1, {'@': 95}), 8: (1, {'@': 95}), 19: (1, {'@': 95}), 31: (1, {'@': 95}), 33: (1, {'@': 95}), 30: (1, {'@': 95}), 27: (1, {'@': 95}), 29: (1, {'@': 95}), 28: (1, {'@': 95}), 32: (1, {'@': 95})}, 104: {9: (1, {'@': 96}), 10: (1, {'@': 96}), 0: (1, {'@': 96}), 1: (1, {'@': 96}), 7: (1, {'@': 96}), 11: (1, {'@': 96}), 12: (1, {'@': 96}), 2: (1, {'@': 96}), 3: (1, {'@': 96}), 18: (1, {'@': 96}), 4: (1, {'@': 96}), 13: (1, {'@': 96}), 14: (1, {'@': 96}), 15: (1, {'@': 96}), 16: (1, {'@': 96}), 17: (1, {'@': 96}), 5: (1, {'@': 96}), 6: (1, {'@': 96}), 8: (1, {'@': 96}), 19: (1, {'@': 96}), 31: (1, {'@': 96}), 33: (1, {'@': 96}), 30: (1, {'@': 96}), 27: (1, {'@': 96}), 29: (1, {'@': 96}), 28: (1, {'@': 96}), 32: (1, {'@': 96})}, 105: {9: (1, {'@': 97}), 10: (1, {'@': 97}), 0: (1, {'@': 97}), 1: (1, {'@': 97}), 7: (1, {'@': 97}), 11: (1, {'@': 97}), 12: (1, {'@': 97}), 2: (1, {'@': 97}), 3: (1, {'@': 97}), 4: (1, {'@': 97}), 26: (1, {'@': 97}), 13: (1, {'@': 97}), 5: (1, {'@': 97}), 14: (1, {'@': 97}), 15: (1, {'@': 97}), 16: (1, {'@': 97}), 17: (1, {'@': 97}), 18: (1, {'@': 97}), 6: (1, {'@': 97}), 8: (1, {'@': 97}), 19: (1, {'@': 97}), 27: (1, {'@': 97}), 28: (1, {'@': 97}), 32: (1, {'@': 97}), 33: (1, {'@': 97}), 29: (1, {'@': 97}), 30: (1, {'@': 97}), 31: (1, {'@': 97}), 39: (1, {'@': 97}), 40: (1, {'@': 97}), 41: (1, {'@': 97})}, 106: {11: (1, {'@': 98}), 0: (1, {'@': 98}), 1: (1, {'@': 98}), 12: (1, {'@': 98}), 2: (1, {'@': 98}), 15: (1, {'@': 98}), 13: (1, {'@': 98}), 18: (1, {'@': 98}), 4: (1, {'@': 98}), 16: (1, {'@': 98}), 17: (1, {'@': 98}), 5: (1, {'@': 98}), 6: (1, {'@': 98}), 19: (1, {'@': 98})}, 107: {9: (1, {'@': 99}), 10: (1, {'@': 99}), 0: (1, {'@': 99}), 1: (1, {'@': 99}), 7: (1, {'@': 99}), 11: (1, {'@': 99}), 12: (1, {'@': 99}), 2: (1, {'@': 99}), 3: (1, {'@': 99}), 18: (1, {'@': 99}), 4: (1, {'@': 99}), 13: (1, {'@': 99}), 14: (1, {'@': 99}), 15: (1, {'@': 99}), 16: (1, {'@': 99}), 17: (1, {'@': 99}), 5: (1, {'@': 99}), 6: (1, {'@': 99}), 8: (1, {'@': 99}), 19: (1, {'@': 99}), 31: (1, {'@': 99}), 33: (1, {'@': 99}), 30: (1, {'@': 99}), 27: (1, {'@': 99}), 29: (1, {'@': 99}), 28: (1, {'@': 99}), 32: (1, {'@': 99})}, 108: {9: (1, {'@': 100}), 10: (1, {'@': 100}), 0: (1, {'@': 100}), 1: (1, {'@': 100}), 7: (1, {'@': 100}), 11: (1, {'@': 100}), 12: (1, {'@': 100}), 2: (1, {'@': 100}), 3: (1, {'@': 100}), 18: (1, {'@': 100}), 4: (1, {'@': 100}), 13: (1, {'@': 100}), 14: (1, {'@': 100}), 15: (1, {'@': 100}), 16: (1, {'@': 100}), 17: (1, {'@': 100}), 5: (1, {'@': 100}), 6: (1, {'@': 100}), 8: (1, {'@': 100}), 19: (1, {'@': 100}), 31: (1, {'@': 100}), 33: (1, {'@': 100}), 30: (1, {'@': 100}), 27: (1, {'@': 100}), 29: (1, {'@': 100}), 28: (1, {'@': 100}), 32: (1, {'@': 100})}, 109: {1: (0, 76), 13: (0, 109), 20: (0, 612), 12: (0, 381), 4: (0, 123), 46: (0, 616), 22: (0, 620), 47: (0, 40), 61: (0, 625), 49: (0, 636), 48: (0, 49), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 110: {14: (0, 332), 6: (0, 314), 55: (0, 645), 8: (0, 131), 7: (0, 410), 31: (0, 567), 9: (0, 411)}, 111: {15: (0, 422), 1: (0, 438), 20: (0, 439), 12: (0, 381)}, 112: {11: (1, {'@': 101}), 0: (1, {'@': 101}), 1: (1, {'@': 101}), 12: (1, {'@': 101}), 2: (1, {'@': 101}), 29: (1, {'@': 101}), 28: (1, {'@': 101}), 4: (1, {'@': 101}), 13: (1, {'@': 101}), 5: (1, {'@': 101}), 15: (1, {'@': 101}), 16: (1, {'@': 101}), 17: (1, {'@': 101}), 18: (1, {'@': 101}), 6: (1, {'@': 101}), 19: (1, {'@': 101})}, 113: {15: (1, {'@': 102}), 39: (1, {'@': 102})}, 114: {1: (0, 208), 13: (0, 109), 20: (0, 7), 12: (0, 381), 4: (0, 123), 46: (0, 110), 22: (0, 36), 47: (0, 40), 48: (0, 49), 15: (0, 510), 49: (0, 52), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 115: {43: (0, 150), 42: (0, 147), 38: (0, 155), 12: (0, 381), 20: (0, 173)}, 116: {31: (0, 648), 56: (0, 467)}, 117: {15: (1, {'@': 103}), 39: (1, {'@': 103})}, 118: {15: (0, 429), 1: (0, 432), 12: (0, 381), 20: (0, 433)}, 119: {9: (1, {'@': 104}), 10: (1, {'@': 104}), 0: (1, {'@': 104}), 1: (1, {'@': 104}), 7: (1, {'@': 104}), 11: (1, {'@': 104}), 12: (1, {'@': 104}), 2: (1, {'@': 104}), 3: (1, {'@': 104}), 18: (1, {'@': 104}), 4: (1, {'@': 104}), 13: (1, {'@': 104}), 14: (1, {'@': 104}), 15: (1, {'@': 104}), 16: (1, {'@': 104}), 17: (1, {'@': 104}), 5: (1, {'@': 104}), 6: (1, {'@': 104}), 8: (1, {'@': 104}), 19: (1, {'@': 104}), 31: (1, {'@': 104}), 33: (1, {'@': 104}), 30: (1, {'@': 104}), 27: (1, {'@': 104}), 29: (1, {'@': 104}), 28: (1, {'@': 104}), 32: (1, {'@': 104})}, 120: {20: (0, 628), 12: (0, 381), 1: (0, 534), 15: (0, 539)}, 121: {20: (0, 558), 15: (0, 569), 1: (0, 576), 12: (0, 381)}, 122: {38: (0, 53)}, 123: {38: (0, 116), 44: (0, 68)}, 124: {9: (1, {'@': 105}), 10: (1, {'@': 105}), 0: (1, {'@': 105}), 1: (1, {'@': 105}), 7: (1, {'@': 105}), 11: (1, {'@': 105}), 12: (1, {'@': 105}), 2: (1, {'@': 105}), 3: (1, {'@': 105}), 18: (1, {'@': 105}), 4: (1, {'@': 105}), 13: (1, {'@': 105}), 14: (1, {'@': 105}), 15: (1, {'@': 105}), 16: (1, {'@': 105}), 17: (1, {'@': 105}), 5: (1, {'@': 105}), 6: (1, {'@': 105}), 8: (1, {'@': 105}), 19: (1, {'@': 105}), 31: (1, {'@': 105}), 33: (1, {'@': 105}), 30: (1, {'@': 105}), 27: (1, {'@': 105}), 29: (1, {'@': 105}), 28: (1, {'@': 105}), 32: (1, {'@': 105})}, 125: {42: (0, 140), 12: (0, 381), 43: (0, 150), 38: (0, 155), 20: (0, 173), 15: (0, 184)}, 126: {14: (0, 332), 6: (0, 314), 55: (0, 645), 31: (0, 264), 8: (0, 131), 7: (0, 410), 9: (0, 411)}, 127: {9: (1, {'@': 106}), 10: (1, {'@': 106}), 0: (1, {'@': 106}), 1: (1, {'@': 106}), 7: (1, {'@': 106}), 11: (1, {'@': 106}), 12: (1, {'@': 106}), 2: (1, {'@': 106}), 3: (1, {'@': 106}), 18: (1, {'@': 106}), 4: (1, {'@': 106}), 13: (1, {'@': 106}), 14: (1, {'@': 106}), 15: (1, {'@': 106}), 16: (1, {'@': 106}), 17: (1, {'@': 106}), 5: (1, {'@': 106}), 6: (1, {'@': 106}), 8: (1, {'@': 106}), 19: (1, {'@': 106}), 31: (1, {'@': 106}), 33: (1, {'@': 106}), 30: (1, {'@': 106}), 27: (1, {'@': 106}), 29: (1, {'@': 106}), 28: (1, {'@': 106}), 32: (1, {'@': 106})}, 128: {20: (0, 252), 12: (0, 381), 1: (0, 21), 15: (0, 22)}, 129: {1: (0, 208), 13: (0, 109), 15: (0, 596), 20: (0, 7), 12: (0, 381), 4: (0, 123), 46: (0, 608), 22: (0, 36), 47: (0, 40), 48: (0, 49), 49: (0, 52), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 130: {10: (0, 32)}, 131: {11: (1, {'@': 107}), 1: (1, {'@': 107}), 12: (1, {'@': 107}), 4: (1, {'@': 107}), 13: (1, {'@': 107}), 48: (1, {'@': 107})}, 132: {63: (1, {'@': 108}), 15: (1, {'@': 108})}, 133: {70: (0, 234)}, 134: {42: (0, 272), 43: (0, 150), 15: (0, 199), 38: (0, 155), 12: (0, 381), 20: (0, 173)}, 135: {9: (1, {'@': 109}), 6: (1, {'@': 109}), 14: (1, {'@': 109}), 7: (1, {'@': 109}), 8: (1, {'@': 109}), 31: (1, {'@': 109}), 10: (1, {'@': 109}), 3: (1, {'@': 109})}, 136: {15: (0, 361), 39: (0, 23)}, 137: {9: (1, {'@': 110}), 10: (1, {'@': 110}), 0: (1, {'@': 110}), 1: (1, {'@': 110}), 7: (1, {'@': 110}), 11: (1, {'@': 110}), 12: (1, {'@': 110}), 2: (1, {'@': 110}), 3: (1, {'@': 110}), 18: (1, {'@': 110}), 4: (1, {'@': 110}), 13: (1, {'@': 110}), 14: (1, {'@': 110}), 15: (1, {'@': 110}), 16: (1, {'@': 110}), 17: (1, {'@': 110}), 5: (1, {'@': 110}), 6: (1, {'@': 110}), 8: (1, {'@': 110}), 19: (1, {'@': 110}), 31: (1, {'@': 110}), 33: (1, {'@': 110}), 30: (1, {'@': 110}), 27: (1, {'@': 110}), 29: (1, {'@': 110}), 28: (1, {'@': 110}), 32: (1, {'@': 110})}, 138: {9: (1, {'@': 111}), 10: (1, {'@': 111}), 0: (1, {'@': 111}), 1: (1, {'@': 111}), 7: (1, {'@': 111}), 11: (1, {'@': 111}), 12: (1, {'@': 111}), 2: (1, {'@': 111}), 3: (1, {'@': 111}), 18: (1, {'@': 111}), 4: (1, {'@': 111}), 13: (1, {'@': 111}), 14: (1, {'@': 111}), 15: (1, {'@': 111}), 16: (1, {'@': 111}), 17: (1, {'@': 111}), 5: (1, {'@': 111}), 6: (1, {'@': 111}), 8: (1, {'@': 111}), 19: (1, {'@': 111}), 31: (1, {'@': 111}), 33: (1, {'@': 111}), 30: (1, {'@': 111}), 27: (1, {'@': 111}), 29: (1, {'@': 111}), 28: (1, {'@': 111}), 32: (1, {'@': 111})}, 139: {11: (1, {'@': 112}), 0: (1, {'@': 112}), 1: (1, {'@': 112}), 12: (1, {'@': 112}), 2: (1, {'@': 112}), 29: (1, {'@': 112}), 28: (1, {'@': 112}), 4: (1, {'@': 112}), 13: (1, {'@': 112}), 5: (1, {'@': 112}), 15: (1, {'@': 112}), 16: (1, {'@': 112}), 17: (1, {'@': 112}), 18: (1, {'@': 112}), 6: (1, {'@': 112}), 19: (1, {'@': 112})}, 140: {15: (1, {'@': 113}), 39: (1, {'@': 113})}, 141: {32: (1, {'@': 114}), 3: (1, {'@': 114})}, 142: {40: (0, 24), 15: (0, 26), 41: (0, 27), 18: (0, 29), 6: (0, 31), 39: (1, {'@': 115})}, 143: {11: (1, {'@': 116}), 0: (1, {'@': 116}), 1: (1, {'@': 116}), 12: (1, {'@': 116}), 2: (1, {'@': 116}), 15: (1, {'@': 116}), 13: (1, {'@': 116}), 18: (1, {'@': 116}), 4: (1, {'@': 116}), 16: (1, {'@': 116}), 17: (1, {'@': 116}), 5: (1, {'@': 116}), 6: (1, {'@': 116}), 19: (1, {'@': 116})}, 144: {1: (0, 376), 20: (0, 378), 4: (0, 507), 12: (0, 381), 69: (0, 517), 13: (0, 404), 6: (0, 339), 22: (0, 382), 57: (0, 385), 36: (0, 377), 71: (0, 511), 58: (0, 343), 59: (0, 469), 60: (0, 350), 44: (0, 523), 19: (0, 363), 72: (0, 526), 73: (0, 472), 11: (0, 278)}, 145: {15: (0, 175), 42: (0, 214), 43: (0, 150), 38: (0, 155), 12: (0, 381), 20: (0, 173)}, 146: {5: (0, 474), 11: (1, {'@': 117}), 0: (1, {'@': 117}), 1: (1, {'@': 117}), 12: (1, {'@': 117}), 15: (1, {'@': 117}), 18: (1, {'@': 117}), 4: (1, {'@': 117}), 16: (1, {'@': 117}), 17: (1, {'@': 117}), 13: (1, {'@': 117}), 6: (1, {'@': 117}), 19: (1, {'@': 117})}, 147: {15: (1, {'@': 118}), 39: (1, {'@': 118})}, 148: {64: (0, 253), 63: (0, 633), 44: (0, 289), 67: (0, 132)}, 149: {1: (0, 376), 20: (0, 378), 4: (0, 507), 12: (0, 381), 13: (0, 404), 6: (0, 339), 22: (0, 382), 57: (0, 385), 68: (0, 277), 36: (0, 377), 58: (0, 343), 69: (0, 591), 60: (0, 350), 59: (0, 594), 19: (0, 363), 11: (0, 278)}, 150: {15: (1, {'@': 119}), 39: (1, {'@': 119}), 41: (1, {'@': 119}), 40: (1, {'@': 119}), 18: (1, {'@': 119}), 6: (1, {'@': 119})}, 151: {15: (0, 456), 11: (1, {'@': 120}), 1: (1, {'@': 120}), 12: (1, {'@': 120}), 44: (1, {'@': 120}), 4: (1, {'@': 120}), 13: (1, {'@': 120}), 6: (1, {'@': 120}), 19: (1, {'@': 120}), 45: (1, {'@': 120})}, 152: {1: (0, 186), 20: (0, 7), 4: (0, 389), 12: (0, 381), 34: (0, 43), 19: (0, 194), 13: (0, 213), 35: (0, 243), 6: (0, 250), 36: (0, 261), 11: (0, 280), 37: (0, 287), 22: (0, 293)}, 153: {26: (0, 351)}, 154: {11: (1, {'@': 121}), 0: (1, {'@': 121}), 1: (1, {'@': 121}), 12: (1, {'@': 121}), 2: (1, {'@': 121}), 29: (1, {'@': 121}), 18: (1, {'@': 121}), 28: (1, {'@': 121}), 4: (1, {'@': 121}), 13: (1, {'@': 121}), 15: (1, {'@': 121}), 16: (1, {'@': 121}), 17: (1, {'@': 121}), 5: (1, {'@': 121}), 6: (1, {'@': 121}), 19: (1, {'@': 121})}, 155: {15: (1, {'@': 122}), 39: (1, {'@': 122}), 41: (1, {'@': 122}), 40: (1, {'@': 122}), 18: (1, {'@': 122}), 6: (1, {'@': 122})}, 156: {15: (0, 28), 11: (1, {'@': 123}), 1: (1, {'@': 123}), 12: (1, {'@': 123}), 44: (1, {'@': 123}), 4: (1, {'@': 123}), 13: (1, {'@': 123}), 6: (1, {'@': 123}), 19: (1, {'@': 123}), 45: (1, {'@': 123})}, 157: {43: (0, 150), 38: (0, 155), 12: (0, 381), 42: (0, 223), 20: (0, 173)}, 158: {11: (1, {'@': 124}), 0: (1, {'@': 124}), 1: (1, {'@': 124}), 12: (1, {'@': 124}), 15: (1, {'@': 124}), 18: (1, {'@': 124}), 4: (1, {'@': 124}), 16: (1, {'@': 124}), 17: (1, {'@': 124}), 13: (1, {'@': 124}), 6: (1, {'@': 124}), 19: (1, {'@': 124})}, 159: {11: (1, {'@': 125}), 0: (1, {'@': 125}), 1: (1, {'@': 125}), 12: (1, {'@': 125}), 2: (1, {'@': 125}), 29: (1, {'@': 125}), 18: (1, {'@': 125}), 28: (1, {'@': 125}), 4: (1, {'@': 125}), 13: (1, {'@': 125}), 15: (1, {'@': 125}), 16: (1, {'@': 125}), 17: (1, {'@': 125}), 5: (1, {'@': 125}), 6: (1, {'@': 125}), 19: (1, {'@': 125})}, 160: {42: (0, 142), 43: (0, 150), 38: (0, 155), 74: (0, 165), 12: (0, 381), 20: (0, 173)}, 161: {75: (0, 144), 32: (0, 156), 3: (0, 151)}, 162: {11: (1, {'@': 126}), 0: (1, {'@': 126}), 1: (1, {'@': 126}), 12: (1, {'@': 126}), 15: (1, {'@': 126}), 18: (1, {'@': 126}), 4: (1, {'@': 126}), 16: (1, {'@': 126}), 17: (1, {'@': 126}), 13: (1, {'@': 126}), 6: (1, {'@': 126}), 19: (1, {'@': 126})}, 163: {15: (1, {'@': 127}), 39: (1, {'@': 127})}, 164: {15: (0, 394), 18: (0, 396), 9: (0, 319), 26: (0, 403)}, 165: {39: (0, 73), 15: (0, 181)}, 166: {64: (0, 253), 44: (0, 289), 63: (0, 622), 67: (0, 627)}, 167: {10: (1, {'@': 128}), 3: (1, {'@': 128})}, 168: {15: (0, 394), 18: (0, 396), 9: (0, 319), 26: (0, 403), 0: (1, {'@': 129}), 1: (1, {'@': 129}), 2: (1, {'@': 129}), 3: (1, {'@': 129}), 4: (1, {'@': 129}), 5: (1, {'@': 129}), 6: (1, {'@': 129}), 7: (1, {'@': 129}), 8: (1, {'@': 129}), 10: (1, {'@': 129}), 11: (1, {'@': 129}), 12: (1, {'@': 129}), 13: (1, {'@': 129}), 14: (1, {'@': 129}), 16: (1, {'@': 129}), 17: (1, {'@': 129}), 19: (1, {'@': 129})}, 169: {11: (1, {'@': 130}), 0: (1, {'@': 130}), 1: (1, {'@': 130}), 12: (1, {'@': 130}), 2: (1, {'@': 130}), 4: (1, {'@': 130}), 13: (1, {'@': 130}), 5: (1, {'@': 130}), 15: (1, {'@': 130}), 16: (1, {'@': 130}), 17: (1, {'@': 130}), 18: (1, {'@': 130}), 6: (1, {'@': 130}), 19: (1, {'@': 130})}, 170: {42: (0, 229), 43: (0, 150), 38: (0, 155), 12: (0, 381), 20: (0, 173)}, 171: {10: (0, 298)}, 172: {42: (0, 367), 43: (0, 150), 38: (0, 155), 12: (0, 381), 20: (0, 173)}, 173: {15: (1, {'@': 131}), 39: (1, {'@': 131}), 41: (1, {'@': 131}), 40: (1, {'@': 131}), 18: (1, {'@': 131}), 6: (1, {'@': 131})}, 174: {18: (0, 406), 15: (0, 408), 26: (0, 128), 0: (1, {'@': 132}), 1: (1, {'@': 132}), 2: (1, {'@': 132}), 3: (1, {'@': 132}), 4: (1, {'@': 132}), 5: (1, {'@': 132}), 6: (1, {'@': 132}), 7: (1, {'@': 132}), 8: (1, {'@': 132}), 9: (1, {'@': 132}), 10: (1, {'@': 132}), 11: (1, {'@': 132}), 12: (1, {'@': 132}), 13: (1, {'@': 132}), 14: (1, {'@': 132}), 16: (1, {'@': 132}), 17: (1, {'@': 132}), 19: (1, {'@': 132})}, 175: {42: (0, 390), 43: (0, 150), 38: (0, 155), 12: (0, 381), 20: (0, 173)}, 176: {11: (1, {'@': 133}), 0: (1, {'@': 133}), 1: (1, {'@': 133}), 12: (1, {'@': 133}), 2: (1, {'@': 133}), 29: (1, {'@': 133}), 18: (1, {'@': 133}), 28: (1, {'@': 133}), 4: (1, {'@': 133}), 13: (1, {'@': 133}), 15: (1, {'@': 133}), 16: (1, {'@': 133}), 17: (1, {'@': 133}), 5: (1, {'@': 133}), 6: (1, {'@': 133}), 19: (1, {'@': 133})}, 177: {2: (0, 241), 5: (0, 4), 76: (0, 146), 11: (1, {'@': 134}), 0: (1, {'@': 134}), 1: (1, {'@': 134}), 12: (1, {'@': 134}), 15: (1, {'@': 134}), 18: (1, {'@': 134}), 4: (1, {'@': 134}), 16: (1, {'@': 134}), 17: (1, {'@': 134}), 13: (1, {'@': 134}), 6: (1, {'@': 134}), 19: (1, {'@': 134})}, 178: {10: (0, 302)}, 179: {56: (0, 14), 31: (0, 444)}, 180: {6: (0, 314), 9: (0, 358), 7: (0, 337), 14: (0, 35), 8: (0, 131), 55: (0, 38), 0: (1, {'@': 135}), 1: (1, {'@': 135}), 2: (1, {'@': 135}), 3: (1, {'@': 135}), 4: (1, {'@': 135}), 5: (1, {'@': 135}), 10: (1, {'@': 135}), 11: (1, {'@': 135}), 12: (1, {'@': 135}), 13: (1, {'@': 135}), 15: (1, {'@': 135}), 16: (1, {'@': 135}), 17: (1, {'@': 135}), 18: (1, {'@': 135}), 19: (1, {'@': 135})}, 181: {39: (0, 235)}, 182: {16: (0, 374), 1: (0, 376), 20: (0, 378), 12: (0, 381), 4: (0, 389), 13: (0, 404), 6: (0, 339), 77: (0, 210), 58: (0, 343), 59: (0, 347), 60: (0, 350), 19: (0, 363), 11: (0, 366), 78: (0, 451), 18: (0, 368), 79: (0, 371), 36: (0, 377), 22: (0, 382), 57: (0, 385), 80: (0, 386), 17: (0, 391)}, 183: {55: (0, 297), 6: (0, 314), 31: (0, 613), 9: (0, 309), 7: (0, 316), 14: (0, 323), 8: (0, 131)}, 184: {43: (0, 150), 38: (0, 155), 12: (0, 381), 42: (0, 380), 20: (0, 173)}, 185: {9: (1, {'@': 136}), 10: (1, {'@': 136}), 0: (1, {'@': 136}), 1: (1, {'@': 136}), 7: (1, {'@': 136}), 11: (1, {'@': 136}), 12: (1, {'@': 136}), 2: (1, {'@': 136}), 3: (1, {'@': 136}), 18: (1, {'@': 136}), 4: (1, {'@': 136}), 13: (1, {'@': 136}), 14: (1, {'@': 136}), 15: (1, {'@': 136}), 16: (1, {'@': 136}), 17: (1, {'@': 136}), 5: (1, {'@': 136}), 6: (1, {'@': 136}), 8: (1, {'@': 136}), 19: (1, {'@': 136}), 31: (1, {'@': 136}), 33: (1, {'@': 136}), 30: (1, {'@': 136}), 27: (1, {'@': 136}), 29: (1, {'@': 136}), 28: (1, {'@': 136}), 32: (1, {'@': 136})}, 186: {15: (0, 394), 18: (0, 396), 9: (0, 244), 26: (0, 403)}, 187: {15: (1, {'@': 137}), 39: (1, {'@': 137})}, 188: {20: (0, 630), 12: (0, 381), 1: (0, 638)}, 189: {10: (1, {'@': 138}), 3: (1, {'@': 138})}, 190: {56: (0, 440), 31: (0, 448)}, 191: {5: (0, 162), 11: (1, {'@': 139}), 0: (1, {'@': 139}), 1: (1, {'@': 139}), 12: (1, {'@': 139}), 15: (1, {'@': 139}), 18: (1, {'@': 139}), 4: (1, {'@': 139}), 16: (1, {'@': 139}), 17: (1, {'@': 139}), 13: (1, {'@': 139}), 6: (1, {'@': 139}), 19: (1, {'@': 139})}, 192: {1: (0, 168), 20: (0, 174), 12: (0, 381), 21: (0, 180), 22: (0, 311), 23: (0, 318), 13: (0, 325), 24: (0, 0), 6: (0, 1), 11: (0, 2), 19: (0, 3), 25: (0, 478)}, 193: {9: (1, {'@': 140}), 10: (1, {'@': 140}), 14: (1, {'@': 140}), 31: (1, {'@': 140}), 3: (1, {'@': 140}), 6: (1, {'@': 140}), 7: (1, {'@': 140}), 8: (1, {'@': 140})}, 194: {1: (0, 624), 20: (0, 255), 4: (0, 389), 12: (0, 381), 19: (0, 194), 34: (0, 263), 13: (0, 213), 35: (0, 243), 81: (0, 275), 6: (0, 250), 36: (0, 284), 11: (0, 280), 37: (0, 287), 22: (0, 293)}, 195: {9: (1, {'@': 141}), 10: (1, {'@': 141}), 0: (1, {'@': 141}), 1: (1, {'@': 141}), 7: (1, {'@': 141}), 11: (1, {'@': 141}), 12: (1, {'@': 141}), 2: (1, {'@': 141}), 3: (1, {'@': 141}), 18: (1, {'@': 141}), 4: (1, {'@': 141}), 13: (1, {'@': 141}), 14: (1, {'@': 141}), 15: (1, {'@': 141}), 16: (1, {'@': 141}), 17: (1, {'@': 141}), 5: (1, {'@': 141}), 6: (1, {'@': 141}), 8: (1, {'@': 141}), 19: (1, {'@': 141}), 31: (1, {'@': 141}), 33: (1, {'@': 141}), 30: (1, {'@': 141}), 27: (1, {'@': 141}), 29: (1, {'@': 141}), 28: (1, {'@': 141}), 32: (1, {'@': 141})}, 196: {14: (0, 332), 6: (0, 314), 55: (0, 645), 31: (0, 310), 8: (0, 131), 7: (0, 410), 9: (0, 411)}, 197: {9: (1, {'@': 142}), 6: (1, {'@': 142}), 10: (1, {'@': 142}), 14: (1, {'@': 142}), 7: (1, {'@': 142}), 8: (1, {'@': 142}), 3: (1, {'@': 142}), 33: (1, {'@': 142}), 30: (1, {'@': 142}), 27: (1, {'@': 142}), 11: (1, {'@': 142}), 0: (1, {'@': 142}), 1: (1, {'@': 142}), 12: (1, {'@': 142}), 2: (1, {'@': 142}), 29: (1, {'@': 142}), 28: (1, {'@': 142}), 4: (1, {'@': 142}), 13: (1, {'@': 142}), 5: (1, {'@': 142}), 32: (1, {'@': 142}), 15: (1, {'@': 142}), 16: (1, {'@': 142}), 17: (1, {'@': 142}), 18: (1, {'@': 142}), 19: (1, {'@': 142}), 31: (1, {'@': 142})}, 198: {26: (0, 118)}, 199: {42: (0, 387), 43: (0, 150), 38: (0, 155), 12: (0, 381), 20: (0, 173)}, 200: {11: (1, {'@': 143}), 0: (1, {'@': 143}), 1: (1, {'@': 143}), 12: (1, {'@': 143}), 2: (1, {'@': 143}), 15: (1, {'@': 143}), 13: (1, {'@': 143}), 18: (1, {'@': 143}), 4: (1, {'@': 143}), 16: (1, {'@': 143}), 17: (1, {'@': 143}), 5: (1, {'@': 143}), 6: (1, {'@': 143}), 19: (1, {'@': 143})}, 201: {9: (1, {'@': 144}), 10: (1, {'@': 144}), 0: (1, {'@': 144}), 1: (1, {'@': 144}), 7: (1, {'@': 144}), 11: (1, {'@': 144}), 12: (1, {'@': 144}), 2: (1, {'@': 144}), 3: (1, {'@': 144}), 18: (1, {'@': 144}), 4: (1, {'@': 144}), 13: (1, {'@': 144}), 14: (1, {'@': 144}), 15: (1, {'@': 144}), 16: (1, {'@': 144}), 17: (1, {'@': 144}), 5: (1, {'@': 144}), 6: (1, {'@': 144}), 8: (1, {'@': 144}), 19: (1, {'@': 144}), 31: (1, {'@': 144}), 33: (1, {'@': 144}), 30: (1, {'@': 144}), 27: (1, {'@': 144}), 29: (1, {'@': 144}), 28: (1, {'@': 144}), 32: (1, {'@': 144})}, 202: {9: (1, {'@': 145}), 10: (1, {'@': 145}), 0: (1, {'@': 145}), 1: (1, {'@': 145}), 7: (1, {'@': 145}), 11: (1, {'@': 145}), 12: (1, {'@': 145}), 2: (1, {'@': 145}), 3: (1, {'@': 145}), 18: (1, {'@': 145}), 4: (1, {'@': 145}), 13: (1, {'@': 145}), 14: (1, {'@': 145}), 15: (1, {'@': 145}), 16: (1, {'@': 145}), 17: (1, {'@': 145}), 5: (1, {'@': 145}), 6: (1, {'@': 145}), 8: (1, {'@': 145}), 19: (1, {'@': 145}), 31: (1, {'@': 145}), 33: (1, {'@': 145}), 30: (1, {'@': 145}), 27: (1, {'@': 145}), 29: (1, {'@': 145}), 28: (1, {'@': 145}), 32: (1, {'@': 145})}, 203: {14: (0, 332), 6: (0, 314), 55: (0, 645), 31: (0, 327), 8: (0, 131), 7: (0, 410), 9: (0, 411)}, 204: {1: (0, 168), 20: (0, 174), 12: (0, 381), 21: (0, 180), 22: (0, 311), 23: (0, 318), 13: (0, 325), 24: (0, 0), 6: (0, 1), 15: (0, 192), 11: (0, 2), 19: (0, 3), 25: (0, 200)}, 205: {31: (0, 491), 55: (0, 297), 6: (0, 314), 9: (0, 309), 7: (0, 316), 14: (0, 323), 8: (0, 131)}, 206: {82: (0, 370), 15: (0, 239)}, 207: {9: (1, {'@': 146}), 6: (1, {'@': 146}), 10: (1, {'@': 146}), 14: (1, {'@': 146}), 7: (1, {'@': 146}), 8: (1, {'@': 146}), 3: (1, {'@': 146}), 33: (1, {'@': 146}), 30: (1, {'@': 146}), 27: (1, {'@': 146}), 11: (1, {'@': 146}), 0: (1, {'@': 146}), 1: (1, {'@': 146}), 12: (1, {'@': 146}), 2: (1, {'@': 146}), 29: (1, {'@': 146}), 28: (1, {'@': 146}), 4: (1, {'@': 146}), 13: (1, {'@': 146}), 5: (1, {'@': 146}), 32: (1, {'@': 146}), 15: (1, {'@': 146}), 16: (1, {'@': 146}), 17: (1, {'@': 146}), 18: (1, {'@': 146}), 19: (1, {'@': 146}), 31: (1, {'@': 146})}, 208: {15: (0, 394), 18: (0, 396), 9: (0, 604), 26: (0, 403)}, 209: {14: (0, 332), 6: (0, 314), 55: (0, 645), 31: (0, 313), 8: (0, 131), 7: (0, 410), 9: (0, 411)}, 210: {5: (0, 45), 11: (1, {'@': 147}), 0: (1, {'@': 147}), 1: (1, {'@': 147}), 12: (1, {'@': 147}), 15: (1, {'@': 147}), 18: (1, {'@': 147}), 4: (1, {'@': 147}), 16: (1, {'@': 147}), 17: (1, {'@': 147}), 13: (1, {'@': 147}), 6: (1, {'@': 147}), 19: (1, {'@': 147})}, 211: {9: (1, {'@': 148}), 10: (1, {'@': 148}), 0: (1, {'@': 148}), 1: (1, {'@': 148}), 7: (1, {'@': 148}), 11: (1, {'@': 148}), 12: (1, {'@': 148}), 2: (1, {'@': 148}), 3: (1, {'@': 148}), 18: (1, {'@': 148}), 4: (1, {'@': 148}), 13: (1, {'@': 148}), 14: (1, {'@': 148}), 15: (1, {'@': 148}), 16: (1, {'@': 148}), 17: (1, {'@': 148}), 5: (1, {'@': 148}), 6: (1, {'@': 148}), 8: (1, {'@': 148}), 19: (1, {'@': 148}), 31: (1, {'@': 148}), 33: (1, {'@': 148}), 30: (1, {'@': 148}), 27: (1, {'@': 148}), 29: (1, {'@': 148}), 28: (1, {'@': 148}), 32: (1, {'@': 148})}, 212: {11: (1, {'@': 149}), 0: (1, {'@': 149}), 1: (1, {'@': 149}), 12: (1, {'@': 149}), 2: (1, {'@': 149}), 15: (1, {'@': 149}), 13: (1, {'@': 149}), 18: (1, {'@': 149}), 4: (1, {'@': 149}), 16: (1, {'@': 149}), 17: (1, {'@': 149}), 5: (1, {'@': 149}), 6: (1, {'@': 149}), 19: (1, {'@': 149})}, 213: {1: (0, 624), 20: (0, 255), 4: (0, 389), 12: (0, 381), 19: (0, 194), 34: (0, 263), 13: (0, 213), 35: (0, 243), 81: (0, 247), 6: (0, 250), 36: (0, 284), 11: (0, 280), 37: (0, 287), 22: (0, 33)}, 214: {15: (1, {'@': 150}), 39: (1, {'@': 150})}, 215: {11: (1, {'@': 151}), 0: (1, {'@': 151}), 1: (1, {'@': 151}), 12: (1, {'@': 151}), 2: (1, {'@': 151}), 29: (1, {'@': 151}), 28: (1, {'@': 151}), 4: (1, {'@': 151}), 13: (1, {'@': 151}), 5: (1, {'@': 151}), 15: (1, {'@': 151}), 16: (1, {'@': 151}), 17: (1, {'@': 151}), 18: (1, {'@': 151}), 6: (1, {'@': 151}), 19: (1, {'@': 151}), 63: (1, {'@': 151})}, 216: {15: (0, 295), 83: (0, 212), 12: (0, 381), 20: (0, 221)}, 217: {11: (1, {'@': 152}), 0: (1, {'@': 152}), 1: (1, {'@': 152}), 12: (1, {'@': 152}), 15: (1, {'@': 152}), 18: (1, {'@': 152}), 4: (1, {'@': 152}), 16: (1, {'@': 152}), 17: (1, {'@': 152}), 13: (1, {'@': 152}), 6: (1, {'@': 152}), 19: (1, {'@': 152})}, 218: {9: (1, {'@': 153}), 10: (1, {'@': 153}), 0: (1, {'@': 153}), 1: (1, {'@': 153}), 7: (1, {'@': 153}), 11: (1, {'@': 153}), 12: (1, {'@': 153}), 2: (1, {'@': 153}), 3: (1, {'@': 153}), 18: (1, {'@': 153}), 4: (1, {'@': 153}), 13: (1, {'@': 153}), 14: (1, {'@': 153}), 15: (1, {'@': 153}), 16: (1, {'@': 153}), 17: (1, {'@': 153}), 5: (1, {'@': 153}), 6: (1, {'@': 153}), 8: (1, {'@': 153}), 19: (1, {'@': 153}), 31: (1, {'@': 153}), 33: (1, {'@': 153}), 30: (1, {'@': 153}), 27: (1, {'@': 153}), 29: (1, {'@': 153}), 28: (1, {'@': 153}), 32: (1, {'@': 153})}, 219: {5: (0, 352), 11: (1, {'@': 154}), 0: (1, {'@': 154}), 1: (1, {'@': 154}), 12: (1, {'@': 154}), 15: (1, {'@': 154}), 18: (1, {'@': 154}), 4: (1, {'@': 154}), 16: (1, {'@': 154}), 17: (1, {'@': 154}), 13: (1, {'@': 154}), 6: (1, {'@': 154}), 19: (1, {'@': 154})}, 220: {38: (0, 19)}, 221: {11: (1, {'@': 155}), 0: (1, {'@': 155}), 1: (1, {'@': 155}), 12: (1, {'@': 155}), 2: (1, {'@': 155}), 15: (1, {'@': 155}), 13: (1, {'@': 155}), 18: (1, {'@': 155}), 4: (1, {'@': 155}), 16: (1, {'@': 155}), 17: (1, {'@': 155}), 5: (1, {'@': 155}), 6: (1, {'@': 155}), 19: (1, {'@': 155})}, 222: {10: (1, {'@': 156}), 3: (1, {'@': 156})}, 223: {15: (1, {'@': 157}), 39: (1, {'@': 157})}, 224: {11: (1, {'@': 158}), 0: (1, {'@': 158}), 1: (1, {'@': 158}), 12: (1, {'@': 158}), 2: (1, {'@': 158}), 29: (1, {'@': 158}), 28: (1, {'@': 158}), 4: (1, {'@': 158}), 13: (1, {'@': 158}), 5: (1, {'@': 158}), 15: (1, {'@': 158}), 16: (1, {'@': 158}), 17: (1, {'@': 158}), 18: (1, {'@': 158}), 6: (1, {'@': 158}), 19: (1, {'@': 158}), 63: (1, {'@': 158})}, 225: {11: (1, {'@': 159}), 0: (1, {'@': 159}), 1: (1, {'@': 159}), 12: (1, {'@': 159}), 2: (1, {'@': 159}), 29: (1, {'@': 159}), 28: (1, {'@': 159}), 4: (1, {'@': 159}), 13: (1, {'@': 159}), 5: (1, {'@': 159}), 15: (1, {'@': 159}), 16: (1, {'@': 159}), 17: (1, {'@': 159}), 18: (1, {'@': 159}), 6: (1, {'@': 159}), 19: (1, {'@': 159}), 63: (1, {'@': 159})}, 226: {2: (0, 241), 5: (0, 458), 76: (0, 462), 11: (1, {'@': 160}), 0: (1, {'@': 160}), 1: (1, {'@': 160}), 12: (1, {'@': 160}), 15: (1, {'@': 160}), 18: (1, {'@': 160}), 4: (1, {'@': 160}), 16: (1, {'@': 160}), 17: (1, {'@': 160}), 13: (1, {'@': 160}), 6: (1, {'@': 160}), 19: (1, {'@': 160})}, 227: {82: (0, 373)}, 228: {44: (0, 523), 72: (0, 69), 71: (0, 511)}, 229: {15: (1, {'@': 161}), 39: (1, {'@': 161})}, 230: {42: (0, 163), 43: (0, 150), 38: (0, 155), 15: (0, 172), 12: (0, 381), 20: (0, 173)}, 231: {4: (0, 389), 1: (0, 86), 36: (0, 90)}, 232: {9: (1, {'@': 162}), 10: (1, {'@': 162}), 0: (1, {'@': 162}), 1: (1, {'@': 162}), 7: (1, {'@': 162}), 11: (1, {'@': 162}), 12: (1, {'@': 162}), 2: (1, {'@': 162}), 3: (1, {'@': 162}), 18: (1, {'@': 162}), 4: (1, {'@': 162}), 13: (1, {'@': 162}), 14: (1, {'@': 162}), 15: (1, {'@': 162}), 16: (1, {'@': 162}), 17: (1, {'@': 162}), 5: (1, {'@': 162}), 6: (1, {'@': 162}), 8: (1, {'@': 162}), 19: (1, {'@': 162}), 31: (1, {'@': 162}), 33: (1, {'@': 162}), 30: (1, {'@': 162}), 27: (1, {'@': 162}), 29: (1, {'@': 162}), 28: (1, {'@': 162}), 32: (1, {'@': 162})}, 233: {11: (1, {'@': 163}), 0: (1, {'@': 163}), 1: (1, {'@': 163}), 12: (1, {'@': 163}), 2: (1, {'@': 163}), 29: (1, {'@': 163}), 28: (1, {'@': 163}), 4: (1, {'@': 163}), 13: (1, {'@': 163}), 5: (1, {'@': 163}), 15: (1, {'@': 163}), 16: (1, {'@': 163}), 17: (1, {'@': 163}), 18: (1, {'@': 163}), 6: (1, {'@': 163}), 19: (1, {'@': 163}), 63: (1, {'@': 163})}, 234: {30: (0, 87), 15: (0, 93)}, 235: {9: (1, {'@': 164}), 10: (1, {'@': 164}), 0: (1, {'@': 164}), 1: (1, {'@': 164}), 7: (1, {'@': 164}), 11: (1, {'@': 164}), 12: (1, {'@': 164}), 2: (1, {'@': 164}), 3: (1, {'@': 164}), 4: (1, {'@': 164}), 26: (1, {'@': 164}), 13: (1, {'@': 164}), 5: (1, {'@': 164}), 14: (1, {'@': 164}), 15: (1, {'@': 164}), 16: (1, {'@': 164}), 17: (1, {'@': 164}), 18: (1, {'@': 164}), 6: (1, {'@': 164}), 8: (1, {'@': 164}), 19: (1, {'@': 164}), 27: (1, {'@': 164}), 28: (1, {'@': 164}), 32: (1, {'@': 164}), 33: (1, {'@': 164}), 29: (1, {'@': 164}), 30: (1, {'@': 164}), 31: (1, {'@': 164}), 39: (1, {'@': 164}), 40: (1, {'@': 164}), 41: (1, {'@': 164})}, 236: {9: (1, {'@': 165}), 10: (1, {'@': 165}), 0: (1, {'@': 165}), 1: (1, {'@': 165}), 7: (1, {'@': 165}), 11: (1, {'@': 165}), 12: (1, {'@': 165}), 2: (1, {'@': 165}), 3: (1, {'@': 165}), 18: (1, {'@': 165}), 4: (1, {'@': 165}), 13: (1, {'@': 165}), 14: (1, {'@': 165}), 15: (1, {'@': 165}), 16: (1, {'@': 165}), 17: (1, {'@': 165}), 5: (1, {'@': 165}), 6: (1, {'@': 165}), 8: (1, {'@': 165}), 19: (1, {'@': 165}), 31: (1, {'@': 165}), 33: (1, {'@': 165}), 30: (1, {'@': 165}), 27: (1, {'@': 165}), 29: (1, {'@': 165}), 28: (1, {'@': 165}), 32: (1, {'@': 165})}, 237: {14: (0, 332), 6: (0, 314), 55: (0, 645), 31: (0, 320), 8: (0, 131), 7: (0, 410), 9: (0, 411)}, 238: {84: (0, 169), 28: (0, 270), 11: (1, {'@': 166}), 0: (1, {'@': 166}), 1: (1, {'@': 166}), 12: (1, {'@': 166}), 2: (1, {'@': 166}), 4: (1, {'@': 166}), 13: (1, {'@': 166}), 5: (1, {'@': 166}), 15: (1, {'@': 166}), 16: (1, {'@': 166}), 17: (1, {'@': 166}), 18: (1, {'@': 166}), 6: (1, {'@': 166}), 19: (1, {'@': 166})}, 239: {82: (0, 330)}, 240: {9: (1, {'@': 167}), 6: (1, {'@': 167}), 14: (1, {'@': 167}), 7: (1, {'@': 167}), 8: (1, {'@': 167}), 31: (1, {'@': 167}), 10: (1, {'@': 167}), 3: (1, {'@': 167})}, 241: {11: (1, {'@': 168}), 0: (1, {'@': 168}), 1: (1, {'@': 168}), 12: (1, {'@': 168}), 13: (1, {'@': 168}), 15: (1, {'@': 168}), 18: (1, {'@': 168}), 4: (1, {'@': 168}), 16: (1, {'@': 168}), 17: (1, {'@': 168}), 5: (1, {'@': 168}), 6: (1, {'@': 168}), 19: (1, {'@': 168})}, 242: {9: (1, {'@': 169}), 10: (1, {'@': 169}), 0: (1, {'@': 169}), 1: (1, {'@': 169}), 7: (1, {'@': 169}), 11: (1, {'@': 169}), 12: (1, {'@': 169}), 2: (1, {'@': 169}), 3: (1, {'@': 169}), 18: (1, {'@': 169}), 4: (1, {'@': 169}), 13: (1, {'@': 169}), 14: (1, {'@': 169}), 15: (1, {'@': 169}), 16: (1, {'@': 169}), 17: (1, {'@': 169}), 5: (1, {'@': 169}), 6: (1, {'@': 169}), 8: (1, {'@': 169}), 19: (1, {'@': 169}), 31: (1, {'@': 169}), 33: (1, {'@': 169}), 30: (1, {'@': 169}), 27: (1, {'@': 169}), 29: (1, {'@': 169}), 28: (1, {'@': 169}), 32: (1, {'@': 169})}, 243: {9: (1, {'@': 170}), 7: (1, {'@': 170}), 14: (1, {'@': 170}), 31: (1, {'@': 170}), 6: (1, {'@': 170}), 8: (1, {'@': 170}), 10: (1, {'@': 170}), 3: (1, {'@': 170})}, 244: {1: (0, 6), 20: (0, 7), 12: (0, 381), 35: (0, 393), 11: (0, 395), 13: (0, 213), 85: (0, 397), 22: (0, 399), 38: (0, 402)}, 245: {5: (0, 465), 11: (1, {'@': 171}), 0: (1, {'@': 171}), 1: (1, {'@': 171}), 12: (1, {'@': 171}), 15: (1, {'@': 171}), 18: (1, {'@': 171}), 4: (1, {'@': 171}), 16: (1, {'@': 171}), 17: (1, {'@': 171}), 13: (1, {'@': 171}), 6: (1, {'@': 171}), 19: (1, {'@': 171})}, 246: {11: (1, {'@': 172}), 0: (1, {'@': 172}), 1: (1, {'@': 172}), 12: (1, {'@': 172}), 2: (1, {'@': 172}), 4: (1, {'@': 172}), 13: (1, {'@': 172}), 5: (1, {'@': 172}), 15: (1, {'@': 172}), 16: (1, {'@': 172}), 17: (1, {'@': 172}), 18: (1, {'@': 172}), 6: (1, {'@': 172}), 19: (1, {'@': 172})}, 247: {3: (0, 551), 86: (0, 557), 10: (0, 561)}, 248: {9: (1, {'@': 173}), 10: (1, {'@': 173}), 0: (1, {'@': 173}), 1: (1, {'@': 173}), 7: (1, {'@': 173}), 11: (1, {'@': 173}), 12: (1, {'@': 173}), 2: (1, {'@': 173}), 3: (1, {'@': 173}), 18: (1, {'@': 173}), 4: (1, {'@': 173}), 13: (1, {'@': 173}), 14: (1, {'@': 173}), 15: (1, {'@': 173}), 16: (1, {'@': 173}), 17: (1, {'@': 173}), 5: (1, {'@': 173}), 6: (1, {'@': 173}), 8: (1, {'@': 173}), 19: (1, {'@': 173}), 31: (1, {'@': 173}), 33: (1, {'@': 173}), 30: (1, {'@': 173}), 27: (1, {'@': 173}), 29: (1, {'@': 173}), 28: (1, {'@': 173}), 32: (1, {'@': 173})}, 249: {29: (0, 259), 87: (0, 246), 11: (1, {'@': 174}), 0: (1, {'@': 174}), 1: (1, {'@': 174}), 12: (1, {'@': 174}), 2: (1, {'@': 174}), 4: (1, {'@': 174}), 13: (1, {'@': 174}), 5: (1, {'@': 174}), 15: (1, {'@': 174}), 16: (1, {'@': 174}), 17: (1, {'@': 174}), 18: (1, {'@': 174}), 6: (1, {'@': 174}), 19: (1, {'@': 174})}, 250: {1: (0, 624), 20: (0, 255), 4: (0, 389), 12: (0, 381), 19: (0, 194), 34: (0, 263), 81: (0, 240), 13: (0, 213), 35: (0, 243), 6: (0, 250), 36: (0, 284), 11: (0, 280), 37: (0, 287), 22: (0, 293)}, 251: {11: (1, {'@': 175}), 0: (1, {'@': 175}), 1: (1, {'@': 175}), 12: (1, {'@': 175}), 15: (1, {'@': 175}), 18: (1, {'@': 175}), 4: (1, {'@': 175}), 16: (1, {'@': 175}), 17: (1, {'@': 175}), 13: (1, {'@': 175}), 6: (1, {'@': 175}), 19: (1, {'@': 175})}, 252: {9: (1, {'@': 176}), 10: (1, {'@': 176}), 0: (1, {'@': 176}), 1: (1, {'@': 176}), 7: (1, {'@': 176}), 11: (1, {'@': 176}), 12: (1, {'@': 176}), 2: (1, {'@': 176}), 3: (1, {'@': 176}), 18: (1, {'@': 176}), 4: (1, {'@': 176}), 13: (1, {'@': 176}), 14: (1, {'@': 176}), 15: (1, {'@': 176}), 16: (1, {'@': 176}), 17: (1, {'@': 176}), 5: (1, {'@': 176}), 6: (1, {'@': 176}), 8: (1, {'@': 176}), 19: (1, {'@': 176}), 31: (1, {'@': 176}), 33: (1, {'@': 176}), 30: (1, {'@': 176}), 27: (1, {'@': 176}), 29: (1, {'@': 176}), 28: (1, {'@': 176}), 32: (1, {'@': 176})}, 253: {4: (0, 30), 56: (0, 506)}, 254: {11: (1, {'@': 177}), 0: (1, {'@': 177}), 1: (1, {'@': 177}), 12: (1, {'@': 177}), 2: (1, {'@': 177}), 15: (1, {'@': 177}), 13: (1, {'@': 177}), 18: (1, {'@': 177}), 4: (1, {'@': 177}), 16: (1, {'@': 177}), 17: (1, {'@': 177}), 5: (1, {'@': 177}), 6: (1, {'@': 177}), 19: (1, {'@': 177})}, 255: {18: (0, 406), 15: (0, 408), 26: (0, 128), 9: (1, {'@': 178}), 10: (1, {'@': 178}), 7: (1, {'@': 178}), 14: (1, {'@': 178}), 31: (1, {'@': 178}), 3: (1, {'@': 178}), 6: (1, {'@': 178}), 8: (1, {'@': 178})}, 256: {9: (1, {'@': 179}), 10: (1, {'@': 179}), 0: (1, {'@': 179}), 1: (1, {'@': 179}), 7: (1, {'@': 179}), 11: (1, {'@': 179}), 12: (1, {'@': 179}), 2: (1, {'@': 179}), 3: (1, {'@': 179}), 18: (1, {'@': 179}), 4: (1, {'@': 179}), 13: (1, {'@': 179}), 14: (1, {'@': 179}), 15: (1, {'@': 179}), 16: (1, {'@': 179}), 17: (1, {'@': 179}), 5: (1, {'@': 179}), 6: (1, {'@': 179}), 8: (1, {'@': 179}), 19: (1, {'@': 179}), 31: (1, {'@': 179}), 33: (1, {'@': 179}), 30: (1, {'@': 179}), 27: (1, {'@': 179}), 29: (1, {'@': 179}), 28: (1, {'@': 179}), 32: (1, {'@': 179})}, 257: {11: (1, {'@': 180}), 0: (1, {'@': 180}), 1: (1, {'@': 180}), 12: (1, {'@': 180}), 2: (1, {'@': 180}), 29: (1, {'@': 180}), 18: (1, {'@': 180}), 28: (1, {'@': 180}), 4: (1, {'@': 180}), 13: (1, {'@': 180}), 15: (1, {'@': 180}), 16: (1, {'@': 180}), 17: (1, {'@': 180}), 5: (1, {'@': 180}), 6: (1, {'@': 180}), 19: (1, {'@': 180})}, 258: {10: (0, 468), 9: (1, {'@': 181}), 7: (1, {'@': 181}), 14: (1, {'@': 181}), 3: (1, {'@': 181}), 6: (1, {'@': 181}), 8: (1, {'@': 181})}, 259: {64: (0, 253), 88: (0, 260), 65: (0, 267), 66: (0, 279), 44: (0, 289), 67: (0, 296)}, 260: {11: (1, {'@': 182}), 0: (1, {'@': 182}), 1: (1, {'@': 182}), 12: (1, {'@': 182}), 2: (1, {'@': 182}), 18: (1, {'@': 182}), 4: (1, {'@': 182}), 13: (1, {'@': 182}), 15: (1, {'@': 182}), 16: (1, {'@': 182}), 17: (1, {'@': 182}), 5: (1, {'@': 182}), 6: (1, {'@': 182}), 19: (1, {'@': 182}), 28: (1, {'@': 182})}, 261: {9: (0, 635)}, 262: {38: (0, 71)}, 263: {55: (0, 297), 6: (0, 314), 9: (0, 309), 7: (0, 316), 14: (0, 323), 8: (0, 131), 10: (1, {'@': 183}), 31: (1, {'@': 183}), 3: (1, {'@': 183})}, 264: {11: (1, {'@': 184}), 0: (1, {'@': 184}), 1: (1, {'@': 184}), 12: (1, {'@': 184}), 2: (1, {'@': 184}), 29: (1, {'@': 184}), 28: (1, {'@': 184}), 4: (1, {'@': 184}), 13: (1, {'@': 184}), 5: (1, {'@': 184}), 15: (1, {'@': 184}), 16: (1, {'@': 184}), 17: (1, {'@': 184}), 18: (1, {'@': 184}), 6: (1, {'@': 184}), 19: (1, {'@': 184}), 63: (1, {'@': 184})}, 265: {9: (1, {'@': 185}), 10: (1, {'@': 185}), 0: (1, {'@': 185}), 1: (1, {'@': 185}), 7: (1, {'@': 185}), 11: (1, {'@': 185}), 12: (1, {'@': 185}), 2: (1, {'@': 185}), 3: (1, {'@': 185}), 18: (1, {'@': 185}), 4: (1, {'@': 185}), 13: (1, {'@': 185}), 14: (1, {'@': 185}), 15: (1, {'@': 185}), 16: (1, {'@': 185}), 17: (1, {'@': 185}), 5: (1, {'@': 185}), 6: (1, {'@': 185}), 8: (1, {'@': 185}), 19: (1, {'@': 185}), 31: (1, {'@': 185}), 33: (1, {'@': 185}), 30: (1, {'@': 185}), 27: (1, {'@': 185}), 29: (1, {'@': 185}), 28: (1, {'@': 185}), 32: (1, {'@': 185})}, 266: {89: (0, 471), 10: (0, 476), 3: (0, 477)}, 267: {90: (0, 494), 17: (0, 516), 91: (0, 521)}, 268: {1: (0, 186), 20: (0, 7), 4: (0, 389), 12: (0, 381), 19: (0, 194), 34: (0, 269), 13: (0, 213), 35: (0, 243), 6: (0, 250), 36: (0, 261), 11: (0, 280), 37: (0, 287), 22: (0, 293)}, 269: {55: (0, 297), 31: (0, 575), 6: (0, 314), 9: (0, 309), 7: (0, 316), 14: (0, 323), 8: (0, 131)}, 270: {64: (0, 253), 65: (0, 267), 66: (0, 279), 44: (0, 289), 67: (0, 296), 88: (0, 336)}, 271: {15: (0, 394), 18: (0, 396), 9: (0, 398), 26: (0, 403)}, 272: {15: (1, {'@': 186}), 39: (1, {'@': 186})}, 273: {9: (1, {'@': 187}), 10: (1, {'@': 187}), 0: (1, {'@': 187}), 1: (1, {'@': 187}), 7: (1, {'@': 187}), 11: (1, {'@': 187}), 12: (1, {'@': 187}), 2: (1, {'@': 187}), 3: (1, {'@': 187}), 18: (1, {'@': 187}), 4: (1, {'@': 187}), 13: (1, {'@': 187}), 14: (1, {'@': 187}), 15: (1, {'@': 187}), 16: (1, {'@': 187}), 17: (1, {'@': 187}), 5: (1, {'@': 187}), 6: (1, {'@': 187}), 8: (1, {'@': 187}), 19: (1, {'@': 187}), 31: (1, {'@': 187}), 33: (1, {'@': 187}), 30: (1, {'@': 187}), 27: (1, {'@': 187}), 29: (1, {'@': 187}), 28: (1, {'@': 187}), 32: (1, {'@': 187})}, 274: {44: (0, 523), 72: (0, 62), 71: (0, 511)}, 275: {9: (1, {'@': 188}), 6: (1, {'@': 188}), 14: (1, {'@': 188}), 7: (1, {'@': 188}), 8: (1, {'@': 188}), 31: (1, {'@': 188}), 10: (1, {'@': 188}), 3: (1, {'@': 188})}, 276: {10: (1, {'@': 189}), 3: (1, {'@': 189})}, 277: {33: (0, 335)}, 278: {9: (1, {'@': 190}), 10: (1, {'@': 190}), 7: (1, {'@': 190}), 14: (1, {'@': 190}), 3: (1, {'@': 190}), 6: (1, {'@': 190}), 8: (1, {'@': 190}), 33: (1, {'@': 190}), 30: (1, {'@': 190}), 27: (1, {'@': 190}), 11: (1, {'@': 190}), 0: (1, {'@': 190}), 1: (1, {'@': 190}), 12: (1, {'@': 190}), 2: (1, {'@': 190}), 29: (1, {'@': 190}), 28: (1, {'@': 190}), 4: (1, {'@': 190}), 13: (1, {'@': 190}), 5: (1, {'@': 190}), 32: (1, {'@': 190}), 15: (1, {'@': 190}), 16: (1, {'@': 190}), 17: (1, {'@': 190}), 18: (1, {'@': 190}), 19: (1, {'@': 190}), 31: (1, {'@': 190})}, 279: {15: (0, 454), 92: (0, 524), 11: (1, {'@': 191}), 0: (1, {'@': 191}), 1: (1, {'@': 191}), 12: (1, {'@': 191}), 2: (1, {'@': 191}), 18: (1, {'@': 191}), 28: (1, {'@': 191}), 4: (1, {'@': 191}), 13: (1, {'@': 191}), 16: (1, {'@': 191}), 17: (1, {'@': 191}), 5: (1, {'@': 191}), 6: (1, {'@': 191}), 19: (1, {'@': 191}), 29: (1, {'@': 191})}, 280: {9: (1, {'@': 192}), 7: (1, {'@': 192}), 14: (1, {'@': 192}), 31: (1, {'@': 192}), 6: (1, {'@': 192}), 8: (1, {'@': 192}), 10: (1, {'@': 192}), 3: (1, {'@': 192})}, 281: {10: (0, 535)}, 282: {11: (1, {'@': 193}), 0: (1, {'@': 193}), 1: (1, {'@': 193}), 12: (1, {'@': 193}), 2: (1, {'@': 193}), 15: (1, {'@': 193}), 13: (1, {'@': 193}), 18: (1, {'@': 193}), 4: (1, {'@': 193}), 16: (1, {'@': 193}), 17: (1, {'@': 193}), 5: (1, {'@': 193}), 6: (1, {'@': 193}), 19: (1, {'@': 193})}, 283: {43: (0, 150), 38: (0, 155), 12: (0, 381), 42: (0, 187), 20: (0, 173)}, 284: {9: (0, 635), 10: (1, {'@': 194}), 7: (1, {'@': 194}), 14: (1, {'@': 194}), 31: (1, {'@': 194}), 3: (1, {'@': 194}), 6: (1, {'@': 194}), 8: (1, {'@': 194})}, 285: {12: (0, 381), 20: (0, 634), 1: (0, 644)}, 286: {9: (1, {'@': 195}), 6: (1, {'@': 195}), 10: (1, {'@': 195}), 14: (1, {'@': 195}), 7: (1, {'@': 195}), 8: (1, {'@': 195}), 3: (1, {'@': 195}), 33: (1, {'@': 195}), 30: (1, {'@': 195}), 27: (1, {'@': 195}), 11: (1, {'@': 195}), 0: (1, {'@': 195}), 1: (1, {'@': 195}), 12: (1, {'@': 195}), 2: (1, {'@': 195}), 29: (1, {'@': 195}), 28: (1, {'@': 195}), 4: (1, {'@': 195}), 13: (1, {'@': 195}), 5: (1, {'@': 195}), 32: (1, {'@': 195}), 15: (1, {'@': 195}), 16: (1, {'@': 195}), 17: (1, {'@': 195}), 18: (1, {'@': 195}), 19: (1, {'@': 195}), 31: (1, {'@': 195})}, 287: {9: (1, {'@': 196}), 7: (1, {'@': 196}), 14: (1, {'@': 196}), 31: (1, {'@': 196}), 6: (1, {'@': 196}), 8: (1, {'@': 196}), 10: (1, {'@': 196}), 3: (1, {'@': 196})}, 288: {10: (1, {'@': 197}), 3: (1, {'@': 197})}, 289: {18: (0, 122), 4: (1, {'@': 198}), 56: (1, {'@': 198})}, 290: {10: (1, {'@': 199}), 3: (1, {'@': 199})}, 291: {11: (1, {'@': 200}), 0: (1, {'@': 200}), 1: (1, {'@': 200}), 12: (1, {'@': 200}), 15: (1, {'@': 200}), 18: (1, {'@': 200}), 4: (1, {'@': 200}), 16: (1, {'@': 200}), 17: (1, {'@': 200}), 13: (1, {'@': 200}), 6: (1, {'@': 200}), 19: (1, {'@': 200})}, 292: {6: (0, 314), 9: (0, 358), 7: (0, 337), 14: (0, 35), 8: (0, 131), 55: (0, 38), 11: (1, {'@': 201}), 0: (1, {'@': 201}), 1: (1, {'@': 201}), 12: (1, {'@': 201}), 2: (1, {'@': 201}), 15: (1, {'@': 201}), 13: (1, {'@': 201}), 18: (1, {'@': 201}), 4: (1, {'@': 201}), 16: (1, {'@': 201}), 17: (1, {'@': 201}), 5: (1, {'@': 201}), 19: (1, {'@': 201})}, 293: {9: (1, {'@': 59}), 7: (1, {'@': 59}), 14: (1, {'@': 59}), 31: (1, {'@': 59}), 6: (1, {'@': 59}), 8: (1, {'@': 59}), 10: (1, {'@': 59}), 3: (1, {'@': 59})}, 294: {9: (1, {'@': 202}), 10: (1, {'@': 202}), 0: (1, {'@': 202}), 1: (1, {'@': 202}), 7: (1, {'@': 202}), 11: (1, {'@': 202}), 12: (1, {'@': 202}), 2: (1, {'@': 202}), 3: (1, {'@': 202}), 18: (1, {'@': 202}), 4: (1, {'@': 202}), 13: (1, {'@': 202}), 14: (1, {'@': 202}), 15: (1, {'@': 202}), 16: (1, {'@': 202}), 17: (1, {'@': 202}), 5: (1, {'@': 202}), 6: (1, {'@': 202}), 8: (1, {'@': 202}), 19: (1, {'@': 202}), 31: (1, {'@': 202}), 33: (1, {'@': 202}), 30: (1, {'@': 202}), 27: (1, {'@': 202}), 29: (1, {'@': 202}), 28: (1, {'@': 202}), 32: (1, {'@': 202})}, 295: {12: (0, 381), 20: (0, 481), 83: (0, 485)}, 296: {15: (0, 454), 92: (0, 513), 11: (1, {'@': 203}), 0: (1, {'@': 203}), 1: (1, {'@': 203}), 12: (1, {'@': 203}), 2: (1, {'@': 203}), 18: (1, {'@': 203}), 28: (1, {'@': 203}), 4: (1, {'@': 203}), 13: (1, {'@': 203}), 16: (1, {'@': 203}), 17: (1, {'@': 203}), 5: (1, {'@': 203}), 6: (1, {'@': 203}), 19: (1, {'@': 203}), 29: (1, {'@': 203})}, 297: {1: (0, 405), 20: (0, 407), 4: (0, 389), 12: (0, 381), 35: (0, 393), 11: (0, 395), 13: (0, 213), 93: (0, 409), 85: (0, 531), 22: (0, 399), 36: (0, 536)}, 298: {9: (1, {'@': 204}), 6: (1, {'@': 204}), 14: (1, {'@': 204}), 7: (1, {'@': 204}), 8: (1, {'@': 204}), 31: (1, {'@': 204}), 10: (1, {'@': 204}), 3: (1, {'@': 204})}, 299: {94: (0, 356), 1: (0, 484), 20: (0, 487), 4: (0, 389), 12: (0, 381), 36: (0, 489), 13: (0, 404), 11: (0, 8), 22: (0, 9), 60: (0, 12), 95: (0, 493)}, 300: {9: (1, {'@': 205}), 10: (1, {'@': 205}), 0: (1, {'@': 205}), 1: (1, {'@': 205}), 7: (1, {'@': 205}), 11: (1, {'@': 205}), 12: (1, {'@': 205}), 2: (1, {'@': 205}), 3: (1, {'@': 205}), 18: (1, {'@': 205}), 4: (1, {'@': 205}), 13: (1, {'@': 205}), 14: (1, {'@': 205}), 15: (1, {'@': 205}), 16: (1, {'@': 205}), 17: (1, {'@': 205}), 5: (1, {'@': 205}), 6: (1, {'@': 205}), 8: (1, {'@': 205}), 19: (1, {'@': 205}), 31: (1, {'@': 205}), 33: (1, {'@': 205}), 30: (1, {'@': 205}), 27: (1, {'@': 205}), 29: (1, {'@': 205}), 28: (1, {'@': 205}), 32: (1, {'@': 205})}, 301: {11: (1, {'@': 206}), 0: (1, {'@': 206}), 1: (1, {'@': 206}), 12: (1, {'@': 206}), 2: (1, {'@': 206}), 29: (1, {'@': 206}), 28: (1, {'@': 206}), 4: (1, {'@': 206}), 13: (1, {'@': 206}), 5: (1, {'@': 206}), 15: (1, {'@': 206}), 16: (1, {'@': 206}), 17: (1, {'@': 206}), 18: (1, {'@': 206}), 6: (1, {'@': 206}), 19: (1, {'@': 206})}, 302: {9: (1, {'@': 207}), 6: (1, {'@': 207}), 14: (1, {'@': 207}), 7: (1, {'@': 207}), 8: (1, {'@': 207}), 31: (1, {'@': 207}), 10: (1, {'@': 207}), 3: (1, {'@': 207})}, 303: {1: (0, 376), 12: (0, 381), 4: (0, 507), 20: (0, 378), 13: (0, 404), 6: (0, 339), 71: (0, 511), 73: (0, 514), 69: (0, 517), 58: (0, 343), 59: (0, 520), 60: (0, 350), 44: (0, 523), 19: (0, 363), 72: (0, 526), 36: (0, 377), 96: (0, 529), 22: (0, 382), 57: (0, 385), 45: (0, 133), 11: (0, 278)}, 304: {18: (0, 406), 15: (0, 408), 26: (0, 128), 11: (1, {'@': 208}), 0: (1, {'@': 208}), 1: (1, {'@': 208}), 12: (1, {'@': 208}), 2: (1, {'@': 208}), 13: (1, {'@': 208}), 4: (1, {'@': 208}), 16: (1, {'@': 208}), 17: (1, {'@': 208}), 5: (1, {'@': 208}), 6: (1, {'@': 208}), 19: (1, {'@': 208})}, 305: {1: (0, 376), 20: (0, 378), 4: (0, 389), 15: (0, 50), 12: (0, 381), 13: (0, 404), 6: (0, 339), 22: (0, 382), 57: (0, 385), 36: (0, 377), 59: (0, 55), 58: (0, 343), 60: (0, 350), 19: (0, 363), 11: (0, 278)}, 306: {9: (1, {'@': 209}), 10: (1, {'@': 209}), 0: (1, {'@': 209}), 1: (1, {'@': 209}), 7: (1, {'@': 209}), 11: (1, {'@': 209}), 12: (1, {'@': 209}), 2: (1, {'@': 209}), 3: (1, {'@': 209}), 18: (1, {'@': 209}), 4: (1, {'@': 209}), 13: (1, {'@': 209}), 14: (1, {'@': 209}), 15: (1, {'@': 209}), 16: (1, {'@': 209}), 17: (1, {'@': 209}), 5: (1, {'@': 209}), 6: (1, {'@': 209}), 8: (1, {'@': 209}), 19: (1, {'@': 209}), 31: (1, {'@': 209}), 33: (1, {'@': 209}), 30: (1, {'@': 209}), 27: (1, {'@': 209}), 29: (1, {'@': 209}), 28: (1, {'@': 209}), 32: (1, {'@': 209})}, 307: {38: (0, 51), 15: (0, 54)}, 308: {44: (0, 75)}, 309: {38: (0, 540)}, 310: {9: (1, {'@': 210}), 10: (1, {'@': 210}), 14: (1, {'@': 210}), 31: (1, {'@': 210}), 3: (1, {'@': 210}), 6: (1, {'@': 210}), 7: (1, {'@': 210}), 8: (1, {'@': 210})}, 311: {0: (1, {'@': 211}), 1: (1, {'@': 211}), 2: (1, {'@': 211}), 3: (1, {'@': 211}), 4: (1, {'@': 211}), 5: (1, {'@': 211}), 6: (1, {'@': 211}), 7: (1, {'@': 211}), 8: (1, {'@': 211}), 9: (1, {'@': 211}), 10: (1, {'@': 211}), 11: (1, {'@': 211}), 12: (1, {'@': 211}), 13: (1, {'@': 211}), 14: (1, {'@': 211}), 15: (1, {'@': 211}), 16: (1, {'@': 211}), 17: (1, {'@': 211}), 18: (1, {'@': 211}), 19: (1, {'@': 211})}, 312: {9: (1, {'@': 212}), 6: (1, {'@': 212}), 10: (1, {'@': 212}), 14: (1, {'@': 212}), 7: (1, {'@': 212}), 8: (1, {'@': 212}), 3: (1, {'@': 212}), 33: (1, {'@': 212}), 30: (1, {'@': 212}), 27: (1, {'@': 212}), 11: (1, {'@': 212}), 0: (1, {'@': 212}), 1: (1, {'@': 212}), 12: (1, {'@': 212}), 2: (1, {'@': 212}), 29: (1, {'@': 212}), 28: (1, {'@': 212}), 4: (1, {'@': 212}), 13: (1, {'@': 212}), 5: (1, {'@': 212}), 32: (1, {'@': 212}), 15: (1, {'@': 212}), 16: (1, {'@': 212}), 17: (1, {'@': 212}), 18: (1, {'@': 212}), 19: (1, {'@': 212}), 31: (1, {'@': 212})}, 313: {9: (1, {'@': 213}), 10: (1, {'@': 213}), 14: (1, {'@': 213}), 31: (1, {'@': 213}), 3: (1, {'@': 213}), 6: (1, {'@': 213}), 7: (1, {'@': 213}), 8: (1, {'@': 213})}, 314: {15: (0, 496), 11: (1, {'@': 214}), 1: (1, {'@': 214}), 12: (1, {'@': 214}), 4: (1, {'@': 214}), 13: (1, {'@': 214}), 48: (1, {'@': 214})}, 315: {9: (1, {'@': 215}), 6: (1, {'@': 215}), 10: (1, {'@': 215}), 14: (1, {'@': 215}), 7: (1, {'@': 215}), 8: (1, {'@': 215}), 3: (1, {'@': 215}), 33: (1, {'@': 215}), 30: (1, {'@': 215}), 27: (1, {'@': 215}), 11: (1, {'@': 215}), 0: (1, {'@': 215}), 1: (1, {'@': 215}), 12: (1, {'@': 215}), 2: (1, {'@': 215}), 29: (1, {'@': 215}), 28: (1, {'@': 215}), 4: (1, {'@': 215}), 13: (1, {'@': 215}), 5: (1, {'@': 215}), 32: (1, {'@': 215}), 15: (1, {'@': 215}), 16: (1, {'@': 215}), 17: (1, {'@': 215}), 18: (1, {'@': 215}), 19: (1, {'@': 215}), 31: (1, {'@': 215})}, 316: {38: (0, 544)}, 317: {10: (0, 640)}, 318: {0: (1, {'@': 216}), 1: (1, {'@': 216}), 2: (1, {'@': 216}), 3: (1, {'@': 216}), 4: (1, {'@': 216}), 5: (1, {'@': 216}), 6: (1, {'@': 216}), 7: (1, {'@': 216}), 8: (1, {'@': 216}), 9: (1, {'@': 216}), 10: (1, {'@': 216}), 11: (1, {'@': 216}), 12: (1, {'@': 216}), 13: (1, {'@': 216}), 14: (1, {'@': 216}), 15: (1, {'@': 216}), 16: (1, {'@': 216}), 17: (1, {'@': 216}), 18: (1, {'@': 216}), 19: (1, {'@': 216})}, 319: {1: (0, 6), 20: (0, 7), 12: (0, 381), 52: (0, 527), 24: (0, 530), 22: (0, 533), 13: (0, 325), 38: (0, 538), 11: (0, 542)}, 320: {11: (1, {'@': 217}), 0: (1, {'@': 217}), 1: (1, {'@': 217}), 12: (1, {'@': 217}), 2: (1, {'@': 217}), 29: (1, {'@': 217}), 28: (1, {'@': 217}), 4: (1, {'@': 217}), 13: (1, {'@': 217}), 5: (1, {'@': 217}), 15: (1, {'@': 217}), 16: (1, {'@': 217}), 17: (1, {'@': 217}), 18: (1, {'@': 217}), 6: (1, {'@': 217}), 19: (1, {'@': 217}), 63: (1, {'@': 217})}, 321: {38: (0, 499)}, 322: {15: (1, {'@': 218}), 39: (1, {'@': 218})}, 323: {38: (0, 548)}, 324: {9: (1, {'@': 219}), 6: (1, {'@': 219}), 14: (1, {'@': 219}), 7: (1, {'@': 219}), 8: (1, {'@': 219}), 31: (1, {'@': 219}), 10: (1, {'@': 219}), 3: (1, {'@': 219})}, 325: {1: (0, 168), 20: (0, 174), 12: (0, 381), 22: (0, 401), 21: (0, 180), 23: (0, 318), 13: (0, 325), 24: (0, 0), 6: (0, 1), 25: (0, 42), 11: (0, 2), 19: (0, 3)}, 326: {1: (0, 376), 20: (0, 378), 4: (0, 389), 12: (0, 381), 13: (0, 404), 6: (0, 339), 59: (0, 290), 22: (0, 382), 57: (0, 385), 36: (0, 377), 58: (0, 343), 60: (0, 350), 19: (0, 363), 11: (0, 278)}, 327: {11: (1, {'@': 220}), 0: (1, {'@': 220}), 1: (1, {'@': 220}), 12: (1, {'@': 220}), 2: (1, {'@': 220}), 29: (1, {'@': 220}), 28: (1, {'@': 220}), 4: (1, {'@': 220}), 13: (1, {'@': 220}), 5: (1, {'@': 220}), 15: (1, {'@': 220}), 16: (1, {'@': 220}), 17: (1, {'@': 220}), 18: (1, {'@': 220}), 6: (1, {'@': 220}), 19: (1, {'@': 220}), 63: (1, {'@': 220})}, 328: {38: (0, 502)}, 329: {0: (1, {'@': 221}), 1: (1, {'@': 221}), 2: (1, {'@': 221}), 3: (1, {'@': 221}), 4: (1, {'@': 221}), 5: (1, {'@': 221}), 6: (1, {'@': 221}), 7: (1, {'@': 221}), 8: (1, {'@': 221}), 9: (1, {'@': 221}), 10: (1, {'@': 221}), 11: (1, {'@': 221}), 12: (1, {'@': 221}), 13: (1, {'@': 221}), 14: (1, {'@': 221}), 15: (1, {'@': 221}), 16: (1, {'@': 221}), 17: (1, {'@': 221}), 18: (1, {'@': 221}), 19: (1, {'@': 221})}, 330: {12: (0, 381), 15: (0, 99), 20: (0, 106)}, 331: {1: (0, 624), 20: (0, 255), 4: (0, 389), 12: (0, 381), 19: (0, 194), 34: (0, 263), 13: (0, 213), 81: (0, 649), 97: (0, 130), 35: (0, 243), 6: (0, 250), 36: (0, 284), 11: (0, 280), 37: (0, 287), 22: (0, 293)}, 332: {38: (0, 384)}, 333: {14: (0, 332), 6: (0, 314), 55: (0, 645), 31: (0, 610), 8: (0, 131), 7: (0, 410), 9: (0, 411)}, 334: {1: (0, 76), 13: (0, 109), 20: (0, 612), 12: (0, 381), 4: (0, 123), 46: (0, 616), 22: (0, 36), 47: (0, 40), 49: (0, 636), 48: (0, 49), 50: (0, 56), 19: (0, 58), 97: (0, 281), 11: (0, 63), 6: (0, 66), 61: (0, 288), 51: (0, 70)}, 335: {32: (1, {'@': 222}), 3: (1, {'@': 222})}, 336: {11: (1, {'@': 223}), 0: (1, {'@': 223}), 1: (1, {'@': 223}), 12: (1, {'@': 223}), 2: (1, {'@': 223}), 18: (1, {'@': 223}), 4: (1, {'@': 223}), 13: (1, {'@': 223}), 15: (1, {'@': 223}), 16: (1, {'@': 223}), 17: (1, {'@': 223}), 5: (1, {'@': 223}), 6: (1, {'@': 223}), 19: (1, {'@': 223}), 29: (1, {'@': 223})}, 337: {38: (0, 549)}, 338: {38: (0, 504)}, 339: {1: (0, 376), 20: (0, 378), 4: (0, 389), 12: (0, 381), 13: (0, 404), 6: (0, 339), 22: (0, 382), 57: (0, 385), 36: (0, 377), 58: (0, 343), 60: (0, 350), 59: (0, 286), 19: (0, 363), 11: (0, 278)}, 340: {9: (1, {'@': 224}), 10: (1, {'@': 224}), 0: (1, {'@': 224}), 1: (1, {'@': 224}), 7: (1, {'@': 224}), 11: (1, {'@': 224}), 12: (1, {'@': 224}), 2: (1, {'@': 224}), 3: (1, {'@': 224}), 18: (1, {'@': 224}), 4: (1, {'@': 224}), 13: (1, {'@': 224}), 14: (1, {'@': 224}), 15: (1, {'@': 224}), 16: (1, {'@': 224}), 17: (1, {'@': 224}), 5: (1, {'@': 224}), 6: (1, {'@': 224}), 8: (1, {'@': 224}), 19: (1, {'@': 224}), 31: (1, {'@': 224}), 33: (1, {'@': 224}), 30: (1, {'@': 224}), 27: (1, {'@': 224}), 29: (1, {'@': 224}), 28: (1, {'@': 224}), 32: (1, {'@': 224})}, 341: {5: (0, 291), 11: (1, {'@': 225}), 0: (1, {'@': 225}), 1: (1, {'@': 225}), 12: (1, {'@': 225}), 15: (1, {'@': 225}), 18: (1, {'@': 225}), 4: (1, {'@': 225}), 16: (1, {'@': 225}), 17: (1, {'@': 225}), 13: (1, {'@': 225}), 6: (1, {'@': 225}), 19: (1, {'@': 225})}, 342: {9: (1, {'@': 226}), 6: (1, {'@': 226}), 14: (1, {'@': 226}), 7: (1, {'@': 226}), 8: (1, {'@': 226}), 31: (1, {'@': 226}), 10: (1, {'@': 226}), 3: (1, {'@': 226})}, 343: {55: (0, 299), 6: (0, 314), 9: (0, 321), 7: (0, 328), 14: (0, 338), 8: (0, 131), 10: (1, {'@': 227}), 3: (1, {'@': 227}), 33: (1, {'@': 227}), 30: (1, {'@': 227}), 27: (1, {'@': 227}), 11: (1, {'@': 227}), 0: (1, {'@': 227}), 1: (1, {'@': 227}), 12: (1, {'@': 227}), 2: (1, {'@': 227}), 29: (1, {'@': 227}), 28: (1, {'@': 227}), 18: (1, {'@': 227}), 4: (1, {'@': 227}), 13: (1, {'@': 227}), 32: (1, {'@': 227}), 15: (1, {'@': 227}), 16: (1, {'@': 227}), 17: (1, {'@': 227}), 5: (1, {'@': 227}), 19: (1, {'@': 227}), 31: (1, {'@': 227})}, 344: {20: (0, 436), 12: (0, 381), 1: (0, 553)}, 345: {16: (0, 374), 1: (0, 376), 20: (0, 378), 12: (0, 381), 4: (0, 389), 98: (0, 392), 78: (0, 400), 13: (0, 404), 6: (0, 339), 77: (0, 341), 58: (0, 343), 59: (0, 347), 60: (0, 350), 15: (0, 353), 19: (0, 363), 11: (0, 366), 18: (0, 368), 79: (0, 371), 36: (0, 377), 99: (0, 379), 22: (0, 382), 57: (0, 385), 80: (0, 386), 17: (0, 391)}, 346: {9: (1, {'@': 228}), 10: (1, {'@': 228}), 0: (1, {'@': 228}), 1: (1, {'@': 228}), 7: (1, {'@': 228}), 11: (1, {'@': 228}), 12: (1, {'@': 228}), 2: (1, {'@': 228}), 3: (1, {'@': 228}), 18: (1, {'@': 228}), 4: (1, {'@': 228}), 13: (1, {'@': 228}), 14: (1, {'@': 228}), 15: (1, {'@': 228}), 16: (1, {'@': 228}), 17: (1, {'@': 228}), 5: (1, {'@': 228}), 6: (1, {'@': 228}), 8: (1, {'@': 228}), 19: (1, {'@': 228}), 31: (1, {'@': 228}), 33: (1, {'@': 228}), 30: (1, {'@': 228}), 27: (1, {'@': 228}), 29: (1, {'@': 228}), 28: (1, {'@': 228}), 32: (1, {'@': 228})}, 347: {75: (0, 303), 3: (0, 151), 32: (0, 156), 100: (0, 161)}, 348: {9: (1, {'@': 229}), 10: (1, {'@': 229}), 0: (1, {'@': 229}), 1: (1, {'@': 229}), 7: (1, {'@': 229}), 11: (1, {'@': 229}), 12: (1, {'@': 229}), 2: (1, {'@': 229}), 3: (1, {'@': 229}), 18: (1, {'@': 229}), 4: (1, {'@': 229}), 13: (1, {'@': 229}), 14: (1, {'@': 229}), 15: (1, {'@': 229}), 16: (1, {'@': 229}), 17: (1, {'@': 229}), 5: (1, {'@': 229}), 6: (1, {'@': 229}), 8: (1, {'@': 229}), 19: (1, {'@': 229}), 31: (1, {'@': 229}), 33: (1, {'@': 229}), 30: (1, {'@': 229}), 27: (1, {'@': 229}), 29: (1, {'@': 229}), 28: (1, {'@': 229}), 32: (1, {'@': 229})}, 349: {12: (0, 381), 1: (0, 550), 20: (0, 562)}, 350: {9: (1, {'@': 230}), 10: (1, {'@': 230}), 7: (1, {'@': 230}), 14: (1, {'@': 230}), 3: (1, {'@': 230}), 6: (1, {'@': 230}), 8: (1, {'@': 230}), 33: (1, {'@': 230}), 30: (1, {'@': 230}), 27: (1, {'@': 230}), 11: (1, {'@': 230}), 0: (1, {'@': 230}), 1: (1, {'@': 230}), 12: (1, {'@': 230}), 2: (1, {'@': 230}), 29: (1, {'@': 230}), 28: (1, {'@': 230}), 4: (1, {'@': 230}), 13: (1, {'@': 230}), 5: (1, {'@': 230}), 32: (1, {'@': 230}), 15: (1, {'@': 230}), 16: (1, {'@': 230}), 17: (1, {'@': 230}), 18: (1, {'@': 230}), 19: (1, {'@': 230}), 31: (1, {'@': 230})}, 351: {15: (0, 585), 20: (0, 599), 12: (0, 381), 1: (0, 602)}, 352: {11: (1, {'@': 231}), 0: (1, {'@': 231}), 1: (1, {'@': 231}), 12: (1, {'@': 231}), 15: (1, {'@': 231}), 18: (1, {'@': 231}), 4: (1, {'@': 231}), 16: (1, {'@': 231}), 17: (1, {'@': 231}), 13: (1, {'@': 231}), 6: (1, {'@': 231}), 19: (1, {'@': 231})}, 353: {16: (0, 374), 1: (0, 376), 20: (0, 378), 12: (0, 381), 4: (0, 389), 13: (0, 404), 6: (0, 339), 78: (0, 177), 77: (0, 191), 58: (0, 343), 59: (0, 347), 60: (0, 350), 19: (0, 363), 11: (0, 366), 18: (0, 368), 79: (0, 371), 36: (0, 377), 22: (0, 382), 57: (0, 385), 80: (0, 386), 17: (0, 391)}, 354: {9: (1, {'@': 232}), 10: (1, {'@': 232}), 0: (1, {'@': 232}), 1: (1, {'@': 232}), 7: (1, {'@': 232}), 11: (1, {'@': 232}), 12: (1, {'@': 232}), 2: (1, {'@': 232}), 3: (1, {'@': 232}), 18: (1, {'@': 232}), 4: (1, {'@': 232}), 13: (1, {'@': 232}), 14: (1, {'@': 232}), 15: (1, {'@': 232}), 16: (1, {'@': 232}), 17: (1, {'@': 232}), 5: (1, {'@': 232}), 6: (1, {'@': 232}), 8: (1, {'@': 232}), 19: (1, {'@': 232}), 31: (1, {'@': 232}), 33: (1, {'@': 232}), 30: (1, {'@': 232}), 27: (1, {'@': 232}), 29: (1, {'@': 232}), 28: (1, {'@': 232}), 32: (1, {'@': 232})}, 355: {1: (0, 6), 20: (0, 7), 12: (0, 381), 94: (0, 207), 13: (0, 404), 11: (0, 8), 38: (0, 312), 22: (0, 9), 60: (0, 12)}, 356: {27: (1, {'@': 233}), 0: (1, {'@': 233}), 1: (1, {'@': 233}), 2: (1, {'@': 233}), 3: (1, {'@': 233}), 28: (1, {'@': 233}), 4: (1, {'@': 233}), 5: (1, {'@': 233}), 32: (1, {'@': 233}), 6: (1, {'@': 233}), 7: (1, {'@': 233}), 8: (1, {'@': 233}), 33: (1, {'@': 233}), 9: (1, {'@': 233}), 10: (1, {'@': 233}), 11: (1, {'@': 233}), 12: (1, {'@': 233}), 29: (1, {'@': 233}), 13: (1, {'@': 233}), 14: (1, {'@': 233}), 30: (1, {'@': 233}), 15: (1, {'@': 233}), 31: (1, {'@': 233}), 16: (1, {'@': 233}), 17: (1, {'@': 233}), 18: (1, {'@': 233}), 19: (1, {'@': 233})}, 357: {12: (0, 381), 20: (0, 565), 1: (0, 590)}, 358: {38: (0, 545)}, 359: {9: (1, {'@': 234}), 10: (1, {'@': 234}), 0: (1, {'@': 234}), 1: (1, {'@': 234}), 7: (1, {'@': 234}), 11: (1, {'@': 234}), 12: (1, {'@': 234}), 2: (1, {'@': 234}), 3: (1, {'@': 234}), 18: (1, {'@': 234}), 4: (1, {'@': 234}), 13: (1, {'@': 234}), 14: (1, {'@': 234}), 15: (1, {'@': 234}), 16: (1, {'@': 234}), 17: (1, {'@': 234}), 5: (1, {'@': 234}), 6: (1, {'@': 234}), 8: (1, {'@': 234}), 19: (1, {'@': 234}), 31: (1, {'@': 234}), 33: (1, {'@': 234}), 30: (1, {'@': 234}), 27: (1, {'@': 234}), 29: (1, {'@': 234}), 28: (1, {'@': 234}), 32: (1, {'@': 234})}, 360: {20: (0, 437), 12: (0, 381), 1: (0, 582)}, 361: {39: (0, 105)}, 362: {64: (0, 253), 44: (0, 289), 67: (0, 132), 63: (0, 159)}, 363: {1: (0, 376), 59: (0, 197), 20: (0, 378), 4: (0, 389), 12: (0, 381), 13: (0, 404), 6: (0, 339), 22: (0, 382), 57: (0, 385), 36: (0, 377), 58: (0, 343), 60: (0, 350), 19: (0, 363), 11: (0, 278)}, 364: {15: (0, 57), 20: (0, 64), 1: (0, 67), 12: (0, 381)}, 365: {9: (1, {'@': 235}), 10: (1, {'@': 235}), 0: (1, {'@': 235}), 1: (1, {'@': 235}), 7: (1, {'@': 235}), 11: (1, {'@': 235}), 12: (1, {'@': 235}), 2: (1, {'@': 235}), 3: (1, {'@': 235}), 18: (1, {'@': 235}), 4: (1, {'@': 235}), 13: (1, {'@': 235}), 14: (1, {'@': 235}), 15: (1, {'@': 235}), 16: (1, {'@': 235}), 17: (1, {'@': 235}), 5: (1, {'@': 235}), 6: (1, {'@': 235}), 8: (1, {'@': 235}), 19: (1, {'@': 235}), 31: (1, {'@': 235}), 33: (1, {'@': 235}), 30: (1, {'@': 235}), 27: (1, {'@': 235}), 29: (1, {'@': 235}), 28: (1, {'@': 235}), 32: (1, {'@': 235})}, 366: {82: (0, 204), 56: (0, 216), 15: (0, 227), 9: (1, {'@': 190}), 32: (1, {'@': 190}), 7: (1, {'@': 190}), 14: (1, {'@': 190}), 3: (1, {'@': 190}), 6: (1, {'@': 190}), 8: (1, {'@': 190})}, 367: {15: (1, {'@': 236}), 39: (1, {'@': 236})}, 368: {43: (0, 206)}, 369: {9: (1, {'@': 237}), 10: (1, {'@': 237}), 0: (1, {'@': 237}), 1: (1, {'@': 237}), 7: (1, {'@': 237}), 11: (1, {'@': 237}), 12: (1, {'@': 237}), 2: (1, {'@': 237}), 3: (1, {'@': 237}), 18: (1, {'@': 237}), 4: (1, {'@': 237}), 13: (1, {'@': 237}), 14: (1, {'@': 237}), 15: (1, {'@': 237}), 16: (1, {'@': 237}), 17: (1, {'@': 237}), 5: (1, {'@': 237}), 6: (1, {'@': 237}), 8: (1, {'@': 237}), 19: (1, {'@': 237}), 31: (1, {'@': 237}), 33: (1, {'@': 237}), 30: (1, {'@': 237}), 27: (1, {'@': 237}), 29: (1, {'@': 237}), 28: (1, {'@': 237}), 32: (1, {'@': 237})}, 370: {12: (0, 381), 20: (0, 254), 15: (0, 497)}, 371: {87: (0, 238), 84: (0, 249), 29: (0, 259), 28: (0, 270), 101: (0, 282), 11: (1, {'@': 238}), 0: (1, {'@': 238}), 1: (1, {'@': 238}), 12: (1, {'@': 238}), 2: (1, {'@': 238}), 15: (1, {'@': 238}), 13: (1, {'@': 238}), 18: (1, {'@': 238}), 4: (1, {'@': 238}), 16: (1, {'@': 238}), 17: (1, {'@': 238}), 5: (1, {'@': 238}), 6: (1, {'@': 238}), 19: (1, {'@': 238})}, 372: {9: (1, {'@': 239}), 10: (1, {'@': 239}), 0: (1, {'@': 239}), 1: (1, {'@': 239}), 7: (1, {'@': 239}), 11: (1, {'@': 239}), 12: (1, {'@': 239}), 2: (1, {'@': 239}), 3: (1, {'@': 239}), 18: (1, {'@': 239}), 4: (1, {'@': 239}), 13: (1, {'@': 239}), 14: (1, {'@': 239}), 15: (1, {'@': 239}), 16: (1, {'@': 239}), 17: (1, {'@': 239}), 5: (1, {'@': 239}), 6: (1, {'@': 239}), 8: (1, {'@': 239}), 19: (1, {'@': 239}), 31: (1, {'@': 239}), 33: (1, {'@': 239}), 30: (1, {'@': 239}), 27: (1, {'@': 239}), 29: (1, {'@': 239}), 28: (1, {'@': 239}), 32: (1, {'@': 239})}, 373: {1: (0, 168), 20: (0, 174), 12: (0, 381), 21: (0, 180), 22: (0, 311), 23: (0, 318), 25: (0, 482), 13: (0, 325), 15: (0, 490), 24: (0, 0), 6: (0, 1), 11: (0, 2), 19: (0, 3)}, 374: {11: (1, {'@': 240}), 0: (1, {'@': 240}), 1: (1, {'@': 240}), 12: (1, {'@': 240}), 13: (1, {'@': 240}), 15: (1, {'@': 240}), 18: (1, {'@': 240}), 4: (1, {'@': 240}), 16: (1, {'@': 240}), 17: (1, {'@': 240}), 5: (1, {'@': 240}), 6: (1, {'@': 240}), 19: (1, {'@': 240})}, 375: {9: (1, {'@': 241}), 10: (1, {'@': 241}), 0: (1, {'@': 241}), 1: (1, {'@': 241}), 7: (1, {'@': 241}), 11: (1, {'@': 241}), 12: (1, {'@': 241}), 2: (1, {'@': 241}), 3: (1, {'@': 241}), 18: (1, {'@': 241}), 4: (1, {'@': 241}), 13: (1, {'@': 241}), 14: (1, {'@': 241}), 15: (1, {'@': 241}), 16: (1, {'@': 241}), 17: (1, {'@': 241}), 5: (1, {'@': 241}), 6: (1, {'@': 241}), 8: (1, {'@': 241}), 19: (1, {'@': 241}), 31: (1, {'@': 241}), 33: (1, {'@': 241}), 30: (1, {'@': 241}), 27: (1, {'@': 241}), 29: (1, {'@': 241}), 28: (1, {'@': 241}), 32: (1, {'@': 241})}, 376: {15: (0, 394), 18: (0, 396), 9: (0, 398), 26: (0, 403), 10: (1, {'@': 242}), 3: (1, {'@': 242}), 33: (1, {'@': 242}), 30: (1, {'@': 242}), 27: (1, {'@': 242}), 11: (1, {'@': 242}), 0: (1, {'@': 242}), 1: (1, {'@': 242}), 12: (1, {'@': 242}), 2: (1, {'@': 242}), 29: (1, {'@': 242}), 28: (1, {'@': 242}), 4: (1, {'@': 242}), 13: (1, {'@': 242}), 32: (1, {'@': 242}), 16: (1, {'@': 242}), 17: (1, {'@': 242}), 5: (1, {'@': 242}), 6: (1, {'@': 242}), 19: (1, {'@': 242}), 14: (1, {'@': 242}), 31: (1, {'@': 242}), 7: (1, {'@': 242}), 8: (1, {'@': 242})}, 377: {9: (0, 355), 10: (1, {'@': 243}), 3: (1, {'@': 243}), 33: (1, {'@': 243}), 30: (1, {'@': 243}), 27: (1, {'@': 243}), 11: (1, {'@': 243}), 0: (1, {'@': 243}), 1: (1, {'@': 243}), 12: (1, {'@': 243}), 2: (1, {'@': 243}), 29: (1, {'@': 243}), 28: (1, {'@': 243}), 18: (1, {'@': 243}), 4: (1, {'@': 243}), 13: (1, {'@': 243}), 32: (1, {'@': 243}), 15: (1, {'@': 243}), 16: (1, {'@': 243}), 17: (1, {'@': 243}), 5: (1, {'@': 243}), 6: (1, {'@': 243}), 19: (1, {'@': 243}), 14: (1, {'@': 243}), 31: (1, {'@': 243}), 7: (1, {'@': 243}), 8: (1, {'@': 243})}, 378: {18: (0, 406), 15: (0, 408), 26: (0, 128), 10: (1, {'@': 244}), 3: (1, {'@': 244}), 33: (1, {'@': 244}), 30: (1, {'@': 244}), 27: (1, {'@': 244}), 11: (1, {'@': 244}), 0: (1, {'@': 244}), 1: (1, {'@': 244}), 12: (1, {'@': 244}), 2: (1, {'@': 244}), 29: (1, {'@': 244}), 28: (1, {'@': 244}), 4: (1, {'@': 244}), 13: (1, {'@': 244}), 32: (1, {'@': 244}), 16: (1, {'@': 244}), 17: (1, {'@': 244}), 5: (1, {'@': 244}), 6: (1, {'@': 244}), 19: (1, {'@': 244}), 9: (1, {'@': 244}), 14: (1, {'@': 244}), 31: (1, {'@': 244}), 7: (1, {'@': 244}), 8: (1, {'@': 244})}, 379: {}, 380: {15: (1, {'@': 245}), 39: (1, {'@': 245})}, 381: {74: (0, 136), 42: (0, 142), 43: (0, 150), 38: (0, 155), 12: (0, 381), 15: (0, 160), 20: (0, 173)}, 382: {9: (1, {'@': 181}), 10: (1, {'@': 181}), 7: (1, {'@': 181}), 14: (1, {'@': 181}), 3: (1, {'@': 181}), 6: (1, {'@': 181}), 8: (1, {'@': 181}), 33: (1, {'@': 181}), 30: (1, {'@': 181}), 27: (1, {'@': 181}), 11: (1, {'@': 181}), 0: (1, {'@': 181}), 1: (1, {'@': 181}), 12: (1, {'@': 181}), 2: (1, {'@': 181}), 29: (1, {'@': 181}), 28: (1, {'@': 181}), 4: (1, {'@': 181}), 13: (1, {'@': 181}), 5: (1, {'@': 181}), 32: (1, {'@': 181}), 15: (1, {'@': 181}), 16: (1, {'@': 181}), 17: (1, {'@': 181}), 18: (1, {'@': 181}), 19: (1, {'@': 181}), 31: (1, {'@': 181})}, 383: {1: (0, 632), 20: (0, 609), 15: (0, 614), 12: (0, 381)}, 384: {9: (1, {'@': 246}), 6: (1, {'@': 246}), 14: (1, {'@': 246}), 7: (1, {'@': 246}), 8: (1, {'@': 246}), 31: (1, {'@': 246}), 10: (1, {'@': 246}), 3: (1, {'@': 246})}, 385: {9: (1, {'@': 247}), 10: (1, {'@': 247}), 7: (1, {'@': 247}), 14: (1, {'@': 247}), 3: (1, {'@': 247}), 6: (1, {'@': 247}), 8: (1, {'@': 247}), 33: (1, {'@': 247}), 30: (1, {'@': 247}), 27: (1, {'@': 247}), 11: (1, {'@': 247}), 0: (1, {'@': 247}), 1: (1, {'@': 247}), 12: (1, {'@': 247}), 2: (1, {'@': 247}), 29: (1, {'@': 247}), 28: (1, {'@': 247}), 4: (1, {'@': 247}), 13: (1, {'@': 247}), 5: (1, {'@': 247}), 32: (1, {'@': 247}), 15: (1, {'@': 247}), 16: (1, {'@': 247}), 17: (1, {'@': 247}), 18: (1, {'@': 247}), 19: (1, {'@': 247}), 31: (1, {'@': 247})}, 386: {87: (0, 238), 84: (0, 249), 101: (0, 143), 29: (0, 259), 28: (0, 270), 11: (1, {'@': 248}), 0: (1, {'@': 248}), 1: (1, {'@': 248}), 12: (1, {'@': 248}), 2: (1, {'@': 248}), 15: (1, {'@': 248}), 13: (1, {'@': 248}), 18: (1, {'@': 248}), 4: (1, {'@': 248}), 16: (1, {'@': 248}), 17: (1, {'@': 248}), 5: (1, {'@': 248}), 6: (1, {'@': 248}), 19: (1, {'@': 248})}, 387: {15: (1, {'@': 249}), 39: (1, {'@': 249})}, 388: {9: (1, {'@': 250}), 6: (1, {'@': 250}), 14: (1, {'@': 250}), 7: (1, {'@': 250}), 8: (1, {'@': 250}), 31: (1, {'@': 250}), 10: (1, {'@': 250}), 3: (1, {'@': 250})}, 389: {44: (0, 179), 38: (0, 190)}, 390: {15: (1, {'@': 251}), 39: (1, {'@': 251})}, 391: {1: (0, 164), 21: (0, 292), 20: (0, 304), 12: (0, 381), 22: (0, 311), 23: (0, 318), 13: (0, 325), 24: (0, 0), 6: (0, 1), 11: (0, 2), 19: (0, 3)}, 392: {16: (0, 374), 1: (0, 376), 20: (0, 378), 12: (0, 381), 4: (0, 389), 15: (0, 182), 13: (0, 404), 6: (0, 339), 77: (0, 219), 58: (0, 343), 59: (0, 347), 60: (0, 350), 78: (0, 226), 19: (0, 363), 11: (0, 366), 18: (0, 368), 79: (0, 371), 36: (0, 377), 22: (0, 382), 57: (0, 385), 80: (0, 386), 17: (0, 391), 0: (1, {'@': 252})}, 393: {9: (1, {'@': 253}), 10: (1, {'@': 253}), 7: (1, {'@': 253}), 14: (1, {'@': 253}), 31: (1, {'@': 253}), 3: (1, {'@': 253}), 6: (1, {'@': 253}), 8: (1, {'@': 253})}, 394: {18: (0, 307), 26: (0, 364)}, 395: {9: (1, {'@': 254}), 10: (1, {'@': 254}), 7: (1, {'@': 254}), 14: (1, {'@': 254}), 31: (1, {'@': 254}), 3: (1, {'@': 254}), 6: (1, {'@': 254}), 8: (1, {'@': 254})}, 396: {15: (0, 220), 38: (0, 5)}, 397: {9: (1, {'@': 255}), 6: (1, {'@': 255}), 14: (1, {'@': 255}), 7: (1, {'@': 255}), 8: (1, {'@': 255}), 31: (1, {'@': 255}), 10: (1, {'@': 255}), 3: (1, {'@': 255})}, 398: {1: (0, 6), 20: (0, 7), 12: (0, 381), 13: (0, 404), 11: (0, 8), 22: (0, 9), 94: (0, 10), 38: (0, 11), 60: (0, 12)}, 399: {9: (1, {'@': 256}), 10: (1, {'@': 256}), 7: (1, {'@': 256}), 14: (1, {'@': 256}), 31: (1, {'@': 256}), 3: (1, {'@': 256}), 6: (1, {'@': 256}), 8: (1, {'@': 256})}, 400: {2: (0, 241), 76: (0, 245), 5: (0, 251), 11: (1, {'@': 257}), 0: (1, {'@': 257}), 1: (1, {'@': 257}), 12: (1, {'@': 257}), 15: (1, {'@': 257}), 18: (1, {'@': 257}), 4: (1, {'@': 257}), 16: (1, {'@': 257}), 17: (1, {'@': 257}), 13: (1, {'@': 257}), 6: (1, {'@': 257}), 19: (1, {'@': 257})}, 401: {10: (0, 573), 9: (1, {'@': 211}), 7: (1, {'@': 211}), 14: (1, {'@': 211}), 3: (1, {'@': 211}), 6: (1, {'@': 211}), 8: (1, {'@': 211})}, 402: {9: (1, {'@': 258}), 6: (1, {'@': 258}), 14: (1, {'@': 258}), 7: (1, {'@': 258}), 8: (1, {'@': 258}), 31: (1, {'@': 258}), 10: (1, {'@': 258}), 3: (1, {'@': 258})}, 403: {12: (0, 381), 15: (0, 13), 1: (0, 15), 20: (0, 16)}, 404: {1: (0, 376), 20: (0, 378), 4: (0, 389), 12: (0, 381), 13: (0, 404), 6: (0, 339), 22: (0, 258), 57: (0, 385), 36: (0, 377), 58: (0, 343), 60: (0, 350), 19: (0, 363), 59: (0, 266), 11: (0, 278)}, 405: {15: (0, 394), 18: (0, 396), 26: (0, 403), 9: (1, {'@': 259}), 10: (1, {'@': 259}), 7: (1, {'@': 259}), 14: (1, {'@': 259}), 31: (1, {'@': 259}), 3: (1, {'@': 259}), 6: (1, {'@': 259}), 8: (1, {'@': 259})}, 406: {15: (0, 262), 38: (0, 17)}, 407: {18: (0, 406), 15: (0, 408), 26: (0, 128), 9: (1, {'@': 260}), 10: (1, {'@': 260}), 7: (1, {'@': 260}), 14: (1, {'@': 260}), 31: (1, {'@': 260}), 3: (1, {'@': 260}), 6: (1, {'@': 260}), 8: (1, {'@': 260})}, 408: {26: (0, 18), 18: (0, 20)}, 409: {9: (1, {'@': 261}), 6: (1, {'@': 261}), 14: (1, {'@': 261}), 7: (1, {'@': 261}), 8: (1, {'@': 261}), 31: (1, {'@': 261}), 10: (1, {'@': 261}), 3: (1, {'@': 261})}, 410: {38: (0, 495)}, 411: {38: (0, 498)}, 412: {11: (1, {'@': 262}), 0: (1, {'@': 262}), 1: (1, {'@': 262}), 12: (1, {'@': 262}), 2: (1, {'@': 262}), 29: (1, {'@': 262}), 28: (1, {'@': 262}), 4: (1, {'@': 262}), 13: (1, {'@': 262}), 5: (1, {'@': 262}), 15: (1, {'@': 262}), 16: (1, {'@': 262}), 17: (1, {'@': 262}), 18: (1, {'@': 262}), 6: (1, {'@': 262}), 19: (1, {'@': 262}), 63: (1, {'@': 262})}, 413: {9: (1, {'@': 263}), 10: (1, {'@': 263}), 7: (1, {'@': 263}), 14: (1, {'@': 263}), 31: (1, {'@': 263}), 3: (1, {'@': 263}), 6: (1, {'@': 263}), 8: (1, {'@': 263})}, 414: {11: (1, {'@': 264}), 0: (1, {'@': 264}), 1: (1, {'@': 264}), 12: (1, {'@': 264}), 2: (1, {'@': 264}), 29: (1, {'@': 264}), 28: (1, {'@': 264}), 4: (1, {'@': 264}), 13: (1, {'@': 264}), 5: (1, {'@': 264}), 15: (1, {'@': 264}), 16: (1, {'@': 264}), 17: (1, {'@': 264}), 18: (1, {'@': 264}), 6: (1, {'@': 264}), 19: (1, {'@': 264}), 63: (1, {'@': 264})}, 415: {22: (0, 413), 1: (0, 6), 13: (0, 109), 20: (0, 7), 12: (0, 381), 50: (0, 647), 11: (0, 442), 102: (0, 515), 38: (0, 519), 48: (0, 446), 51: (0, 450)}, 416: {10: (1, {'@': 265}), 3: (1, {'@': 265})}, 417: {9: (1, {'@': 266}), 6: (1, {'@': 266}), 14: (1, {'@': 266}), 7: (1, {'@': 266}), 8: (1, {'@': 266}), 31: (1, {'@': 266}), 10: (1, {'@': 266}), 3: (1, {'@': 266})}, 418: {56: (0, 522), 31: (0, 525)}, 419: {14: (0, 332), 6: (0, 314), 55: (0, 645), 31: (0, 460), 8: (0, 131), 7: (0, 410), 9: (0, 411)}, 420: {14: (0, 332), 6: (0, 314), 31: (0, 193), 55: (0, 645), 8: (0, 131), 7: (0, 410), 9: (0, 411)}, 421: {31: (0, 528), 56: (0, 129)}, 422: {12: (0, 381), 20: (0, 473), 1: (0, 232)}, 423: {15: (0, 166), 63: (0, 176)}, 424: {11: (1, {'@': 267}), 0: (1, {'@': 267}), 1: (1, {'@': 267}), 12: (1, {'@': 267}), 2: (1, {'@': 267}), 29: (1, {'@': 267}), 18: (1, {'@': 267}), 28: (1, {'@': 267}), 4: (1, {'@': 267}), 13: (1, {'@': 267}), 15: (1, {'@': 267}), 16: (1, {'@': 267}), 17: (1, {'@': 267}), 5: (1, {'@': 267}), 6: (1, {'@': 267}), 19: (1, {'@': 267})}, 425: {11: (1, {'@': 268}), 0: (1, {'@': 268}), 1: (1, {'@': 268}), 12: (1, {'@': 268}), 2: (1, {'@': 268}), 29: (1, {'@': 268}), 28: (1, {'@': 268}), 4: (1, {'@': 268}), 13: (1, {'@': 268}), 5: (1, {'@': 268}), 15: (1, {'@': 268}), 16: (1, {'@': 268}), 17: (1, {'@': 268}), 18: (1, {'@': 268}), 6: (1, {'@': 268}), 19: (1, {'@': 268})}, 426: {10: (1, {'@': 269}), 3: (1, {'@': 269})}, 427: {1: (0, 168), 20: (0, 174), 12: (0, 381), 21: (0, 180), 25: (0, 641), 22: (0, 311), 23: (0, 318), 13: (0, 325), 24: (0, 0), 6: (0, 1), 11: (0, 2), 19: (0, 3)}, 428: {10: (0, 447)}, 429: {12: (0, 381), 1: (0, 185), 20: (0, 195)}, 430: {15: (0, 188), 1: (0, 211), 12: (0, 381), 20: (0, 218)}, 431: {9: (1, {'@': 270}), 10: (1, {'@': 270}), 0: (1, {'@': 270}), 1: (1, {'@': 270}), 7: (1, {'@': 270}), 11: (1, {'@': 270}), 12: (1, {'@': 270}), 2: (1, {'@': 270}), 3: (1, {'@': 270}), 18: (1, {'@': 270}), 4: (1, {'@': 270}), 13: (1, {'@': 270}), 14: (1, {'@': 270}), 15: (1, {'@': 270}), 16: (1, {'@': 270}), 17: (1, {'@': 270}), 5: (1, {'@': 270}), 6: (1, {'@': 270}), 8: (1, {'@': 270}), 19: (1, {'@': 270}), 31: (1, {'@': 270}), 33: (1, {'@': 270}), 30: (1, {'@': 270}), 27: (1, {'@': 270}), 29: (1, {'@': 270}), 28: (1, {'@': 270}), 32: (1, {'@': 270})}, 432: {9: (1, {'@': 271}), 10: (1, {'@': 271}), 0: (1, {'@': 271}), 1: (1, {'@': 271}), 7: (1, {'@': 271}), 11: (1, {'@': 271}), 12: (1, {'@': 271}), 2: (1, {'@': 271}), 3: (1, {'@': 271}), 18: (1, {'@': 271}), 4: (1, {'@': 271}), 13: (1, {'@': 271}), 14: (1, {'@': 271}), 15: (1, {'@': 271}), 16: (1, {'@': 271}), 17: (1, {'@': 271}), 5: (1, {'@': 271}), 6: (1, {'@': 271}), 8: (1, {'@': 271}), 19: (1, {'@': 271}), 31: (1, {'@': 271}), 33: (1, {'@': 271}), 30: (1, {'@': 271}), 27: (1, {'@': 271}), 29: (1, {'@': 271}), 28: (1, {'@': 271}), 32: (1, {'@': 271})}, 433: {9: (1, {'@': 272}), 10: (1, {'@': 272}), 0: (1, {'@': 272}), 1: (1, {'@': 272}), 7: (1, {'@': 272}), 11: (1, {'@': 272}), 12: (1, {'@': 272}), 2: (1, {'@': 272}), 3: (1, {'@': 272}), 18: (1, {'@': 272}), 4: (1, {'@': 272}), 13: (1, {'@': 272}), 14: (1, {'@': 272}), 15: (1, {'@': 272}), 16: (1, {'@': 272}), 17: (1, {'@': 272}), 5: (1, {'@': 272}), 6: (1, {'@': 272}), 8: (1, {'@': 272}), 19: (1, {'@': 272}), 31: (1, {'@': 272}), 33: (1, {'@': 272}), 30: (1, {'@': 272}), 27: (1, {'@': 272}), 29: (1, {'@': 272}), 28: (1, {'@': 272}), 32: (1, {'@': 272})}, 434: {9: (1, {'@': 273}), 10: (1, {'@': 273}), 0: (1, {'@': 273}), 1: (1, {'@': 273}), 7: (1, {'@': 273}), 11: (1, {'@': 273}), 12: (1, {'@': 273}), 2: (1, {'@': 273}), 3: (1, {'@': 273}), 18: (1, {'@': 273}), 4: (1, {'@': 273}), 13: (1, {'@': 273}), 14: (1, {'@': 273}), 15: (1, {'@': 273}), 16: (1, {'@': 273}), 17: (1, {'@': 273}), 5: (1, {'@': 273}), 6: (1, {'@': 273}), 8: (1, {'@': 273}), 19: (1, {'@': 273}), 31: (1, {'@': 273}), 33: (1, {'@': 273}), 30: (1, {'@': 273}), 27: (1, {'@': 273}), 29: (1, {'@': 273}), 28: (1, {'@': 273}), 32: (1, {'@': 273})}, 435: {1: (0, 208), 13: (0, 109), 20: (0, 7), 12: (0, 381), 4: (0, 123), 46: (0, 333), 15: (0, 580), 22: (0, 36), 47: (0, 40), 48: (0, 49), 49: (0, 52), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 436: {9: (1, {'@': 274}), 10: (1, {'@': 274}), 0: (1, {'@': 274}), 1: (1, {'@': 274}), 7: (1, {'@': 274}), 11: (1, {'@': 274}), 12: (1, {'@': 274}), 2: (1, {'@': 274}), 3: (1, {'@': 274}), 18: (1, {'@': 274}), 4: (1, {'@': 274}), 13: (1, {'@': 274}), 14: (1, {'@': 274}), 15: (1, {'@': 274}), 16: (1, {'@': 274}), 17: (1, {'@': 274}), 5: (1, {'@': 274}), 6: (1, {'@': 274}), 8: (1, {'@': 274}), 19: (1, {'@': 274}), 31: (1, {'@': 274}), 33: (1, {'@': 274}), 30: (1, {'@': 274}), 27: (1, {'@': 274}), 29: (1, {'@': 274}), 28: (1, {'@': 274}), 32: (1, {'@': 274})}, 437: {9: (1, {'@': 275}), 10: (1, {'@': 275}), 0: (1, {'@': 275}), 1: (1, {'@': 275}), 7: (1, {'@': 275}), 11: (1, {'@': 275}), 12: (1, {'@': 275}), 2: (1, {'@': 275}), 3: (1, {'@': 275}), 18: (1, {'@': 275}), 4: (1, {'@': 275}), 13: (1, {'@': 275}), 14: (1, {'@': 275}), 15: (1, {'@': 275}), 16: (1, {'@': 275}), 17: (1, {'@': 275}), 5: (1, {'@': 275}), 6: (1, {'@': 275}), 8: (1, {'@': 275}), 19: (1, {'@': 275}), 31: (1, {'@': 275}), 33: (1, {'@': 275}), 30: (1, {'@': 275}), 27: (1, {'@': 275}), 29: (1, {'@': 275}), 28: (1, {'@': 275}), 32: (1, {'@': 275})}, 438: {9: (1, {'@': 276}), 10: (1, {'@': 276}), 0: (1, {'@': 276}), 1: (1, {'@': 276}), 7: (1, {'@': 276}), 11: (1, {'@': 276}), 12: (1, {'@': 276}), 2: (1, {'@': 276}), 3: (1, {'@': 276}), 18: (1, {'@': 276}), 4: (1, {'@': 276}), 13: (1, {'@': 276}), 14: (1, {'@': 276}), 15: (1, {'@': 276}), 16: (1, {'@': 276}), 17: (1, {'@': 276}), 5: (1, {'@': 276}), 6: (1, {'@': 276}), 8: (1, {'@': 276}), 19: (1, {'@': 276}), 31: (1, {'@': 276}), 33: (1, {'@': 276}), 30: (1, {'@': 276}), 27: (1, {'@': 276}), 29: (1, {'@': 276}), 28: (1, {'@': 276}), 32: (1, {'@': 276})}, 439: {9: (1, {'@': 277}), 10: (1, {'@': 277}), 0: (1, {'@': 277}), 1: (1, {'@': 277}), 7: (1, {'@': 277}), 11: (1, {'@': 277}), 12: (1, {'@': 277}), 2: (1, {'@': 277}), 3: (1, {'@': 277}), 18: (1, {'@': 277}), 4: (1, {'@': 277}), 13: (1, {'@': 277}), 14: (1, {'@': 277}), 15: (1, {'@': 277}), 16: (1, {'@': 277}), 17: (1, {'@': 277}), 5: (1, {'@': 277}), 6: (1, {'@': 277}), 8: (1, {'@': 277}), 19: (1, {'@': 277}), 31: (1, {'@': 277}), 33: (1, {'@': 277}), 30: (1, {'@': 277}), 27: (1, {'@': 277}), 29: (1, {'@': 277}), 28: (1, {'@': 277}), 32: (1, {'@': 277})}, 440: {1: (0, 186), 20: (0, 7), 4: (0, 389), 12: (0, 381), 19: (0, 194), 34: (0, 183), 15: (0, 152), 13: (0, 213), 35: (0, 243), 6: (0, 250), 36: (0, 261), 11: (0, 280), 37: (0, 287), 22: (0, 293)}, 441: {9: (0, 355)}, 442: {9: (1, {'@': 278}), 10: (1, {'@': 278}), 7: (1, {'@': 278}), 14: (1, {'@': 278}), 31: (1, {'@': 278}), 3: (1, {'@': 278}), 6: (1, {'@': 278}), 8: (1, {'@': 278})}, 443: {31: (0, 60), 55: (0, 299), 6: (0, 314), 9: (0, 321), 7: (0, 328), 14: (0, 338), 8: (0, 131)}, 444: {9: (1, {'@': 279}), 10: (1, {'@': 279}), 3: (1, {'@': 279}), 33: (1, {'@': 279}), 30: (1, {'@': 279}), 27: (1, {'@': 279}), 11: (1, {'@': 279}), 0: (1, {'@': 279}), 1: (1, {'@': 279}), 12: (1, {'@': 279}), 2: (1, {'@': 279}), 29: (1, {'@': 279}), 28: (1, {'@': 279}), 4: (1, {'@': 279}), 13: (1, {'@': 279}), 5: (1, {'@': 279}), 15: (1, {'@': 279}), 6: (1, {'@': 279}), 16: (1, {'@': 279}), 17: (1, {'@': 279}), 18: (1, {'@': 279}), 32: (1, {'@': 279}), 19: (1, {'@': 279}), 14: (1, {'@': 279}), 31: (1, {'@': 279}), 7: (1, {'@': 279}), 8: (1, {'@': 279})}, 445: {9: (1, {'@': 280}), 6: (1, {'@': 280}), 14: (1, {'@': 280}), 7: (1, {'@': 280}), 8: (1, {'@': 280}), 31: (1, {'@': 280}), 10: (1, {'@': 280}), 3: (1, {'@': 280})}, 446: {9: (0, 78), 10: (1, {'@': 281}), 7: (1, {'@': 281}), 14: (1, {'@': 281}), 31: (1, {'@': 281}), 3: (1, {'@': 281}), 6: (1, {'@': 281}), 8: (1, {'@': 281})}, 447: {9: (1, {'@': 282}), 6: (1, {'@': 282}), 14: (1, {'@': 282}), 7: (1, {'@': 282}), 8: (1, {'@': 282}), 31: (1, {'@': 282}), 10: (1, {'@': 282}), 3: (1, {'@': 282})}, 448: {9: (1, {'@': 283}), 10: (1, {'@': 283}), 3: (1, {'@': 283}), 33: (1, {'@': 283}), 30: (1, {'@': 283}), 27: (1, {'@': 283}), 11: (1, {'@': 283}), 0: (1, {'@': 283}), 1: (1, {'@': 283}), 12: (1, {'@': 283}), 2: (1, {'@': 283}), 29: (1, {'@': 283}), 28: (1, {'@': 283}), 4: (1, {'@': 283}), 13: (1, {'@': 283}), 5: (1, {'@': 283}), 15: (1, {'@': 283}), 6: (1, {'@': 283}), 16: (1, {'@': 283}), 17: (1, {'@': 283}), 18: (1, {'@': 283}), 32: (1, {'@': 283}), 19: (1, {'@': 283}), 14: (1, {'@': 283}), 31: (1, {'@': 283}), 7: (1, {'@': 283}), 8: (1, {'@': 283})}, 449: {103: (0, 65)}, 450: {9: (1, {'@': 284}), 10: (1, {'@': 284}), 7: (1, {'@': 284}), 14: (1, {'@': 284}), 31: (1, {'@': 284}), 3: (1, {'@': 284}), 6: (1, {'@': 284}), 8: (1, {'@': 284})}, 451: {76: (0, 98), 2: (0, 241), 5: (0, 217), 11: (1, {'@': 285}), 0: (1, {'@': 285}), 1: (1, {'@': 285}), 12: (1, {'@': 285}), 15: (1, {'@': 285}), 18: (1, {'@': 285}), 4: (1, {'@': 285}), 16: (1, {'@': 285}), 17: (1, {'@': 285}), 13: (1, {'@': 285}), 6: (1, {'@': 285}), 19: (1, {'@': 285})}, 452: {9: (1, {'@': 286}), 6: (1, {'@': 286}), 14: (1, {'@': 286}), 7: (1, {'@': 286}), 8: (1, {'@': 286}), 31: (1, {'@': 286}), 10: (1, {'@': 286}), 3: (1, {'@': 286})}, 453: {103: (0, 72)}, 454: {64: (0, 253), 65: (0, 267), 44: (0, 289), 66: (0, 37), 67: (0, 139)}, 455: {3: (0, 547), 10: (0, 555)}, 456: {11: (1, {'@': 287}), 1: (1, {'@': 287}), 12: (1, {'@': 287}), 44: (1, {'@': 287}), 4: (1, {'@': 287}), 13: (1, {'@': 287}), 6: (1, {'@': 287}), 19: (1, {'@': 287}), 45: (1, {'@': 287})}, 457: {1: (0, 76), 13: (0, 109), 20: (0, 612), 97: (0, 428), 12: (0, 381), 4: (0, 123), 46: (0, 616), 22: (0, 36), 47: (0, 40), 15: (0, 559), 49: (0, 636), 61: (0, 563), 48: (0, 49), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 458: {11: (1, {'@': 288}), 0: (1, {'@': 288}), 1: (1, {'@': 288}), 12: (1, {'@': 288}), 15: (1, {'@': 288}), 18: (1, {'@': 288}), 4: (1, {'@': 288}), 16: (1, {'@': 288}), 17: (1, {'@': 288}), 13: (1, {'@': 288}), 6: (1, {'@': 288}), 19: (1, {'@': 288})}, 459: {1: (0, 376), 20: (0, 378), 4: (0, 507), 12: (0, 381), 69: (0, 79), 13: (0, 404), 6: (0, 339), 22: (0, 382), 57: (0, 385), 36: (0, 377), 58: (0, 343), 60: (0, 350), 19: (0, 363), 59: (0, 82), 11: (0, 278)}, 460: {11: (1, {'@': 289}), 0: (1, {'@': 289}), 1: (1, {'@': 289}), 12: (1, {'@': 289}), 2: (1, {'@': 289}), 29: (1, {'@': 289}), 28: (1, {'@': 289}), 4: (1, {'@': 289}), 13: (1, {'@': 289}), 5: (1, {'@': 289}), 15: (1, {'@': 289}), 16: (1, {'@': 289}), 17: (1, {'@': 289}), 18: (1, {'@': 289}), 6: (1, {'@': 289}), 19: (1, {'@': 289}), 63: (1, {'@': 289})}, 461: {1: (0, 208), 13: (0, 109), 20: (0, 7), 12: (0, 381), 4: (0, 123), 38: (0, 418), 46: (0, 419), 22: (0, 36), 47: (0, 40), 44: (0, 421), 48: (0, 49), 49: (0, 52), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 462: {5: (0, 158), 11: (1, {'@': 290}), 0: (1, {'@': 290}), 1: (1, {'@': 290}), 12: (1, {'@': 290}), 15: (1, {'@': 290}), 18: (1, {'@': 290}), 4: (1, {'@': 290}), 16: (1, {'@': 290}), 17: (1, {'@': 290}), 13: (1, {'@': 290}), 6: (1, {'@': 290}), 19: (1, {'@': 290})}, 463: {12: (0, 381), 20: (0, 431), 1: (0, 546)}, 464: {9: (1, {'@': 291}), 6: (1, {'@': 291}), 14: (1, {'@': 291}), 7: (1, {'@': 291}), 8: (1, {'@': 291}), 31: (1, {'@': 291}), 10: (1, {'@': 291}), 3: (1, {'@': 291})}, 465: {11: (1, {'@': 292}), 0: (1, {'@': 292}), 1: (1, {'@': 292}), 12: (1, {'@': 292}), 15: (1, {'@': 292}), 18: (1, {'@': 292}), 4: (1, {'@': 292}), 16: (1, {'@': 292}), 17: (1, {'@': 292}), 13: (1, {'@': 292}), 6: (1, {'@': 292}), 19: (1, {'@': 292})}, 466: {64: (0, 253), 67: (0, 617), 44: (0, 289)}, 467: {1: (0, 208), 13: (0, 109), 20: (0, 7), 12: (0, 381), 4: (0, 123), 46: (0, 420), 22: (0, 36), 47: (0, 40), 15: (0, 572), 48: (0, 49), 49: (0, 52), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 468: {9: (1, {'@': 293}), 6: (1, {'@': 293}), 10: (1, {'@': 293}), 14: (1, {'@': 293}), 7: (1, {'@': 293}), 8: (1, {'@': 293}), 3: (1, {'@': 293}), 33: (1, {'@': 293}), 30: (1, {'@': 293}), 27: (1, {'@': 293}), 11: (1, {'@': 293}), 0: (1, {'@': 293}), 1: (1, {'@': 293}), 12: (1, {'@': 293}), 2: (1, {'@': 293}), 29: (1, {'@': 293}), 28: (1, {'@': 293}), 4: (1, {'@': 293}), 13: (1, {'@': 293}), 5: (1, {'@': 293}), 32: (1, {'@': 293}), 15: (1, {'@': 293}), 16: (1, {'@': 293}), 17: (1, {'@': 293}), 18: (1, {'@': 293}), 19: (1, {'@': 293}), 31: (1, {'@': 293})}, 469: {15: (0, 228), 27: (0, 453), 32: (1, {'@': 294}), 3: (1, {'@': 294}), 11: (1, {'@': 295}), 0: (1, {'@': 295}), 1: (1, {'@': 295}), 12: (1, {'@': 295}), 2: (1, {'@': 295}), 29: (1, {'@': 295}), 28: (1, {'@': 295}), 4: (1, {'@': 295}), 13: (1, {'@': 295}), 5: (1, {'@': 295}), 16: (1, {'@': 295}), 17: (1, {'@': 295}), 18: (1, {'@': 295}), 6: (1, {'@': 295}), 19: (1, {'@': 295})}, 470: {9: (1, {'@': 296}), 10: (1, {'@': 296}), 0: (1, {'@': 296}), 1: (1, {'@': 296}), 7: (1, {'@': 296}), 11: (1, {'@': 296}), 12: (1, {'@': 296}), 2: (1, {'@': 296}), 3: (1, {'@': 296}), 18: (1, {'@': 296}), 4: (1, {'@': 296}), 13: (1, {'@': 296}), 14: (1, {'@': 296}), 15: (1, {'@': 296}), 16: (1, {'@': 296}), 17: (1, {'@': 296}), 5: (1, {'@': 296}), 6: (1, {'@': 296}), 8: (1, {'@': 296}), 19: (1, {'@': 296}), 31: (1, {'@': 296}), 33: (1, {'@': 296}), 30: (1, {'@': 296}), 27: (1, {'@': 296}), 29: (1, {'@': 296}), 28: (1, {'@': 296}), 32: (1, {'@': 296})}, 471: {3: (0, 305), 10: (0, 315)}, 472: {32: (1, {'@': 297}), 3: (1, {'@': 297})}, 473: {9: (1, {'@': 298}), 10: (1, {'@': 298}), 0: (1, {'@': 298}), 1: (1, {'@': 298}), 7: (1, {'@': 298}), 11: (1, {'@': 298}), 12: (1, {'@': 298}), 2: (1, {'@': 298}), 3: (1, {'@': 298}), 18: (1, {'@': 298}), 4: (1, {'@': 298}), 13: (1, {'@': 298}), 14: (1, {'@': 298}), 15: (1, {'@': 298}), 16: (1, {'@': 298}), 17: (1, {'@': 298}), 5: (1, {'@': 298}), 6: (1, {'@': 298}), 8: (1, {'@': 298}), 19: (1, {'@': 298}), 31: (1, {'@': 298}), 33: (1, {'@': 298}), 30: (1, {'@': 298}), 27: (1, {'@': 298}), 29: (1, {'@': 298}), 28: (1, {'@': 298}), 32: (1, {'@': 298})}, 474: {11: (1, {'@': 299}), 0: (1, {'@': 299}), 1: (1, {'@': 299}), 12: (1, {'@': 299}), 15: (1, {'@': 299}), 18: (1, {'@': 299}), 4: (1, {'@': 299}), 16: (1, {'@': 299}), 17: (1, {'@': 299}), 13: (1, {'@': 299}), 6: (1, {'@': 299}), 19: (1, {'@': 299})}, 475: {9: (1, {'@': 300}), 10: (1, {'@': 300}), 14: (1, {'@': 300}), 31: (1, {'@': 300}), 3: (1, {'@': 300}), 6: (1, {'@': 300}), 7: (1, {'@': 300}), 8: (1, {'@': 300})}, 476: {9: (1, {'@': 301}), 6: (1, {'@': 301}), 10: (1, {'@': 301}), 14: (1, {'@': 301}), 7: (1, {'@': 301}), 8: (1, {'@': 301}), 3: (1, {'@': 301}), 33: (1, {'@': 301}), 30: (1, {'@': 301}), 27: (1, {'@': 301}), 11: (1, {'@': 301}), 0: (1, {'@': 301}), 1: (1, {'@': 301}), 12: (1, {'@': 301}), 2: (1, {'@': 301}), 29: (1, {'@': 301}), 28: (1, {'@': 301}), 4: (1, {'@': 301}), 13: (1, {'@': 301}), 5: (1, {'@': 301}), 32: (1, {'@': 301}), 15: (1, {'@': 301}), 16: (1, {'@': 301}), 17: (1, {'@': 301}), 18: (1, {'@': 301}), 19: (1, {'@': 301}), 31: (1, {'@': 301})}, 477: {1: (0, 376), 20: (0, 378), 4: (0, 389), 12: (0, 381), 13: (0, 404), 6: (0, 339), 22: (0, 382), 57: (0, 385), 36: (0, 377), 58: (0, 343), 60: (0, 350), 19: (0, 363), 59: (0, 222), 15: (0, 326), 11: (0, 278)}, 478: {11: (1, {'@': 302}), 0: (1, {'@': 302}), 1: (1, {'@': 302}), 12: (1, {'@': 302}), 2: (1, {'@': 302}), 15: (1, {'@': 302}), 13: (1, {'@': 302}), 18: (1, {'@': 302}), 4: (1, {'@': 302}), 16: (1, {'@': 302}), 17: (1, {'@': 302}), 5: (1, {'@': 302}), 6: (1, {'@': 302}), 19: (1, {'@': 302})}, 479: {15: (0, 394), 18: (0, 396), 26: (0, 403), 9: (1, {'@': 303}), 10: (1, {'@': 303}), 7: (1, {'@': 303}), 14: (1, {'@': 303}), 31: (1, {'@': 303}), 3: (1, {'@': 303}), 6: (1, {'@': 303}), 8: (1, {'@': 303})}, 480: {26: (0, 643), 15: (0, 153)}, 481: {11: (1, {'@': 304}), 0: (1, {'@': 304}), 1: (1, {'@': 304}), 12: (1, {'@': 304}), 2: (1, {'@': 304}), 15: (1, {'@': 304}), 13: (1, {'@': 304}), 18: (1, {'@': 304}), 4: (1, {'@': 304}), 16: (1, {'@': 304}), 17: (1, {'@': 304}), 5: (1, {'@': 304}), 6: (1, {'@': 304}), 19: (1, {'@': 304})}, 482: {11: (1, {'@': 305}), 0: (1, {'@': 305}), 1: (1, {'@': 305}), 12: (1, {'@': 305}), 2: (1, {'@': 305}), 15: (1, {'@': 305}), 13: (1, {'@': 305}), 18: (1, {'@': 305}), 4: (1, {'@': 305}), 16: (1, {'@': 305}), 17: (1, {'@': 305}), 5: (1, {'@': 305}), 6: (1, {'@': 305}), 19: (1, {'@': 305})}, 483: {18: (0, 406), 15: (0, 408), 26: (0, 128), 9: (1, {'@': 306}), 10: (1, {'@': 306}), 7: (1, {'@': 306}), 14: (1, {'@': 306}), 31: (1, {'@': 306}), 3: (1, {'@': 306}), 6: (1, {'@': 306}), 8: (1, {'@': 306})}, 484: {15: (0, 394), 18: (0, 396), 26: (0, 403), 27: (1, {'@': 307}), 0: (1, {'@': 307}), 1: (1, {'@': 307}), 2: (1, {'@': 307}), 3: (1, {'@': 307}), 28: (1, {'@': 307}), 4: (1, {'@': 307}), 5: (1, {'@': 307}), 32: (1, {'@': 307}), 6: (1, {'@': 307}), 7: (1, {'@': 307}), 8: (1, {'@': 307}), 33: (1, {'@': 307}), 9: (1, {'@': 307}), 10: (1, {'@': 307}), 11: (1, {'@': 307}), 12: (1, {'@': 307}), 29: (1, {'@': 307}), 13: (1, {'@': 307}), 14: (1, {'@': 307}), 30: (1, {'@': 307}), 31: (1, {'@': 307}), 16: (1, {'@': 307}), 17: (1, {'@': 307}), 19: (1, {'@': 307})}, 485: {11: (1, {'@': 308}), 0: (1, {'@': 308}), 1: (1, {'@': 308}), 12: (1, {'@': 308}), 2: (1, {'@': 308}), 15: (1, {'@': 308}), 13: (1, {'@': 308}), 18: (1, {'@': 308}), 4: (1, {'@': 308}), 16: (1, {'@': 308}), 17: (1, {'@': 308}), 5: (1, {'@': 308}), 6: (1, {'@': 308}), 19: (1, {'@': 308})}, 486: {9: (1, {'@': 309}), 10: (1, {'@': 309}), 7: (1, {'@': 309}), 14: (1, {'@': 309}), 31: (1, {'@': 309}), 3: (1, {'@': 309}), 6: (1, {'@': 309}), 8: (1, {'@': 309})}, 487: {18: (0, 406), 15: (0, 408), 26: (0, 128), 27: (1, {'@': 310}), 0: (1, {'@': 310}), 1: (1, {'@': 310}), 2: (1, {'@': 310}), 3: (1, {'@': 310}), 28: (1, {'@': 310}), 4: (1, {'@': 310}), 5: (1, {'@': 310}), 32: (1, {'@': 310}), 6: (1, {'@': 310}), 7: (1, {'@': 310}), 8: (1, {'@': 310}), 33: (1, {'@': 310}), 9: (1, {'@': 310}), 10: (1, {'@': 310}), 11: (1, {'@': 310}), 12: (1, {'@': 310}), 29: (1, {'@': 310}), 13: (1, {'@': 310}), 14: (1, {'@': 310}), 30: (1, {'@': 310}), 31: (1, {'@': 310}), 16: (1, {'@': 310}), 17: (1, {'@': 310}), 19: (1, {'@': 310})}, 488: {9: (1, {'@': 311}), 10: (1, {'@': 311}), 7: (1, {'@': 311}), 14: (1, {'@': 311}), 31: (1, {'@': 311}), 3: (1, {'@': 311}), 6: (1, {'@': 311}), 8: (1, {'@': 311})}, 489: {27: (1, {'@': 312}), 0: (1, {'@': 312}), 1: (1, {'@': 312}), 2: (1, {'@': 312}), 3: (1, {'@': 312}), 28: (1, {'@': 312}), 4: (1, {'@': 312}), 5: (1, {'@': 312}), 32: (1, {'@': 312}), 6: (1, {'@': 312}), 7: (1, {'@': 312}), 8: (1, {'@': 312}), 33: (1, {'@': 312}), 9: (1, {'@': 312}), 10: (1, {'@': 312}), 11: (1, {'@': 312}), 12: (1, {'@': 312}), 29: (1, {'@': 312}), 13: (1, {'@': 312}), 14: (1, {'@': 312}), 30: (1, {'@': 312}), 15: (1, {'@': 312}), 31: (1, {'@': 312}), 16: (1, {'@': 312}), 17: (1, {'@': 312}), 18: (1, {'@': 312}), 19: (1, {'@': 312})}, 490: {1: (0, 168), 20: (0, 174), 12: (0, 381), 21: (0, 180), 22: (0, 311), 23: (0, 318), 25: (0, 46), 13: (0, 325), 24: (0, 0), 6: (0, 1), 11: (0, 2), 19: (0, 3)}, 491: {9: (1, {'@': 313}), 10: (1, {'@': 313}), 3: (1, {'@': 313}), 33: (1, {'@': 313}), 30: (1, {'@': 313}), 27: (1, {'@': 313}), 11: (1, {'@': 313}), 0: (1, {'@': 313}), 1: (1, {'@': 313}), 12: (1, {'@': 313}), 2: (1, {'@': 313}), 29: (1, {'@': 313}), 28: (1, {'@': 313}), 4: (1, {'@': 313}), 13: (1, {'@': 313}), 5: (1, {'@': 313}), 15: (1, {'@': 313}), 6: (1, {'@': 313}), 16: (1, {'@': 313}), 17: (1, {'@': 313}), 18: (1, {'@': 313}), 32: (1, {'@': 313}), 19: (1, {'@': 313}), 14: (1, {'@': 313}), 31: (1, {'@': 313}), 7: (1, {'@': 313}), 8: (1, {'@': 313})}, 492: {9: (1, {'@': 314}), 6: (1, {'@': 314}), 14: (1, {'@': 314}), 7: (1, {'@': 314}), 8: (1, {'@': 314}), 31: (1, {'@': 314}), 10: (1, {'@': 314}), 3: (1, {'@': 314})}, 493: {9: (1, {'@': 315}), 6: (1, {'@': 315}), 10: (1, {'@': 315}), 14: (1, {'@': 315}), 7: (1, {'@': 315}), 8: (1, {'@': 315}), 3: (1, {'@': 315}), 33: (1, {'@': 315}), 30: (1, {'@': 315}), 27: (1, {'@': 315}), 11: (1, {'@': 315}), 0: (1, {'@': 315}), 1: (1, {'@': 315}), 12: (1, {'@': 315}), 2: (1, {'@': 315}), 29: (1, {'@': 315}), 28: (1, {'@': 315}), 4: (1, {'@': 315}), 13: (1, {'@': 315}), 5: (1, {'@': 315}), 32: (1, {'@': 315}), 15: (1, {'@': 315}), 16: (1, {'@': 315}), 17: (1, {'@': 315}), 18: (1, {'@': 315}), 19: (1, {'@': 315}), 31: (1, {'@': 315})}, 494: {64: (0, 253), 15: (0, 466), 44: (0, 289), 67: (0, 74)}, 495: {9: (1, {'@': 316}), 6: (1, {'@': 316}), 14: (1, {'@': 316}), 7: (1, {'@': 316}), 8: (1, {'@': 316}), 31: (1, {'@': 316}), 10: (1, {'@': 316}), 3: (1, {'@': 316})}, 496: {11: (1, {'@': 317}), 1: (1, {'@': 317}), 12: (1, {'@': 317}), 4: (1, {'@': 317}), 13: (1, {'@': 317}), 48: (1, {'@': 317})}, 497: {12: (0, 381), 20: (0, 97)}, 498: {9: (1, {'@': 318}), 6: (1, {'@': 318}), 14: (1, {'@': 318}), 7: (1, {'@': 318}), 8: (1, {'@': 318}), 31: (1, {'@': 318}), 10: (1, {'@': 318}), 3: (1, {'@': 318})}, 499: {9: (1, {'@': 319}), 6: (1, {'@': 319}), 10: (1, {'@': 319}), 14: (1, {'@': 319}), 7: (1, {'@': 319}), 8: (1, {'@': 319}), 3: (1, {'@': 319}), 33: (1, {'@': 319}), 30: (1, {'@': 319}), 27: (1, {'@': 319}), 11: (1, {'@': 319}), 0: (1, {'@': 319}), 1: (1, {'@': 319}), 12: (1, {'@': 319}), 2: (1, {'@': 319}), 29: (1, {'@': 319}), 28: (1, {'@': 319}), 4: (1, {'@': 319}), 13: (1, {'@': 319}), 5: (1, {'@': 319}), 32: (1, {'@': 319}), 15: (1, {'@': 319}), 16: (1, {'@': 319}), 17: (1, {'@': 319}), 18: (1, {'@': 319}), 19: (1, {'@': 319}), 31: (1, {'@': 319})}, 500: {15: (0, 503), 26: (0, 111)}, 501: {14: (0, 332), 6: (0, 314), 55: (0, 645), 8: (0, 131), 7: (0, 410), 31: (0, 642), 9: (0, 411)}, 502: {9: (1, {'@': 320}), 6: (1, {'@': 320}), 10: (1, {'@': 320}), 14: (1, {'@': 320}), 7: (1, {'@': 320}), 8: (1, {'@': 320}), 3: (1, {'@': 320}), 33: (1, {'@': 320}), 30: (1, {'@': 320}), 27: (1, {'@': 320}), 11: (1, {'@': 320}), 0: (1, {'@': 320}), 1: (1, {'@': 320}), 12: (1, {'@': 320}), 2: (1, {'@': 320}), 29: (1, {'@': 320}), 28: (1, {'@': 320}), 4: (1, {'@': 320}), 13: (1, {'@': 320}), 5: (1, {'@': 320}), 32: (1, {'@': 320}), 15: (1, {'@': 320}), 16: (1, {'@': 320}), 17: (1, {'@': 320}), 18: (1, {'@': 320}), 19: (1, {'@': 320}), 31: (1, {'@': 320})}, 503: {26: (0, 430)}, 504: {9: (1, {'@': 321}), 6: (1, {'@': 321}), 10: (1, {'@': 321}), 14: (1, {'@': 321}), 7: (1, {'@': 321}), 8: (1, {'@': 321}), 3: (1, {'@': 321}), 33: (1, {'@': 321}), 30: (1, {'@': 321}), 27: (1, {'@': 321}), 11: (1, {'@': 321}), 0: (1, {'@': 321}), 1: (1, {'@': 321}), 12: (1, {'@': 321}), 2: (1, {'@': 321}), 29: (1, {'@': 321}), 28: (1, {'@': 321}), 4: (1, {'@': 321}), 13: (1, {'@': 321}), 5: (1, {'@': 321}), 32: (1, {'@': 321}), 15: (1, {'@': 321}), 16: (1, {'@': 321}), 17: (1, {'@': 321}), 18: (1, {'@': 321}), 19: (1, {'@': 321}), 31: (1, {'@': 321})}, 505: {1: (0, 208), 13: (0, 109), 20: (0, 7), 12: (0, 381), 4: (0, 123), 46: (0, 574), 22: (0, 36), 47: (0, 40), 48: (0, 49), 49: (0, 52), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 506: {4: (0, 461), 1: (0, 224)}, 507: {1: (0, 271), 38: (0, 190), 20: (0, 7), 4: (0, 389), 12: (0, 381), 13: (0, 404), 44: (0, 179), 6: (0, 339), 22: (0, 382), 57: (0, 385), 36: (0, 441), 58: (0, 443), 60: (0, 350), 19: (0, 363), 11: (0, 278)}, 508: {11: (1, {'@': 322}), 0: (1, {'@': 322}), 1: (1, {'@': 322}), 12: (1, {'@': 322}), 15: (1, {'@': 322}), 18: (1, {'@': 322}), 4: (1, {'@': 322}), 16: (1, {'@': 322}), 17: (1, {'@': 322}), 13: (1, {'@': 322}), 6: (1, {'@': 322}), 19: (1, {'@': 322})}, 509: {9: (1, {'@': 323}), 10: (1, {'@': 323}), 0: (1, {'@': 323}), 1: (1, {'@': 323}), 7: (1, {'@': 323}), 11: (1, {'@': 323}), 12: (1, {'@': 323}), 2: (1, {'@': 323}), 3: (1, {'@': 323}), 18: (1, {'@': 323}), 4: (1, {'@': 323}), 13: (1, {'@': 323}), 14: (1, {'@': 323}), 15: (1, {'@': 323}), 16: (1, {'@': 323}), 17: (1, {'@': 323}), 5: (1, {'@': 323}), 6: (1, {'@': 323}), 8: (1, {'@': 323}), 19: (1, {'@': 323}), 31: (1, {'@': 323}), 33: (1, {'@': 323}), 30: (1, {'@': 323}), 27: (1, {'@': 323}), 29: (1, {'@': 323}), 28: (1, {'@': 323}), 32: (1, {'@': 323})}, 510: {1: (0, 208), 13: (0, 109), 20: (0, 7), 12: (0, 381), 4: (0, 123), 46: (0, 592), 22: (0, 36), 47: (0, 40), 48: (0, 49), 49: (0, 52), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 511: {15: (1, {'@': 324}), 32: (1, {'@': 324}), 3: (1, {'@': 324})}, 512: {33: (0, 141)}, 513: {15: (0, 80), 11: (1, {'@': 325}), 0: (1, {'@': 325}), 1: (1, {'@': 325}), 12: (1, {'@': 325}), 2: (1, {'@': 325}), 18: (1, {'@': 325}), 28: (1, {'@': 325}), 4: (1, {'@': 325}), 13: (1, {'@': 325}), 16: (1, {'@': 325}), 17: (1, {'@': 325}), 5: (1, {'@': 325}), 6: (1, {'@': 325}), 19: (1, {'@': 325}), 29: (1, {'@': 325})}, 514: {32: (1, {'@': 326}), 3: (1, {'@': 326})}, 515: {9: (1, {'@': 327}), 6: (1, {'@': 327}), 14: (1, {'@': 327}), 7: (1, {'@': 327}), 8: (1, {'@': 327}), 31: (1, {'@': 327}), 10: (1, {'@': 327}), 3: (1, {'@': 327})}, 516: {90: (0, 494), 91: (0, 301)}, 517: {15: (0, 274), 27: (0, 449), 32: (1, {'@': 328}), 3: (1, {'@': 328})}, 518: {9: (1, {'@': 329}), 10: (1, {'@': 329}), 0: (1, {'@': 329}), 1: (1, {'@': 329}), 7: (1, {'@': 329}), 11: (1, {'@': 329}), 12: (1, {'@': 329}), 2: (1, {'@': 329}), 3: (1, {'@': 329}), 18: (1, {'@': 329}), 4: (1, {'@': 329}), 13: (1, {'@': 329}), 14: (1, {'@': 329}), 15: (1, {'@': 329}), 16: (1, {'@': 329}), 17: (1, {'@': 329}), 5: (1, {'@': 329}), 6: (1, {'@': 329}), 8: (1, {'@': 329}), 19: (1, {'@': 329}), 31: (1, {'@': 329}), 33: (1, {'@': 329}), 30: (1, {'@': 329}), 27: (1, {'@': 329}), 29: (1, {'@': 329}), 28: (1, {'@': 329}), 32: (1, {'@': 329})}, 519: {9: (1, {'@': 330}), 6: (1, {'@': 330}), 14: (1, {'@': 330}), 7: (1, {'@': 330}), 8: (1, {'@': 330}), 31: (1, {'@': 330}), 10: (1, {'@': 330}), 3: (1, {'@': 330})}, 520: {15: (0, 228), 27: (0, 453), 32: (1, {'@': 294}), 3: (1, {'@': 294})}, 521: {11: (1, {'@': 331}), 0: (1, {'@': 331}), 1: (1, {'@': 331}), 12: (1, {'@': 331}), 2: (1, {'@': 331}), 29: (1, {'@': 331}), 28: (1, {'@': 331}), 4: (1, {'@': 331}), 13: (1, {'@': 331}), 5: (1, {'@': 331}), 15: (1, {'@': 331}), 16: (1, {'@': 331}), 17: (1, {'@': 331}), 18: (1, {'@': 331}), 6: (1, {'@': 331}), 19: (1, {'@': 331})}, 522: {1: (0, 208), 13: (0, 109), 20: (0, 7), 12: (0, 381), 4: (0, 123), 46: (0, 583), 22: (0, 36), 47: (0, 40), 15: (0, 603), 48: (0, 49), 49: (0, 52), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 523: {26: (0, 308), 15: (1, {'@': 332}), 32: (1, {'@': 332}), 3: (1, {'@': 332})}, 524: {15: (0, 80), 11: (1, {'@': 333}), 0: (1, {'@': 333}), 1: (1, {'@': 333}), 12: (1, {'@': 333}), 2: (1, {'@': 333}), 18: (1, {'@': 333}), 28: (1, {'@': 333}), 4: (1, {'@': 333}), 13: (1, {'@': 333}), 16: (1, {'@': 333}), 17: (1, {'@': 333}), 5: (1, {'@': 333}), 6: (1, {'@': 333}), 19: (1, {'@': 333}), 29: (1, {'@': 333})}, 525: {11: (1, {'@': 334}), 0: (1, {'@': 334}), 1: (1, {'@': 334}), 12: (1, {'@': 334}), 2: (1, {'@': 334}), 29: (1, {'@': 334}), 28: (1, {'@': 334}), 4: (1, {'@': 334}), 13: (1, {'@': 334}), 5: (1, {'@': 334}), 15: (1, {'@': 334}), 16: (1, {'@': 334}), 17: (1, {'@': 334}), 18: (1, {'@': 334}), 6: (1, {'@': 334}), 19: (1, {'@': 334}), 63: (1, {'@': 334})}, 526: {15: (0, 459)}, 527: {0: (1, {'@': 335}), 1: (1, {'@': 335}), 2: (1, {'@': 335}), 3: (1, {'@': 335}), 4: (1, {'@': 335}), 5: (1, {'@': 335}), 6: (1, {'@': 335}), 7: (1, {'@': 335}), 8: (1, {'@': 335}), 9: (1, {'@': 335}), 10: (1, {'@': 335}), 11: (1, {'@': 335}), 12: (1, {'@': 335}), 13: (1, {'@': 335}), 14: (1, {'@': 335}), 15: (1, {'@': 335}), 16: (1, {'@': 335}), 17: (1, {'@': 335}), 18: (1, {'@': 335}), 19: (1, {'@': 335})}, 528: {11: (1, {'@': 336}), 0: (1, {'@': 336}), 1: (1, {'@': 336}), 12: (1, {'@': 336}), 2: (1, {'@': 336}), 29: (1, {'@': 336}), 28: (1, {'@': 336}), 4: (1, {'@': 336}), 13: (1, {'@': 336}), 5: (1, {'@': 336}), 15: (1, {'@': 336}), 16: (1, {'@': 336}), 17: (1, {'@': 336}), 18: (1, {'@': 336}), 6: (1, {'@': 336}), 19: (1, {'@': 336}), 63: (1, {'@': 336})}, 529: {75: (0, 231), 32: (0, 156), 3: (0, 151)}, 530: {9: (1, {'@': 337}), 10: (1, {'@': 337}), 0: (1, {'@': 337}), 1: (1, {'@': 337}), 11: (1, {'@': 337}), 12: (1, {'@': 337}), 2: (1, {'@': 337}), 3: (1, {'@': 337}), 18: (1, {'@': 337}), 4: (1, {'@': 337}), 13: (1, {'@': 337}), 14: (1, {'@': 337}), 15: (1, {'@': 337}), 6: (1, {'@': 337}), 16: (1, {'@': 337}), 17: (1, {'@': 337}), 5: (1, {'@': 337}), 7: (1, {'@': 337}), 8: (1, {'@': 337}), 19: (1, {'@': 337})}, 531: {9: (1, {'@': 338}), 10: (1, {'@': 338}), 7: (1, {'@': 338}), 14: (1, {'@': 338}), 31: (1, {'@': 338}), 3: (1, {'@': 338}), 6: (1, {'@': 338}), 8: (1, {'@': 338})}, 532: {10: (1, {'@': 339}), 3: (1, {'@': 339})}, 533: {9: (1, {'@': 340}), 10: (1, {'@': 340}), 0: (1, {'@': 340}), 1: (1, {'@': 340}), 11: (1, {'@': 340}), 12: (1, {'@': 340}), 2: (1, {'@': 340}), 3: (1, {'@': 340}), 18: (1, {'@': 340}), 4: (1, {'@': 340}), 13: (1, {'@': 340}), 14: (1, {'@': 340}), 15: (1, {'@': 340}), 6: (1, {'@': 340}), 16: (1, {'@': 340}), 17: (1, {'@': 340}), 5: (1, {'@': 340}), 7: (1, {'@': 340}), 8: (1, {'@': 340}), 19: (1, {'@': 340})}, 534: {9: (1, {'@': 341}), 10: (1, {'@': 341}), 0: (1, {'@': 341}), 1: (1, {'@': 341}), 7: (1, {'@': 341}), 11: (1, {'@': 341}), 12: (1, {'@': 341}), 2: (1, {'@': 341}), 3: (1, {'@': 341}), 18: (1, {'@': 341}), 4: (1, {'@': 341}), 13: (1, {'@': 341}), 14: (1, {'@': 341}), 15: (1, {'@': 341}), 16: (1, {'@': 341}), 17: (1, {'@': 341}), 5: (1, {'@': 341}), 6: (1, {'@': 341}), 8: (1, {'@': 341}), 19: (1, {'@': 341}), 31: (1, {'@': 341}), 33: (1, {'@': 341}), 30: (1, {'@': 341}), 27: (1, {'@': 341}), 29: (1, {'@': 341}), 28: (1, {'@': 341}), 32: (1, {'@': 341})}, 535: {9: (1, {'@': 342}), 6: (1, {'@': 342}), 14: (1, {'@': 342}), 7: (1, {'@': 342}), 8: (1, {'@': 342}), 31: (1, {'@': 342}), 10: (1, {'@': 342}), 3: (1, {'@': 342})}, 536: {9: (1, {'@': 343}), 10: (1, {'@': 343}), 7: (1, {'@': 343}), 14: (1, {'@': 343}), 31: (1, {'@': 343}), 3: (1, {'@': 343}), 6: (1, {'@': 343}), 8: (1, {'@': 343})}, 537: {10: (0, 135)}, 538: {0: (1, {'@': 344}), 1: (1, {'@': 344}), 2: (1, {'@': 344}), 3: (1, {'@': 344}), 4: (1, {'@': 344}), 5: (1, {'@': 344}), 6: (1, {'@': 344}), 7: (1, {'@': 344}), 8: (1, {'@': 344}), 9: (1, {'@': 344}), 10: (1, {'@': 344}), 11: (1, {'@': 344}), 12: (1, {'@': 344}), 13: (1, {'@': 344}), 14: (1, {'@': 344}), 15: (1, {'@': 344}), 16: (1, {'@': 344}), 17: (1, {'@': 344}), 18: (1, {'@': 344}), 19: (1, {'@': 344})}, 539: {12: (0, 381), 20: (0, 202), 1: (0, 242)}, 540: {9: (1, {'@': 345}), 6: (1, {'@': 345}), 14: (1, {'@': 345}), 7: (1, {'@': 345}), 8: (1, {'@': 345}), 31: (1, {'@': 345}), 10: (1, {'@': 345}), 3: (1, {'@': 345})}, 541: {1: (0, 265), 15: (0, 285), 12: (0, 381), 20: (0, 294)}, 542: {9: (1, {'@': 346}), 10: (1, {'@': 346}), 0: (1, {'@': 346}), 1: (1, {'@': 346}), 11: (1, {'@': 346}), 12: (1, {'@': 346}), 2: (1, {'@': 346}), 3: (1, {'@': 346}), 18: (1, {'@': 346}), 4: (1, {'@': 346}), 13: (1, {'@': 346}), 14: (1, {'@': 346}), 15: (1, {'@': 346}), 6: (1, {'@': 346}), 16: (1, {'@': 346}), 17: (1, {'@': 346}), 5: (1, {'@': 346}), 7: (1, {'@': 346}), 8: (1, {'@': 346}), 19: (1, {'@': 346})}, 543: {30: (0, 149)}, 544: {9: (1, {'@': 347}), 6: (1, {'@': 347}), 14: (1, {'@': 347}), 7: (1, {'@': 347}), 8: (1, {'@': 347}), 31: (1, {'@': 347}), 10: (1, {'@': 347}), 3: (1, {'@': 347})}, 545: {0: (1, {'@': 348}), 1: (1, {'@': 348}), 2: (1, {'@': 348}), 3: (1, {'@': 348}), 4: (1, {'@': 348}), 5: (1, {'@': 348}), 6: (1, {'@': 348}), 7: (1, {'@': 348}), 8: (1, {'@': 348}), 9: (1, {'@': 348}), 10: (1, {'@': 348}), 11: (1, {'@': 348}), 12: (1, {'@': 348}), 13: (1, {'@': 348}), 14: (1, {'@': 348}), 15: (1, {'@': 348}), 16: (1, {'@': 348}), 17: (1, {'@': 348}), 18: (1, {'@': 348}), 19: (1, {'@': 348})}, 546: {9: (1, {'@': 349}), 10: (1, {'@': 349}), 0: (1, {'@': 349}), 1: (1, {'@': 349}), 7: (1, {'@': 349}), 11: (1, {'@': 349}), 12: (1, {'@': 349}), 2: (1, {'@': 349}), 3: (1, {'@': 349}), 18: (1, {'@': 349}), 4: (1, {'@': 349}), 13: (1, {'@': 349}), 14: (1, {'@': 349}), 15: (1, {'@': 349}), 16: (1, {'@': 349}), 17: (1, {'@': 349}), 5: (1, {'@': 349}), 6: (1, {'@': 349}), 8: (1, {'@': 349}), 19: (1, {'@': 349}), 31: (1, {'@': 349}), 33: (1, {'@': 349}), 30: (1, {'@': 349}), 27: (1, {'@': 349}), 29: (1, {'@': 349}), 28: (1, {'@': 349}), 32: (1, {'@': 349})}, 547: {1: (0, 76), 13: (0, 109), 20: (0, 612), 12: (0, 381), 4: (0, 123), 46: (0, 616), 22: (0, 36), 47: (0, 40), 15: (0, 334), 49: (0, 636), 61: (0, 167), 48: (0, 49), 50: (0, 56), 19: (0, 58), 97: (0, 171), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 548: {9: (1, {'@': 350}), 6: (1, {'@': 350}), 14: (1, {'@': 350}), 7: (1, {'@': 350}), 8: (1, {'@': 350}), 31: (1, {'@': 350}), 10: (1, {'@': 350}), 3: (1, {'@': 350})}, 549: {0: (1, {'@': 351}), 1: (1, {'@': 351}), 2: (1, {'@': 351}), 3: (1, {'@': 351}), 4: (1, {'@': 351}), 5: (1, {'@': 351}), 6: (1, {'@': 351}), 7: (1, {'@': 351}), 8: (1, {'@': 351}), 9: (1, {'@': 351}), 10: (1, {'@': 351}), 11: (1, {'@': 351}), 12: (1, {'@': 351}), 13: (1, {'@': 351}), 14: (1, {'@': 351}), 15: (1, {'@': 351}), 16: (1, {'@': 351}), 17: (1, {'@': 351}), 18: (1, {'@': 351}), 19: (1, {'@': 351})}, 550: {9: (1, {'@': 352}), 10: (1, {'@': 352}), 0: (1, {'@': 352}), 1: (1, {'@': 352}), 7: (1, {'@': 352}), 11: (1, {'@': 352}), 12: (1, {'@': 352}), 2: (1, {'@': 352}), 3: (1, {'@': 352}), 18: (1, {'@': 352}), 4: (1, {'@': 352}), 13: (1, {'@': 352}), 14: (1, {'@': 352}), 15: (1, {'@': 352}), 16: (1, {'@': 352}), 17: (1, {'@': 352}), 5: (1, {'@': 352}), 6: (1, {'@': 352}), 8: (1, {'@': 352}), 19: (1, {'@': 352}), 31: (1, {'@': 352}), 33: (1, {'@': 352}), 30: (1, {'@': 352}), 27: (1, {'@': 352}), 29: (1, {'@': 352}), 28: (1, {'@': 352}), 32: (1, {'@': 352})}, 551: {1: (0, 624), 20: (0, 255), 4: (0, 389), 12: (0, 381), 19: (0, 194), 34: (0, 263), 81: (0, 571), 13: (0, 213), 35: (0, 243), 6: (0, 250), 36: (0, 284), 15: (0, 619), 11: (0, 280), 37: (0, 287), 22: (0, 293), 97: (0, 626)}, 552: {0: (1, {'@': 353}), 1: (1, {'@': 353}), 2: (1, {'@': 353}), 3: (1, {'@': 353}), 4: (1, {'@': 353}), 5: (1, {'@': 353}), 6: (1, {'@': 353}), 7: (1, {'@': 353}), 8: (1, {'@': 353}), 9: (1, {'@': 353}), 10: (1, {'@': 353}), 11: (1, {'@': 353}), 12: (1, {'@': 353}), 13: (1, {'@': 353}), 14: (1, {'@': 353}), 15: (1, {'@': 353}), 16: (1, {'@': 353}), 17: (1, {'@': 353}), 18: (1, {'@': 353}), 19: (1, {'@': 353})}, 553: {9: (1, {'@': 354}), 10: (1, {'@': 354}), 0: (1, {'@': 354}), 1: (1, {'@': 354}), 7: (1, {'@': 354}), 11: (1, {'@': 354}), 12: (1, {'@': 354}), 2: (1, {'@': 354}), 3: (1, {'@': 354}), 18: (1, {'@': 354}), 4: (1, {'@': 354}), 13: (1, {'@': 354}), 14: (1, {'@': 354}), 15: (1, {'@': 354}), 16: (1, {'@': 354}), 17: (1, {'@': 354}), 5: (1, {'@': 354}), 6: (1, {'@': 354}), 8: (1, {'@': 354}), 19: (1, {'@': 354}), 31: (1, {'@': 354}), 33: (1, {'@': 354}), 30: (1, {'@': 354}), 27: (1, {'@': 354}), 29: (1, {'@': 354}), 28: (1, {'@': 354}), 32: (1, {'@': 354})}, 554: {1: (0, 624), 15: (0, 331), 81: (0, 532), 20: (0, 255), 4: (0, 389), 12: (0, 381), 19: (0, 194), 34: (0, 263), 13: (0, 213), 97: (0, 537), 35: (0, 243), 6: (0, 250), 36: (0, 284), 11: (0, 280), 37: (0, 287), 22: (0, 293)}, 555: {9: (1, {'@': 355}), 6: (1, {'@': 355}), 14: (1, {'@': 355}), 7: (1, {'@': 355}), 8: (1, {'@': 355}), 31: (1, {'@': 355}), 10: (1, {'@': 355}), 3: (1, {'@': 355})}, 556: {15: (0, 394), 18: (0, 396), 26: (0, 403), 0: (1, {'@': 356}), 1: (1, {'@': 356}), 2: (1, {'@': 356}), 3: (1, {'@': 356}), 4: (1, {'@': 356}), 5: (1, {'@': 356}), 7: (1, {'@': 356}), 6: (1, {'@': 356}), 8: (1, {'@': 356}), 9: (1, {'@': 356}), 10: (1, {'@': 356}), 11: (1, {'@': 356}), 12: (1, {'@': 356}), 13: (1, {'@': 356}), 14: (1, {'@': 356}), 16: (1, {'@': 356}), 17: (1, {'@': 356}), 19: (1, {'@': 356})}, 557: {3: (0, 554), 10: (0, 637)}, 558: {9: (1, {'@': 357}), 10: (1, {'@': 357}), 0: (1, {'@': 357}), 1: (1, {'@': 357}), 7: (1, {'@': 357}), 11: (1, {'@': 357}), 12: (1, {'@': 357}), 2: (1, {'@': 357}), 3: (1, {'@': 357}), 18: (1, {'@': 357}), 4: (1, {'@': 357}), 13: (1, {'@': 357}), 14: (1, {'@': 357}), 15: (1, {'@': 357}), 16: (1, {'@': 357}), 17: (1, {'@': 357}), 5: (1, {'@': 357}), 6: (1, {'@': 357}), 8: (1, {'@': 357}), 19: (1, {'@': 357}), 31: (1, {'@': 357}), 33: (1, {'@': 357}), 30: (1, {'@': 357}), 27: (1, {'@': 357}), 29: (1, {'@': 357}), 28: (1, {'@': 357}), 32: (1, {'@': 357})}, 559: {1: (0, 76), 13: (0, 109), 20: (0, 612), 12: (0, 381), 4: (0, 123), 46: (0, 616), 22: (0, 36), 47: (0, 40), 97: (0, 178), 49: (0, 636), 48: (0, 49), 50: (0, 56), 61: (0, 189), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 560: {18: (0, 406), 15: (0, 408), 26: (0, 128), 0: (1, {'@': 358}), 1: (1, {'@': 358}), 2: (1, {'@': 358}), 3: (1, {'@': 358}), 4: (1, {'@': 358}), 5: (1, {'@': 358}), 7: (1, {'@': 358}), 6: (1, {'@': 358}), 8: (1, {'@': 358}), 9: (1, {'@': 358}), 10: (1, {'@': 358}), 11: (1, {'@': 358}), 12: (1, {'@': 358}), 13: (1, {'@': 358}), 14: (1, {'@': 358}), 16: (1, {'@': 358}), 17: (1, {'@': 358}), 19: (1, {'@': 358})}, 561: {9: (1, {'@': 359}), 6: (1, {'@': 359}), 14: (1, {'@': 359}), 7: (1, {'@': 359}), 8: (1, {'@': 359}), 31: (1, {'@': 359}), 10: (1, {'@': 359}), 3: (1, {'@': 359})}, 562: {9: (1, {'@': 360}), 10: (1, {'@': 360}), 0: (1, {'@': 360}), 1: (1, {'@': 360}), 7: (1, {'@': 360}), 11: (1, {'@': 360}), 12: (1, {'@': 360}), 2: (1, {'@': 360}), 3: (1, {'@': 360}), 18: (1, {'@': 360}), 4: (1, {'@': 360}), 13: (1, {'@': 360}), 14: (1, {'@': 360}), 15: (1, {'@': 360}), 16: (1, {'@': 360}), 17: (1, {'@': 360}), 5: (1, {'@': 360}), 6: (1, {'@': 360}), 8: (1, {'@': 360}), 19: (1, {'@': 360}), 31: (1, {'@': 360}), 33: (1, {'@': 360}), 30: (1, {'@': 360}), 27: (1, {'@': 360}), 29: (1, {'@': 360}), 28: (1, {'@': 360}), 32: (1, {'@': 360})}, 563: {10: (1, {'@': 361}), 3: (1, {'@': 361})}, 564: {0: (1, {'@': 362}), 1: (1, {'@': 362}), 2: (1, {'@': 362}), 3: (1, {'@': 362}), 4: (1, {'@': 362}), 5: (1, {'@': 362}), 7: (1, {'@': 362}), 6: (1, {'@': 362}), 8: (1, {'@': 362}), 9: (1, {'@': 362}), 10: (1, {'@': 362}), 11: (1, {'@': 362}), 12: (1, {'@': 362}), 13: (1, {'@': 362}), 14: (1, {'@': 362}), 15: (1, {'@': 362}), 16: (1, {'@': 362}), 17: (1, {'@': 362}), 18: (1, {'@': 362}), 19: (1, {'@': 362})}, 565: {9: (1, {'@': 363}), 10: (1, {'@': 363}), 0: (1, {'@': 363}), 1: (1, {'@': 363}), 7: (1, {'@': 363}), 11: (1, {'@': 363}), 12: (1, {'@': 363}), 2: (1, {'@': 363}), 3: (1, {'@': 363}), 18: (1, {'@': 363}), 4: (1, {'@': 363}), 13: (1, {'@': 363}), 14: (1, {'@': 363}), 15: (1, {'@': 363}), 16: (1, {'@': 363}), 17: (1, {'@': 363}), 5: (1, {'@': 363}), 6: (1, {'@': 363}), 8: (1, {'@': 363}), 19: (1, {'@': 363}), 31: (1, {'@': 363}), 33: (1, {'@': 363}), 30: (1, {'@': 363}), 27: (1, {'@': 363}), 29: (1, {'@': 363}), 28: (1, {'@': 363}), 32: (1, {'@': 363})}, 566: {9: (1, {'@': 364}), 6: (1, {'@': 364}), 14: (1, {'@': 364}), 7: (1, {'@': 364}), 8: (1, {'@': 364}), 31: (1, {'@': 364}), 10: (1, {'@': 364}), 3: (1, {'@': 364})}, 567: {11: (1, {'@': 365}), 0: (1, {'@': 365}), 1: (1, {'@': 365}), 12: (1, {'@': 365}), 2: (1, {'@': 365}), 29: (1, {'@': 365}), 28: (1, {'@': 365}), 4: (1, {'@': 365}), 13: (1, {'@': 365}), 5: (1, {'@': 365}), 15: (1, {'@': 365}), 16: (1, {'@': 365}), 17: (1, {'@': 365}), 18: (1, {'@': 365}), 6: (1, {'@': 365}), 19: (1, {'@': 365}), 63: (1, {'@': 365})}, 568: {0: (1, {'@': 366}), 1: (1, {'@': 366}), 2: (1, {'@': 366}), 3: (1, {'@': 366}), 4: (1, {'@': 366}), 5: (1, {'@': 366}), 6: (1, {'@': 366}), 7: (1, {'@': 366}), 8: (1, {'@': 366}), 9: (1, {'@': 366}), 10: (1, {'@': 366}), 11: (1, {'@': 366}), 12: (1, {'@': 366}), 13: (1, {'@': 366}), 14: (1, {'@': 366}), 15: (1, {'@': 366}), 16: (1, {'@': 366}), 17: (1, {'@': 366}), 18: (1, {'@': 366}), 19: (1, {'@': 366})}, 569: {12: (0, 381), 1: (0, 236), 20: (0, 256)}, 570: {9: (1, {'@': 367}), 6: (1, {'@': 367}), 14: (1, {'@': 367}), 7: (1, {'@': 367}), 8: (1, {'@': 367}), 31: (1, {'@': 367}), 10: (1, {'@': 367}), 3: (1, {'@': 367})}, 571: {10: (1, {'@': 368}), 3: (1, {'@': 368})}, 572: {1: (0, 208), 13: (0, 109), 20: (0, 7), 12: (0, 381), 4: (0, 123), 46: (0, 196), 22: (0, 36), 47: (0, 40), 48: (0, 49), 49: (0, 52), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 573: {9: (1, {'@': 369}), 10: (1, {'@': 369}), 0: (1, {'@': 369}), 1: (1, {'@': 369}), 7: (1, {'@': 369}), 11: (1, {'@': 369}), 12: (1, {'@': 369}), 2: (1, {'@': 369}), 3: (1, {'@': 369}), 18: (1, {'@': 369}), 4: (1, {'@': 369}), 13: (1, {'@': 369}), 14: (1, {'@': 369}), 15: (1, {'@': 369}), 16: (1, {'@': 369}), 17: (1, {'@': 369}), 5: (1, {'@': 369}), 6: (1, {'@': 369}), 8: (1, {'@': 369}), 19: (1, {'@': 369})}, 574: {14: (0, 332), 6: (0, 314), 55: (0, 645), 31: (0, 588), 8: (0, 131), 7: (0, 410), 9: (0, 411)}, 575: {9: (1, {'@': 370}), 10: (1, {'@': 370}), 3: (1, {'@': 370}), 33: (1, {'@': 370}), 30: (1, {'@': 370}), 27: (1, {'@': 370}), 11: (1, {'@': 370}), 0: (1, {'@': 370}), 1: (1, {'@': 370}), 12: (1, {'@': 370}), 2: (1, {'@': 370}), 29: (1, {'@': 370}), 28: (1, {'@': 370}), 4: (1, {'@': 370}), 13: (1, {'@': 370}), 5: (1, {'@': 370}), 15: (1, {'@': 370}), 6: (1, {'@': 370}), 16: (1, {'@': 370}), 17: (1, {'@': 370}), 18: (1, {'@': 370}), 32: (1, {'@': 370}), 19: (1, {'@': 370}), 14: (1, {'@': 370}), 31: (1, {'@': 370}), 7: (1, {'@': 370}), 8: (1, {'@': 370})}, 576: {9: (1, {'@': 371}), 10: (1, {'@': 371}), 0: (1, {'@': 371}), 1: (1, {'@': 371}), 7: (1, {'@': 371}), 11: (1, {'@': 371}), 12: (1, {'@': 371}), 2: (1, {'@': 371}), 3: (1, {'@': 371}), 18: (1, {'@': 371}), 4: (1, {'@': 371}), 13: (1, {'@': 371}), 14: (1, {'@': 371}), 15: (1, {'@': 371}), 16: (1, {'@': 371}), 17: (1, {'@': 371}), 5: (1, {'@': 371}), 6: (1, {'@': 371}), 8: (1, {'@': 371}), 19: (1, {'@': 371}), 31: (1, {'@': 371}), 33: (1, {'@': 371}), 30: (1, {'@': 371}), 27: (1, {'@': 371}), 29: (1, {'@': 371}), 28: (1, {'@': 371}), 32: (1, {'@': 371})}, 577: {3: (0, 88), 10: (0, 92)}, 578: {9: (1, {'@': 372}), 10: (1, {'@': 372}), 3: (1, {'@': 372}), 33: (1, {'@': 372}), 30: (1, {'@': 372}), 27: (1, {'@': 372}), 11: (1, {'@': 372}), 0: (1, {'@': 372}), 1: (1, {'@': 372}), 12: (1, {'@': 372}), 2: (1, {'@': 372}), 29: (1, {'@': 372}), 28: (1, {'@': 372}), 4: (1, {'@': 372}), 13: (1, {'@': 372}), 5: (1, {'@': 372}), 15: (1, {'@': 372}), 6: (1, {'@': 372}), 16: (1, {'@': 372}), 17: (1, {'@': 372}), 18: (1, {'@': 372}), 32: (1, {'@': 372}), 19: (1, {'@': 372}), 14: (1, {'@': 372}), 31: (1, {'@': 372}), 7: (1, {'@': 372}), 8: (1, {'@': 372})}, 579: {9: (1, {'@': 373}), 10: (1, {'@': 373}), 0: (1, {'@': 373}), 1: (1, {'@': 373}), 7: (1, {'@': 373}), 11: (1, {'@': 373}), 12: (1, {'@': 373}), 2: (1, {'@': 373}), 3: (1, {'@': 373}), 18: (1, {'@': 373}), 4: (1, {'@': 373}), 13: (1, {'@': 373}), 14: (1, {'@': 373}), 15: (1, {'@': 373}), 16: (1, {'@': 373}), 17: (1, {'@': 373}), 5: (1, {'@': 373}), 6: (1, {'@': 373}), 8: (1, {'@': 373}), 19: (1, {'@': 373}), 31: (1, {'@': 373}), 33: (1, {'@': 373}), 30: (1, {'@': 373}), 27: (1, {'@': 373}), 29: (1, {'@': 373}), 28: (1, {'@': 373}), 32: (1, {'@': 373})}, 580: {1: (0, 208), 13: (0, 109), 20: (0, 7), 12: (0, 381), 4: (0, 123), 46: (0, 209), 22: (0, 36), 47: (0, 40), 48: (0, 49), 49: (0, 52), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 581: {10: (1, {'@': 374}), 3: (1, {'@': 374})}, 582: {9: (1, {'@': 375}), 10: (1, {'@': 375}), 0: (1, {'@': 375}), 1: (1, {'@': 375}), 7: (1, {'@': 375}), 11: (1, {'@': 375}), 12: (1, {'@': 375}), 2: (1, {'@': 375}), 3: (1, {'@': 375}), 18: (1, {'@': 375}), 4: (1, {'@': 375}), 13: (1, {'@': 375}), 14: (1, {'@': 375}), 15: (1, {'@': 375}), 16: (1, {'@': 375}), 17: (1, {'@': 375}), 5: (1, {'@': 375}), 6: (1, {'@': 375}), 8: (1, {'@': 375}), 19: (1, {'@': 375}), 31: (1, {'@': 375}), 33: (1, {'@': 375}), 30: (1, {'@': 375}), 27: (1, {'@': 375}), 29: (1, {'@': 375}), 28: (1, {'@': 375}), 32: (1, {'@': 375})}, 583: {31: (0, 233), 14: (0, 332), 6: (0, 314), 55: (0, 645), 8: (0, 131), 7: (0, 410), 9: (0, 411)}, 584: {9: (1, {'@': 376}), 10: (1, {'@': 376}), 0: (1, {'@': 376}), 1: (1, {'@': 376}), 7: (1, {'@': 376}), 11: (1, {'@': 376}), 12: (1, {'@': 376}), 2: (1, {'@': 376}), 3: (1, {'@': 376}), 18: (1, {'@': 376}), 4: (1, {'@': 376}), 13: (1, {'@': 376}), 14: (1, {'@': 376}), 15: (1, {'@': 376}), 16: (1, {'@': 376}), 17: (1, {'@': 376}), 5: (1, {'@': 376}), 6: (1, {'@': 376}), 8: (1, {'@': 376}), 19: (1, {'@': 376})}, 585: {12: (0, 381), 20: (0, 248), 1: (0, 273)}, 586: {1: (0, 168), 20: (0, 174), 12: (0, 381), 21: (0, 180), 22: (0, 311), 23: (0, 318), 13: (0, 325), 24: (0, 0), 6: (0, 1), 11: (0, 2), 19: (0, 3), 15: (0, 83), 25: (0, 95)}, 587: {30: (0, 84)}, 588: {11: (1, {'@': 377}), 0: (1, {'@': 377}), 1: (1, {'@': 377}), 12: (1, {'@': 377}), 2: (1, {'@': 377}), 29: (1, {'@': 377}), 28: (1, {'@': 377}), 4: (1, {'@': 377}), 13: (1, {'@': 377}), 5: (1, {'@': 377}), 15: (1, {'@': 377}), 16: (1, {'@': 377}), 17: (1, {'@': 377}), 18: (1, {'@': 377}), 6: (1, {'@': 377}), 19: (1, {'@': 377}), 63: (1, {'@': 377})}, 589: {12: (0, 381), 20: (0, 119), 15: (0, 344), 1: (0, 348)}, 590: {9: (1, {'@': 378}), 10: (1, {'@': 378}), 0: (1, {'@': 378}), 1: (1, {'@': 378}), 7: (1, {'@': 378}), 11: (1, {'@': 378}), 12: (1, {'@': 378}), 2: (1, {'@': 378}), 3: (1, {'@': 378}), 18: (1, {'@': 378}), 4: (1, {'@': 378}), 13: (1, {'@': 378}), 14: (1, {'@': 378}), 15: (1, {'@': 378}), 16: (1, {'@': 378}), 17: (1, {'@': 378}), 5: (1, {'@': 378}), 6: (1, {'@': 378}), 8: (1, {'@': 378}), 19: (1, {'@': 378}), 31: (1, {'@': 378}), 33: (1, {'@': 378}), 30: (1, {'@': 378}), 27: (1, {'@': 378}), 29: (1, {'@': 378}), 28: (1, {'@': 378}), 32: (1, {'@': 378})}, 591: {33: (1, {'@': 379}), 30: (1, {'@': 379})}, 592: {31: (0, 225), 14: (0, 332), 6: (0, 314), 55: (0, 645), 8: (0, 131), 7: (0, 410), 9: (0, 411)}, 593: {15: (0, 61), 12: (0, 381), 1: (0, 104), 20: (0, 107)}, 594: {33: (1, {'@': 380}), 30: (1, {'@': 380})}, 595: {63: (0, 629), 15: (0, 615)}, 596: {1: (0, 208), 13: (0, 109), 20: (0, 7), 12: (0, 381), 4: (0, 123), 46: (0, 203), 22: (0, 36), 47: (0, 40), 48: (0, 49), 49: (0, 52), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 597: {1: (0, 102), 15: (0, 349), 12: (0, 381), 20: (0, 354)}, 598: {30: (0, 89)}, 599: {9: (1, {'@': 381}), 10: (1, {'@': 381}), 0: (1, {'@': 381}), 1: (1, {'@': 381}), 7: (1, {'@': 381}), 11: (1, {'@': 381}), 12: (1, {'@': 381}), 2: (1, {'@': 381}), 3: (1, {'@': 381}), 18: (1, {'@': 381}), 4: (1, {'@': 381}), 13: (1, {'@': 381}), 14: (1, {'@': 381}), 15: (1, {'@': 381}), 16: (1, {'@': 381}), 17: (1, {'@': 381}), 5: (1, {'@': 381}), 6: (1, {'@': 381}), 8: (1, {'@': 381}), 19: (1, {'@': 381}), 31: (1, {'@': 381}), 33: (1, {'@': 381}), 30: (1, {'@': 381}), 27: (1, {'@': 381}), 29: (1, {'@': 381}), 28: (1, {'@': 381}), 32: (1, {'@': 381})}, 600: {26: (0, 120)}, 601: {11: (1, {'@': 382}), 0: (1, {'@': 382}), 1: (1, {'@': 382}), 12: (1, {'@': 382}), 2: (1, {'@': 382}), 15: (1, {'@': 382}), 13: (1, {'@': 382}), 18: (1, {'@': 382}), 4: (1, {'@': 382}), 16: (1, {'@': 382}), 17: (1, {'@': 382}), 5: (1, {'@': 382}), 6: (1, {'@': 382}), 19: (1, {'@': 382})}, 602: {9: (1, {'@': 383}), 10: (1, {'@': 383}), 0: (1, {'@': 383}), 1: (1, {'@': 383}), 7: (1, {'@': 383}), 11: (1, {'@': 383}), 12: (1, {'@': 383}), 2: (1, {'@': 383}), 3: (1, {'@': 383}), 18: (1, {'@': 383}), 4: (1, {'@': 383}), 13: (1, {'@': 383}), 14: (1, {'@': 383}), 15: (1, {'@': 383}), 16: (1, {'@': 383}), 17: (1, {'@': 383}), 5: (1, {'@': 383}), 6: (1, {'@': 383}), 8: (1, {'@': 383}), 19: (1, {'@': 383}), 31: (1, {'@': 383}), 33: (1, {'@': 383}), 30: (1, {'@': 383}), 27: (1, {'@': 383}), 29: (1, {'@': 383}), 28: (1, {'@': 383}), 32: (1, {'@': 383})}, 603: {1: (0, 208), 13: (0, 109), 20: (0, 7), 12: (0, 381), 4: (0, 123), 46: (0, 237), 22: (0, 36), 47: (0, 40), 48: (0, 49), 49: (0, 52), 50: (0, 56), 19: (0, 58), 11: (0, 63), 6: (0, 66), 51: (0, 70)}, 604: {22: (0, 413), 1: (0, 6), 13: (0, 109), 20: (0, 7), 12: (0, 381), 50: (0, 647), 102: (0, 388), 11: (0, 442), 38: (0, 445), 48: (0, 446), 51: (0, 450)}, 605: {9: (1, {'@': 384}), 10: (1, {'@': 384}), 0: (1, {'@': 384}), 1: (1, {'@': 384}), 7: (1, {'@': 384}), 11: (1, {'@': 384}), 12: (1, {'@': 384}), 2: (1, {'@': 384}), 3: (1, {'@': 384}), 18: (1, {'@': 384}), 4: (1, {'@': 384}), 13: (1, {'@': 384}), 14: (1, {'@': 384}), 15: (1, {'@': 384}), 16: (1, {'@': 384}), 17: (1, {'@': 384}), 5: (1, {'@': 384}), 6: (1, {'@': 384}), 8: (1, {'@': 384}), 19: (1, {'@': 384}), 31: (1, {'@': 384}), 33: (1, {'@': 384}), 30: (1, {'@': 384}), 27: (1, {'@': 384}), 29: (1, {'@': 384}), 28: (1, {'@': 384}), 32: (1, {'@': 384})}, 606: {9: (1, {'@': 385}), 6: (1, {'@': 385}), 14: (1, {'@': 385}), 7: (1, {'@': 385}), 8: (1, {'@': 385}), 31: (1, {'@': 385}), 10: (1, {'@': 385}), 3: (1, {'@': 385})}, 607: {1: (0, 34), 12: (0, 381), 20: (0, 359), 15: (0, 360)}, 608: {14: (0, 332), 31: (0, 215), 6: (0, 314), 55: (0, 645), 8: (0, 131), 7: (0, 410), 9: (0, 411)}, 609: {9: (1, {'@': 386}), 10: (1, {'@': 386}), 0: (1, {'@': 386}), 1: (1, {'@': 386}), 7: (1, {'@': 386}), 11: (1, {'@': 386}), 12: (1, {'@': 386}), 2: (1, {'@': 386}), 3: (1, {'@': 386}), 18: (1, {'@': 386}), 4: (1, {'@': 386}), 13: (1, {'@': 386}), 14: (1, {'@': 386}), 15: (1, {'@': 386}), 16: (1, {'@': 386}), 17: (1, {'@': 386}), 5: (1, {'@': 386}), 6: (1, {'@': 386}), 8: (1, {'@': 386}), 19: (1, {'@': 386}), 31: (1, {'@': 386}), 33: (1, {'@': 386}), 30: (1, {'@': 386}), 27: (1, {'@': 386}), 29: (1, {'@': 386}), 28: (1, {'@': 386}), 32: (1, {'@': 386})}, 610: {9: (1, {'@': 387}), 10: (1, {'@': 387}), 14: (1, {'@': 387}), 31: (1, {'@': 387}), 3: (1, {'@': 387}), 6: (1, {'@': 387}), 7: (1, {'@': 387}), 8: (1, {'@': 387})}, 611: {15: (0, 463), 1: (0, 124), 20: (0, 127), 12: (0, 381)}, 612: {18: (0, 406), 15: (0, 408), 26: (0, 128), 9: (1, {'@': 388}), 10: (1, {'@': 388}), 7: (1, {'@': 388}), 14: (1, {'@': 388}), 31: (1, {'@': 388}), 3: (1, {'@': 388}), 6: (1, {'@': 388}), 8: (1, {'@': 388})}, 613: {9: (1, {'@': 389}), 10: (1, {'@': 389}), 3: (1, {'@': 389}), 33: (1, {'@': 389}), 30: (1, {'@': 389}), 27: (1, {'@': 389}), 11: (1, {'@': 389}), 0: (1, {'@': 389}), 1: (1, {'@': 389}), 12: (1, {'@': 389}), 2: (1, {'@': 389}), 29: (1, {'@': 389}), 28: (1, {'@': 389}), 4: (1, {'@': 389}), 13: (1, {'@': 389}), 5: (1, {'@': 389}), 15: (1, {'@': 389}), 6: (1, {'@': 389}), 16: (1, {'@': 389}), 17: (1, {'@': 389}), 18: (1, {'@': 389}), 32: (1, {'@': 389}), 19: (1, {'@': 389}), 14: (1, {'@': 389}), 31: (1, {'@': 389}), 7: (1, {'@': 389}), 8: (1, {'@': 389})}, 614: {12: (0, 381), 20: (0, 470), 1: (0, 306)}, 615: {64: (0, 253), 44: (0, 289), 63: (0, 257), 67: (0, 627)}, 616: {14: (0, 332), 6: (0, 314), 55: (0, 645), 8: (0, 131), 7: (0, 410), 9: (0, 411), 10: (1, {'@': 390}), 31: (1, {'@': 390}), 3: (1, {'@': 390})}, 617: {62: (0, 595), 15: (0, 148), 63: (0, 154)}, 618: {9: (1, {'@': 391}), 10: (1, {'@': 391}), 0: (1, {'@': 391}), 1: (1, {'@': 391}), 7: (1, {'@': 391}), 11: (1, {'@': 391}), 12: (1, {'@': 391}), 2: (1, {'@': 391}), 3: (1, {'@': 391}), 18: (1, {'@': 391}), 4: (1, {'@': 391}), 13: (1, {'@': 391}), 14: (1, {'@': 391}), 15: (1, {'@': 391}), 16: (1, {'@': 391}), 17: (1, {'@': 391}), 5: (1, {'@': 391}), 6: (1, {'@': 391}), 8: (1, {'@': 391}), 19: (1, {'@': 391}), 31: (1, {'@': 391}), 33: (1, {'@': 391}), 30: (1, {'@': 391}), 27: (1, {'@': 391}), 29: (1, {'@': 391}), 28: (1, {'@': 391}), 32: (1, {'@': 391})}, 619: {1: (0, 624), 20: (0, 255), 4: (0, 389), 12: (0, 381), 19: (0, 194), 81: (0, 276), 34: (0, 263), 13: (0, 213), 35: (0, 243), 6: (0, 250), 36: (0, 284), 11: (0, 280), 37: (0, 287), 22: (0, 293), 97: (0, 317)}, 620: {10: (0, 452), 9: (1, {'@': 61}), 7: (1, {'@': 61}), 14: (1, {'@': 61}), 3: (1, {'@': 61}), 6: (1, {'@': 61}), 8: (1, {'@': 61})}, 621: {9: (1, {'@': 392}), 6: (1, {'@': 392}), 14: (1, {'@': 392}), 7: (1, {'@': 392}), 8: (1, {'@': 392}), 31: (1, {'@': 392}), 10: (1, {'@': 392}), 3: (1, {'@': 392})}, 622: {11: (1, {'@': 393}), 0: (1, {'@': 393}), 1: (1, {'@': 393}), 12: (1, {'@': 393}), 2: (1, {'@': 393}), 29: (1, {'@': 393}), 18: (1, {'@': 393}), 28: (1, {'@': 393}), 4: (1, {'@': 393}), 13: (1, {'@': 393}), 15: (1, {'@': 393}), 16: (1, {'@': 393}), 17: (1, {'@': 393}), 5: (1, {'@': 393}), 6: (1, {'@': 393}), 19: (1, {'@': 393})}, 623: {12: (0, 381), 20: (0, 201), 1: (0, 340)}, 624: {15: (0, 394), 18: (0, 396), 9: (0, 244), 26: (0, 403), 10: (1, {'@': 394}), 7: (1, {'@': 394}), 14: (1, {'@': 394}), 31: (1, {'@': 394}), 3: (1, {'@': 394}), 6: (1, {'@': 394}), 8: (1, {'@': 394})}, 625: {104: (0, 455), 3: (0, 457), 10: (0, 464)}, 626: {10: (0, 324)}, 627: {63: (1, {'@': 395}), 15: (1, {'@': 395})}, 628: {9: (1, {'@': 396}), 10: (1, {'@': 396}), 0: (1, {'@': 396}), 1: (1, {'@': 396}), 7: (1, {'@': 396}), 11: (1, {'@': 396}), 12: (1, {'@': 396}), 2: (1, {'@': 396}), 3: (1, {'@': 396}), 18: (1, {'@': 396}), 4: (1, {'@': 396}), 13: (1, {'@': 396}), 14: (1, {'@': 396}), 15: (1, {'@': 396}), 16: (1, {'@': 396}), 17: (1, {'@': 396}), 5: (1, {'@': 396}), 6: (1, {'@': 396}), 8: (1, {'@': 396}), 19: (1, {'@': 396}), 31: (1, {'@': 396}), 33: (1, {'@': 396}), 30: (1, {'@': 396}), 27: (1, {'@': 396}), 29: (1, {'@': 396}), 28: (1, {'@': 396}), 32: (1, {'@': 396})}, 629: {11: (1, {'@': 397}), 0: (1, {'@': 397}), 1: (1, {'@': 397}), 12: (1, {'@': 397}), 2: (1, {'@': 397}), 29: (1, {'@': 397}), 18: (1, {'@': 397}), 28: (1, {'@': 397}), 4: (1, {'@': 397}), 13: (1, {'@': 397}), 15: (1, {'@': 397}), 16: (1, {'@': 397}), 17: (1, {'@': 397}), 5: (1, {'@': 397}), 6: (1, {'@': 397}), 19: (1, {'@': 397})}, 630: {9: (1, {'@': 398}), 10: (1, {'@': 398}), 0: (1, {'@': 398}), 1: (1, {'@': 398}), 7: (1, {'@': 398}), 11: (1, {'@': 398}), 12: (1, {'@': 398}), 2: (1, {'@': 398}), 3: (1, {'@': 398}), 18: (1, {'@': 398}), 4: (1, {'@': 398}), 13: (1, {'@': 398}), 14: (1, {'@': 398}), 15: (1, {'@': 398}), 16: (1, {'@': 398}), 17: (1, {'@': 398}), 5: (1, {'@': 398}), 6: (1, {'@': 398}), 8: (1, {'@': 398}), 19: (1, {'@': 398}), 31: (1, {'@': 398}), 33: (1, {'@': 398}), 30: (1, {'@': 398}), 27: (1, {'@': 398}), 29: (1, {'@': 398}), 28: (1, {'@': 398}), 32: (1, {'@': 398})}, 631: {15: (0, 100), 26: (0, 383)}, 632: {9: (1, {'@': 399}), 10: (1, {'@': 399}), 0: (1, {'@': 399}), 1: (1, {'@': 399}), 7: (1, {'@': 399}), 11: (1, {'@': 399}), 12: (1, {'@': 399}), 2: (1, {'@': 399}), 3: (1, {'@': 399}), 18: (1, {'@': 399}), 4: (1, {'@': 399}), 13: (1, {'@': 399}), 14: (1, {'@': 399}), 15: (1, {'@': 399}), 16: (1, {'@': 399}), 17: (1, {'@': 399}), 5: (1, {'@': 399}), 6: (1, {'@': 399}), 8: (1, {'@': 399}), 19: (1, {'@': 399}), 31: (1, {'@': 399}), 33: (1, {'@': 399}), 30: (1, {'@': 399}), 27: (1, {'@': 399}), 29: (1, {'@': 399}), 28: (1, {'@': 399}), 32: (1, {'@': 399})}, 633: {11: (1, {'@': 400}), 0: (1, {'@': 400}), 1: (1, {'@': 400}), 12: (1, {'@': 400}), 2: (1, {'@': 400}), 29: (1, {'@': 400}), 18: (1, {'@': 400}), 28: (1, {'@': 400}), 4: (1, {'@': 400}), 13: (1, {'@': 400}), 15: (1, {'@': 400}), 16: (1, {'@': 400}), 17: (1, {'@': 400}), 5: (1, {'@': 400}), 6: (1, {'@': 400}), 19: (1, {'@': 400})}, 634: {9: (1, {'@': 401}), 10: (1, {'@': 401}), 0: (1, {'@': 401}), 1: (1, {'@': 401}), 7: (1, {'@': 401}), 11: (1, {'@': 401}), 12: (1, {'@': 401}), 2: (1, {'@': 401}), 3: (1, {'@': 401}), 18: (1, {'@': 401}), 4: (1, {'@': 401}), 13: (1, {'@': 401}), 14: (1, {'@': 401}), 15: (1, {'@': 401}), 16: (1, {'@': 401}), 17: (1, {'@': 401}), 5: (1, {'@': 401}), 6: (1, {'@': 401}), 8: (1, {'@': 401}), 19: (1, {'@': 401}), 31: (1, {'@': 401}), 33: (1, {'@': 401}), 30: (1, {'@': 401}), 27: (1, {'@': 401}), 29: (1, {'@': 401}), 28: (1, {'@': 401}), 32: (1, {'@': 401})}, 635: {1: (0, 6), 20: (0, 7), 12: (0, 381), 35: (0, 393), 85: (0, 566), 11: (0, 395), 13: (0, 213), 38: (0, 570), 22: (0, 399)}, 636: {9: (0, 415), 10: (1, {'@': 402}), 7: (1, {'@': 402}), 14: (1, {'@': 402}), 31: (1, {'@': 402}), 3: (1, {'@': 402}), 6: (1, {'@': 402}), 8: (1, {'@': 402})}, 637: {9: (1, {'@': 403}), 6: (1, {'@': 403}), 14: (1, {'@': 403}), 7: (1, {'@': 403}), 8: (1, {'@': 403}), 31: (1, {'@': 403}), 10: (1, {'@': 403}), 3: (1, {'@': 403})}, 638: {9: (1, {'@': 404}), 10: (1, {'@': 404}), 0: (1, {'@': 404}), 1: (1, {'@': 404}), 7: (1, {'@': 404}), 11: (1, {'@': 404}), 12: (1, {'@': 404}), 2: (1, {'@': 404}), 3: (1, {'@': 404}), 18: (1, {'@': 404}), 4: (1, {'@': 404}), 13: (1, {'@': 404}), 14: (1, {'@': 404}), 15: (1, {'@': 404}), 16: (1, {'@': 404}), 17: (1, {'@': 404}), 5: (1, {'@': 404}), 6: (1, {'@': 404}), 8: (1, {'@': 404}), 19: (1, {'@': 404}), 31: (1, {'@': 404}), 33: (1, {'@': 404}), 30: (1, {'@': 404}), 27: (1, {'@': 404}), 29: (1, {'@': 404}), 28: (1, {'@': 404}), 32: (1, {'@': 404})}, 639: {26: (0, 121)}, 640: {9: (1, {'@': 405}), 6: (1, {'@': 405}), 14: (1, {'@': 405}), 7: (1, {'@': 405}), 8: (1, {'@': 405}), 31: (1, {'@': 405}), 10: (1, {'@': 405}), 3: (1, {'@': 405})}, 641: {10: (1, {'@': 406}), 3: (1, {'@': 406})}, 642: {11: (1, {'@': 407}), 0: (1, {'@': 407}), 1: (1, {'@': 407}), 12: (1, {'@': 407}), 2: (1, {'@': 407}), 29: (1, {'@': 407}), 28: (1, {'@': 407}), 4: (1, {'@': 407}), 13: (1, {'@': 407}), 5: (1, {'@': 407}), 15: (1, {'@': 407}), 16: (1, {'@': 407}), 17: (1, {'@': 407}), 18: (1, {'@': 407}), 6: (1, {'@': 407}), 19: (1, {'@': 407}), 63: (1, {'@': 407})}, 643: {15: (0, 357), 12: (0, 381), 1: (0, 372), 20: (0, 375)}, 644: {9: (1, {'@': 408}), 10: (1, {'@': 408}), 0: (1, {'@': 408}), 1: (1, {'@': 408}), 7: (1, {'@': 408}), 11: (1, {'@': 408}), 12: (1, {'@': 408}), 2: (1, {'@': 408}), 3: (1, {'@': 408}), 18: (1, {'@': 408}), 4: (1, {'@': 408}), 13: (1, {'@': 408}), 14: (1, {'@': 408}), 15: (1, {'@': 408}), 16: (1, {'@': 408}), 17: (1, {'@': 408}), 5: (1, {'@': 408}), 6: (1, {'@': 408}), 8: (1, {'@': 408}), 19: (1, {'@': 408}), 31: (1, {'@': 408}), 33: (1, {'@': 408}), 30: (1, {'@': 408}), 27: (1, {'@': 408}), 29: (1, {'@': 408}), 28: (1, {'@': 408}), 32: (1, {'@': 408})}, 645: {22: (0, 413), 1: (0, 479), 13: (0, 109), 20: (0, 483), 12: (0, 381), 50: (0, 647), 4: (0, 123), 49: (0, 486), 102: (0, 488), 11: (0, 442), 105: (0, 492), 48: (0, 446), 51: (0, 450)}, 646: {9: (1, {'@': 409}), 10: (1, {'@': 409}), 0: (1, {'@': 409}), 1: (1, {'@': 409}), 7: (1, {'@': 409}), 11: (1, {'@': 409}), 12: (1, {'@': 409}), 2: (1, {'@': 409}), 3: (1, {'@': 409}), 18: (1, {'@': 409}), 4: (1, {'@': 409}), 13: (1, {'@': 409}), 14: (1, {'@': 409}), 15: (1, {'@': 409}), 16: (1, {'@': 409}), 17: (1, {'@': 409}), 5: (1, {'@': 409}), 6: (1, {'@': 409}), 8: (1, {'@': 409}), 19: (1, {'@': 409}), 31: (1, {'@': 409}), 33: (1, {'@': 409}), 30: (1, {'@': 409}), 27: (1, {'@': 409}), 29: (1, {'@': 409}), 28: (1, {'@': 409}), 32: (1, {'@': 409})}, 647: {9: (1, {'@': 410}), 10: (1, {'@': 410}), 7: (1, {'@': 410}), 14: (1, {'@': 410}), 31: (1, {'@': 410}), 3: (1, {'@': 410}), 6: (1, {'@': 410}), 8: (1, {'@': 410})}, 648: {9: (1, {'@': 411}), 10: (1, {'@': 411}), 14: (1, {'@': 411}), 31: (1, {'@': 411}), 3: (1, {'@': 411}), 6: (1, {'@': 411}), 7: (1, {'@': 411}), 8: (1, {'@': 411})}, 649: {10: (1, {'@': 412}), 3: (1, {'@': 412})}, 650: {12: (0, 381), 20: (0, 346), 1: (0, 365)}}, 'start_states': {'table': 345}, 'end_states': {'table': 379}}, 'lexer_conf': {'tokens': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}, {'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}, {'@': 13}, {'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}, {'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}], 'ignore': [], 'g_regex_flags': 0, '__type__': 'LexerConf'}, 'start': ['table'], '__type__': 'LALR_ContextualLexer'}, 'rules': [{'@': 252}, {'@': 304}, {'@': 308}, {'@': 155}, {'@': 149}, {'@': 382}, {'@': 98}, {'@': 92}, {'@': 177}, {'@': 66}, {'@': 305}, {'@': 302}, {'@': 143}, {'@': 201}, {'@': 208}, {'@': 193}, {'@': 238}, {'@': 116}, {'@': 248}, {'@': 87}, {'@': 88}, {'@': 114}, {'@': 222}, {'@': 380}, {'@': 379}, {'@': 295}, {'@': 84}, {'@': 86}, {'@': 73}, {'@': 78}, {'@': 294}, {'@': 328}, {'@': 76}, {'@': 80}, {'@': 72}, {'@': 332}, {'@': 324}, {'@': 82}, {'@': 287}, {'@': 120}, {'@': 57}, {'@': 123}, {'@': 172}, {'@': 174}, {'@': 130}, {'@': 166}, {'@': 223}, {'@': 182}, {'@': 325}, {'@': 203}, {'@': 333}, {'@': 191}, {'@': 331}, {'@': 206}, {'@': 180}, {'@': 397}, {'@': 400}, {'@': 121}, {'@': 393}, {'@': 133}, {'@': 125}, {'@': 267}, {'@': 158}, {'@': 336}, {'@': 334}, {'@': 264}, {'@': 262}, {'@': 289}, {'@': 184}, {'@': 220}, {'@': 151}, {'@': 217}, {'@': 163}, {'@': 159}, {'@': 365}, {'@': 377}, {'@': 407}, {'@': 69}, {'@': 198}, {'@': 89}, {'@': 376}, {'@': 369}, {'@': 215}, {'@': 301}, {'@': 293}, {'@': 58}, {'@': 109}, {'@': 403}, {'@': 405}, {'@': 219}, {'@': 359}, {'@': 226}, {'@': 342}, {'@': 204}, {'@': 355}, {'@': 207}, {'@': 282}, {'@': 291}, {'@': 286}, {'@': 135}, {'@': 129}, {'@': 132}, {'@': 362}, {'@': 356}, {'@': 358}, {'@': 45}, {'@': 211}, {'@': 216}, {'@': 44}, {'@': 346}, {'@': 340}, {'@': 337}, {'@': 344}, {'@': 335}, {'@': 348}, {'@': 366}, {'@': 353}, {'@': 351}, {'@': 221}, {'@': 67}, {'@': 227}, {'@': 242}, {'@': 243}, {'@': 244}, {'@': 233}, {'@': 307}, {'@': 312}, {'@': 310}, {'@': 190}, {'@': 181}, {'@': 247}, {'@': 230}, {'@': 47}, {'@': 48}, {'@': 51}, {'@': 50}, {'@': 212}, {'@': 49}, {'@': 146}, {'@': 319}, {'@': 315}, {'@': 321}, {'@': 320}, {'@': 195}, {'@': 142}, {'@': 183}, {'@': 394}, {'@': 194}, {'@': 178}, {'@': 338}, {'@': 259}, {'@': 343}, {'@': 260}, {'@': 192}, {'@': 59}, {'@': 196}, {'@': 170}, {'@': 254}, {'@': 256}, {'@': 253}, {'@': 258}, {'@': 367}, {'@': 255}, {'@': 364}, {'@': 345}, {'@': 261}, {'@': 350}, {'@': 347}, {'@': 167}, {'@': 188}, {'@': 390}, {'@': 83}, {'@': 402}, {'@': 388}, {'@': 311}, {'@': 303}, {'@': 309}, {'@': 306}, {'@': 74}, {'@': 68}, {'@': 79}, {'@': 61}, {'@': 64}, {'@': 71}, {'@': 278}, {'@': 281}, {'@': 284}, {'@': 263}, {'@': 410}, {'@': 280}, {'@': 330}, {'@': 250}, {'@': 327}, {'@': 318}, {'@': 314}, {'@': 246}, {'@': 316}, {'@': 266}, {'@': 385}, {'@': 300}, {'@': 411}, {'@': 213}, {'@': 387}, {'@': 210}, {'@': 140}, {'@': 279}, {'@': 283}, {'@': 370}, {'@': 313}, {'@': 372}, {'@': 389}, {'@': 111}, {'@': 110}, {'@': 90}, {'@': 63}, {'@': 100}, {'@': 95}, {'@': 176}, {'@': 54}, {'@': 384}, {'@': 373}, {'@': 75}, {'@': 77}, {'@': 205}, {'@': 85}, {'@': 53}, {'@': 52}, {'@': 401}, {'@': 408}, {'@': 202}, {'@': 185}, {'@': 296}, {'@': 209}, {'@': 386}, {'@': 399}, {'@': 173}, {'@': 187}, {'@': 381}, {'@': 383}, {'@': 363}, {'@': 378}, {'@': 241}, {'@': 239}, {'@': 179}, {'@': 165}, {'@': 357}, {'@': 371}, {'@': 360}, {'@': 352}, {'@': 232}, {'@': 94}, {'@': 275}, {'@': 375}, {'@': 234}, {'@': 60}, {'@': 228}, {'@': 235}, {'@': 409}, {'@': 323}, {'@': 398}, {'@': 404}, {'@': 153}, {'@': 148}, {'@': 298}, {'@': 162}, {'@': 277}, {'@': 276}, {'@': 141}, {'@': 136}, {'@': 272}, {'@': 271}, {'@': 237}, {'@': 273}, {'@': 99}, {'@': 96}, {'@': 145}, {'@': 169}, {'@': 396}, {'@': 341}, {'@': 270}, {'@': 349}, {'@': 106}, {'@': 105}, {'@': 274}, {'@': 354}, {'@': 104}, {'@': 229}, {'@': 144}, {'@': 224}, {'@': 329}, {'@': 391}, {'@': 164}, {'@': 81}, {'@': 97}, {'@': 55}, {'@': 249}, {'@': 186}, {'@': 118}, {'@': 102}, {'@': 251}, {'@': 150}, {'@': 137}, {'@': 56}, {'@': 245}, {'@': 113}, {'@': 157}, {'@': 218}, {'@': 236}, {'@': 127}, {'@': 161}, {'@': 103}, {'@': 115}, {'@': 131}, {'@': 122}, {'@': 119}, {'@': 392}, {'@': 107}, {'@': 317}, {'@': 214}, {'@': 168}, {'@': 240}, {'@': 299}, {'@': 117}, {'@': 46}, {'@': 134}, {'@': 126}, {'@': 139}, {'@': 292}, {'@': 171}, {'@': 175}, {'@': 257}, {'@': 200}, {'@': 225}, {'@': 322}, {'@': 93}, {'@': 152}, {'@': 285}, {'@': 65}, {'@': 147}, {'@': 124}, {'@': 290}, {'@': 288}, {'@': 160}, {'@': 231}, {'@': 154}, {'@': 326}, {'@': 297}, {'@': 112}, {'@': 62}, {'@': 268}, {'@': 101}, {'@': 108}, {'@': 395}, {'@': 265}, {'@': 91}, {'@': 406}, {'@': 269}, {'@': 199}, {'@': 156}, {'@': 374}, {'@': 70}, {'@': 189}, {'@': 368}, {'@': 412}, {'@': 339}, {'@': 138}, {'@': 361}, {'@': 197}, {'@': 128}], 'options': {'debug': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['table'], 'priority': None, 'ambiguity': 'auto', 'propagate_positions': True, 'lexer_callbacks': {}, 'maybe_placeholders': False, 'edit_terminals': None, 'g_regex_flags': 0}, '__type__': 'Lark'}
@@ -2189,5 +2189,5 @@ MEMO = (
 )
 Shift = 0
 Reduce = 1
-def Lark_StandAlone(transformer=None, postlex=None, *, tbl):
-  return Lark._load_from_dict(DATA, MEMO, transformer=transformer, postlex=postlex, tbl=tbl)
+def Lark_StandAlone(transformer=None, postlex=None):
+  return Lark._load_from_dict(DATA, MEMO, transformer=transformer, postlex=postlex)
@@ -1,6 +1,10 @@
+import importlib
+import os
 import re
-from collections.abc import Iterable
-from functools import partial
+import sys
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache, partial
 from itertools import chain, cycle, islice, zip_longest
 from inspect import signature, Parameter
 
@@ -14,8 +18,8 @@ from nutshell.common import macros
 from nutshell.common.errors import *
 from .lark_assets import parser as lark_standalone
 from ._transformer import Preprocess
-from ._classes import VarName, StateList
-from . import _symutils as symutils, _neighborhoods as nbhoods
+from ._classes import FinalTransition, VarName, StateList
+from . import _symutils as symutils, _neighborhoods as nbhoods, _optimizer as optimizer, _search as search, _tree as ruletree
 
 # no need to catch \s*,\s* because directive values are translated with KILL_WS
 CUSTOM_NBHD = re.compile(r'(?:[NS][EW]?|[EW])(?:,(?:[NS][EW]?|[EW]))*')
@@ -30,7 +34,27 @@ class Bidict(bidict.bidict):
     on_dup = bidict.OnDup(val=bidict.DROP_NEW, kv=bidict.DROP_NEW)
 
 
+@lru_cache(maxsize=None)
+def get_parser():
+    """
+    Deserializing the parse table and building the contextual lexer is the
+    costliest part of setting up a table, and none of it depends on the table
+    itself (its TableSegment is passed to parse() instead) -- so build it once
+    and share it between every @TABLE parsed by this process.
+    """
+    return lark_standalone.Lark_StandAlone()
+
+
 class TableSegment:
+    # {line key :: expansion of that line}, shared between tables so that
+    # recompiling an edited rule only has to re-expand the lines that changed
+    # (see Preprocess._transform_tree() for what goes into the key)
+    expanded_lines = OrderedDict()
+    EXPANDED_LINES_MAXSIZE = 8192
+    # how many characters of compiled transitions are held in memory before
+    # they spill over into a temporary file (see _spool_final())
+    SPOOL_MAXSIZE = 1 << 22
+    
     CARDINALS = generate_cardinals({
       'oneDimensional': ('W', 'E'),
       'vonNeumann': ('N', 'E', 'S', 'W'),
@@ -69,19 +93,21 @@ class TableSegment:
         self.current_macros = []
         self._prepped_macros = {}
         self.available_macros = macros.__dict__.copy()
+        self.dependencies = set()  # paths of external files pulled in (macros, symmetries, modifiers)
+        self.expanded_groups = {}  # {TransitionGroup.structure() :: its expansion}
+        self._search_index = None  # (built by match() the first time it's called)
 
         self.specials = {'any': VarName('any'), 'live': VarName('live')}
         self.new_varname = VarName.new_generator()
         
         if not tbl:
-            self.final = []
+            self._spool_final(())
             self._n_states = self.directives['n_states'] = max(2, self.directives.pop('states', 2))
             return
         
         transformer = Preprocess(tbl=self)
-        parser = lark_standalone.Lark_StandAlone(tbl=self)
         try:
-            _parsed = parser.parse('\n'.join(self._src))
+            _parsed = get_parser().parse('\n'.join(self._src), tbl=self)
         except lark_standalone.UnexpectedCharacters as e:
             raise SyntaxErr(
               (e.line, e.column, 1+e.column),
@@ -104,13 +130,40 @@ class TableSegment:
                 # force these to be equal (in the event of, say, inline-rulestring
                 # napkins' having been used, which don't update directives)
                 self.directives['symmetries'] = sym.name[0] if hasattr(sym, 'name') else sym.__name__.lower()
-            self.final = [t.fix_vars() for t in self._data]
+            final = (t.fix_vars() for t in self._data)
         else:
             MinSym = symutils.find_min_sym_type(self.sym_types, self.trlen)
             self.directives['symmetries'] = MinSym.name[0] if hasattr(MinSym, 'name') else MinSym.__name__.lower()
-            self.final = [new_tr for tr in self._data for new_tr in tr.in_symmetry(MinSym)]
+            final = (new_tr for tr in self._data for new_tr in tr.in_symmetry(MinSym))
         self.directives['n_states'] = self.directives.pop('states')
-        self._apply_macros()
+        if self.current_macros:
+            # macros can rearrange any span of the table, so they need it all at once
+            final = self._apply_macros(list(final))
+        options = cli.result.transpile
+        if options.prune_shadowed:
+            shadowed = optimizer.ShadowedTransitions(self)
+            final = shadowed.filter(final)
+        if options.optimize:
+            merged = optimizer.MergedTransitions(self, by_context=bool(options.comment_src or options.preserve_comments))
+            final = merged.filter(final)
+        self._spool_final(final)
+        if options.prune_shadowed:
+            printq(f'Removed {shadowed.removed} shadowed transition{"" if shadowed.removed == 1 else "s"}')
+        if options.optimize:
+            printq(f'Merged {merged.merged} transition{"" if merged.merged == 1 else "s"} into others')
+    
+    @classmethod
+    def reload_dependency(cls, path):
+        """
+        If `path` is a module some table imported (e.g. for a symmetry type or
+        rulestring modifier), reimport it and forget anything cached from its
+        old version
+        """
+        for module in list(sys.modules.values()):
+            if getattr(module, '__file__', None) and os.path.abspath(module.__file__) == path:
+                importlib.reload(module)
+                symutils.forget_module(module.__name__)
+                cls.expanded_lines.clear()
     
     def __getitem__(self, item):
         return self._src[item]
@@ -121,7 +174,7 @@ class TableSegment:
         for directive, value in self.directives.items():
             if directive != 'neighborhood':
                 yield f'{directive}: {value}'
-        if vars_valid or self.final:  # if there are more things to yield
+        if vars_valid or self._n_final:  # if there are more things to yield
             yield ''
         for var, states in self.vars.items():
             if var.rep == -1:
@@ -133,13 +186,49 @@ class TableSegment:
                 yield f'var {var.name}.{suf} = {var.name}.0'
         if vars_valid:  # if that loop ran
             yield ''
-        yield from self._iter_final_transitions()
+        self._final.seek(0)
+        yield from (line[:-1] for line in self._final)
     
-    def _iter_final_transitions(self):
+    def tree(self):
+        """
+        Lines of a @TREE segment that does the same thing as this table
+        (built from its compiled transitions, read back from the spooled
+        text without any comments -s or -c put in)
+        """
+        self._final.seek(0)
+        lines = (line.split('#', 1)[0].strip() for line in self._final)
+        return ruletree.RuleTree(self, (FinalTransition(map(str.strip, line.split(','))) for line in lines if line))
+    
+    def _spool_final(self, final):
+        """
+        Compiles the final transitions down to lines of text as they're
+        generated, rather than keeping every FinalTransition around, and
+        stores those in a file that only goes to disk if it gets big. (The
+        var declarations that go above them can't be written until all of
+        them have been generated, because that's what updates self.vars.)
+        """
+        self._final = tempfile.SpooledTemporaryFile(self.SPOOL_MAXSIZE, 'w+')
+        self._n_final = 0
+        try:
+            for line in self._iter_final_transitions(final):
+                self._final.write(f'{line}\n')
+                self._n_final += 1
+        except BaseException:
+            self._final.close()
+            raise
+    
+    def close(self):
+        """
+        Frees the compiled transitions spooled by _spool_final() (and with
+        them the temporary file they spilt over into, if they did)
+        """
+        self._final.close()
+    
+    def _iter_final_transitions(self, final):
         src, cmt = cli.result.transpile.comment_src, cli.result.transpile.preserve_comments
         seen = set()
         last_cmt_lno = -1
-        for tr in self.final:
+        for tr in final:
             if tr.ctx not in seen:
                 seen.add(tr.ctx)
                 lno, start, end = tr.ctx
@@ -154,9 +243,9 @@ class TableSegment:
                     yield src.format(line=lno+self.start, span=self[lno-1][start:end])
                 if cmt and lno in self.comments:
                     last_cmt_lno = lno
-                    yield '{}{}'.format(', '.join(map(str, tr)), self.comments[lno])
+                    yield '{}{}'.format(', '.join(tr), self.comments[lno])
                     continue
-            yield ', '.join(map(str, tr))
+            yield ', '.join(tr)
     
     @property
     def neighborhood(self):
@@ -214,13 +303,22 @@ class TableSegment:
     
     def add_sym_type(self, name):
         try:
-            self.sym_types.add(symutils.get_sym_type(name))
+            sym_type = symutils.get_sym_type(name)
         except (ImportError, ModuleNotFoundError):
             raise ImportError(f'No symmetry type {name!r} found')
+        self.sym_types.add(sym_type)
+        if '.' in name:
+            self.add_dependency(sys.modules[sym_type.__module__])
     
     def add_macros(self, path):
         with open(path) as f:
             exec(f.read(), self.available_macros)
+        self.dependencies.add(os.path.abspath(path))
+    
+    def add_dependency(self, module):
+        path = getattr(module, '__file__', None)
+        if path is not None:
+            self.dependencies.add(os.path.abspath(path))
     
     def set_macro(self, meta, name, args):
         self.current_macros.append((meta.lno, self._prep_macro(self.available_macros[name]), args.split()))
@@ -237,18 +335,19 @@ class TableSegment:
             self._prepped_macros[func] = partial(typecast(func), **{k: v for k, v in special_params if k in kwargs})
         return self._prepped_macros[func]
 
-    def _apply_macros(self):
-        if not self.final or not self.current_macros:
-            return
+    def _apply_macros(self, final):
+        if not final:
+            return final
         mcrs = {}
         for lno, macro, args in self.current_macros:
             if '\\' not in args:
                 mcrs.setdefault(macro, []).append((lno, args))
                 continue
             start, args = mcrs[macro].pop()
-            from_ = next(i for i, v in enumerate(self.final) if v.ctx.lno > start)
-            to = next(i for i, v in enumerate(self.final) if v.ctx.lno > lno)
-            self.final[from_:to] = macro([i for i in self.final if start < i.ctx.lno < lno], *args)
+            from_ = next(i for i, v in enumerate(final) if v.ctx.lno > start)
+            to = next(i for i, v in enumerate(final) if v.ctx.lno > lno)
+            final[from_:to] = macro([i for i in final if start < i.ctx.lno < lno], *args)
+        return final
     
     def check_cdir(self, cdir, meta, *, return_int=True, enforce_int=False):
         if cdir in ('FG', 'BG'):
@@ -270,76 +369,72 @@ class TableSegment:
               f"{pre} {cdir} does not exist in neighborhood {self.directives['neighborhood']!r}"
               )
     
-    def match(self, tr):
-        tr = list(map(_SearchTerm, tr))  # XXX: hopefully can remove _SearchTerm w/ new symmetries
-        printq('Complete!\n\nSearching for match...')
+    def search(self, tr):
+        """
+        Looks up the transition `tr` (its states as ints, with '*' and '?'
+        as wildcards) in this table. Returns a dict with its 'result' --
+        'found', 'overridden' (an earlier transition matches everything but
+        its resultant), 'no match', or 'default' (no match, but tr leaves
+        the cell as it is anyway) -- and, if some transition was hit, the
+        'line' it's on, that line's 'source' text and the 'span' of it the
+        transition came from, the 'compiled' transition, and, for each '?'
+        in tr, the states its 'terms' could have been (along with the
+        'cell' they were matched by, if that's a variable).
+        """
         start, *in_napkin, end = tr
         if len(in_napkin) != self.trlen:
             raise Error(None, f'Bad length for match (expected {2+self.trlen} states, got {2+len(in_napkin)})')
-        in_trs = [(start, *napkin, end) for napkin in self.symmetries(in_napkin).expand()]
-        question_indices = [i for i, v in enumerate(tr) if v.request_idx]
-        for tr in self._data:
-            for in_tr in in_trs:
-                # to know whether to abort on no match, or to continue in
-                # hopes that the wildcard is valid elsewhere
-                tripped_wildcard = False
-                for cur_len, (in_state, tr_state) in enumerate(zip(in_tr, tr), -1):
-                    if in_state.is_wildcard:
-                        tripped_wildcard = True
-                        continue
-                    if (
-                      in_state.value not in tr_state
-                      if isinstance(tr_state, Iterable)
-                      else in_state.value != getattr(tr_state, 'value', tr_state)
-                    ):
-                        if not tripped_wildcard and cur_len == self.trlen:
-                            lno, start, end = tr.ctx
-                            return (
-                              'No match\n\n'
-                              f'Impossible match!\nOverridden on line {self.start+lno} by:\n  {self[lno-1]}\n'
-                              f'''{"" if start == 1 else f"  {' '*(start-1)}{'^'*(end-start)}"}\n'''  # TODO FIXME: deuglify
-                              f"Specifically (compiled line):\n  {', '.join(map(str, tr.fix_vars()))}"
-                              )
-                        break
-                else:
-                    lno, start, end = tr.ctx
-                    fixed_tr = tr.fix_vars()
-                    separator = '\n\n\n' if question_indices else ''
-                    _NEWLINE = '\n'  # for fstring...
-                    return (
-                      'Found!\n\n'
-                      f'Line {self.start+lno}:\n  {self[lno-1]}\n'
-                      f'''{"" if start == 1 else f"  {' '*(start-1)}{'^'*(end-start)}"}\n'''  # TODO FIXME: deuglify
-                      f"Compiled line:\n  {', '.join(map(str, tr.fix_vars()))}"
-                      f'''{separator}{_NEWLINE.join(
-                        f"* TERM #{n} ('{fixed_tr[n]}') is one of {tr[n].untether()}"
-                        if isinstance(tr[n], StateList)
-                        else f'* TERM #{n} is {tr[n]}'
-                        for n in question_indices
-                        )
-                      }'''
-                      )
-        if start == end:
-            return 'No match\n\nThis transition is the result of unspecified default behavior'
-        return 'No match'
-
-
-class _SearchTerm:
-    """
-    This class will only exist as long as I use "sorted()" to
-    expand napkin symmetries, because it exists only to be comparable
-    to int
-    """
-    def __init__(self, value):
-        self.value = value
-        self.is_wildcard = value == '*' or value == '?'
-        self.request_idx = value == '?'
+        if self._search_index is None:
+            self._search_index = search.TransitionIndex(self._data, self.symmetries, self.trlen, self.n_states)
+        first = self._search_index.first(tr)
+        if first is None:
+            return {'result': 'default' if start == end and start not in search.WILDCARDS else 'no match'}
+        idx, same_resultant = first
+        found = self._data[idx]
+        lno, start, end = found.ctx
+        fixed_tr = found.fix_vars()
+        ret = {
+          'result': 'found' if same_resultant else 'overridden',
+          'line': self.start + lno,
+          'source': self[lno-1],
+          'span': [start, end],
+          'compiled': list(map(str, fixed_tr)),
+          }
+        if same_resultant:
+            ret['terms'] = [
+              {'term': n, 'cell': str(fixed_tr[n]), 'states': list(found[n].untether())}
+              if isinstance(found[n], StateList)
+              else {'term': n, 'states': [getattr(found[n], 'value', found[n])]}
+              for n, v in enumerate(tr) if v == '?'
+              ]
+        return ret
     
-    def __lt__(self, other):
-        if not isinstance(other, self.__class__):
-            return NotImplemented
-        if self.is_wildcard:
-            return True
-        if other.is_wildcard:
-            return False
-        return self.value.__lt__(other.value)
+    def match(self, tr):
+        printq('Complete!\n\nSearching for match...')
+        found = self.search(tr)
+        if found['result'] == 'default':
+            return 'No match\n\nThis transition is the result of unspecified default behavior'
+        if found['result'] == 'no match':
+            return 'No match'
+        start, end = found['span']
+        caret = "" if start == 1 else f"  {' '*(start-1)}{'^'*(end-start)}"  # TODO FIXME: deuglify
+        if found['result'] == 'overridden':
+            return (
+              'No match\n\n'
+              f"Impossible match!\nOverridden on line {found['line']} by:\n  {found['source']}\n"
+              f'{caret}\n'
+              f"Specifically (compiled line):\n  {', '.join(found['compiled'])}"
+              )
+        terms = '\n'.join(
+          f"* TERM #{term['term']} ('{term['cell']}') is one of {tuple(term['states'])}"
+          if 'cell' in term
+          else f"* TERM #{term['term']} is {term['states'][0]}"
+          for term in found['terms']
+          )
+        return (
+          'Found!\n\n'
+          f"Line {found['line']}:\n  {found['source']}\n"
+          f'{caret}\n'
+          f"Compiled line:\n  {', '.join(found['compiled'])}"
+          f"{'' if not terms else chr(10) * 3}{terms}"
+          )
@@ -1,6 +1,7 @@
 import inspect
+from concurrent.futures import ThreadPoolExecutor
 
-from .segment_types import NutshellSegment, TableSegment, ColorSegment, IconSegment
+from . import segment_types
 from .common import errors, utils
 
 
@@ -13,17 +14,66 @@ def seg(name, modifiers, cls=None, *, include_bare=True):
     return base + [(f'{name}:{modifier}', cls) for modifier in modifiers]
 
 
+# Converters are named rather than referenced directly so that each
+# segment type is only imported if a rule actually contains it
 CONVERTERS = [
-  *seg('NUTSHELL', NutshellSegment),
-  *seg('TABLE', TableSegment),
-  *seg('COLORS', ColorSegment),
-  *seg('ICONS', (7, 15, 31), IconSegment),
+  *seg('NUTSHELL', 'NutshellSegment'),
+  *seg('TABLE', 'TableSegment'),
+  *seg('COLORS', 'ColorSegment'),
+  *seg('ICONS', (7, 15, 31), 'IconSegment'),
   ]
 
 
-def parse(fp):
+def dependencies(converter):
+    """
+    If the converter requires another segment/other segments to work, it'll have
+    a kwarg called 'dep' annotated with a list of the name/s of said segment/s
+    """
+    return getattr(inspect.signature(converter).parameters.get('dep'), 'annotation', None) or []
+
+
+def toposort(graph):
+    """
+    graph: dict of {node: [nodes it depends on]}
+    
+    return: list of graph's nodes, each after everything it depends on,
+    otherwise in the order they were given
+    """
+    ordered, done, visiting = [], set(), set()
+    
+    def visit(node):
+        if node in done:
+            return
+        if node in visiting:
+            raise ValueError(f'Circular segment dependency involving {node}')
+        visiting.add(node)
+        for dep in graph[node]:
+            visit(dep)
+        visiting.discard(node)
+        done.add(node)
+        ordered.append(node)
+    
+    for node in graph:
+        visit(node)
+    return ordered
+
+
+def _convert(label, seg, seg_lno, convert):
+    try:
+        return convert()
+    except errors.NutshellException as e:
+        if e.lno is None:
+            # Note, `seg` is not passed in this branch
+            raise e.__class__(None, e.msg, label)
+        raise e.__class__(e.lno, e.msg, label, seg, shift=e.shift or seg_lno)
+
+
+def parse(fp, *, only=None):
     """
     fp: file obj pointing to a full rulefile
+    only: labels of the segments the caller will actually use; if given,
+          any segment that neither they nor their dependencies need is
+          left unconverted (as its list of lines)
     
     return: file, segmented into dict
     """
@@ -45,30 +95,63 @@ def parse(fp):
         if seg is not None:
             segments[seg].append(line)
     
-    # Parse and operate on gathered segments
+    converters = {}
     for label, converter in CONVERTERS:
-        try:
-            seg, seg_lno = segments[label], lines[label]
-        except KeyError:
+        if label not in segments:
             continue
         # The comment `# golly` can be used segment-initially to
         # indicate that that particular segment should not be touched
-        if seg[0].translate(utils.KILL_WS).lower() == '#golly':
-            segments[label] = seg[1:]
+        if segments[label][0].translate(utils.KILL_WS).lower() == '#golly':
+            segments[label] = segments[label][1:]
             continue
-        # If the converter requires another segment/other segments to work, it'll have
-        # a kwarg called 'dep' annotated with a list of the name/s of said segment/s
-        annot = getattr(inspect.signature(converter).parameters.get('dep'), 'annotation', None) or {}
-        try:
-            # Converter classes' constructors should all have the
-            # signature `__init__(data, line_number=0)` with optional
-            # `dep` kwarg as explained above
-            segments[label] = converter(seg, seg_lno, **(annot and {'dep': [segments.get(i) for i in annot]}))
-        except errors.NutshellException as e:
-            if e.lno is None:
-                # Note, `seg` is not passed in this branch
-                raise e.__class__(None, e.msg, label)
-            raise e.__class__(e.lno, e.msg, label, seg, shift=e.shift or seg_lno)
+        converters[label] = getattr(segment_types, converter)
+    
+    # Only the dependencies between segments that are actually being
+    # converted have to be waited on; any other one is passed as is
+    graph = {label: [i for i in dependencies(converter) if i in converters] for label, converter in converters.items()}
+    order = toposort(graph)
+    if only is not None:
+        needed = set()
+        stack = [i for i in only if i in graph]
+        while stack:
+            label = stack.pop()
+            if label not in needed:
+                needed.add(label)
+                stack.extend(graph[label])
+        order = [i for i in order if i in needed]
+    
+    # Parse and operate on gathered segments, each as soon as everything it
+    # depends on is done (segments submitted after their dependencies and
+    # one thread per segment, so waiting on those never deadlocks)
+    with ThreadPoolExecutor(max(1, 2 * len(order))) as pool:
+        futures, prepared = {}, {}
+        # A converter can also have a `prepare(data, line_number=0)` classmethod
+        # for the part of its work that needs no other segment; that's started
+        # right away and its result handed to the constructor as `prepared`
+        for label in order:
+            prepare = getattr(converters[label], 'prepare', None)
+            if prepare is not None:
+                prepared[label] = pool.submit(prepare, segments[label], lines[label])
+        
+        def run(label):
+            converter, annot = converters[label], dependencies(converters[label])
+            kwargs = {'dep': [futures[i].result() if i in futures else segments.get(i) for i in annot]} if annot else {}
+            
+            def convert():
+                if label in prepared:
+                    kwargs['prepared'] = prepared[label].result()
+                # Converter classes' constructors should all have the
+                # signature `__init__(data, line_number=0)` with optional
+                # `dep` kwarg as explained in dependencies() above
+                return converter(segments[label], lines[label], **kwargs)
+            return _convert(label, segments[label], lines[label], convert)
+        
+        for label in order:
+            futures[label] = pool.submit(run, label)
+        # In dependency order, so that the error raised is the one that
+        # would've come up first if they'd been converted one at a time
+        for label in order:
+            segments[label] = futures[label].result()
     
     for name in list(segments):
         if ':' in name:
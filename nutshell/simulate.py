@@ -0,0 +1,196 @@
+"""
+Runs patterns under a rule's compiled @TABLE without going through Golly.
+
+The table is compiled to a rule tree (see segment_types/table/_tree.py), and
+that tree's nodes to a single NumPy array with a row per node, so going one
+level down the tree for every cell of the grid at once is just one lookup
+into that array. Where the tree is too big to build, each generation goes
+through the table's lines in order instead, the way `nutshell-ca diff` does
+(slower, but with nothing to build up front). Needs NumPy, which Nutshell
+otherwise doesn't.
+"""
+import hashlib
+import re
+import sys
+from contextlib import redirect_stdout
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from nutshell import segmentor
+from nutshell.common.errors import NutshellException
+from nutshell.common.utils import printq
+from nutshell.diff import GollyTable
+from nutshell.segment_types.table.table import TableSegment
+from nutshell.segment_types.table._tree import TREE_ORDER
+
+# {compass direction :: (row, column) offset of the cell in that direction}
+OFFSETS = {
+  'N': (-1, 0), 'NE': (-1, 1), 'E': (0, 1), 'SE': (1, 1),
+  'S': (1, 0), 'SW': (1, -1), 'W': (0, -1), 'NW': (-1, -1),
+}
+# How many cells to add to each side of an unbounded grid at a time
+MARGIN = 16
+
+_RLE_TOKEN = re.compile(r'(\d*)([p-y]?[A-X]|[.bo$!])')
+
+
+def rle_state(symbol):
+    """The state an RLE cell symbol stands for ('b'/'o' or multistate '.', 'A'..'X', 'pA'..'yO')"""
+    if symbol in '.b':
+        return 0
+    if symbol == 'o':
+        return 1
+    *prefix, letter = symbol
+    return 24 * (ord(prefix[0]) - ord('o') if prefix else 0) + ord(letter) - ord('@')
+
+
+def read_rle(lines):
+    """Rows of states in the RLE pattern `lines`, all padded with 0s to the same length"""
+    body = ''.join(
+      line.strip() for line in lines
+      if not line.startswith('#') and not re.match(r'\s*x\s*=', line)
+      )
+    body = ''.join(body.split()).split('!', 1)[0]
+    rows, row, pos = [], [], 0
+    for match in _RLE_TOKEN.finditer(body):
+        if match.start() != pos:
+            break
+        pos = match.end()
+        count, symbol = int(match[1] or 1), match[2]
+        if symbol == '$':
+            rows.append(row)
+            rows.extend([] for _ in range(count - 1))
+            row = []
+        else:
+            row.extend([rle_state(symbol)] * count)
+    if pos != len(body):
+        raise ValueError(f'Unexpected {body[pos:pos+8]!r} in RLE pattern')
+    rows.append(row)
+    width = max(map(len, rows))
+    return [row + [0] * (width - len(row)) for row in rows]
+
+
+class TreeRule:
+    """
+    A rule tree's nodes as a single array, called with the grid as seen
+    from each of `offsets` (the cells each level of the tree looks at, in
+    order) to give the grid's next generation
+    """
+    def __init__(self, tree):
+        self._nodes = np.array([line.split()[1:] for line in tree.nodes], dtype=np.intp)
+        self._root = len(tree.nodes) - 1
+        self.offsets = [OFFSETS[cdir] for cdir in TREE_ORDER[tree.n_neighbors]] + [(0, 0)]
+
+    def __call__(self, cells):
+        node = np.full(cells[0].shape, self._root, dtype=np.intp)
+        for states in cells:
+            node = self._nodes[node, states]
+        # (the last level's "children" are the cells' new states)
+        return node
+
+
+class TableRule:
+    """
+    A GollyTable, called with the grid as seen from each of `offsets` (the
+    center cell and then its neighbors, in the table's order) to give the
+    grid's next generation
+    """
+    def __init__(self, table):
+        self._table = table
+        cardinals = TableSegment.CARDINALS[table.neighborhood]
+        self.offsets = [(0, 0)] + [OFFSETS[cdir] for cdir in sorted(cardinals, key=cardinals.get)]
+
+    def __call__(self, cells):
+        results, _ = self._table.evaluate(np.stack([states.ravel() for states in cells], axis=1))
+        return results.reshape(cells[0].shape)
+
+
+class Simulation:
+    """
+    A grid of cells stepped under a TreeRule or TableRule: bounded (cells
+    off its edges are always 0) if given a `size`, wrapped around into a
+    torus if `torus`, and otherwise unbounded, by growing whenever the
+    pattern nears an edge.
+    """
+    def __init__(self, rule, pattern, *, size=None, torus=False):
+        self._rule = rule
+        self.torus = torus
+        self.bounded = torus or size is not None
+        pattern = np.array(pattern, dtype=np.uint8)
+        height, width = pattern.shape
+        if size is None:
+            size = (width, height) if torus else (width + 2 * MARGIN, height + 2 * MARGIN)
+        if size[0] < width or size[1] < height:
+            raise ValueError(f'Pattern ({width}x{height}) is bigger than the grid ({size[0]}x{size[1]})')
+        self.grid = np.zeros(size[::-1], dtype=np.uint8)
+        # (where the pattern's top-left corner started out, so hashes don't depend on how the grid's grown)
+        self._origin = (size[1] - height) // 2, (size[0] - width) // 2
+        self.grid[self._origin[0]:self._origin[0] + height, self._origin[1]:self._origin[1] + width] = pattern
+        self.generation = 0
+
+    def step(self):
+        if not self.bounded and (self.grid[[0, -1]].any() or self.grid[:, [0, -1]].any()):
+            self.grid = np.pad(self.grid, MARGIN)
+            self._origin = self._origin[0] + MARGIN, self._origin[1] + MARGIN
+        height, width = self.grid.shape
+        padded = np.pad(self.grid, 1, mode='wrap' if self.torus else 'constant')
+        self.grid = self._rule([padded[1+dy:1+dy+height, 1+dx:1+dx+width] for dy, dx in self._rule.offsets]).astype(np.uint8)
+        self.generation += 1
+
+    @property
+    def population(self):
+        return int(np.count_nonzero(self.grid))
+
+    @property
+    def hash(self):
+        """
+        Hash of the pattern's bounding box and the states in it (relative to
+        where the pattern started out, so it depends on neither the grid's
+        size nor how much of it is empty)
+        """
+        rows, cols = np.nonzero(self.grid.any(axis=1))[0], np.nonzero(self.grid.any(axis=0))[0]
+        if not len(rows):
+            return hashlib.blake2b(digest_size=8).hexdigest()
+        top, bottom, left, right = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+        box = f'{top - self._origin[0]},{left - self._origin[1]},{bottom - top},{right - left};'
+        return hashlib.blake2b(box.encode() + self.grid[top:bottom, left:right].tobytes(), digest_size=8).hexdigest()
+
+
+def run(args):
+    """
+    Yields a line for each generation of args.pattern under the @TABLE in
+    args.rulefile, with its number, population, and hash. Progress goes
+    to stderr, so that only these lines go to stdout.
+    """
+    if np is None:
+        raise SystemExit('nutshell-ca simulate needs NumPy (e.g. `pip install numpy`)')
+    with redirect_stdout(sys.stderr):
+        printq('\nParsing...')
+        with open(args.rulefile) as fp:
+            parsed = segmentor.parse(fp, only=['@TABLE'])
+        if '@TABLE' not in parsed:
+            raise SystemExit(f'No @TABLE in {args.rulefile} to simulate')
+        table = parsed['@TABLE']
+        printq('Complete!\n\nBuilding rule tree...')
+        try:
+            rule = TreeRule(table.tree())
+        except NutshellException as e:
+            printq(f'{e.msg}\nGoing through the table line by line instead (which is slower)')
+            rule = TableRule(GollyTable(args.rulefile, ['@TABLE', *table]))
+        finally:
+            table.close()
+        printq('Complete!\n')
+    highest = max((max(row, default=0) for row in args.pattern), default=0)
+    if highest >= table.n_states:
+        raise SystemExit(f'Pattern has a cell in state {highest}, but the rule only has {table.n_states} states')
+    try:
+        sim = Simulation(rule, args.pattern, size=args.size, torus=args.torus)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    yield f'{sim.generation} {sim.population} {sim.hash}'
+    for _ in range(args.generations):
+        sim.step()
+        yield f'{sim.generation} {sim.population} {sim.hash}'
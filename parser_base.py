@@ -1556,29 +1556,28 @@ class LALR_Parser(object):
         self.parser = _Parser(analysis.parse_table, callbacks, debug)
 
     @classmethod
-    def deserialize(cls, data, memo, callbacks, *, tbl):
+    def deserialize(cls, data, memo, callbacks):
         inst = cls.__new__(cls)
         inst._parse_table = IntParseTable.deserialize(data, memo)
-        inst.parser = _Parser(inst._parse_table, callbacks, tbl=tbl)
+        inst.parser = _Parser(inst._parse_table, callbacks)
         return inst
 
     def serialize(self, memo):
         return self._parse_table.serialize(memo)
 
-    def parse(self, *args):
-        return self.parser.parse(*args)
+    def parse(self, *args, **kwargs):
+        return self.parser.parse(*args, **kwargs)
 
 
 class _Parser:
-    def __init__(self, parse_table, callbacks, debug=False, *, tbl):
+    def __init__(self, parse_table, callbacks, debug=False):
         self.states = parse_table.states
         self.start_states = parse_table.start_states
         self.end_states = parse_table.end_states
         self.callbacks = callbacks
         self.debug = debug
-        self._tbl = tbl
 
-    def parse(self, seq, start, set_state=None):
+    def parse(self, seq, start, set_state=None, *, tbl):
         token = None
         stream = iter(seq)
         states = self.states
@@ -1640,7 +1639,7 @@ class _Parser:
 
             raise
 
-        token = Token.new_borrow_pos('$END', '', token, tbl=self._tbl) if token else Token('$END', '', 0, 1, 1, tbl=self._tbl)
+        token = Token.new_borrow_pos('$END', '', token, tbl=tbl) if token else Token('$END', '', 0, 1, 1, tbl=tbl)
         while True:
             _action, arg = get_action(token)
             assert(_action is Reduce)
@@ -1749,13 +1748,13 @@ def get_frontend(parser, lexer):
 
 
 class _ParserFrontend(Serialize):
-    def _parse(self, input, start, *args):
+    def _parse(self, input, start, *args, **kwargs):
         if start is None:
             start = self.start
             if len(start) > 1:
                 raise ValueError("Lark initialized with more than 1 possible start rule. Must specify which start rule to parse", start)
             start ,= start
-        return self.parser.parse(input, start, *args)
+        return self.parser.parse(input, start, *args, **kwargs)
 
 
 class WithLexer(_ParserFrontend):
@@ -1773,10 +1772,10 @@ class WithLexer(_ParserFrontend):
         self.postlex = lexer_conf.postlex
 
     @classmethod
-    def deserialize(cls, data, memo, callbacks, postlex, *, tbl):
+    def deserialize(cls, data, memo, callbacks, postlex):
         inst = super(WithLexer, cls).deserialize(data, memo)
         inst.postlex = postlex
-        inst.parser = LALR_Parser.deserialize(inst.parser, memo, callbacks, tbl=tbl)
+        inst.parser = LALR_Parser.deserialize(inst.parser, memo, callbacks)
         inst.init_lexer()
         return inst
 
@@ -1826,7 +1825,7 @@ class LALR_ContextualLexer(LALR_WithLexer):
             parser_state[0] = s
 
         token_stream = self.lex(text, lambda: parser_state[0], tbl=tbl)
-        return self._parse(token_stream, start, set_parser_state)
+        return self._parse(token_stream, start, set_parser_state, tbl=tbl)
 
 
 class LarkOptions(Serialize):
@@ -2109,7 +2108,7 @@ class Lark(Serialize):
         inst = cls.__new__(cls)
         return inst._load(f)
 
-    def _load(self, f, transformer=None, postlex=None, *, tbl):
+    def _load(self, f, transformer=None, postlex=None):
         if isinstance(f, dict):
             d = f
         else:
@@ -2128,14 +2127,13 @@ class Lark(Serialize):
         self.rules = [Rule.deserialize(r, memo) for r in data['rules']]
         self.source = '<deserialized>'
         self._prepare_callbacks()
-        self.parser = self.parser_class.deserialize(data['parser'], memo, self._callbacks, self.options.postlex, tbl=tbl)
-        self._tbl = tbl
+        self.parser = self.parser_class.deserialize(data['parser'], memo, self._callbacks, self.options.postlex)
         return self
 
     @classmethod
-    def _load_from_dict(cls, data, memo, transformer=None, postlex=None, *, tbl):
+    def _load_from_dict(cls, data, memo, transformer=None, postlex=None):
         inst = cls.__new__(cls)
-        return inst._load({'data': data, 'memo': memo}, transformer, postlex, tbl=tbl)
+        return inst._load({'data': data, 'memo': memo}, transformer, postlex)
 
     @classmethod
     def open(cls, grammar_filename, rel_to=None, **options):
@@ -2172,11 +2170,13 @@ class Lark(Serialize):
         "Get information about a terminal"
         return self._terminals_dict[name]
 
-    def parse(self, text, start=None):
+    def parse(self, text, start=None, *, tbl):
         """Parse the given text, according to the options provided.
 
         The 'start' parameter is required if Lark was given multiple possible start symbols (using the start option).
+        (Modified) `tbl` is the TableSegment whose state-count the lexer should update; it's
+        bound per call so that one Lark instance can be shared between tables.
 
         Returns a tree, unless specified otherwise.
         """
-        return self.parser.parse(text, start=start, tbl=self._tbl)
+        return self.parser.parse(text, start=start, tbl=tbl)
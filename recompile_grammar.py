@@ -106,8 +106,8 @@ def main(fobj, start, out=None):
 
     print('Shift = 0', file=out)
     print('Reduce = 1', file=out)
-    print("def Lark_StandAlone(transformer=None, postlex=None, *, tbl):", file=out)
-    print("  return Lark._load_from_dict(DATA, MEMO, transformer=transformer, postlex=postlex, tbl=tbl)", file=out)
+    print("def Lark_StandAlone(transformer=None, postlex=None):", file=out)
+    print("  return Lark._load_from_dict(DATA, MEMO, transformer=transformer, postlex=postlex)", file=out)
 
 
 
@@ -47,7 +47,8 @@ setuptools.setup(
   url='https://github.com/supposedly/nutshell',
   description="Transpiler from a powerful alternative cellular-automaton-specification language to Golly's",
   install_requires=['bidict', 'joffrey>=0.5.1'],  #, 'lark-parser'],
-  python_requires='>=3.6',
+  extras_require={'simulate': ['numpy'], 'diff': ['numpy']},
+  python_requires='>=3.7',
   entry_points={
     'console_scripts': [
       'nutshell-ca=nutshell.main:main'
@@ -1,6 +1,10 @@
 """With the pytest-cov plugin installed, run this using `py.test test.py --cov=nutshell/ --cov-report html`"""
+import json
 import os
+import subprocess
 import sys
+import sysconfig
+from collections.abc import Iterable
 
 import ergo
 import pytest
@@ -10,6 +14,7 @@ from nutshell.main import transpile, write_rule
 from nutshell.common.utils import RAND_SEED, random as nutshell_rand
 
 ARGV = sys.argv + [None, None][len(sys.argv):]
+EXAMPLES = sorted('./examples/nutshells/' + fname for fname in os.listdir('./examples/nutshells'))
 wtf = cli.commands['transpile']
 cli.commands['transpile'].set_defaults(
   comment_src='#### line {line}: {span} ####',
@@ -22,6 +27,301 @@ def test_codecov():
             transpile(fp)
 
 
+def _nutshell(*args, **kwargs):
+    return subprocess.run([sys.executable, '-m', 'nutshell', *args], capture_output=True, text=True, check=True, **kwargs)
+
+
+def _takes(cell, state):
+    if isinstance(cell, Iterable):
+        return state in cell
+    return state == getattr(cell, 'value', cell)
+
+
+def _first_match(table, query):
+    """What -f should find for `query`, going through table's transitions and query's variants one by one"""
+    start, *napkin, end = query
+    variants = set(map(tuple, table.symmetries(napkin).expand()))
+    for tr in table._data:
+        if any(all(map(_takes, tr, (start, *variant))) for variant in variants):
+            return 'found' if _takes(tr[-1], end) else 'overridden', list(map(str, tr.fix_vars()))
+    return 'default' if start == end else 'no match', None
+
+
+def test_find():
+    np = pytest.importorskip('numpy')
+    from nutshell import diff, segmentor
+    rng = np.random.default_rng(0)
+    for path in EXAMPLES:
+        with open(path) as fp:
+            table = segmentor.parse(fp, only=['@TABLE'])['@TABLE']
+        golly = diff.GollyTable(path, ['@TABLE', *table])
+        # (far fewer under permute, where each query can have 8! variants to go through)
+        n = 5 if table.directives['symmetries'] == 'permute' else 100
+        configs = np.concatenate([golly.sample(n, rng), rng.integers(table.n_states, size=(n, 1 + table.trlen))])
+        ends = rng.integers(table.n_states, size=len(configs))
+        for config, end in zip(configs.tolist(), ends.tolist()):
+            found = table.search([*config, end])
+            assert (found['result'], found.get('compiled')) == _first_match(table, [*config, end]), (path, config, end)
+        table.close()
+
+
+def test_find_file(tmp_path):
+    src, queries = tmp_path / 'find.ruel', tmp_path / 'queries.txt'
+    src.write_text(
+      '@NUTSHELL find\n\n@TABLE\nstates: 3\nneighborhood: vonNeumann\n\n'
+      '0, 1, 0, 0, 0; 1\n1, any, any, any, any; 2\n'
+      )
+    queries.write_text(
+      '0, 1, 0, 0, 0, 1\n\n# comment\n0, 1, 0, 0, 0, 2  # overridden\n'
+      '0, 2, 0, 0, 0, 0\n0, 2, 0, 0, 0, 1\n1, ?, 0, 0, 0, 2\n0, 1, 0\nzero, 1\n'
+      )
+    results = [json.loads(line) for line in _nutshell('t', str(src), '--find-file', str(queries)).stdout.splitlines()]
+    assert [(r['query_line'], r.get('result'), r.get('line')) for r in results] == [
+      (1, 'found', 7), (4, 'overridden', 7), (5, 'default', None), (6, 'no match', None),
+      (7, 'found', 8), (8, None, None), (9, None, None)
+      ]
+    assert results[4]['terms'] == [{'term': 1, 'cell': 'any.0', 'states': [0, 1, 2]}]
+    assert 'expected 6 states' in results[5]['error'] and 'error' in results[6]
+    assert all(r['file'] == str(src) for r in results)
+
+
+def test_cache(tmp_path):
+    src, macros, cache = tmp_path / 'cached.ruel', tmp_path / 'macros.py', str(tmp_path / 'cache')
+    macros.write_text('def nothing(transitions):\n    return transitions\n')
+    src.write_text(f'@NUTSHELL cached\n\n@TABLE\nstates: 2\nmacros: {macros}\n\n0, 1, 1, 1, 0, 0, 0, 0, 0; 1\n')
+    out, plain = tmp_path / 'out', tmp_path / 'plain'
+    out.mkdir()
+    plain.mkdir()
+    _nutshell('t', str(src), str(plain))
+    uncached = (plain / 'cached.rule').read_text()
+
+    def run(*options):
+        hit = 'using cached output' in _nutshell('t', str(src), str(out), '--cache', cache, *options).stdout
+        return hit, (out / 'cached.rule').read_text()
+    assert run() == (False, uncached)
+    assert run() == (True, uncached)
+    for options in (['-p'], ['-o'], ['--format', 'tree']):
+        assert not run(*options)[0]
+        assert run(*options)[0]
+    macros.write_text('def nothing(transitions):\n    return list(transitions)\n')
+    assert run() == (False, uncached)
+    assert run() == (True, uncached)
+
+
+def test_reloaded_symmetries(tmp_path, monkeypatch):
+    from nutshell.segment_types.table import _symutils as symutils
+    from nutshell.segment_types.table.table import TableSegment
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    monkeypatch.setattr(sys, 'dont_write_bytecode', True)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = tmp_path / 'edited_symmetries.py'
+    expanded = 'return [self[i:] + self[:i] for i in range(0, len(self), {})]'
+    template = (
+      'from nutshell import Napkin\n\n'
+      'class Turns(Napkin):\n'
+      '    neighborhoods = 4,\n'
+      "    fallback = 'none'\n"
+      '    @property\n'
+      '    def expanded(self):\n'
+      '        {}\n'
+      )
+    module.write_text(template.format(expanded.format(1)))
+    assert len(symutils.get_sym_type('edited_symmetries.Turns').symmetries[4]) == 4
+    module.write_text(template.format(expanded.format(2)))
+    TableSegment.reload_dependency(str(module))
+    assert len(symutils.get_sym_type('edited_symmetries.Turns').symmetries[4]) == 2
+
+
+def _transpile_examples(out, *options, skip=()):
+    """Transpiles the examples (bar those named in `skip`) into the directory `out`, returning {filename :: path}"""
+    out.mkdir()
+    _nutshell('t', ' '.join(path for path in EXAMPLES if os.path.basename(path) not in skip), str(out), *options)
+    return {path.name: path for path in out.iterdir()}
+
+
+def test_jobs(tmp_path):
+    serial = _transpile_examples(tmp_path / 'serial')
+    parallel = _transpile_examples(tmp_path / 'parallel', '-j', '4')
+    assert len(serial) == len(EXAMPLES) and serial.keys() == parallel.keys()
+    for name, path in serial.items():
+        assert path.read_bytes() == parallel[name].read_bytes(), name
+
+
+def _assert_same_behavior(before, after, monkeypatch):
+    from nutshell import diff
+    # (sampling any rule with over a million or so neighborhoods, to keep this quick)
+    monkeypatch.setattr(diff, 'EXHAUSTIVE_MAX', 1 << 20)
+    lines = []
+    try:
+        for line in diff.run(ergo.misc.ErgoNamespace(before=before, after=after, samples=50000, seed=0, show=3)):
+            lines.append(line)
+    except SystemExit:
+        pytest.fail('\n'.join(lines))
+
+
+def test_prune_shadowed(tmp_path, monkeypatch):
+    pytest.importorskip('numpy')
+    plain, pruned = _transpile_examples(tmp_path / 'plain'), _transpile_examples(tmp_path / 'pruned', '-p')
+    for name, path in plain.items():
+        _assert_same_behavior(path, pruned[name], monkeypatch)
+
+
+def test_optimize(tmp_path, monkeypatch):
+    pytest.importorskip('numpy')
+    plain = _transpile_examples(tmp_path / 'plain')
+    optimized, both = _transpile_examples(tmp_path / 'optimized', '-o'), _transpile_examples(tmp_path / 'both', '-p', '-o')
+    for name, path in plain.items():
+        _assert_same_behavior(path, optimized[name], monkeypatch)
+        _assert_same_behavior(path, both[name], monkeypatch)
+
+
+def test_optimize_bound_resultant(tmp_path):
+    np = pytest.importorskip('numpy')
+    from nutshell import diff
+    src = tmp_path / 'bound.ruel'
+    src.write_text(
+      '@NUTSHELL bound\n\n@TABLE\nstates: 3\nsymmetries: rotate4\nneighborhood: vonNeumann\n\n'
+      '0, 1, any, any, any; 1\n0, 2, any, any, any; 2\n'
+      )
+    (tmp_path / 'plain').mkdir()
+    (tmp_path / 'opt').mkdir()
+    _nutshell('t', str(src), str(tmp_path / 'plain'))
+    _nutshell('t', str(src), str(tmp_path / 'opt'), '-o')
+    plain, opt = diff.GollyTable(tmp_path / 'plain/bound.rule'), diff.GollyTable(tmp_path / 'opt/bound.rule')
+    configs = np.indices((3,) * 5).reshape(5, -1).T
+    assert (plain.evaluate(configs)[0] == opt.evaluate(configs)[0]).all()
+
+
+def test_diff_bound_resultant(tmp_path):
+    pytest.importorskip('numpy')
+    from nutshell import diff
+    header = '@RULE x\n@TABLE\nn_states: 3\nneighborhood: vonNeumann\nsymmetries: rotate4\nvar live = {1,2}\nvar a = {0,1,2}\nvar b = a\nvar c = a\n'
+    bound = tmp_path / 'bound.rule'
+    bound.write_text(header + '0, live, a, b, c, live\n')
+    # (a table that does what bound.rule does to one neighborhood of each
+    # rotate4 class, and so only differs from it on the rest of them)
+    reps, = diff.every_neighborhood(3, 4, [(0, 1, 2, 3), (1, 2, 3, 0), (2, 3, 0, 1), (3, 0, 1, 2)])
+    results, _ = diff.GollyTable(bound).evaluate(reps)
+    literal = tmp_path / 'literal.rule'
+    literal.write_text(header + ''.join(f"{', '.join(map(str, rep))}, {result}\n" for rep, result in zip(reps, results)))
+    with pytest.raises(SystemExit) as e:
+        list(diff.run(ergo.misc.ErgoNamespace(before=bound, after=literal, samples=0, seed=0, show=0)))
+    assert e.value.code == 1
+
+
+def test_tree_matches_table(tmp_path):
+    np = pytest.importorskip('numpy')
+    from nutshell import diff
+    from nutshell.segment_types.table.table import TableSegment
+    from nutshell.segment_types.table._tree import TREE_ORDER
+    rng = np.random.default_rng(0)
+    tables = _transpile_examples(tmp_path / 'table', skip={'bf.ruel'})
+    trees = _transpile_examples(tmp_path / 'tree', '--format', 'tree', skip={'bf.ruel'})
+    for name, path in tables.items():
+        table = diff.GollyTable(path)
+        configs = np.concatenate([table.sample(5000, rng), rng.integers(table.n_states, size=(5000, 1 + table.trlen))])
+        segment = trees[name].read_text().split('\n@TREE\n', 1)[1].split('\n@', 1)[0].splitlines()
+        header = dict(line.split('=') for line in segment[:3])
+        nodes = np.array([line.split()[1:] for line in segment[3:] if line], dtype=np.intp)
+        cardinals = TableSegment.CARDINALS[table.neighborhood]
+        node = np.full(len(configs), len(nodes) - 1)
+        # (the center cell last, and any cell outside the table's neighborhood as whatever state)
+        for cdir in (*TREE_ORDER[int(header['num_neighbors'])], None):
+            if cdir is None or cdir in cardinals:
+                node = nodes[node, configs[:, cardinals.get(cdir, 0)]]
+            else:
+                node = nodes[node, rng.integers(table.n_states, size=len(configs))]
+        assert (node == table.evaluate(configs)[0]).all(), name
+
+
+def test_tree_too_big(tmp_path):
+    previous = tmp_path / 'bf.rule'
+    previous.write_text('@RULE bf\n')
+    proc = subprocess.run(
+      [sys.executable, '-m', 'nutshell', 't', './examples/nutshells/bf.ruel', str(tmp_path), '--format', 'tree'],
+      capture_output=True, text=True
+      )
+    assert proc.returncode == 1
+    assert 'Rule tree too big to build' in proc.stderr
+    # (the last good output stays put, and nothing's left half-written beside it)
+    assert previous.read_text() == '@RULE bf\n'
+    assert list(tmp_path.iterdir()) == [previous]
+
+
+def test_simulate(tmp_path):
+    pytest.importorskip('numpy')
+    life = tmp_path / 'life.ruel'
+    life.write_text(
+      '@NUTSHELL life\n\n@TABLE\nstates: 2\nsymmetries: permute\n\n'
+      '0, 1, 1, 1, 0, 0, 0, 0, 0; 1\n1, 1, 1, 0, 0, 0, 0, 0, 0; 1\n1, 1, 1, 1, 0, 0, 0, 0, 0; 1\n'
+      '1, any, any, any, any, any, any, any, any; 0\n'
+      )
+
+    def run(rle, generations, *options):
+        proc = _nutshell('s', str(life), '-', '-g', str(generations), *options, input=f'x = 0, y = 0\n{rle}\n')
+        return [(int(population), digest) for _, population, digest in map(str.split, proc.stdout.splitlines())]
+    # diehard vanishes after 130 generations
+    diehard = run('6bob$2o6b$bo3b3o!', 130)
+    assert diehard[0][0] == 7 and diehard[129][0] > 0 and diehard[130][0] == 0
+    # a blinker oscillates in place
+    blinker = run('3o!', 4, '--size', '5x5')
+    assert [population for population, _ in blinker] == [3] * 5
+    assert blinker[0][1] == blinker[2][1] == blinker[4][1] != blinker[1][1] == blinker[3][1]
+    # a glider is the same 4 generations later, a cell further down and right
+    glider = run('bo$2bo$3o!', 4)
+    assert [population for population, _ in glider] == [5] * 5
+    assert glider[4][1] == run('4b$2bo$3bo$b3o!', 0)[0][1] != glider[0][1]
+    assert run('bo$2bo$3o!', 4, '--torus', '--size', '6x6')[4][1] == glider[4][1]
+
+
+def test_simulate_without_tree():
+    pytest.importorskip('numpy')
+    # (bf.ruel's tree is too big to build, so this goes through its table)
+    proc = _nutshell('s', './examples/nutshells/bf.ruel', '-', '-g', '2', '--size', '8x8', input='x = 3, y = 2\nABC$DEF!\n')
+    assert [line.split()[:2] for line in proc.stdout.splitlines()] == [['0', '6'], ['1', '5'], ['2', '5']]
+
+
+def test_spooled_output_closed(monkeypatch):
+    if not os.path.isdir('/proc/self/fd'):
+        pytest.skip('needs /proc/self/fd')
+    from nutshell.segment_types.table.table import TableSegment
+    # (so that every table's transitions spill over into a temporary file)
+    monkeypatch.setattr(TableSegment, 'SPOOL_MAXSIZE', 1)
+    before = len(os.listdir('/proc/self/fd'))
+    for fname in list(os.walk('./examples/nutshells'))[0][2]:
+        with open('./examples/nutshells/' + fname) as fp:
+            transpile(fp)
+    assert len(os.listdir('/proc/self/fd')) == before
+
+
+def test_lazy_imports():
+    proc = subprocess.run(
+      [sys.executable, '-c', 'import sys, nutshell.main; print(*sys.modules)'],
+      capture_output=True, text=True, check=True
+      )
+    loaded = set(proc.stdout.split())
+    assert not loaded & {'bidict', 'numpy', 'nutshell.tools', 'nutshell.segment_types.table.lark_assets.parser'}
+
+    def import_time(module):
+        """Microseconds spent importing `module`, bar the standard library (which anything pays for)"""
+        proc = subprocess.run(
+          [sys.executable, '-X', 'importtime', '-c', f'import json, sys, {module}; print(json.dumps({{k: getattr(v, "__file__", None) for k, v in sys.modules.items()}}))'],
+          capture_output=True, text=True, check=True
+          )
+        files, stdlib = json.loads(proc.stdout), sysconfig.get_paths()['stdlib']
+        total = 0
+        for line in proc.stderr.splitlines():
+            own, _, name = line[len('import time:'):].split('|')
+            path = files.get(name.strip())
+            if own.strip().isdigit() and path and (not path.startswith(stdlib) or 'site-packages' in path):
+                total += int(own)
+        return total
+    # (it ought to cost less than the table engine it puts off importing, which is
+    # timed on the same machine; the best of a few tries at each is taken so that
+    # a busy one doesn't fail it)
+    assert min(import_time('nutshell.main') for _ in range(3)) < min(import_time('nutshell.segment_types.table.table') for _ in range(3))
+
+
 if __name__ == '__main__':
     main = ARGV[1]
     if main is None: